@@ -1,21 +1,41 @@
-import multiprocessing
 from typing import TYPE_CHECKING
 
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from modules.core.process_memory import ProcessMemory
+from modules.core.process_resources import ProcessResources
+from modules.core.web_server import WebServer
+from modules.logger.logger import Logger
+from modules.logger.logger_manager import LoggerManager
+
 if TYPE_CHECKING:
     from gunicorn.arbiter import Arbiter
     from gunicorn.workers.base import Worker
 
+# Process counts, recycling and timeouts come from `web.server` config (WEB_WORKERS, WEB_THREADS, ...);
+# see the sizing profile in docs/deployment.md. Flags on the gunicorn command line still win.
+server_settings = WebServer.settings()
+
 # Server Socket
 bind = "0.0.0.0:8080"
 
 # Worker Processes
-workers = multiprocessing.cpu_count() * 2 + 1
+workers = server_settings.workers
 worker_class = "gthread"
-threads = 2 * multiprocessing.cpu_count()
+threads = server_settings.threads
+
+# Replace each worker after max_requests (+ up to max_requests_jitter) requests to bound slow leaks
+# without restarting every worker at once.
+max_requests = server_settings.max_requests
+max_requests_jitter = server_settings.max_requests_jitter
 
 # Preload app before forking workers
-# This ensures bootstrap tasks run once in the master process
+# This ensures bootstrap tasks run once in the master process. The master collects no garbage while it
+# imports, and web_app.py freezes the heap it built so the workers keep sharing it (see ProcessMemory).
 preload_app = True
+ProcessMemory.hold_gc_until_fork()
 
 # Logging
 loglevel = "info"
@@ -24,24 +44,22 @@ access_log_format = "app - request - %(h)s - %(s)s - %(m)s - %(M)sms - %(U)s - %
 errorlog = "-"
 
 
-def post_fork(_server: "Arbiter", _worker: "Worker") -> None:
-    """Hook to configure Gunicorn access logger to use Datadog handler after worker fork"""
-    import logging
-
-    from modules.logger.internal.datadog_handler import DatadogHandler
-    from modules.logger.internal.datadog_handler_level import LogLevel
+def post_fork(_server: "Arbiter", worker: "Worker") -> None:
+    """Runs in each worker right after the fork. The master loaded config, mounted loggers and ran
+    bootstrap once; the worker keeps those and re-creates only what holds connections (the Mongo client
+    and its collections, outbound HTTP pools), turns garbage collection back on with the worker
+    thresholds, then ships gunicorn's access log to Datadog."""
+    ProcessResources.reset_after_fork()
+    ProcessMemory.tune_gc_after_fork()
+    LoggerManager.mount_access_logger("gunicorn.access")
+    Logger.info(message=f"[web.worker] pid {worker.pid} started: {ProcessMemory.describe(ProcessMemory.usage())}")
 
-    # Get Gunicorn's access logger
-    gunicorn_logger = logging.getLogger("gunicorn.access")
 
-    # Add Datadog handler to Gunicorn's access logger
-    datadog_handler = DatadogHandler("flask")
-    datadog_handler.setLevel(LogLevel.get_level())
-    formatter = logging.Formatter("[%(asctime)s] - %(name)s - %(levelname)s - %(message)s")
-    datadog_handler.setFormatter(formatter)
-    gunicorn_logger.addHandler(datadog_handler)
+def worker_exit(_server: "Arbiter", worker: "Worker") -> None:
+    # How much of the master's memory the worker still shares when it is recycled or stopped.
+    Logger.info(message=f"[web.worker] pid {worker.pid} exiting: {ProcessMemory.describe(ProcessMemory.usage())}")
 
 
 # Timeout
-timeout = 30
-keepalive = 2
+timeout = server_settings.timeout_seconds
+keepalive = server_settings.keepalive_seconds
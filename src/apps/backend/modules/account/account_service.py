@@ -1,8 +1,14 @@
+import uuid
+
+from modules.account.internal.account_notification_fan_out import AccountNotificationFanOut
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_writer import AccountWriter
+from modules.account.internal.password_hash import PasswordHash
+from modules.account.jobs.notify_accounts_job import NotifyAccountsJob
 from modules.account.types import (
     Account,
     AccountDeletionResult,
+    AccountQuery,
     AccountSearchByIdParams,
     AccountSearchParams,
     CreateAccountByPhoneNumberParams,
@@ -13,10 +19,11 @@ from modules.account.types import (
 )
 from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.types import CreateOTPParams
-from modules.core.common.types import AuditActor
+from modules.core.common.types import ActorType, AuditActor
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import (
     AccountNotificationPreferences,
+    BulkNotificationContent,
     CreateOrUpdateAccountNotificationPreferencesParams,
 )
 
@@ -87,9 +94,24 @@ class AccountService:
     def get_account_by_username(*, username: str, actor: AuditActor) -> Account:
         return AccountReader.get_account_by_username(username=username, actor=actor)
 
+    @staticmethod
+    def prepare_password_verification() -> None:
+        """
+        Hash the digest that logins for unknown usernames are checked against. Call at boot, before the
+        server forks, so the first such login in each worker is not slower than the rest.
+        """
+        PasswordHash.prepare_equalized_timing()
+
     @staticmethod
     def get_account_by_username_and_password(*, params: AccountSearchParams, actor: AuditActor) -> Account:
-        return AccountReader.get_account_by_username_and_password(params=params, actor=actor)
+        account = AccountReader.get_account_by_username_and_password(params=params, actor=actor)
+        # The password was just proven, so the rehash is attributed to the account itself.
+        AccountWriter.rehash_password_if_outdated(
+            account=account,
+            password=params.password,
+            actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=account.id),
+        )
+        return account
 
     @staticmethod
     def update_account_profile(*, account_id: str, actor: AuditActor, params: UpdateAccountProfileParams) -> Account:
@@ -111,6 +133,21 @@ class AccountService:
             account_id=account_id, actor=actor
         )
 
+    @staticmethod
+    def send_notification_to_accounts(*, query: AccountQuery, content: BulkNotificationContent) -> str:
+        """
+        Send the content to every account matching the query, honouring each account's notification
+        preferences. Delivery runs in the background in chunks spread across workers; the returned
+        fan-out id is recorded in the arguments of the NotifyAccountsJob run that tracks progress.
+        """
+        fan_out_id = uuid.uuid4().hex
+        NotifyAccountsJob.perform_async(
+            fan_out_id=fan_out_id,
+            account_query=AccountNotificationFanOut.encode_query(query),
+            content=AccountNotificationFanOut.encode_content(content),
+        )
+        return fan_out_id
+
     @staticmethod
     def delete_account(*, account_id: str, actor: AuditActor) -> AccountDeletionResult:
         return AccountWriter.delete_account(account_id=account_id, actor=actor)
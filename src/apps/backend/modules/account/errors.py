@@ -56,3 +56,12 @@ class AccountWithPhoneNumberExistsError(AppError):
             http_status_code=409,
             message=f"An account with the phone number {phone_number} already exists. Try logging in or use a different phone number.",
         )
+
+
+class AccountPasswordHashingUnavailableError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=AccountErrorCode.PASSWORD_HASHING_UNAVAILABLE,
+            http_status_code=503,
+            message="We are receiving too many sign-in requests right now. Please try again in a moment.",
+        )
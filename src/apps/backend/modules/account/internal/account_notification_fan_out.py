@@ -0,0 +1,76 @@
+from dataclasses import asdict
+from typing import Any, ClassVar
+
+from modules.account.types import Account, AccountQuery, PhoneNumber
+from modules.config.config_service import ConfigService
+from modules.notification.types import (
+    BulkEmailContent,
+    BulkNotificationContent,
+    BulkNotificationRecipient,
+    BulkNotificationResult,
+    EmailSender,
+)
+
+
+class AccountNotificationFanOut:
+    """Job-argument encoding and recipient mapping for the account notification fan-out. Query and
+    content travel through the broker as plain dicts and are rebuilt into their types in the worker."""
+
+    CONFIG_KEY: ClassVar[str] = "accounts.notification_fan_out"
+
+    @staticmethod
+    def accounts_per_chunk() -> int:
+        return ConfigService.get_int(key=f"{AccountNotificationFanOut.CONFIG_KEY}.accounts_per_chunk", default=500)
+
+    @staticmethod
+    def encode_query(query: AccountQuery) -> dict[str, Any]:
+        return asdict(query)
+
+    @staticmethod
+    def decode_query(encoded: dict[str, Any]) -> AccountQuery:
+        phone_number = encoded.get("phone_number")
+        ids = encoded.get("ids")
+        return AccountQuery(
+            **{
+                **encoded,
+                "ids": tuple(ids) if ids is not None else None,
+                "phone_number": PhoneNumber(**phone_number) if phone_number is not None else None,
+            }
+        )
+
+    @staticmethod
+    def encode_content(content: BulkNotificationContent) -> dict[str, Any]:
+        return asdict(content)
+
+    @staticmethod
+    def decode_content(encoded: dict[str, Any]) -> BulkNotificationContent:
+        email = encoded.get("email")
+        return BulkNotificationContent(
+            email=(
+                BulkEmailContent(
+                    sender=EmailSender(**email["sender"]),
+                    template_id=email["template_id"],
+                    template_data=email.get("template_data"),
+                )
+                if email is not None
+                else None
+            ),
+            sms_message_body=encoded.get("sms_message_body"),
+        )
+
+    @staticmethod
+    def recipients_for(accounts: list[Account]) -> list[BulkNotificationRecipient]:
+        # Username-and-password accounts sign in with their email address; phone accounts have none.
+        return [
+            BulkNotificationRecipient(
+                account_id=account.id,
+                email=account.username or None,
+                phone_number=account.phone_number,
+                template_data={"first_name": account.first_name},
+            )
+            for account in accounts
+        ]
+
+    @staticmethod
+    def progress_of(result: BulkNotificationResult) -> dict[str, int]:
+        return {"chunks_completed": 1, **asdict(result)}
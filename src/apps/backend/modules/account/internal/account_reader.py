@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Iterator, Optional
 
 from modules.account.errors import (
     AccountInvalidCredentialsError,
@@ -75,3 +75,12 @@ class AccountReader:
     def check_phone_number_not_exist(*, phone_number: PhoneNumber, actor: AuditActor) -> None:
         if AccountRepository.query_one(AccountQuery(phone_number=phone_number), actor=actor) is not None:
             raise AccountWithPhoneNumberExistsError(phone_number=phone_number)
+
+    @staticmethod
+    def iter_account_id_batches(*, query: AccountQuery, batch_size: int) -> Iterator[list[str]]:
+        return AccountRepository.iter_id_batches(query, batch_size=batch_size)
+
+    @staticmethod
+    def get_accounts_by_ids(*, account_ids: list[str], actor: AuditActor) -> list[Account]:
+        # Inactive accounts are left out, so one deleted after its id was streamed is not contacted.
+        return AccountRepository.query(AccountQuery(ids=tuple(account_ids)), actor=actor)
@@ -1,11 +1,26 @@
 import bcrypt
 
+from modules.account.internal.password_hashing_executor import PasswordHashingExecutor
+from modules.config.config_service import ConfigService
+
 
 class AccountUtil:
+    ROUNDS_CONFIG_KEY = "accounts.password_hashing.rounds"
+    DEFAULT_ROUNDS = 10
+
+    @staticmethod
+    def password_hash_rounds() -> int:
+        return ConfigService[int].get_value(key=AccountUtil.ROUNDS_CONFIG_KEY, default=AccountUtil.DEFAULT_ROUNDS)
+
     @staticmethod
     def hash_password(*, password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        rounds = AccountUtil.password_hash_rounds()
+        return PasswordHashingExecutor.run(
+            lambda: bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode()
+        )
 
     @staticmethod
     def compare_password(*, password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        return PasswordHashingExecutor.run(
+            lambda: bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        )
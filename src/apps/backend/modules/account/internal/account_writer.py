@@ -3,9 +3,10 @@ from datetime import UTC, datetime
 
 from phonenumbers import is_valid_number, parse
 
-from modules.account.errors import AccountWithIdNotFoundError
+from modules.account.errors import AccountPasswordHashingUnavailableError, AccountWithIdNotFoundError
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.password_hash import PasswordHash
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import (
     Account,
@@ -61,6 +62,19 @@ class AccountWriter:
 
         return updated_account
 
+    @staticmethod
+    def rehash_password_if_outdated(*, account: Account, password: str, actor: AuditActor) -> None:
+        # Runs right after a successful login, the only moment the plaintext is at hand, so a change to
+        # the configured cost reaches every active account without a migration.
+        if not PasswordHash.of(account.hashed_password).needs_rehash():
+            return
+        try:
+            hashed_password = AccountUtil.hash_password(password=password)
+        except AccountPasswordHashingUnavailableError:
+            # The login itself succeeded; a saturated pool only postpones the upgrade to the next login.
+            return
+        AccountRepository.update_fields(account.id, {"hashed_password": hashed_password}, actor=actor)
+
     @staticmethod
     def update_account_profile(*, account_id: str, params: UpdateAccountProfileParams, actor: AuditActor) -> Account:
         update_fields: FieldUpdates = {}
@@ -1,8 +1,19 @@
+import secrets
+import threading
+from typing import ClassVar, Optional
+
 import bcrypt
 
+from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.password_hashing_executor import PasswordHashingExecutor
+
 
 class PasswordHash:
-    _TIMING_EQUALIZING_DIGEST_FOR_ABSENT_ACCOUNT = "$2b$10$lrjOG2MQ/QZO9KF0QYnx7uUOq.mct.XH0KNH03SjtgQsQ/v2lbYOO"
+    # A throwaway digest at the configured cost. Checking a login for an unknown username against it costs
+    # exactly what checking a real account does, so response time does not reveal whether the username
+    # exists. It is hashed at boot, before gunicorn forks, so no login pays for hashing it.
+    _timing_equalizing_digest: ClassVar[Optional[str]] = None
+    _timing_equalizing_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, digest: str) -> None:
         self._digest = digest
@@ -11,9 +22,40 @@ class PasswordHash:
     def of(cls, digest: str) -> "PasswordHash":
         return cls(digest)
 
+    @classmethod
+    def prepare_equalized_timing(cls) -> None:
+        cls._timing_equalizing_digest_for_configured_rounds()
+
     @classmethod
     def for_absent_account_with_equalized_timing(cls) -> "PasswordHash":
-        return cls(cls._TIMING_EQUALIZING_DIGEST_FOR_ABSENT_ACCOUNT)
+        return cls(cls._timing_equalizing_digest_for_configured_rounds())
+
+    @classmethod
+    def _timing_equalizing_digest_for_configured_rounds(cls) -> str:
+        rounds = AccountUtil.password_hash_rounds()
+        digest = cls._timing_equalizing_digest
+        if digest is not None and cls(digest).rounds() == rounds:
+            return digest
+        # Reached at boot, or in a request only if boot did not prepare it or the configured cost has changed.
+        with cls._timing_equalizing_lock:
+            digest = cls._timing_equalizing_digest
+            if digest is None or cls(digest).rounds() != rounds:
+                # Hashed inline rather than on PasswordHashingExecutor, so it never holds a login's slot.
+                password = secrets.token_urlsafe(32).encode("utf-8")
+                digest = bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds)).decode()
+                cls._timing_equalizing_digest = digest
+            return digest
 
     def matches(self, password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), self._digest.encode("utf-8"))
+        digest = self._digest.encode("utf-8")
+        return PasswordHashingExecutor.run(lambda: bcrypt.checkpw(password.encode("utf-8"), digest))
+
+    def rounds(self) -> Optional[int]:
+        # Modular crypt format: $2b$<cost>$<salt+hash>.
+        parts = self._digest.split("$")
+        if len(parts) < 4 or not parts[2].isdigit():
+            return None
+        return int(parts[2])
+
+    def needs_rehash(self) -> bool:
+        return self.rounds() != AccountUtil.password_hash_rounds()
@@ -0,0 +1,85 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, ClassVar, Optional
+
+from modules.account.errors import AccountPasswordHashingUnavailableError
+from modules.config.config_service import ConfigService
+
+
+class _QueueWaitExceeded(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class _ExecutorState:
+    executor: ThreadPoolExecutor
+    # One slot per running or queued hash; a request that cannot take one is rejected without waiting.
+    slots: threading.BoundedSemaphore
+    max_queue_wait_seconds: float
+
+
+class PasswordHashingExecutor:
+    """Runs bcrypt hashing and verification on a small dedicated pool instead of the request thread.
+
+    bcrypt releases the GIL, so a login storm on request threads would otherwise occupy every core and every
+    gthread thread at once. Here at most `max_workers` hashes run per process and at most `max_queue_size`
+    wait behind them; anything beyond that, or anything that waited longer than `max_queue_wait_seconds`,
+    is rejected with a 503 instead of compounding the backlog, so the remaining request threads stay free
+    for cheap endpoints. Sizing lives under `accounts.password_hashing`."""
+
+    CONFIG_KEY: ClassVar[str] = "accounts.password_hashing"
+
+    _state: ClassVar[Optional[_ExecutorState]] = None
+    _state_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def run[T](cls, operation: Callable[[], T]) -> T:
+        state = cls._get_state()
+        if not state.slots.acquire(blocking=False):
+            raise AccountPasswordHashingUnavailableError()
+
+        enqueued_at = time.monotonic()
+
+        def run_within_queue_limit() -> T:
+            try:
+                if time.monotonic() - enqueued_at > state.max_queue_wait_seconds:
+                    raise _QueueWaitExceeded()
+                return operation()
+            finally:
+                state.slots.release()
+
+        try:
+            return state.executor.submit(run_within_queue_limit).result()
+        except _QueueWaitExceeded:
+            raise AccountPasswordHashingUnavailableError()
+
+    @classmethod
+    def _get_state(cls) -> _ExecutorState:
+        state = cls._state
+        if state is not None:
+            return state
+        with cls._state_lock:
+            if cls._state is None:
+                max_workers = ConfigService[int].get_value(key=f"{cls.CONFIG_KEY}.max_workers", default=1)
+                max_queue_size = ConfigService[int].get_value(key=f"{cls.CONFIG_KEY}.max_queue_size", default=4)
+                cls._state = _ExecutorState(
+                    executor=ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hashing"),
+                    slots=threading.BoundedSemaphore(max_workers + max_queue_size),
+                    max_queue_wait_seconds=ConfigService[float].get_value(
+                        key=f"{cls.CONFIG_KEY}.max_queue_wait_seconds", default=1.0
+                    ),
+                )
+            return cls._state
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # Pool threads do not survive fork, and the bootstrap step hashes the seeded user's password in the
+        # gunicorn master before workers are forked. Each child builds its own pool on first use.
+        cls._state = None
+        cls._state_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=PasswordHashingExecutor._reset_after_fork)
@@ -87,6 +87,9 @@ class AccountRepository(ApplicationRepository[Account, AccountQuery]):
             object_id = cls._to_object_id(params.id)
             # A malformed id matches nothing; force an empty result rather than raising.
             store_filter["_id"] = object_id if object_id is not None else {"$in": []}
+        if params.ids is not None:
+            object_ids = [cls._to_object_id(account_id) for account_id in params.ids]
+            store_filter["_id"] = {"$in": [object_id for object_id in object_ids if object_id is not None]}
         if params.username is not None:
             store_filter["username"] = params.username
         if params.phone_number is not None:
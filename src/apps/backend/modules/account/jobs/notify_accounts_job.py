@@ -0,0 +1,60 @@
+from typing import Any, Iterator
+
+from modules.account.internal.account_notification_fan_out import AccountNotificationFanOut
+from modules.account.internal.account_reader import AccountReader
+from modules.core.common.types import AuditActor
+from modules.core.job import Job
+from modules.notification.notification_service import NotificationService
+
+
+class NotifyAccountsJob(Job):
+    """Streams the ids of every account matching a query in keyset batches and enqueues one
+    NotifyAccountsChunkJob per batch, so delivery spreads across workers. Progress accumulates on this
+    job's own job_run record: `chunks_enqueued` and `accounts` when streaming ends, and each chunk's
+    counts as it completes. The fan-out is finished once `chunks_completed` reaches `chunks_enqueued`."""
+
+    # Announcement content is not needed to trace a run and may carry personal template data.
+    redacted_arguments = frozenset({"content"})
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        fan_out_id: str = kwargs["fan_out_id"]
+        query = AccountNotificationFanOut.decode_query(kwargs["account_query"])
+        # The Job base builds each run's actor from its job_run id.
+        job_run_id = str(actor.actor_id)
+
+        accounts = 0
+
+        def chunk_calls() -> Iterator[dict[str, Any]]:
+            nonlocal accounts
+            for account_ids in AccountReader.iter_account_id_batches(
+                query=query, batch_size=AccountNotificationFanOut.accounts_per_chunk()
+            ):
+                accounts += len(account_ids)
+                yield {
+                    # Keyed by the chunk's first account so a retried fan-out re-enqueues the same deliveries.
+                    "idempotency_key": f"{fan_out_id}:{account_ids[0]}",
+                    "parent_job_run_id": job_run_id,
+                    "account_ids": account_ids,
+                    "content": kwargs["content"],
+                }
+
+        batch = NotifyAccountsChunkJob.perform_many(chunk_calls())
+        Job.increment_progress(job_run_id, {"chunks_enqueued": batch.enqueued, "accounts": accounts}, actor=actor)
+
+
+class NotifyAccountsChunkJob(Job):
+    max_retries = 5
+    retry_backoff_max = 120
+    redacted_arguments = frozenset({"content"})
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        accounts = AccountReader.get_accounts_by_ids(account_ids=kwargs["account_ids"], actor=actor)
+        result = NotificationService.send_bulk_notification(
+            recipients=AccountNotificationFanOut.recipients_for(accounts),
+            content=AccountNotificationFanOut.decode_content(kwargs["content"]),
+            idempotency_key=kwargs["idempotency_key"],
+            actor=actor,
+        )
+        Job.increment_progress(kwargs["parent_job_run_id"], AccountNotificationFanOut.progress_of(result), actor=actor)
@@ -0,0 +1,15 @@
+from aiohttp import web
+
+from modules.account.rest_api.account_async_view import AccountAsyncView, AccountNotificationPreferencesAsyncView
+
+
+class AccountAsyncRouter:
+    @staticmethod
+    def create_routes() -> list[web.RouteDef]:
+        return [
+            web.route("POST", "/accounts", AccountAsyncView),
+            *(web.route(method, "/accounts/{account_id}", AccountAsyncView) for method in ("DELETE", "GET", "PATCH")),
+            web.route(
+                "PATCH", "/accounts/{account_id}/notification-preferences", AccountNotificationPreferencesAsyncView
+            ),
+        ]
@@ -0,0 +1,68 @@
+from dataclasses import asdict
+
+from aiohttp import web
+
+from modules.account.account_service import AccountService
+from modules.account.rest_api.account_view import AccountView
+from modules.authentication.rest_api.async_access_auth_middleware import (
+    REQUEST_ACCOUNT_ID_KEY,
+    async_access_auth_middleware,
+    enforce_async_account_ownership,
+)
+from modules.core.async_web_app import AsyncWebApp
+from modules.core.blocking_call_executor import BlockingCallExecutor
+from modules.core.common.types import ActorType, AuditActor
+
+
+class AccountAsyncView(web.View):
+    """The account API for the async serving mode: same routes, validation and responses as AccountView,
+    whose helpers run on the BlockingCallExecutor, one hop per request."""
+
+    async def post(self) -> web.StreamResponse:
+        request_data = AccountView.request_body_object(await AsyncWebApp.read_json(self.request))
+        account = await BlockingCallExecutor.run(
+            AccountView.create_account, request_data, AsyncWebApp.client_ip(self.request)
+        )
+        return AsyncWebApp.json_response(asdict(account), status=201)
+
+    @async_access_auth_middleware
+    async def get(self) -> web.StreamResponse:
+        include_notification_preferences = (
+            self.request.query.get("include_notification_preferences", "").lower() == "true"
+        )
+        account_dict = await BlockingCallExecutor.run(
+            AccountView.get_account_dict,
+            self.request.match_info["account_id"],
+            include_notification_preferences=include_notification_preferences,
+        )
+        return AsyncWebApp.json_response(account_dict)
+
+    async def patch(self) -> web.StreamResponse:
+        account_id = self.request.match_info["account_id"]
+        request_data = AccountView.request_body_object(await AsyncWebApp.read_json(self.request))
+        if AccountView.is_profile_update(request_data):
+            await enforce_async_account_ownership(self.request, account_id)
+        account = await BlockingCallExecutor.run(AccountView.update_account, account_id, request_data)
+        return AsyncWebApp.json_response(asdict(account))
+
+    @async_access_auth_middleware
+    async def delete(self) -> web.StreamResponse:
+        await BlockingCallExecutor.run(
+            AccountService.delete_account,
+            account_id=self.request.match_info["account_id"],
+            actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=self.request[REQUEST_ACCOUNT_ID_KEY]),
+        )
+        return web.Response(status=204)
+
+
+class AccountNotificationPreferencesAsyncView(web.View):
+    @async_access_auth_middleware
+    async def patch(self) -> web.StreamResponse:
+        request_data = AccountView.request_body_object(await AsyncWebApp.read_json(self.request))
+        updated_preferences = await BlockingCallExecutor.run(
+            AccountView.update_notification_preferences,
+            self.request.match_info["account_id"],
+            request_data,
+            caller_account_id=self.request[REQUEST_ACCOUNT_ID_KEY],
+        )
+        return AsyncWebApp.json_response(asdict(updated_preferences))
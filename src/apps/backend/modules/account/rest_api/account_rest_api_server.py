@@ -1,5 +1,7 @@
+from aiohttp import web
 from flask import Blueprint
 
+from modules.account.rest_api.account_async_router import AccountAsyncRouter
 from modules.account.rest_api.account_router import AccountRouter
 
 
@@ -8,3 +10,7 @@ class AccountRestApiServer:
     def create() -> Blueprint:
         account_api_blueprint = Blueprint("account", __name__)
         return AccountRouter.create_route(blueprint=account_api_blueprint)
+
+    @staticmethod
+    def create_async() -> list[web.RouteDef]:
+        return AccountAsyncRouter.create_routes()
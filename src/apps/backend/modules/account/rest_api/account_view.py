@@ -1,5 +1,5 @@
 from dataclasses import asdict
-from typing import Any
+from typing import Any, Optional
 
 from flask import jsonify, request
 from flask.typing import ResponseReturnValue
@@ -8,6 +8,7 @@ from flask.views import MethodView
 from modules.account.account_service import AccountService
 from modules.account.errors import AccountBadRequestError
 from modules.account.types import (
+    Account,
     AccountSearchByIdParams,
     CreateAccountByPhoneNumberParams,
     CreateAccountByUsernameAndPasswordParams,
@@ -17,48 +18,63 @@ from modules.account.types import (
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware, enforce_account_ownership
 from modules.core.common.types import ActorType, AuditActor
 from modules.notification.errors import AccountNotificationPreferencesNotFoundError
-from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
+from modules.notification.types import (
+    AccountNotificationPreferences,
+    CreateOrUpdateAccountNotificationPreferencesParams,
+)
+from modules.rate_limit.rate_limit_service import RateLimitService
+from modules.rate_limit.types import RateLimitScope
 
 ANONYMOUS_ACTOR = AuditActor(actor_type=ActorType.ANONYMOUS, actor_id=None)
 
 
 class AccountView(MethodView):
+    # The static helpers below take plain values rather than the Flask request, so AccountAsyncView shares
+    # the validation and service calls; each runs the blocking calls of one request.
+
     @staticmethod
     def _get_request_body_as_object() -> dict[str, Any]:
-        request_data = request.get_json()
+        return AccountView.request_body_object(request.get_json())
+
+    @staticmethod
+    def request_body_object(request_data: Any) -> dict[str, Any]:
         if not isinstance(request_data, dict):
             raise AccountBadRequestError("Request body must be a JSON object")
         return request_data
 
-    def post(self) -> ResponseReturnValue:
-        request_data = self._get_request_body_as_object()
-
+    @staticmethod
+    def create_account(request_data: dict[str, Any], client_ip: Optional[str]) -> Account:
         if "phone_number" in request_data:
-            account = AccountService.get_or_create_account_by_phone_number(
-                params=CreateAccountByPhoneNumberParams.from_dict(request_data), actor=ANONYMOUS_ACTOR
+            phone_number_params = CreateAccountByPhoneNumberParams.from_dict(request_data)
+            # Every accepted request sends an SMS, so the limit is what caps the Twilio bill under abuse.
+            RateLimitService.enforce(
+                route="otp_request",
+                identifiers={
+                    RateLimitScope.IP: client_ip,
+                    RateLimitScope.PHONE_NUMBER: str(phone_number_params.phone_number),
+                },
             )
-
-        elif "password" in request_data and "username" in request_data:
-            account = AccountService.create_account_by_username_and_password(
-                params=CreateAccountByUsernameAndPasswordParams.from_dict(request_data), actor=ANONYMOUS_ACTOR
+            return AccountService.get_or_create_account_by_phone_number(
+                params=phone_number_params, actor=ANONYMOUS_ACTOR
             )
 
-        else:
-            raise AccountBadRequestError(
-                "Request body must contain either a phone_number object or username and password fields"
+        if "password" in request_data and "username" in request_data:
+            RateLimitService.enforce(route="signup", identifiers={RateLimitScope.IP: client_ip})
+            return AccountService.create_account_by_username_and_password(
+                params=CreateAccountByUsernameAndPasswordParams.from_dict(request_data), actor=ANONYMOUS_ACTOR
             )
 
-        return jsonify(asdict(account)), 201
+        raise AccountBadRequestError(
+            "Request body must contain either a phone_number object or username and password fields"
+        )
 
-    @access_auth_middleware
-    def get(self, account_id: str) -> ResponseReturnValue:
+    @staticmethod
+    def get_account_dict(account_id: str, *, include_notification_preferences: bool) -> dict[str, Any]:
         actor = AuditActor(actor_type=ActorType.ACCOUNT, actor_id=account_id)
         account_params = AccountSearchByIdParams(id=account_id)
         account = AccountService.get_account_by_id(params=account_params, actor=actor)
         account_dict = asdict(account)
 
-        include_notification_preferences = request.args.get("include_notification_preferences", "").lower() == "true"
-
         if include_notification_preferences:
             try:
                 notification_preferences = AccountService.get_account_notification_preferences_by_account_id(
@@ -68,48 +84,46 @@ class AccountView(MethodView):
             except AccountNotificationPreferencesNotFoundError:
                 pass
 
-        return jsonify(account_dict), 200
+        return account_dict
 
-    def patch(self, account_id: str) -> ResponseReturnValue:
-        request_data = self._get_request_body_as_object()
+    @staticmethod
+    def is_password_reset(request_data: dict[str, Any]) -> bool:
+        return "token" in request_data and "new_password" in request_data
+
+    @staticmethod
+    def is_profile_update(request_data: dict[str, Any]) -> bool:
+        # A profile update needs the caller to own the account; a password reset is proven by its token.
+        return not AccountView.is_password_reset(request_data) and (
+            "first_name" in request_data or "last_name" in request_data
+        )
 
-        if "token" in request_data and "new_password" in request_data:
+    @staticmethod
+    def update_account(account_id: str, request_data: dict[str, Any]) -> Account:
+        # For a profile update, the caller's ownership of account_id has been enforced already.
+        if AccountView.is_password_reset(request_data):
             reset_account_params = ResetPasswordParams(
                 account_id=account_id, new_password=request_data["new_password"], token=request_data["token"]
             )
-            account = AccountService.reset_account_password(
+            return AccountService.reset_account_password(
                 params=reset_account_params, actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=account_id)
             )
 
-        elif "first_name" in request_data or "last_name" in request_data:
-            enforce_account_ownership(account_id)
+        if AccountView.is_profile_update(request_data):
             update_profile_params = UpdateAccountProfileParams(
                 first_name=request_data.get("first_name"), last_name=request_data.get("last_name")
             )
-            account = AccountService.update_account_profile(
+            return AccountService.update_account_profile(
                 account_id=account_id,
-                actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=getattr(request, "account_id")),
+                actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=account_id),
                 params=update_profile_params,
             )
 
-        else:
-            raise AccountBadRequestError("Invalid request data")
-
-        return jsonify(asdict(account)), 200
-
-    @access_auth_middleware
-    def delete(self, account_id: str) -> ResponseReturnValue:
-        AccountService.delete_account(
-            account_id=account_id,
-            actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=getattr(request, "account_id")),
-        )
-        return "", 204
+        raise AccountBadRequestError("Invalid request data")
 
     @staticmethod
-    @access_auth_middleware
-    def update_account_notification_preferences(account_id: str) -> ResponseReturnValue:
-        request_data = AccountView._get_request_body_as_object()
-
+    def update_notification_preferences(
+        account_id: str, request_data: dict[str, Any], *, caller_account_id: str
+    ) -> AccountNotificationPreferences:
         for field in ["email_enabled", "push_enabled", "sms_enabled"]:
             if field in request_data and not isinstance(request_data[field], bool):
                 raise AccountBadRequestError(f"{field} must be a boolean")
@@ -132,10 +146,43 @@ class AccountView(MethodView):
 
         preferences_params = CreateOrUpdateAccountNotificationPreferencesParams(**preferences_kwargs)
 
-        updated_preferences = AccountService.create_or_update_account_notification_preferences(
+        return AccountService.create_or_update_account_notification_preferences(
             account_id=account_id,
-            actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=getattr(request, "account_id")),
+            actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=caller_account_id),
             preferences=preferences_params,
         )
 
+    def post(self) -> ResponseReturnValue:
+        account = self.create_account(self._get_request_body_as_object(), request.remote_addr)
+        return jsonify(asdict(account)), 201
+
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        include_notification_preferences = request.args.get("include_notification_preferences", "").lower() == "true"
+        account_dict = self.get_account_dict(
+            account_id, include_notification_preferences=include_notification_preferences
+        )
+        return jsonify(account_dict), 200
+
+    def patch(self, account_id: str) -> ResponseReturnValue:
+        request_data = self._get_request_body_as_object()
+        if self.is_profile_update(request_data):
+            enforce_account_ownership(account_id)
+        account = self.update_account(account_id, request_data)
+        return jsonify(asdict(account)), 200
+
+    @access_auth_middleware
+    def delete(self, account_id: str) -> ResponseReturnValue:
+        AccountService.delete_account(
+            account_id=account_id,
+            actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=getattr(request, "account_id")),
+        )
+        return "", 204
+
+    @staticmethod
+    @access_auth_middleware
+    def update_account_notification_preferences(account_id: str) -> ResponseReturnValue:
+        updated_preferences = AccountView.update_notification_preferences(
+            account_id, AccountView._get_request_body_as_object(), caller_account_id=getattr(request, "account_id")
+        )
         return jsonify(asdict(updated_preferences)), 200
@@ -96,6 +96,7 @@ class Account:
 @dataclass(frozen=True)
 class AccountQuery(QueryParams):
     id: Optional[str] = None
+    ids: Optional[tuple[str, ...]] = None
     username: Optional[str] = None
     phone_number: Optional[PhoneNumber] = None
     # Accounts are soft-deleted via `active`; reads default to active records only.
@@ -123,6 +124,7 @@ class AccountErrorCode:
     USERNAME_ALREADY_EXISTS: str = "ACCOUNT_ERR_01"
     BAD_REQUEST: str = "ACCOUNT_ERR_04"
     PHONE_NUMBER_ALREADY_EXISTS: str = "ACCOUNT_ERR_05"
+    PASSWORD_HASHING_UNAVAILABLE: str = "ACCOUNT_ERR_06"
 
 
 @dataclass(frozen=True)
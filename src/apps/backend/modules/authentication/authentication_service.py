@@ -1,5 +1,6 @@
 import urllib.parse
 from dataclasses import asdict
+from datetime import UTC, datetime, timedelta
 
 from modules.account.types import Account, PhoneNumber
 from modules.authentication.internal.access_token.access_token_util import AccessTokenUtil
@@ -13,12 +14,15 @@ from modules.authentication.types import (
     AccessToken,
     AccessTokenPayload,
     CreateOTPParams,
+    CredentialPruningConfig,
+    MailerConfig,
     OTPBasedAuthAccessTokenRequestParams,
     PasswordResetToken,
+    PrunedCredentials,
     VerifyOTPParams,
 )
 from modules.config.config_service import ConfigService
-from modules.core.common.types import AuditActor
+from modules.core.common.types import AuditActor, CacheStats
 from modules.notification.email_service import EmailService
 from modules.notification.sms_service import SMSService
 from modules.notification.types import EmailRecipient, EmailSender, SendEmailParams, SendSMSParams
@@ -50,6 +54,10 @@ class AuthenticationService:
     def verify_access_token(*, token: str) -> AccessTokenPayload:
         return AccessTokenUtil.verify_access_token(token=token)
 
+    @staticmethod
+    def get_verified_token_cache_stats() -> CacheStats:
+        return AccessTokenUtil.get_verified_token_cache_stats()
+
     @staticmethod
     def create_password_reset_token(params: Account, *, actor: AuditActor) -> PasswordResetToken:
         token = PasswordResetTokenUtil.generate_password_reset_token()
@@ -81,21 +89,18 @@ class AuthenticationService:
     def send_password_reset_email(
         account_id: str, first_name: str, username: str, password_reset_token: str, *, actor: AuditActor
     ) -> None:
-        web_app_host = ConfigService[str].get_value(key="web_app_host")
-        default_email = ConfigService[str].get_value(key="mailer.default_email")
-        default_email_name = ConfigService[str].get_value(key="mailer.default_email_name")
-        forgot_password_mail_template_id = ConfigService[str].get_value(key="mailer.forgot_password_mail_template_id")
+        mailer_config = ConfigService.get_section(MailerConfig)
 
         template_data = {
             "first_name": first_name,
-            "password_reset_link": f"{web_app_host}/accounts/{account_id}/reset_password?token={urllib.parse.quote(password_reset_token)}",
+            "password_reset_link": f"{mailer_config.web_app_host}/accounts/{account_id}/reset_password?token={urllib.parse.quote(password_reset_token)}",
             "username": username,
         }
 
         password_reset_email_params = SendEmailParams(
-            template_id=forgot_password_mail_template_id,
+            template_id=mailer_config.forgot_password_mail_template_id,
             recipient=EmailRecipient(email=username),
-            sender=EmailSender(email=default_email, name=default_email_name),
+            sender=EmailSender(email=mailer_config.default_email, name=mailer_config.default_email_name),
             template_data=template_data,
         )
 
@@ -122,3 +127,21 @@ class AuthenticationService:
     @staticmethod
     def verify_otp(*, params: VerifyOTPParams, account_id: str, actor: AuditActor) -> OTP:
         return OTPWriter.verify_otp(params=params, actor=actor)
+
+    @staticmethod
+    def prune_expired_credentials(*, actor: AuditActor) -> PrunedCredentials:
+        config = ConfigService.get_section(CredentialPruningConfig)
+        otps = OTPWriter.delete_otps_created_before(
+            datetime.now(UTC) - timedelta(hours=config.otp_retention_hours),
+            batch_size=config.batch_size,
+            max_batches=config.max_batches_per_run,
+            actor=actor,
+        )
+        # Reset token expiry is written as a naive local time (see PasswordResetTokenUtil), so the cutoff is too.
+        password_reset_tokens = PasswordResetTokenWriter.delete_password_reset_tokens_expired_before(
+            datetime.now() - timedelta(hours=config.password_reset_token_retention_hours),
+            batch_size=config.batch_size,
+            max_batches=config.max_batches_per_run,
+            actor=actor,
+        )
+        return PrunedCredentials(otps=otps, password_reset_tokens=password_reset_tokens)
@@ -1,6 +1,9 @@
+import hashlib
 import os
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 import jwt
 
@@ -11,29 +14,43 @@ from modules.authentication.errors import (
     AccessTokenSigningKeyInsecureError,
     OTPIncorrectError,
 )
-from modules.authentication.types import OTP, AccessToken, AccessTokenPayload, OTPStatus
+from modules.authentication.types import OTP, AccessToken, AccessTokenPayload, OTPStatus, TokenConfig
 from modules.config.config_service import ConfigService
+from modules.core.common.types import CacheStats
+from modules.core.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True)
+class _TokenVerificationState:
+    # Everything verification needs from config, resolved together so a config reload (tests swap the
+    # config manager) yields a fresh signing key and an empty cache: a payload verified under one key must
+    # never be served under another.
+    config_source: object
+    signing_key: str
+    verified_tokens: TTLCache[bytes, AccessTokenPayload]
 
 
 class AccessTokenUtil:
-    SIGNING_KEY_CONFIG_KEY: ClassVar[str] = "accounts.token_signing_key"
+    VERIFIED_TOKEN_CACHE_CONFIG_KEY: ClassVar[str] = "accounts.verified_token_cache"
     LOCAL_APP_ENVS: ClassVar[frozenset[str]] = frozenset({"development", "testing"})
     INSECURE_SIGNING_KEYS: ClassVar[frozenset[str]] = frozenset({"", "JWT_TOKEN"})
 
+    _verification_state: ClassVar[Optional[_TokenVerificationState]] = None
+
     @staticmethod
     def validate_signing_key() -> None:
         app_env = os.environ.get("APP_ENV", "development")
         if app_env in AccessTokenUtil.LOCAL_APP_ENVS:
             return
 
-        signing_key = ConfigService[str].get_value(key=AccessTokenUtil.SIGNING_KEY_CONFIG_KEY, default="")
+        signing_key = ConfigService.get_section(TokenConfig).token_signing_key
         if signing_key.strip() in AccessTokenUtil.INSECURE_SIGNING_KEYS:
             raise AccessTokenSigningKeyInsecureError()
 
     @staticmethod
     def generate_access_token(*, account: Account) -> AccessToken:
-        jwt_signing_key = ConfigService[str].get_value(key=AccessTokenUtil.SIGNING_KEY_CONFIG_KEY)
-        jwt_expiry = timedelta(days=ConfigService[int].get_value(key="accounts.token_expiry_days"))
+        jwt_signing_key = AccessTokenUtil._get_verification_state().signing_key
+        jwt_expiry = timedelta(days=ConfigService.get_section(TokenConfig).token_expiry_days)
         expiry_time = datetime.now() + jwt_expiry
 
         payload = {"account_id": account.id, "exp": expiry_time.timestamp()}
@@ -43,10 +60,16 @@ class AccessTokenUtil:
 
     @staticmethod
     def verify_access_token(*, token: str) -> AccessTokenPayload:
-        jwt_signing_key = ConfigService[str].get_value(key=AccessTokenUtil.SIGNING_KEY_CONFIG_KEY)
+        state = AccessTokenUtil._get_verification_state()
+        # Keyed by digest so the cache never holds usable bearer tokens. Only successful verifications are
+        # stored: an invalid or expired token always takes the full decode path and raises.
+        token_digest = hashlib.sha256(token.encode()).digest()
+        cached_payload = state.verified_tokens.get(token_digest)
+        if cached_payload is not None:
+            return cached_payload
 
         try:
-            verified_token = jwt.decode(token, jwt_signing_key, algorithms=["HS256"])
+            verified_token = jwt.decode(token, state.signing_key, algorithms=["HS256"])
         except jwt.exceptions.DecodeError:
             raise AccessTokenInvalidError("Invalid access token")
         except jwt.ExpiredSignatureError:
@@ -56,9 +79,43 @@ class AccessTokenUtil:
         if not account_id or not isinstance(account_id, str):
             raise AccessTokenInvalidError("Invalid access token payload")
 
-        return AccessTokenPayload(account_id=account_id)
+        payload = AccessTokenPayload(account_id=account_id)
+        expires_at = verified_token.get("exp")
+        # Capped at `exp`, so a cached payload is never served after the token itself has expired.
+        ttl_seconds = expires_at - time.time() if isinstance(expires_at, (int, float)) else None
+        state.verified_tokens.set(token_digest, payload, ttl_seconds=ttl_seconds)
+        return payload
+
+    @staticmethod
+    def get_verified_token_cache_stats() -> CacheStats:
+        return AccessTokenUtil._get_verification_state().verified_tokens.stats()
+
+    @staticmethod
+    def _get_verification_state() -> _TokenVerificationState:
+        config_source = ConfigService.config_manager
+        state = AccessTokenUtil._verification_state
+        if state is None or state.config_source is not config_source:
+            cache_config_key = AccessTokenUtil.VERIFIED_TOKEN_CACHE_CONFIG_KEY
+            state = _TokenVerificationState(
+                config_source=config_source,
+                signing_key=ConfigService.get_section(TokenConfig).token_signing_key,
+                verified_tokens=TTLCache(
+                    max_entries=ConfigService.get_int(key=f"{cache_config_key}.max_entries", default=0),
+                    ttl_seconds=ConfigService.get_int(key=f"{cache_config_key}.ttl_seconds", default=0),
+                ),
+            )
+            AccessTokenUtil._verification_state = state
+        return state
+
+    @staticmethod
+    def _reset_after_fork() -> None:
+        # Each forked worker starts with its own empty cache (and unheld cache lock) instead of the parent's.
+        AccessTokenUtil._verification_state = None
 
     @staticmethod
     def validate_otp_for_access_token(*, otp: OTP) -> None:
         if otp.status != OTPStatus.SUCCESS:
             raise OTPIncorrectError()
+
+
+os.register_at_fork(after_in_child=AccessTokenUtil._reset_after_fork)
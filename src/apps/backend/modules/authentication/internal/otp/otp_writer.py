@@ -1,9 +1,10 @@
 from dataclasses import asdict
+from datetime import datetime
 
 from modules.account.types import PhoneNumber
 from modules.authentication.errors import OTPExpiredError, OTPIncorrectError
 from modules.authentication.internal.otp.otp_util import OTPUtil
-from modules.authentication.internal.otp.store.otp_repository import OTPRepository
+from modules.authentication.internal.otp.store.otp_repository import OTP_NEWEST_FIRST, OTPRepository
 from modules.authentication.types import OTP, CreateOTPParams, OTPQuery, OTPStatus, VerifyOTPParams
 from modules.core.common.types import AuditActor
 
@@ -25,19 +26,26 @@ class OTPWriter:
 
     @staticmethod
     def verify_otp(*, params: VerifyOTPParams, actor: AuditActor) -> OTP:
-        # Newest first, so a stale code resolves to the most recent attempt; matches the previous _id sort.
-        otp = OTPRepository.query_one(
-            OTPQuery(otp_code=params.otp_code, phone_number=params.phone_number), actor=actor, sort=[("_id", -1)]
+        # Match and consume in one write, so two requests racing with the same code cannot both succeed.
+        consumed_otp = OTPRepository.update_by_query(
+            OTPQuery(otp_code=params.otp_code, phone_number=params.phone_number, active=True),
+            {"active": False, "status": str(OTPStatus.SUCCESS)},
+            actor=actor,
+            sort=OTP_NEWEST_FIRST,
         )
-        if otp is None:
-            raise OTPIncorrectError()
+        if consumed_otp is not None:
+            return consumed_otp
 
-        # A correct-but-already-consumed code is "expired", distinct from an incorrect code above.
-        if not otp.active:
+        # A correct-but-already-consumed or superseded code is "expired", distinct from an incorrect code.
+        spent_otp = OTPRepository.query_one(
+            OTPQuery(otp_code=params.otp_code, phone_number=params.phone_number, active=False), actor=actor
+        )
+        if spent_otp is not None:
             raise OTPExpiredError()
+        raise OTPIncorrectError()
 
-        updated_otp = OTPRepository.update(otp.id, {"active": False, "status": str(OTPStatus.SUCCESS)}, actor=actor)
-        # update() returns None only if the row vanished between the read and the patch; the read above
-        # found it, so it is present here.
-        assert updated_otp is not None
-        return updated_otp
+    @staticmethod
+    def delete_otps_created_before(cutoff: datetime, *, batch_size: int, max_batches: int, actor: AuditActor) -> int:
+        return OTPRepository.delete_by_query(
+            OTPQuery(created_before=cutoff), batch_size=batch_size, max_batches=max_batches, actor=actor
+        )
@@ -1,9 +1,10 @@
+from pymongo import ASCENDING, DESCENDING
 from pymongo.collection import Collection
 from pymongo.errors import OperationFailure
 
 from modules.authentication.internal.otp.store.otp_model import OTPDocument, OTPModel
 from modules.authentication.types import OTP, OTPQuery
-from modules.core.repository import ApplicationRepository, StoredDocument, StoreFilter
+from modules.core.repository import ApplicationRepository, SortSpec, StoredDocument, StoreFilter
 from modules.logger.logger import Logger
 
 OTP_VALIDATION_SCHEMA = {
@@ -30,14 +31,23 @@ OTP_VALIDATION_SCHEMA = {
     }
 }
 
+# Newest first. A number's OTPs are read and consumed in this order, always with its phone_number and active
+# flag pinned, so the phone_number_active_id_index serves the filter and the sort without an in-memory sort.
+OTP_NEWEST_FIRST: SortSpec = [("_id", DESCENDING)]
+
 
 class OTPRepository(ApplicationRepository[OTP, OTPQuery]):
     collection_name = OTPModel.get_collection_name()
 
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
-
-        collection.create_index("phone_number")
+        collection.create_index(
+            [("phone_number", ASCENDING), ("active", ASCENDING), *OTP_NEWEST_FIRST], name="phone_number_active_id_index"
+        )
+        if "phone_number_1" in collection.index_information():
+            # A prefix of phone_number_active_id_index, so it only costs writes.
+            collection.drop_index("phone_number_1")
+        collection.create_index("created_at")
         add_validation_command = {
             "collMod": cls.collection_name,
             "validator": OTP_VALIDATION_SCHEMA,
@@ -89,4 +99,6 @@ class OTPRepository(ApplicationRepository[OTP, OTPQuery]):
             }
         if params.active is not None:
             store_filter["active"] = params.active
+        if params.created_before is not None:
+            store_filter["created_at"] = {"$lt": params.created_before}
         return store_filter
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 
 import bcrypt
 
+from modules.authentication.types import TokenConfig
 from modules.config.config_service import ConfigService
 
 
@@ -27,8 +28,8 @@ class PasswordResetTokenUtil:
 
     @staticmethod
     def get_token_expires_at() -> datetime:
-        default_token_expire_time_in_seconds = ConfigService[int].get_value(key="accounts.token_expires_in_seconds")
-        return datetime.now() + timedelta(seconds=default_token_expire_time_in_seconds)
+        token_config = ConfigService.get_section(TokenConfig)
+        return datetime.now() + timedelta(seconds=token_config.token_expires_in_seconds)
 
     @staticmethod
     def is_token_expired(expires_at: datetime) -> bool:
@@ -1,9 +1,11 @@
+from datetime import datetime
+
 from modules.authentication.errors import PasswordResetTokenNotFoundError
 from modules.authentication.internal.password_reset_token.password_reset_token_util import PasswordResetTokenUtil
 from modules.authentication.internal.password_reset_token.store.password_reset_token_repository import (
     PasswordResetTokenRepository,
 )
-from modules.authentication.types import PasswordResetToken
+from modules.authentication.types import PasswordResetToken, PasswordResetTokenQuery
 from modules.core.common.types import AuditActor
 
 
@@ -24,3 +26,11 @@ class PasswordResetTokenWriter:
             raise PasswordResetTokenNotFoundError()
 
         return updated_token
+
+    @staticmethod
+    def delete_password_reset_tokens_expired_before(
+        cutoff: datetime, *, batch_size: int, max_batches: int, actor: AuditActor
+    ) -> int:
+        return PasswordResetTokenRepository.delete_by_query(
+            PasswordResetTokenQuery(expired_before=cutoff), batch_size=batch_size, max_batches=max_batches, actor=actor
+        )
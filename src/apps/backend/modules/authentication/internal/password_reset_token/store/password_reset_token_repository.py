@@ -38,6 +38,7 @@ class PasswordResetTokenRepository(ApplicationRepository[PasswordResetToken, Pas
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
         collection.create_index("token")
+        collection.create_index("expires_at")
         add_validation_command = {
             "collMod": cls.collection_name,
             "validator": PASSWORD_RESET_TOKEN_VALIDATION_SCHEMA,
@@ -74,6 +75,8 @@ class PasswordResetTokenRepository(ApplicationRepository[PasswordResetToken, Pas
         if params.account_id is not None:
             # The account reference is stored as an ObjectId, so the domain account id is converted here.
             store_filter["account"] = ObjectId(params.account_id)
+        if params.expired_before is not None:
+            store_filter["expires_at"] = {"$lt": params.expired_before}
         return store_filter
 
     @classmethod
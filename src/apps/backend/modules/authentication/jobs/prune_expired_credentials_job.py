@@ -0,0 +1,34 @@
+from typing import Any
+
+from modules.authentication.authentication_service import AuthenticationService
+from modules.core.common.types import AuditActor
+from modules.core.job import Job
+from modules.logger.logger import Logger
+
+
+class PruneExpiredCredentialsJob(Job):
+    """Deletes OTPs and password reset tokens past their retention (accounts.credential_pruning), a bounded
+    number of batches per run, so neither collection keeps every credential ever issued. The counts land on
+    the run's job_run record as `otps_deleted` and `password_reset_tokens_deleted`."""
+
+    queue = "low"
+    cron_schedule = "23 * * * *"
+    # Two overlapping runs would only race each other for the same oldest documents.
+    max_concurrency = 1
+    unique_key = ()
+    dedupe_window = 300
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        pruned = AuthenticationService.prune_expired_credentials(actor=actor)
+        Job.increment_progress(
+            str(actor.actor_id),
+            {"otps_deleted": pruned.otps, "password_reset_tokens_deleted": pruned.password_reset_tokens},
+            actor=actor,
+        )
+        Logger.info(
+            message=(
+                f"[authentication.credential_pruning] otps_deleted={pruned.otps} "
+                f"password_reset_tokens_deleted={pruned.password_reset_tokens}"
+            )
+        )
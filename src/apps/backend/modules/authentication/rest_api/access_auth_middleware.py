@@ -1,5 +1,5 @@
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from flask import request
 
@@ -10,16 +10,19 @@ from modules.authentication.errors import (
     UnauthorizedAccessError,
 )
 from modules.authentication.types import AccessTokenPayload
+from modules.config.config_service import ConfigService
 from modules.core.audit_service import AuditService
 from modules.core.common.types import ActorType, AuditActor, AuditOutcome, ResourceAction
 
 # The account boundary is the only resource the middleware can name for every route without importing
 # each module's collection: a denied attempt is recorded against the owner boundary the caller crossed.
 DENIED_RESOURCE_TYPE = "accounts"
+# Operator routes (job runs and the like) belong to no account; a denied attempt is recorded against the path.
+DENIED_OPERATOR_RESOURCE_TYPE = "operator_routes"
 
 
-def verify_request_access_token() -> AccessTokenPayload:
-    authorization_header = request.headers.get("Authorization")
+def verify_authorization_header(authorization_header: Optional[str]) -> AccessTokenPayload:
+    # Shared by the Flask and the async views: everything here is in memory (JWT check, token cache).
     if not authorization_header:
         raise AuthorizationHeaderNotFoundError("Authorization header is missing.")
 
@@ -27,13 +30,20 @@ def verify_request_access_token() -> AccessTokenPayload:
     if len(authorization_parts) != 2 or authorization_parts[0] != "Bearer" or not authorization_parts[1]:
         raise InvalidAuthorizationHeaderError("Invalid authorization header.")
 
-    access_token_payload = AuthenticationService.verify_access_token(token=authorization_parts[1])
+    return AuthenticationService.verify_access_token(token=authorization_parts[1])
+
+
+def verify_request_access_token() -> AccessTokenPayload:
+    access_token_payload = verify_authorization_header(request.headers.get("Authorization"))
     setattr(request, "account_id", access_token_payload.account_id)
     return access_token_payload
 
 
 def enforce_account_ownership(account_id: str) -> None:
-    access_token_payload = verify_request_access_token()
+    enforce_account_ownership_of(verify_request_access_token(), account_id)
+
+
+def enforce_account_ownership_of(access_token_payload: AccessTokenPayload, account_id: str) -> None:
     if access_token_payload.account_id != account_id:
         AuditService.record_audit(
             actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=access_token_payload.account_id),
@@ -56,3 +66,25 @@ def access_auth_middleware(next_function: Callable[..., Any]) -> Callable[..., A
         return next_function(*args, **kwargs)
 
     return wrapper
+
+
+def operator_auth_middleware(next_function: Callable[..., Any]) -> Callable[..., Any]:
+    # For routes that expose system-wide state rather than one account's data: the caller must hold a valid
+    # access token and be listed in web.operator_account_ids.
+    @wraps(next_function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        access_token_payload = verify_request_access_token()
+        operator_account_ids = ConfigService.get_list(key="web.operator_account_ids", default=[])
+        if access_token_payload.account_id not in operator_account_ids:
+            AuditService.record_audit(
+                actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=access_token_payload.account_id),
+                resource_type=DENIED_OPERATOR_RESOURCE_TYPE,
+                resource_id=request.path,
+                action=ResourceAction.READ,
+                outcome=AuditOutcome.DENIED,
+            )
+            raise UnauthorizedAccessError("Unauthorized access.")
+
+        return next_function(*args, **kwargs)
+
+    return wrapper
@@ -13,6 +13,8 @@ from modules.authentication.types import (
     OTPBasedAuthAccessTokenRequestParams,
 )
 from modules.core.common.types import ActorType, AuditActor
+from modules.rate_limit.rate_limit_service import RateLimitService
+from modules.rate_limit.types import RateLimitScope
 
 ANONYMOUS_ACTOR = AuditActor(actor_type=ActorType.ANONYMOUS, actor_id=None)
 
@@ -27,6 +29,13 @@ class AccessTokenView(MethodView):
             access_token_params = OTPBasedAuthAccessTokenRequestParams(
                 otp_code=request_data["otp_code"], phone_number=phone_number_obj
             )
+            RateLimitService.enforce(
+                route="otp_login",
+                identifiers={
+                    RateLimitScope.IP: request.remote_addr,
+                    RateLimitScope.PHONE_NUMBER: str(phone_number_obj),
+                },
+            )
             account = AccountService.get_account_by_phone_number(
                 phone_number=access_token_params.phone_number, actor=ANONYMOUS_ACTOR
             )
@@ -35,6 +44,13 @@ class AccessTokenView(MethodView):
             )
         elif "username" in request_data and "password" in request_data:
             access_token_params = EmailBasedAuthAccessTokenRequestParams.from_dict(request_data)
+            RateLimitService.enforce(
+                route="login",
+                identifiers={
+                    RateLimitScope.IP: request.remote_addr,
+                    RateLimitScope.USERNAME: access_token_params.username,
+                },
+            )
             account = AccountService.get_account_by_username_and_password(
                 params=AccountSearchParams(
                     username=access_token_params.username, password=access_token_params.password
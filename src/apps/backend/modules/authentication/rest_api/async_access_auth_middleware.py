@@ -0,0 +1,44 @@
+from functools import wraps
+from typing import Awaitable, Callable
+
+from aiohttp import web
+
+from modules.authentication.rest_api.access_auth_middleware import (
+    enforce_account_ownership_of,
+    verify_authorization_header,
+)
+from modules.authentication.types import AccessTokenPayload
+from modules.core.blocking_call_executor import BlockingCallExecutor
+
+# Key under which the authenticated caller's account id is stored on the aiohttp request, the counterpart
+# of the `account_id` attribute the Flask middleware sets.
+REQUEST_ACCOUNT_ID_KEY = "account_id"
+
+
+def verify_async_request_access_token(request: web.Request) -> AccessTokenPayload:
+    access_token_payload = verify_authorization_header(request.headers.get("Authorization"))
+    request[REQUEST_ACCOUNT_ID_KEY] = access_token_payload.account_id
+    return access_token_payload
+
+
+async def enforce_async_account_ownership(request: web.Request, account_id: str) -> None:
+    access_token_payload = verify_async_request_access_token(request)
+    if access_token_payload.account_id != account_id:
+        # Records the denied attempt (a Mongo write) and raises.
+        await BlockingCallExecutor.run(enforce_account_ownership_of, access_token_payload, account_id)
+
+
+def async_access_auth_middleware[
+    ViewT: web.View
+](next_function: Callable[[ViewT], Awaitable[web.StreamResponse]]) -> Callable[[ViewT], Awaitable[web.StreamResponse]]:
+    @wraps(next_function)
+    async def wrapper(view: ViewT) -> web.StreamResponse:
+        account_id = view.request.match_info.get("account_id")
+        if account_id is not None:
+            await enforce_async_account_ownership(view.request, account_id)
+        else:
+            verify_async_request_access_token(view.request)
+
+        return await next_function(view)
+
+    return wrapper
@@ -2,12 +2,18 @@ from flask import Blueprint
 
 from modules.authentication.rest_api.access_token_view import AccessTokenView
 from modules.authentication.rest_api.password_reset_token_view import PasswordResetTokenView
+from modules.authentication.rest_api.verified_token_cache_view import VerifiedTokenCacheView
 
 
 class AuthenticationRouter:
     @staticmethod
     def create_route(*, blueprint: Blueprint) -> Blueprint:
         blueprint.add_url_rule("/access-tokens", view_func=AccessTokenView.as_view("access_token_view"))
+        blueprint.add_url_rule(
+            "/access-tokens/verification-cache",
+            view_func=VerifiedTokenCacheView.as_view("verified_token_cache_view"),
+            methods=["GET"],
+        )
         blueprint.add_url_rule(
             "/password-reset-tokens", view_func=PasswordResetTokenView.as_view("password_reset_token_view")
         )
@@ -8,6 +8,8 @@ from modules.account.account_service import AccountService
 from modules.authentication.authentication_service import AuthenticationService
 from modules.authentication.types import CreatePasswordResetTokenParams
 from modules.core.common.types import ActorType, AuditActor
+from modules.rate_limit.rate_limit_service import RateLimitService
+from modules.rate_limit.types import RateLimitScope
 
 ANONYMOUS_ACTOR = AuditActor(actor_type=ActorType.ANONYMOUS, actor_id=None)
 
@@ -16,6 +18,13 @@ class PasswordResetTokenView(MethodView):
     def post(self) -> ResponseReturnValue:
         request_data = request.get_json()
         password_reset_token_params = CreatePasswordResetTokenParams(**request_data)
+        RateLimitService.enforce(
+            route="password_reset",
+            identifiers={
+                RateLimitScope.IP: request.remote_addr,
+                RateLimitScope.USERNAME: password_reset_token_params.username,
+            },
+        )
         account_obj = AccountService.get_account_by_username(
             username=password_reset_token_params.username, actor=ANONYMOUS_ACTOR
         )
@@ -0,0 +1,16 @@
+from dataclasses import asdict
+
+from flask import jsonify
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.rest_api.access_auth_middleware import operator_auth_middleware
+
+
+class VerifiedTokenCacheView(MethodView):
+    @operator_auth_middleware
+    def get(self) -> ResponseReturnValue:
+        # The cache is per process, so these are the counters of the worker that served the request.
+        stats = AuthenticationService.get_verified_token_cache_stats()
+        return jsonify(asdict(stats)), 200
@@ -1,9 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
-from typing import Any, Optional, Union
+from typing import Any, ClassVar, Optional, Union
 
 from modules.account.types import AccountErrorCode, PhoneNumber
+from modules.config.types import CONFIG_KEY_METADATA, ConfigSection
 from modules.core.common.types import QueryParams
 from modules.core.errors import AppError
 
@@ -72,6 +73,7 @@ class PasswordResetToken:
 @dataclass(frozen=True)
 class PasswordResetTokenQuery(QueryParams):
     account_id: Optional[str] = None
+    expired_before: Optional[datetime] = None
 
 
 @dataclass(frozen=True)
@@ -109,6 +111,7 @@ class OTPQuery(QueryParams):
     otp_code: Optional[str] = None
     phone_number: Optional[PhoneNumber] = None
     active: Optional[bool] = None
+    created_before: Optional[datetime] = None
 
 
 @dataclass(frozen=True)
@@ -127,3 +130,44 @@ class CreateOTPParams:
 class VerifyOTPParams:
     otp_code: str
     phone_number: PhoneNumber
+
+
+@dataclass(frozen=True)
+class TokenConfig(ConfigSection):
+    config_prefix: ClassVar[str] = "accounts"
+
+    # Left empty rather than required so a deployment without a key fails the signing key check, which
+    # explains how to fix it, instead of a bare missing-key error.
+    token_expiry_days: int
+    token_expires_in_seconds: int
+    token_signing_key: str = ""
+
+
+@dataclass(frozen=True)
+class CredentialPruningConfig(ConfigSection):
+    config_prefix: ClassVar[str] = "accounts.credential_pruning"
+
+    # OTPs are deleted this long after they were issued, whether used, superseded or never entered; reset
+    # tokens this long after they expired.
+    otp_retention_hours: int = 24
+    password_reset_token_retention_hours: int = 24
+    # Each run deletes at most batch_size * max_batches_per_run documents per collection; the next run
+    # picks up where it stopped.
+    batch_size: int = 500
+    max_batches_per_run: int = 20
+
+
+@dataclass(frozen=True)
+class PrunedCredentials:
+    otps: int
+    password_reset_tokens: int
+
+
+@dataclass(frozen=True)
+class MailerConfig(ConfigSection):
+    config_prefix: ClassVar[str] = "mailer"
+
+    default_email: str
+    default_email_name: str
+    forgot_password_mail_template_id: str
+    web_app_host: str = field(metadata={CONFIG_KEY_METADATA: "web_app_host"})
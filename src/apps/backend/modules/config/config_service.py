@@ -1,8 +1,10 @@
-from typing import Generic, Optional
+import dataclasses
+import typing
+from typing import Any, Callable, Generic, Optional
 
-from modules.config.errors import MissingKeyError
+from modules.config.errors import MissingKeyError, ValueTypeMismatchError
 from modules.config.internal.config_manager import ConfigManager
-from modules.config.types import ConfigType, ErrorCode
+from modules.config.types import CONFIG_KEY_METADATA, ConfigSection, ConfigType, ErrorCode
 
 
 class ConfigService(Generic[ConfigType]):
@@ -18,3 +20,110 @@ class ConfigService(Generic[ConfigType]):
     @classmethod
     def has_value(cls, key: str) -> bool:
         return cls.config_manager.has(key)
+
+    @classmethod
+    def get_str(cls, key: str, default: Optional[str] = None) -> str:
+        value = cls._get_present_value(key, default)
+        if not isinstance(value, str):
+            raise cls._type_mismatch(key, expected_value_type="str", value=value)
+        return value
+
+    @classmethod
+    def get_int(cls, key: str, default: Optional[int] = None) -> int:
+        value = cls._get_present_value(key, default)
+        # bool is a subclass of int, but a flag set where a number is expected is a config mistake.
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise cls._type_mismatch(key, expected_value_type="int", value=value)
+        return value
+
+    @classmethod
+    def get_float(cls, key: str, default: Optional[float] = None) -> float:
+        value = cls._get_present_value(key, default)
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise cls._type_mismatch(key, expected_value_type="float", value=value)
+        return float(value)
+
+    @classmethod
+    def get_bool(cls, key: str, default: Optional[bool] = None) -> bool:
+        value = cls._get_present_value(key, default)
+        if not isinstance(value, bool):
+            raise cls._type_mismatch(key, expected_value_type="bool", value=value)
+        return value
+
+    @classmethod
+    def get_list(cls, key: str, default: Optional[list[Any]] = None) -> list[Any]:
+        value = cls._get_present_value(key, default)
+        if not isinstance(value, list):
+            raise cls._type_mismatch(key, expected_value_type="list", value=value)
+        return value
+
+    @classmethod
+    def get_section[SectionT: ConfigSection](cls, section_type: type[SectionT]) -> SectionT:
+        """
+        Return the typed config section, building and validating it on first use.
+
+        Sections are cached on the loaded config, so after the first call this is a dict lookup and a
+        reload() rebuilds them from the new values. A missing key or a value of the wrong type raises
+        MissingKeyError or ValueTypeMismatchError; loading sections at boot surfaces those before traffic.
+        """
+        config_manager = cls.config_manager
+        section = config_manager.sections.get(section_type)
+        if section is None:
+            section = cls._build_section(section_type)
+            config_manager.sections[section_type] = section
+        return typing.cast(SectionT, section)
+
+    @classmethod
+    def load_sections(cls, *section_types: type[ConfigSection]) -> None:
+        for section_type in section_types:
+            cls.get_section(section_type)
+
+    @classmethod
+    def reload(cls) -> None:
+        """
+        Rebuild the configuration from the config files and the current environment.
+
+        Lookups are served from a snapshot taken at load time, so anything that changes an environment
+        variable or config file after import (typically a test) must call this to see the change.
+        """
+        cls.config_manager = ConfigManager()
+
+    @classmethod
+    def _build_section[SectionT: ConfigSection](cls, section_type: type[SectionT]) -> SectionT:
+        accessors: dict[type, Callable[..., Any]] = {
+            bool: cls.get_bool,
+            float: cls.get_float,
+            int: cls.get_int,
+            list: cls.get_list,
+            str: cls.get_str,
+        }
+        field_types = typing.get_type_hints(section_type)
+        values: dict[str, Any] = {}
+        for field in dataclasses.fields(section_type):
+            field_type = field_types[field.name]
+            accessor = accessors.get(typing.get_origin(field_type) or field_type)
+            if accessor is None:
+                raise TypeError(
+                    f"Unsupported type {field_type!r} for config field {section_type.__name__}.{field.name}"
+                )
+
+            key = field.metadata.get(CONFIG_KEY_METADATA, f"{section_type.config_prefix}.{field.name}")
+            default = None if field.default is dataclasses.MISSING else field.default
+            values[field.name] = accessor(key=key, default=default)
+        return section_type(**values)
+
+    @classmethod
+    def _get_present_value(cls, key: str, default: Optional[Any]) -> Any:
+        value = cls.config_manager.get(key, default=default)
+        if value is None:
+            raise MissingKeyError(missing_key=key, error_code=ErrorCode.MISSING_KEY)
+        return value
+
+    @staticmethod
+    def _type_mismatch(key: str, *, expected_value_type: str, value: Any) -> ValueTypeMismatchError:
+        return ValueTypeMismatchError(
+            actual_value_type=type(value).__name__,
+            error_code=ErrorCode.VALUE_TYPE_MISMATCH,
+            expected_value_type=expected_value_type,
+            key=key,
+        )
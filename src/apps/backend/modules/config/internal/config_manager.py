@@ -1,4 +1,6 @@
-from typing import Optional, cast
+import copy
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, cast
 
 from modules.config.internal.config_files.app_env_config_file import AppEnvConfig
 from modules.config.internal.config_files.custom_env_config_file import CustomEnvConfig
@@ -20,25 +22,21 @@ class ConfigManager:
         merged_content = ConfigUtil.deep_merge(default_content, app_env_content, os_env_content)
 
         self.config_store: Config = merged_content
+        # Every dotted path (leaf or subtree) is resolved once here, so a lookup is a single dict hit instead
+        # of a split and a nested walk. The map is read-only; a new ConfigManager is built to pick up changes.
+        # Its subtree and list values are shared with config_store, so get() hands those out as copies.
+        self.flattened_store: Mapping[str, Any] = MappingProxyType(
+            ConfigUtil.flatten(merged_content, separator=self.CONFIG_KEY_SEPARATOR)
+        )
+        # Typed sections built from this snapshot, keyed by section class; see ConfigService.get_section.
+        self.sections: dict[type, Any] = {}
 
     def get(self, key: str, default: Optional[ConfigType] = None) -> Optional[ConfigType]:
-        value = self._traverse_config(key)
-        return value if value is not None else default
+        value = self.flattened_store.get(key)
+        if value is None:
+            return default
+        # A caller that changes a returned subtree or list must not change config for the whole process.
+        return cast(ConfigType, copy.deepcopy(value) if isinstance(value, (dict, list)) else value)
 
     def has(self, key: str) -> bool:
-        return self._traverse_config(key) is not None
-
-    def _traverse_config(self, key: str) -> Optional[ConfigType]:
-        values = self.config_store
-        for k in key.split(self.CONFIG_KEY_SEPARATOR):
-            if not isinstance(values, dict) or k not in values:
-                return None
-
-            next_values = values[k]
-
-            if not isinstance(next_values, dict):
-                return cast(ConfigType, next_values)
-
-            values = next_values
-
-        return cast(ConfigType, values)
+        return self.flattened_store.get(key) is not None
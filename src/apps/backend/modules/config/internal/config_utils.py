@@ -24,6 +24,18 @@ class ConfigUtil:
 
         return merged_config
 
+    @staticmethod
+    def flatten(config: Config, separator: str, prefix: str = "") -> dict[str, Any]:
+        flattened: dict[str, Any] = {}
+
+        for key, value in config.items():
+            path = f"{prefix}{separator}{key}" if prefix else key
+            flattened[path] = value
+            if isinstance(value, dict):
+                flattened.update(ConfigUtil.flatten(cast(Config, value), separator, prefix=path))
+
+        return flattened
+
     @staticmethod
     def read_yml_from_config_dir(filename: str) -> dict[str, Any]:
         config_path = ConfigUtil._get_base_config_directory(ConfigUtil.CURRENT_FILE)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, TypeVar
+from typing import Any, ClassVar, TypeVar
 
 ConfigType = TypeVar("ConfigType", bound=bool | dict[str, Any] | float | int | list[Any] | str)
 
@@ -8,3 +8,18 @@ ConfigType = TypeVar("ConfigType", bound=bool | dict[str, Any] | float | int | l
 class ErrorCode:
     MISSING_KEY: str = "KEY_ERR_404"
     VALUE_TYPE_MISMATCH: str = "INVALID_VALUE_TYPE_400"
+
+
+CONFIG_KEY_METADATA = "config_key"
+
+
+@dataclass(frozen=True)
+class ConfigSection:
+    """
+    Base for a frozen, typed group of config values resolved through ConfigService.get_section.
+
+    Each field is read from `<config_prefix>.<field name>`, or from the absolute key given in the field's
+    metadata under CONFIG_KEY_METADATA. A field's default is used when its key is absent.
+    """
+
+    config_prefix: ClassVar[str] = ""
@@ -0,0 +1,62 @@
+import functools
+import json
+from datetime import date
+from typing import Any, Optional
+
+from aiohttp import web
+from werkzeug.http import http_date
+
+from modules.config.config_service import ConfigService
+
+
+def _json_default(value: Any) -> Any:
+    # The types Flask's JSON provider encodes beyond plain JSON, encoded the same way, so a client sees the
+    # same body from either serving mode.
+    if isinstance(value, date):
+        return http_date(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_dumps = functools.partial(json.dumps, default=_json_default, sort_keys=True, separators=(",", ":"))
+
+
+class AsyncWebApp:
+    """Request and response helpers for the aiohttp views that web_async_app.py serves next to the Flask
+    app. They give an async view what Flask gives a sync one: the JSON body, query ints, the client
+    address behind the proxy, and JSON responses encoded as jsonify encodes them."""
+
+    API_PREFIX = "/api"
+
+    @staticmethod
+    def json_response(data: Any, *, status: int = 200) -> web.Response:
+        return web.json_response(data, status=status, dumps=_dumps)
+
+    @staticmethod
+    async def read_json(request: web.Request) -> Any:
+        # None when there is no body or it is not valid JSON; each view answers that with its own 400.
+        if not request.can_read_body:
+            return None
+        try:
+            return await request.json()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def query_int(request: web.Request, name: str) -> Optional[int]:
+        # Like Flask's request.args.get(name, type=int): a value that is not an integer counts as absent.
+        value = request.query.get(name)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def client_ip(request: web.Request) -> Optional[str]:
+        # Matches ProxyFix's default in the Flask app: behind the proxy, the address it appended last.
+        if ConfigService[bool].get_value(key="is_server_running_behind_proxy", default=False):
+            forwarded_for = request.headers.get("X-Forwarded-For")
+            if forwarded_for:
+                return forwarded_for.split(",")[-1].strip()
+        return request.remote
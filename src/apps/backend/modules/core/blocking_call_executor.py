@@ -0,0 +1,75 @@
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, ClassVar, Optional
+
+from modules.config.config_service import ConfigService
+from modules.core.common.types import AsyncWebConfig
+from modules.core.errors import BlockingCallExecutorSaturatedError
+
+
+@dataclass(frozen=True)
+class _ExecutorState:
+    executor: ThreadPoolExecutor
+    # One slot per running or queued call, released when the call finishes, not when its caller stops waiting.
+    slots: threading.BoundedSemaphore
+
+
+class BlockingCallExecutor:
+    """Runs the synchronous service layer for async views on a bounded per-process thread pool.
+
+    pymongo, redis-py, bcrypt and the provider SDKs all block, so an async view hands each service call to
+    this pool and awaits it. The event loop stays free to accept connections and parse requests, and the
+    number of threads no longer caps the number of open connections. At most `blocking_call_max_workers`
+    calls run and `blocking_call_max_queue_size` wait; a call beyond that is answered 503 at once instead of
+    queueing without bound. Sizing lives under `web_async`."""
+
+    _state: ClassVar[Optional[_ExecutorState]] = None
+    _state_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    async def run[T](cls, operation: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        state = cls._get_state()
+        if not state.slots.acquire(blocking=False):
+            raise BlockingCallExecutorSaturatedError()
+
+        # The call sees the caller's context variables, as it would if it ran on the request thread.
+        context = contextvars.copy_context()
+        try:
+            future: Future[T] = state.executor.submit(context.run, functools.partial(operation, *args, **kwargs))
+        except BaseException:
+            state.slots.release()
+            raise
+        future.add_done_callback(lambda _: state.slots.release())
+        return await asyncio.wrap_future(future)
+
+    @classmethod
+    def _get_state(cls) -> _ExecutorState:
+        state = cls._state
+        if state is not None:
+            return state
+        with cls._state_lock:
+            if cls._state is None:
+                config = ConfigService.get_section(AsyncWebConfig)
+                cls._state = _ExecutorState(
+                    executor=ThreadPoolExecutor(
+                        max_workers=config.blocking_call_max_workers, thread_name_prefix="blocking-call"
+                    ),
+                    slots=threading.BoundedSemaphore(
+                        config.blocking_call_max_workers + config.blocking_call_max_queue_size
+                    ),
+                )
+            return cls._state
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # Pool threads do not survive fork; each gunicorn worker builds its own pool on first use.
+        cls._state = None
+        cls._state_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=BlockingCallExecutor._reset_after_fork)
@@ -2,6 +2,12 @@ from celery import Celery
 
 from modules.config.config_service import ConfigService
 
+# Most urgent first. Each queue has a ".cpu" twin for jobs declared JobWorkload.CPU, so CPU-bound work can be
+# served by process pools while the plain queues go to thread pools; see modules/core/worker_profiles.py.
+JOB_QUEUES = ("critical", "default", "low")
+CPU_QUEUE_SUFFIX = ".cpu"
+ALL_QUEUES = JOB_QUEUES + tuple(f"{queue}{CPU_QUEUE_SUFFIX}" for queue in JOB_QUEUES)
+
 app = Celery("foundation")
 
 app.conf.update(
@@ -21,11 +27,10 @@ app.conf.update(
     beat_scheduler="redbeat.RedBeatScheduler",
     redbeat_redis_url=ConfigService[str].get_value("celery.broker_url"),
     redbeat_lock_key=None,
-    task_queues={
-        "critical": {"exchange": "critical", "routing_key": "critical"},
-        "default": {"exchange": "default", "routing_key": "default"},
-        "low": {"exchange": "low", "routing_key": "low"},
-    },
+    task_queues={queue: {"exchange": queue, "routing_key": queue} for queue in ALL_QUEUES},
+    # A worker consuming several queues takes from the first non-empty one in its --queues order, instead of
+    # rotating between them, so a backlog on "low" does not hold up "critical".
+    broker_transport_options={"queue_order_strategy": "priority"},
     task_default_queue="default",
     task_default_exchange="default",
     task_default_routing_key="default",
@@ -1,4 +1,13 @@
+from datetime import timedelta
+
 from modules.core.common.types import PaginationParams
 
 # Default pagination parameters
 DEFAULT_PAGINATION_PARAMS = PaginationParams(page=1, size=10, offset=0)
+
+# Job run listings page by keyset cursor rather than page number
+DEFAULT_JOB_RUN_PAGE_SIZE = 20
+MAX_JOB_RUN_PAGE_SIZE = 100
+
+# Window a job run summary covers when the caller gives no `since`
+DEFAULT_JOB_RUN_SUMMARY_WINDOW = timedelta(hours=24)
@@ -2,7 +2,9 @@ import enum
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Generic, List, Optional, TypeVar
+from typing import ClassVar, Generic, List, Optional, TypeVar
+
+from modules.config.types import CONFIG_KEY_METADATA, ConfigSection
 
 T = TypeVar("T")
 
@@ -128,12 +130,36 @@ class AuditLogEntry:
 
 
 type JobArguments = dict[str, FieldChangeValue]
+# Named counters a long-running job (e.g. a fan-out and its chunk jobs) adds to as it goes.
+type JobRunProgress = dict[str, int]
 
 
 class JobRunStatus(str, enum.Enum):
     RUNNING = "running"
     SUCCEEDED = "succeeded"
     FAILED = "failed"
+    # Not run: another task with the same Job.unique_key ran within the dedupe window.
+    SKIPPED = "skipped"
+    # Not run yet: the job was at Job.max_concurrency, so the task was queued again for later.
+    DEFERRED = "deferred"
+
+
+class JobRunRecording(str, enum.Enum):
+    # Insert a running row when the run starts and update it when it ends: the run is visible while in
+    # flight and can carry progress counters.
+    FULL = "full"
+    # One insert when the run ends, with started_at carried in memory.
+    COMPLETION_ONLY = "completion_only"
+    # Like COMPLETION_ONLY, but finished runs are held in the worker process and inserted in batches.
+    BUFFERED = "buffered"
+
+
+class JobWorkload(str, enum.Enum):
+    # Waits on Mongo, Redis or a provider API most of the time; runs on the job's queue, served by thread pools.
+    IO = "io"
+    # Spends its time in Python code; runs on the job's ".cpu" queue, served by process pools, so it does not
+    # hold the GIL against I/O jobs sharing its worker.
+    CPU = "cpu"
 
 
 @dataclass(frozen=True)
@@ -145,6 +171,11 @@ class JobRun:
     retry_count: int = 0
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
+    progress: JobRunProgress = field(default_factory=dict)
+    # The Celery task id the run executed under; the retries of one task share it.
+    task_id: Optional[str] = None
+    # The aggregate run of the perform_many batch or workflow this run belongs to.
+    parent_job_run_id: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
@@ -154,3 +185,218 @@ class JobRunQuery(QueryParams):
     id: Optional[str] = None
     job_name: Optional[str] = None
     status: Optional[JobRunStatus] = None
+    task_id: Optional[str] = None
+    parent_job_run_id: Optional[str] = None
+    started_after: Optional[datetime] = None
+    started_before: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class JobManifestEntry:
+    job_name: str
+    module: str
+    cron_schedule: Optional[str] = None
+
+    @property
+    def task_name(self) -> str:
+        return f"{self.module}.{self.job_name}"
+
+
+@dataclass(frozen=True)
+class JobBatch:
+    enqueued: int
+    # Calls not enqueued because a task with the same Job.unique_key was already pending.
+    duplicates: int = 0
+    # The aggregate job_run of a tracked batch (see Job.perform_many); None when the batch is untracked.
+    job_run_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class JobWorkflowRun:
+    # The workflow's aggregate job_run; every step's run names it as parent_job_run_id.
+    job_run_id: str
+    # Celery id of the workflow's result: the final task's, or the group's when the workflow is a bare group.
+    result_id: str
+
+
+@dataclass(frozen=True)
+class JobRunPage:
+    items: list[JobRun]
+    # Opaque keyset cursor for the next page; None on the last page.
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class JobRunSummary:
+    job_name: str
+    since: datetime
+    total: int
+    running: int
+    succeeded: int
+    failed: int
+    skipped: int
+    deferred: int
+    # Failed over finished runs, so runs still in progress do not dilute it.
+    failure_rate: float
+    p50_duration_ms: Optional[float] = None
+    p95_duration_ms: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class JobRunErrorCode:
+    NOT_FOUND: str = "JOB_RUN_ERR_01"
+    BAD_REQUEST: str = "JOB_RUN_ERR_02"
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_entries: int
+
+
+@dataclass(frozen=True)
+class MongoConfig(ConfigSection):
+    config_prefix: ClassVar[str] = "mongodb"
+
+    uri: str
+    connection_caching: bool = True
+    # Connections one process may open to each server. A web process never uses more than its request
+    # threads at once, so this only needs to cover the busiest process type (see docs/deployment.md).
+    max_pool_size: int = 100
+
+
+@dataclass(frozen=True)
+class RedisConfig(ConfigSection):
+    config_prefix: ClassVar[str] = "redis"
+
+    # The Celery broker's Redis doubles as the shared store for request-path state (rate limits and the like).
+    url: str = field(metadata={CONFIG_KEY_METADATA: "celery.broker_url"})
+    socket_timeout_seconds: float = 0.5
+
+
+class CircuitState(str, enum.Enum):
+    # Shared by the outbound HTTP client's per-host breakers and the notification provider breakers.
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class OutboundHttpConfig(ConfigSection):
+    config_prefix: ClassVar[str] = "outbound_http"
+
+    connect_timeout_seconds: float = 3.05
+    read_timeout_seconds: float = 10.0
+    # Kept-alive connections per host; requests beyond this open a connection that is closed after use.
+    pool_maxsize: int = 10
+    # Retries cover connection failures for every method, and 429/502/503/504 for idempotent methods only.
+    max_retries: int = 2
+    backoff_factor: float = 0.2
+    backoff_jitter: float = 0.2
+    # Consecutive failures (transport errors or 5xx) that open a host's breaker; 0 turns breakers off.
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout_seconds: float = 30.0
+
+
+@dataclass(frozen=True)
+class AsyncWebConfig(ConfigSection):
+    config_prefix: ClassVar[str] = "web_async"
+
+    # Blocking service calls (Mongo, Redis, bcrypt, provider APIs) one async web process runs at once, and
+    # how many more may wait for a thread before further requests are answered 503.
+    blocking_call_max_workers: int = 32
+    blocking_call_max_queue_size: int = 256
+
+
+@dataclass(frozen=True)
+class WebServerConfig(ConfigSection):
+    config_prefix: ClassVar[str] = "web.server"
+
+    # 0 sizes the worker count from the host: workers_per_core per CPU plus one, at most max_workers. Each
+    # worker is a full copy of the app with its own Mongo pool, so the cap bounds memory and connections
+    # on large hosts; the request threads inside a worker carry the I/O concurrency.
+    workers: int = 0
+    workers_per_core: float = 1.0
+    max_workers: int = 8
+    threads: int = 8
+    # A worker is replaced after serving max_requests plus up to max_requests_jitter requests, so slow
+    # leaks are bounded and workers do not all restart together. 0 turns recycling off.
+    max_requests: int = 2000
+    max_requests_jitter: int = 200
+    timeout_seconds: int = 30
+    keepalive_seconds: int = 2
+
+
+@dataclass(frozen=True)
+class WebServerSettings:
+    workers: int
+    threads: int
+    max_requests: int
+    max_requests_jitter: int
+    timeout_seconds: int
+    keepalive_seconds: int
+
+
+@dataclass(frozen=True)
+class ProcessMemoryConfig(ConfigSection):
+    config_prefix: ClassVar[str] = "process_memory"
+
+    # Move the heap a forking parent built at import (modules, config, app, job registry) into gc's
+    # permanent generation, so collections in the children never write to those shared pages.
+    freeze_preloaded_heap: bool = True
+    # Collection thresholds for forked children. A higher first threshold means fewer collections of the
+    # short-lived objects each request allocates.
+    gc_generation0_threshold: int = 10_000
+    gc_generation1_threshold: int = 10
+    gc_generation2_threshold: int = 10
+
+
+@dataclass(frozen=True)
+class ProcessMemoryUsage:
+    # From /proc/<pid>/smaps_rollup, in KiB. `shared_kib` is memory still shared with another process,
+    # such as the pages a worker inherited from the gunicorn master; `private_kib` is this process's alone.
+    rss_kib: int
+    pss_kib: int
+    shared_kib: int
+    private_kib: int
+
+
+@dataclass(frozen=True)
+class JobRunBufferConfig(ConfigSection):
+    config_prefix: ClassVar[str] = "job_run.buffer"
+
+    # Buffered job runs are inserted once this many are pending, or once the oldest has waited this long.
+    max_records: int = 200
+    flush_interval_seconds: float = 5.0
+
+
+class WorkerPool(str, enum.Enum):
+    PREFORK = "prefork"
+    THREADS = "threads"
+    SOLO = "solo"
+
+
+@dataclass(frozen=True)
+class WorkerProfile:
+    name: str
+    # Consumed in this order: a worker takes from the first non-empty queue, so list the most urgent first.
+    queues: tuple[str, ...]
+    pool: WorkerPool
+    concurrency: int
+    # Messages each pool slot reserves ahead of the one it is running.
+    prefetch_multiplier: int
+    # Set to let a prefork pool shrink to this many processes when idle and grow back to `concurrency`.
+    min_concurrency: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class OutboundHttpErrorCode:
+    CIRCUIT_OPEN: str = "OUTBOUND_HTTP_ERR_01"
+
+
+@dataclass(frozen=True)
+class BlockingCallErrorCode:
+    SATURATED: str = "BLOCKING_CALL_ERR_01"
@@ -1,5 +1,7 @@
 from typing import Any, Optional
 
+from modules.core.common.types import BlockingCallErrorCode, JobRunErrorCode, OutboundHttpErrorCode
+
 
 class AppError(Exception):
     def __init__(self, message: str, code: str, http_status_code: Optional[int] = None) -> None:
@@ -20,3 +22,35 @@ class AppError(Exception):
             "with_traceback": self.with_traceback,
         }
         return error_dict
+
+
+class OutboundCircuitOpenError(AppError):
+    def __init__(self, host: str, retry_after_seconds: float) -> None:
+        super().__init__(
+            code=OutboundHttpErrorCode.CIRCUIT_OPEN,
+            http_status_code=503,
+            message=f"Calls to {host} are paused after repeated failures; retrying in {retry_after_seconds:.0f}s.",
+        )
+        self.host = host
+        self.retry_after_seconds = retry_after_seconds
+
+
+class JobRunNotFoundError(AppError):
+    def __init__(self, job_run_id: str) -> None:
+        super().__init__(
+            code=JobRunErrorCode.NOT_FOUND, http_status_code=404, message=f"Job run with id {job_run_id} not found."
+        )
+
+
+class JobRunBadRequestError(AppError):
+    def __init__(self, message: str) -> None:
+        super().__init__(code=JobRunErrorCode.BAD_REQUEST, http_status_code=400, message=message)
+
+
+class BlockingCallExecutorSaturatedError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=BlockingCallErrorCode.SATURATED,
+            http_status_code=503,
+            message="The server is busy right now. Please try again in a moment.",
+        )
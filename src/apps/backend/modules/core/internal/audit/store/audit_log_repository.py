@@ -47,16 +47,23 @@ class AuditLogRepository:
     collection_name = AuditLogModel.get_collection_name()
 
     _collection: ClassVar[Optional[Collection]] = None
+    _collection_initialized: ClassVar[bool] = False
 
     @classmethod
     def collection(cls) -> Collection:
         if cls._collection is None:
             database = ApplicationRepositoryClient.get_client().get_database()
             collection = database[cls.collection_name]
-            cls._init_collection(collection)
+            if not cls._collection_initialized:
+                cls._init_collection(collection)
+                cls._collection_initialized = True
             cls._collection = collection
         return cls._collection
 
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        cls._collection = None
+
     @classmethod
     def _init_collection(cls, collection: Collection) -> None:
         add_validation_command = {
@@ -0,0 +1,81 @@
+import hashlib
+import json
+import time
+from typing import Any, ClassVar, Optional
+
+from redis.exceptions import RedisError
+
+from modules.core.redis_client import RedisClient
+from modules.logger.logger import Logger
+
+
+class JobLimiter:
+    """Redis-backed guards a Job class opts into: a dedupe lock that lets one task per unique key run within a
+    window, and a counting semaphore that caps how many runs of one job execute at once.
+
+    The semaphore is a sorted set per job with one member per running holder, scored by when its lease
+    expires, so a holder whose worker died frees its slot once the lease runs out. Acquiring adds the holder
+    and counts in one MULTI round trip; a holder over the limit takes itself back out. Two runs racing for the
+    last slot can both back off, never both run. When Redis is unreachable every guard lets the run through:
+    it is the broker too, so the outage has bigger symptoms, and a skipped job is worse than a doubled one."""
+
+    UNIQUE_KEY_PREFIX: ClassVar[str] = "job:unique"
+    CONCURRENCY_KEY_PREFIX: ClassVar[str] = "job:concurrency"
+
+    @staticmethod
+    def unique_key_for(job_name: str, unique_key: tuple[str, ...], kwargs: dict[str, Any]) -> str:
+        # Hashed so argument values (account ids, phone numbers) are not stored in Redis in the clear.
+        values = json.dumps([kwargs.get(name) for name in unique_key], sort_keys=True, default=str)
+        digest = hashlib.sha256(values.encode("utf-8")).hexdigest()[:32]
+        return f"{JobLimiter.UNIQUE_KEY_PREFIX}:{job_name}:{digest}"
+
+    @staticmethod
+    def claim_unique(key: str, task_id: str, *, window_seconds: int) -> Optional[str]:
+        """
+        Claim `key` for `task_id` for `window_seconds` unless another task holds it. Returns the task id
+        holding the key (task_id itself when claimed or already held), or None when Redis is unavailable.
+        """
+        try:
+            client = RedisClient.get_client()
+            # The key can expire between SET NX and GET; one more attempt then claims it.
+            for _ in range(2):
+                if client.set(key, task_id, nx=True, ex=window_seconds):
+                    return task_id
+                owner = client.get(key)
+                if owner is not None:
+                    return owner.decode() if isinstance(owner, bytes) else str(owner)
+        except RedisError as error:
+            JobLimiter._log_redis_unavailable(error)
+        return None
+
+    @staticmethod
+    def acquire_slot(job_name: str, holder: str, *, limit: int, lease_seconds: int) -> bool:
+        key = f"{JobLimiter.CONCURRENCY_KEY_PREFIX}:{job_name}"
+        now = time.time()
+        try:
+            client = RedisClient.get_client()
+            pipeline = client.pipeline(transaction=True)
+            pipeline.zremrangebyscore(key, "-inf", now)
+            pipeline.zadd(key, {holder: now + lease_seconds})
+            pipeline.zcard(key)
+            pipeline.expire(key, lease_seconds)
+            _, _, holders, _ = pipeline.execute()
+            if int(holders) <= limit:
+                return True
+            client.zrem(key, holder)
+            return False
+        except RedisError as error:
+            JobLimiter._log_redis_unavailable(error)
+            return True
+
+    @staticmethod
+    def release_slot(job_name: str, holder: str) -> None:
+        try:
+            RedisClient.get_client().zrem(f"{JobLimiter.CONCURRENCY_KEY_PREFIX}:{job_name}", holder)
+        except RedisError as error:
+            # The lease expires the slot anyway.
+            JobLimiter._log_redis_unavailable(error)
+
+    @staticmethod
+    def _log_redis_unavailable(error: RedisError) -> None:
+        Logger.warn(message=f"[job.limits.redis_unavailable] running without the guard | error={error!r}")
@@ -0,0 +1,95 @@
+import os
+import threading
+import time
+from typing import ClassVar, Optional
+
+from modules.config.config_service import ConfigService
+from modules.core.common.types import ActorType, AuditActor, JobRun, JobRunBufferConfig
+from modules.core.internal.job_run.store.job_run_repository import JobRunRepository
+from modules.logger.logger import Logger
+
+JOB_RUN_BUFFER_ACTOR = AuditActor(actor_type=ActorType.WORKER, actor_id="job_run_buffer")
+
+
+class JobRunBuffer:
+    """Finished job runs of JobRunRecording.BUFFERED jobs, held per worker process and inserted in batches.
+
+    A batch is written when `max_records` runs are pending, by a background thread once the oldest pending
+    run has waited `flush_interval_seconds`, and when the worker process shuts down. Runs still pending when
+    a process is killed are lost, which is the trade for skipping per-run writes."""
+
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _pending: ClassVar[list[JobRun]] = []
+    _oldest_pending_at: ClassVar[float] = 0.0
+    _flusher: ClassVar[Optional[threading.Thread]] = None
+    # The process the buffer belongs to: a forked child starts with a copy of the parent's pending runs and
+    # without its flusher thread, and must not write the parent's runs a second time.
+    _pid: ClassVar[int] = os.getpid()
+
+    @staticmethod
+    def add(job_run: JobRun) -> None:
+        config = ConfigService.get_section(JobRunBufferConfig)
+        batch: list[JobRun] = []
+        with JobRunBuffer._lock:
+            JobRunBuffer._reset_after_fork()
+            if not JobRunBuffer._pending:
+                JobRunBuffer._oldest_pending_at = time.monotonic()
+            JobRunBuffer._pending.append(job_run)
+            if len(JobRunBuffer._pending) >= config.max_records:
+                batch = JobRunBuffer._take_pending()
+            JobRunBuffer._ensure_flusher(config)
+        JobRunBuffer._write(batch)
+
+    @staticmethod
+    def flush() -> None:
+        with JobRunBuffer._lock:
+            JobRunBuffer._reset_after_fork()
+            batch = JobRunBuffer._take_pending()
+        JobRunBuffer._write(batch)
+
+    @staticmethod
+    def _take_pending() -> list[JobRun]:
+        batch = JobRunBuffer._pending
+        JobRunBuffer._pending = []
+        return batch
+
+    @staticmethod
+    def _write(batch: list[JobRun]) -> None:
+        if not batch:
+            return
+        try:
+            JobRunRepository.create_completed(batch, actor=JOB_RUN_BUFFER_ACTOR)
+        except Exception as error:
+            # Bookkeeping must not fail the job that triggered the flush; the runs are dropped and counted.
+            Logger.error(message=f"[job_run.buffer] dropped {len(batch)} job runs | error={error!r}")
+
+    @staticmethod
+    def _ensure_flusher(config: JobRunBufferConfig) -> None:
+        if JobRunBuffer._flusher is not None and JobRunBuffer._flusher.is_alive():
+            return
+        JobRunBuffer._flusher = threading.Thread(
+            target=JobRunBuffer._flush_periodically,
+            args=(config.flush_interval_seconds,),
+            name="job-run-buffer-flusher",
+            daemon=True,
+        )
+        JobRunBuffer._flusher.start()
+
+    @staticmethod
+    def _flush_periodically(interval_seconds: float) -> None:
+        while True:
+            time.sleep(interval_seconds)
+            with JobRunBuffer._lock:
+                due = bool(JobRunBuffer._pending) and (
+                    time.monotonic() - JobRunBuffer._oldest_pending_at >= interval_seconds
+                )
+            if due:
+                JobRunBuffer.flush()
+
+    @staticmethod
+    def _reset_after_fork() -> None:
+        if JobRunBuffer._pid == os.getpid():
+            return
+        JobRunBuffer._pid = os.getpid()
+        JobRunBuffer._pending = []
+        JobRunBuffer._flusher = None
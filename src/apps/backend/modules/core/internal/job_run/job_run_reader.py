@@ -0,0 +1,81 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from modules.core.common.types import AuditActor, JobRun, JobRunPage, JobRunQuery, JobRunStatus, JobRunSummary
+from modules.core.errors import JobRunBadRequestError, JobRunNotFoundError
+from modules.core.internal.job_run.store.job_run_repository import JOB_RUN_LISTING_SORT, JobRunRepository
+
+SUMMARY_PERCENTILES = [0.5, 0.95]
+
+
+class JobRunReader:
+    @staticmethod
+    def get_job_run(*, job_run_id: str, actor: AuditActor) -> JobRun:
+        job_run = JobRunRepository.find(job_run_id, actor=actor)
+        if job_run is None:
+            raise JobRunNotFoundError(job_run_id=job_run_id)
+        return job_run
+
+    @staticmethod
+    def get_latest_job_run_by_task_id(*, task_id: str, actor: AuditActor) -> Optional[JobRun]:
+        # Each retry of a task starts a new run under the same task id; the newest one carries the outcome.
+        return JobRunRepository.query_one(JobRunQuery(task_id=task_id), actor=actor, sort=JOB_RUN_LISTING_SORT)
+
+    @staticmethod
+    def get_job_runs(*, params: JobRunQuery, limit: int, cursor: Optional[str], actor: AuditActor) -> JobRunPage:
+        after_started_at, after_id = JobRunReader._decode_cursor(cursor) if cursor else (None, None)
+        # One extra run tells whether another page exists without a count over the whole range.
+        job_runs = JobRunRepository.query_page(
+            params, limit=limit + 1, actor=actor, after_started_at=after_started_at, after_id=after_id
+        )
+        if len(job_runs) <= limit:
+            return JobRunPage(items=job_runs)
+        items = job_runs[:limit]
+        return JobRunPage(items=items, next_cursor=JobRunReader._encode_cursor(items[-1]))
+
+    @staticmethod
+    def get_job_run_summary(*, job_name: str, since: datetime) -> JobRunSummary:
+        params = JobRunQuery(job_name=job_name, started_after=since)
+        counts = JobRunRepository.count_by_status(params)
+        succeeded = counts.get(JobRunStatus.SUCCEEDED, 0)
+        failed = counts.get(JobRunStatus.FAILED, 0)
+        finished = succeeded + failed
+        p50_duration_ms, p95_duration_ms = JobRunRepository.duration_percentiles_ms(
+            params, SUMMARY_PERCENTILES, finished_count=finished
+        )
+        return JobRunSummary(
+            job_name=job_name,
+            since=since,
+            total=sum(counts.values()),
+            running=counts.get(JobRunStatus.RUNNING, 0),
+            succeeded=succeeded,
+            failed=failed,
+            skipped=counts.get(JobRunStatus.SKIPPED, 0),
+            deferred=counts.get(JobRunStatus.DEFERRED, 0),
+            failure_rate=failed / finished if finished else 0.0,
+            p50_duration_ms=p50_duration_ms,
+            p95_duration_ms=p95_duration_ms,
+        )
+
+    @staticmethod
+    def _encode_cursor(job_run: JobRun) -> str:
+        started_at = job_run.started_at.isoformat() if job_run.started_at is not None else None
+        payload = json.dumps([started_at, job_run.id]).encode()
+        # Unpadded so the cursor goes into a query string as is.
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+        try:
+            started_at, job_run_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            after_started_at = datetime.fromisoformat(started_at)
+        except (binascii.Error, TypeError, ValueError):
+            raise JobRunBadRequestError("Invalid cursor")
+        if not isinstance(job_run_id, str) or not ObjectId.is_valid(job_run_id):
+            raise JobRunBadRequestError("Invalid cursor")
+        return after_started_at, job_run_id
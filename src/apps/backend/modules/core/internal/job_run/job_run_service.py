@@ -1,15 +1,54 @@
+import dataclasses
 from datetime import UTC, datetime
+from typing import Optional
 
-from modules.core.common.types import REDACTED, ActorType, AuditActor, JobArguments, JobRun, JobRunStatus
+from modules.core.common.types import (
+    REDACTED,
+    ActorType,
+    AuditActor,
+    JobArguments,
+    JobRun,
+    JobRunPage,
+    JobRunProgress,
+    JobRunQuery,
+    JobRunRecording,
+    JobRunStatus,
+    JobRunSummary,
+)
 from modules.core.internal.audit.audit_writer import SENSITIVE_FIELD_KEYWORDS
+from modules.core.internal.job_run.job_run_buffer import JobRunBuffer
+from modules.core.internal.job_run.job_run_reader import JobRunReader
 from modules.core.internal.job_run.store.job_run_repository import JobRunRepository
 
 JOB_RUNNER_BOOTSTRAP_ACTOR = AuditActor(actor_type=ActorType.WORKER, actor_id="job_runner")
 
+# Progress counters of a batch's aggregate job_run (see Job.perform_many).
+BATCH_ENQUEUED = "enqueued"
+BATCH_ENQUEUE_FINISHED = "enqueue_finished"
+BATCH_SUCCEEDED = "succeeded"
+BATCH_FAILED = "failed"
+BATCH_SKIPPED = "skipped"
+
+# Progress counter of a workflow's aggregate job_run holding its step count (see JobWorkflow); outcomes are
+# counted under the batch names above.
+WORKFLOW_STEPS = "steps"
+
 
 class JobRunService:
     @staticmethod
-    def start(*, job_name: str, arguments: JobArguments, retry_count: int) -> JobRun:
+    def start(
+        *,
+        job_name: str,
+        arguments: JobArguments,
+        retry_count: int,
+        task_id: Optional[str] = None,
+        parent_job_run_id: Optional[str] = None,
+        recording: JobRunRecording = JobRunRecording.FULL,
+    ) -> JobRun:
+        """
+        Begin a job run. Under FULL recording the running row is inserted now; otherwise nothing is written
+        and the run, with an id assigned in memory, is inserted by finish().
+        """
         entity = JobRun(
             id="",
             job_name=job_name,
@@ -17,16 +56,136 @@ class JobRunService:
             arguments=JobRunService._redact(arguments),
             retry_count=retry_count,
             started_at=datetime.now(UTC),
+            task_id=task_id,
+            parent_job_run_id=parent_job_run_id,
         )
+        if recording != JobRunRecording.FULL:
+            return dataclasses.replace(entity, id=JobRunRepository.new_id())
         return JobRunRepository.create(entity, actor=JOB_RUNNER_BOOTSTRAP_ACTOR)
 
     @staticmethod
-    def mark_succeeded(*, job_run_id: str) -> None:
-        JobRunService._finalize(job_run_id=job_run_id, status=JobRunStatus.SUCCEEDED)
+    def finish(*, job_run: JobRun, status: JobRunStatus, recording: JobRunRecording = JobRunRecording.FULL) -> None:
+        if recording == JobRunRecording.FULL:
+            JobRunService._finalize(job_run_id=job_run.id, status=status)
+            return
+        finished = dataclasses.replace(job_run, status=status, ended_at=datetime.now(UTC))
+        if recording == JobRunRecording.BUFFERED:
+            JobRunBuffer.add(finished)
+        else:
+            JobRunRepository.create_completed([finished], actor=JOB_RUNNER_BOOTSTRAP_ACTOR)
+
+    @staticmethod
+    def record_not_run(
+        *,
+        job_name: str,
+        arguments: JobArguments,
+        retry_count: int,
+        task_id: Optional[str],
+        status: JobRunStatus,
+        parent_job_run_id: Optional[str] = None,
+        recording: JobRunRecording = JobRunRecording.FULL,
+    ) -> JobRun:
+        # A skipped or deferred run starts and ends at once, so even a FULL job writes it in one insert.
+        if recording == JobRunRecording.FULL:
+            recording = JobRunRecording.COMPLETION_ONLY
+        job_run = JobRunService.start(
+            job_name=job_name,
+            arguments=arguments,
+            retry_count=retry_count,
+            task_id=task_id,
+            parent_job_run_id=parent_job_run_id,
+            recording=recording,
+        )
+        JobRunService.finish(job_run=job_run, status=status, recording=recording)
+        return job_run
+
+    @staticmethod
+    def flush_buffered() -> None:
+        JobRunBuffer.flush()
+
+    @staticmethod
+    def increment_progress(*, job_run_id: str, counters: JobRunProgress, actor: AuditActor) -> None:
+        JobRunRepository.increment_progress(job_run_id, counters, actor=actor)
+
+    @staticmethod
+    def start_batch(*, job_name: str) -> JobRun:
+        return JobRunService.start(job_name=f"{job_name}.perform_many", arguments={}, retry_count=0)
+
+    @staticmethod
+    def record_batch_enqueued(*, batch_job_run_id: str, count: int) -> None:
+        JobRunService._increment_batch(
+            batch_job_run_id, {BATCH_ENQUEUED: count}, AuditActor(actor_type=ActorType.JOB, actor_id=batch_job_run_id)
+        )
+
+    @staticmethod
+    def finish_batch_enqueue(*, batch_job_run_id: str) -> None:
+        JobRunService._increment_batch(
+            batch_job_run_id,
+            {BATCH_ENQUEUE_FINISHED: 1},
+            AuditActor(actor_type=ActorType.JOB, actor_id=batch_job_run_id),
+        )
+
+    @staticmethod
+    def record_batch_outcome(*, batch_job_run_id: str, status: JobRunStatus, actor: AuditActor) -> None:
+        JobRunService._increment_batch(batch_job_run_id, {JobRunService._outcome_counter(status): 1}, actor)
+
+    @staticmethod
+    def start_workflow(*, name: str, arguments: JobArguments, steps: int) -> JobRun:
+        job_run = JobRunService.start(job_name=f"workflow.{name}", arguments=arguments, retry_count=0)
+        JobRunRepository.increment_progress(
+            job_run.id, {WORKFLOW_STEPS: steps}, actor=AuditActor(actor_type=ActorType.JOB, actor_id=job_run.id)
+        )
+        return job_run
+
+    @staticmethod
+    def record_workflow_outcome(*, workflow_job_run_id: str, status: JobRunStatus, actor: AuditActor) -> None:
+        counter = JobRunService._outcome_counter(status)
+        progress = JobRunRepository.increment_progress(workflow_job_run_id, {counter: 1}, actor=actor)
+        if progress is None:
+            return
+        failed = progress.get(BATCH_FAILED, 0)
+        if counter == BATCH_FAILED and failed == 1:
+            # A failed step stops the steps chained after it and the chord waiting on it, so the workflow
+            # fails with its first failed step; steps already running in parallel still count afterwards.
+            JobRunService._finalize(job_run_id=workflow_job_run_id, status=JobRunStatus.FAILED)
+        elif not failed and progress.get(BATCH_SUCCEEDED, 0) + progress.get(BATCH_SKIPPED, 0) == progress.get(
+            WORKFLOW_STEPS
+        ):
+            JobRunService._finalize(job_run_id=workflow_job_run_id, status=JobRunStatus.SUCCEEDED)
+
+    @staticmethod
+    def get_job_run(*, job_run_id: str, actor: AuditActor) -> JobRun:
+        return JobRunReader.get_job_run(job_run_id=job_run_id, actor=actor)
+
+    @staticmethod
+    def get_latest_job_run_by_task_id(*, task_id: str, actor: AuditActor) -> Optional[JobRun]:
+        return JobRunReader.get_latest_job_run_by_task_id(task_id=task_id, actor=actor)
+
+    @staticmethod
+    def get_job_runs(*, params: JobRunQuery, limit: int, cursor: Optional[str], actor: AuditActor) -> JobRunPage:
+        return JobRunReader.get_job_runs(params=params, limit=limit, cursor=cursor, actor=actor)
+
+    @staticmethod
+    def get_job_run_summary(*, job_name: str, since: datetime) -> JobRunSummary:
+        return JobRunReader.get_job_run_summary(job_name=job_name, since=since)
+
+    @staticmethod
+    def _increment_batch(batch_job_run_id: str, counters: JobRunProgress, actor: AuditActor) -> None:
+        # The counters only grow, so exactly one increment (the last job to finish, or the end of enqueueing
+        # if every job already finished) sees the batch complete, and that caller finalizes the batch run.
+        progress = JobRunRepository.increment_progress(batch_job_run_id, counters, actor=actor)
+        if progress is None or not progress.get(BATCH_ENQUEUE_FINISHED):
+            return
+        failed = progress.get(BATCH_FAILED, 0)
+        finished = progress.get(BATCH_SUCCEEDED, 0) + progress.get(BATCH_SKIPPED, 0) + failed
+        if finished == progress.get(BATCH_ENQUEUED, 0):
+            JobRunService._finalize(
+                job_run_id=batch_job_run_id, status=JobRunStatus.FAILED if failed else JobRunStatus.SUCCEEDED
+            )
 
     @staticmethod
-    def mark_failed(*, job_run_id: str) -> None:
-        JobRunService._finalize(job_run_id=job_run_id, status=JobRunStatus.FAILED)
+    def _outcome_counter(status: JobRunStatus) -> str:
+        return {JobRunStatus.SUCCEEDED: BATCH_SUCCEEDED, JobRunStatus.SKIPPED: BATCH_SKIPPED}.get(status, BATCH_FAILED)
 
     @staticmethod
     def _finalize(*, job_run_id: str, status: JobRunStatus) -> None:
@@ -5,7 +5,7 @@ from typing import NotRequired, Optional
 from bson import ObjectId
 
 from modules.core.base_model import BaseModel, StoredDocument, StoredDocumentBase
-from modules.core.common.types import JobArguments, JobRunStatus
+from modules.core.common.types import JobArguments, JobRunProgress, JobRunStatus
 
 
 class JobRunDocument(StoredDocumentBase):
@@ -15,6 +15,9 @@ class JobRunDocument(StoredDocumentBase):
     retry_count: NotRequired[int]
     started_at: NotRequired[Optional[datetime]]
     ended_at: NotRequired[Optional[datetime]]
+    progress: NotRequired[JobRunProgress]
+    task_id: NotRequired[Optional[str]]
+    parent_job_run_id: NotRequired[Optional[str]]
 
 
 @dataclass
@@ -25,6 +28,9 @@ class JobRunModel(BaseModel):
     retry_count: int = 0
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
+    progress: JobRunProgress = field(default_factory=dict)
+    task_id: Optional[str] = None
+    parent_job_run_id: Optional[str] = None
     id: Optional[ObjectId | str] = None
 
     def to_bson(self) -> JobRunDocument:
@@ -35,6 +41,9 @@ class JobRunModel(BaseModel):
             "retry_count": self.retry_count,
             "started_at": self.started_at,
             "ended_at": self.ended_at,
+            "progress": self.progress,
+            "task_id": self.task_id,
+            "parent_job_run_id": self.parent_job_run_id,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
@@ -52,6 +61,9 @@ class JobRunModel(BaseModel):
             retry_count=bson_data.get("retry_count", 0),
             started_at=bson_data.get("started_at"),
             ended_at=bson_data.get("ended_at"),
+            progress=bson_data.get("progress") or {},
+            task_id=bson_data.get("task_id"),
+            parent_job_run_id=bson_data.get("parent_job_run_id"),
             created_at=bson_data.get("created_at"),
             updated_at=bson_data.get("updated_at"),
         )
@@ -1,10 +1,16 @@
-from pymongo import ASCENDING, DESCENDING
+import math
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
 from pymongo.collection import Collection
 from pymongo.errors import OperationFailure
 
-from modules.core.common.types import JobRun, JobRunQuery
+from modules.core.common.types import AuditActor, JobRun, JobRunProgress, JobRunQuery, JobRunStatus, ResourceAction
+from modules.core.internal.audit.audit_writer import AuditWriter
 from modules.core.internal.job_run.store.job_run_model import JobRunDocument, JobRunModel
-from modules.core.repository import ApplicationRepository, StoredDocument, StoreFilter
+from modules.core.repository import ApplicationRepository, SortSpec, StoredDocument, StoreFilter
 from modules.logger.logger import Logger
 
 JOB_RUN_VALIDATION_SCHEMA = {
@@ -18,20 +24,44 @@ JOB_RUN_VALIDATION_SCHEMA = {
             "retry_count": {"bsonType": "int"},
             "started_at": {"bsonType": ["date", "null"]},
             "ended_at": {"bsonType": ["date", "null"]},
+            "progress": {"bsonType": "object"},
+            "task_id": {"bsonType": ["string", "null"]},
+            "parent_job_run_id": {"bsonType": ["string", "null"]},
             "created_at": {"bsonType": "date"},
             "updated_at": {"bsonType": "date"},
         },
     }
 }
 
+# Newest first, with _id breaking ties between runs that started in the same millisecond, so a keyset cursor
+# (started_at, _id) names exactly one position in the order.
+JOB_RUN_LISTING_SORT: SortSpec = [("started_at", DESCENDING), ("_id", DESCENDING)]
+
+JOB_NAME_STARTED_AT_INDEX_KEYS: SortSpec = [("job_name", ASCENDING), *JOB_RUN_LISTING_SORT]
+
 
 class JobRunRepository(ApplicationRepository[JobRun, JobRunQuery]):
     collection_name = JobRunModel.get_collection_name()
 
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
-        collection.create_index([("job_name", ASCENDING), ("started_at", DESCENDING)], name="job_name_started_at_index")
+        existing_index = collection.index_information().get("job_name_started_at_index")
+        if existing_index is not None and [(name, int(direction)) for name, direction in existing_index["key"]] != (
+            JOB_NAME_STARTED_AT_INDEX_KEYS
+        ):
+            # The index gained _id as a tiebreaker for keyset pages; an index's keys cannot change in place.
+            collection.drop_index("job_name_started_at_index")
+        collection.create_index(JOB_NAME_STARTED_AT_INDEX_KEYS, name="job_name_started_at_index")
+        collection.create_index(JOB_RUN_LISTING_SORT, name="started_at_index")
         collection.create_index([("status", ASCENDING)], name="status_index")
+        collection.create_index(
+            [("task_id", ASCENDING)], name="task_id_index", partialFilterExpression={"task_id": {"$type": "string"}}
+        )
+        collection.create_index(
+            [("parent_job_run_id", ASCENDING), *JOB_RUN_LISTING_SORT],
+            name="parent_job_run_id_index",
+            partialFilterExpression={"parent_job_run_id": {"$type": "string"}},
+        )
 
         add_validation_command = {
             "collMod": cls.collection_name,
@@ -58,6 +88,9 @@ class JobRunRepository(ApplicationRepository[JobRun, JobRunQuery]):
             retry_count=model.retry_count,
             started_at=model.started_at,
             ended_at=model.ended_at,
+            progress=model.progress,
+            task_id=model.task_id,
+            parent_job_run_id=model.parent_job_run_id,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -72,8 +105,128 @@ class JobRunRepository(ApplicationRepository[JobRun, JobRunQuery]):
             retry_count=entity.retry_count,
             started_at=entity.started_at,
             ended_at=entity.ended_at,
+            progress=entity.progress,
+            task_id=entity.task_id,
+            parent_job_run_id=entity.parent_job_run_id,
         ).to_bson()
 
+    @staticmethod
+    def new_id() -> str:
+        return str(ObjectId())
+
+    @classmethod
+    def create_completed(cls, entities: list[JobRun], *, actor: AuditActor) -> None:
+        # For runs recorded only once they end: each id was assigned in memory when the run started, so the
+        # job's own writes could already name it, and every row goes in one insert with one audit insert.
+        if not entities:
+            return
+        docs = [{**cls.to_doc(entity), "_id": ObjectId(entity.id)} for entity in entities]
+        cls.collection().insert_many(docs, ordered=False)
+        AuditWriter.record_many(
+            actor=actor,
+            resource_type=cls._resource_type(),
+            resource_ids=[entity.id for entity in entities],
+            action=ResourceAction.CREATE,
+        )
+
+    @classmethod
+    def increment_progress(
+        cls, job_run_id: str, counters: JobRunProgress, *, actor: AuditActor
+    ) -> Optional[JobRunProgress]:
+        # $inc rather than read-modify-write: chunk jobs of one fan-out report into the same record
+        # concurrently from different workers. Returns the counters as this increment left them, so the
+        # caller whose increment completes a batch knows it did; None when no such run exists.
+        object_id = cls._to_object_id(job_run_id)
+        if object_id is None or not counters:
+            return None
+        previous = cls.collection().find_one_and_update(
+            {"_id": object_id},
+            {
+                "$inc": {f"progress.{name}": amount for name, amount in counters.items()},
+                "$set": {"updated_at": datetime.now(UTC)},
+            },
+            return_document=ReturnDocument.BEFORE,
+        )
+        if previous is None:
+            return None
+        previous_progress: JobRunProgress = previous.get("progress") or {}
+        cls._emit_field_update_audit(
+            actor,
+            job_run_id,
+            {f"progress.{name}": previous_progress.get(name, 0) + amount for name, amount in counters.items()},
+            {f"progress.{name}": previous_progress.get(name, 0) for name in counters},
+        )
+        return {
+            **previous_progress,
+            **{name: previous_progress.get(name, 0) + amount for name, amount in counters.items()},
+        }
+
+    @classmethod
+    def query_page(
+        cls,
+        params: JobRunQuery,
+        *,
+        limit: int,
+        actor: AuditActor,
+        after_started_at: Optional[datetime] = None,
+        after_id: Optional[str] = None,
+    ) -> list[JobRun]:
+        # Keyset pagination in JOB_RUN_LISTING_SORT order: the page starts just after (after_started_at,
+        # after_id), so it is a range scan of job_name_started_at_index (or started_at_index) however deep
+        # the page is. The $lte bound does the seeking; $nor only drops the runs tied on started_at that an
+        # earlier page already returned.
+        store_filter = cls._to_filter(params)
+        if after_started_at is not None and after_id is not None:
+            after_object_id = cls._to_object_id(after_id)
+            keyset_filter: StoreFilter = {
+                "started_at": {"$lte": after_started_at},
+                "$nor": [{"started_at": after_started_at, "_id": {"$gte": after_object_id}}],
+            }
+            store_filter = {"$and": [store_filter, keyset_filter]} if store_filter else keyset_filter
+        docs = cls._query_docs(store_filter, sort=JOB_RUN_LISTING_SORT, limit=limit)
+        cls._emit_read_audit(actor, [str(doc["_id"]) for doc in docs])
+        return [cls.from_doc(doc) for doc in docs]
+
+    @classmethod
+    def count_by_status(cls, params: JobRunQuery) -> dict[JobRunStatus, int]:
+        # Aggregates read no single record, so like count() they are not read-audited.
+        pipeline: list[dict[str, Any]] = [
+            {"$match": cls._to_filter(params)},
+            {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+        ]
+        return {JobRunStatus(doc["_id"]): int(doc["count"]) for doc in cls.collection().aggregate(pipeline)}
+
+    @classmethod
+    def duration_percentiles_ms(
+        cls, params: JobRunQuery, percentiles: list[float], *, finished_count: int
+    ) -> list[Optional[float]]:
+        # Nearest-rank percentiles of ended_at - started_at over the finished (succeeded or failed) runs, the
+        # same runs finished_count counts. The durations are sorted once on the server and each percentile is
+        # a skip into that order, so no duration list is shipped.
+        if finished_count <= 0:
+            return [None for _ in percentiles]
+        ranks = {
+            f"p{index}": max(0, math.ceil(percentile * finished_count) - 1)
+            for index, percentile in enumerate(percentiles)
+        }
+        finished: StoreFilter = {
+            "status": {"$in": [JobRunStatus.SUCCEEDED.value, JobRunStatus.FAILED.value]},
+            "ended_at": {"$ne": None},
+            "started_at": {"$ne": None},
+        }
+        pipeline: list[dict[str, Any]] = [
+            {"$match": {"$and": [cls._to_filter(params), finished]}},
+            {"$project": {"_id": 0, "duration_ms": {"$subtract": ["$ended_at", "$started_at"]}}},
+            {"$sort": {"duration_ms": ASCENDING}},
+            {"$facet": {name: [{"$skip": rank}, {"$limit": 1}] for name, rank in ranks.items()}},
+        ]
+        facets: StoredDocument = next(cls.collection().aggregate(pipeline, allowDiskUse=True), {})
+        values: list[Optional[float]] = []
+        for name in ranks:
+            matched = facets.get(name) or []
+            values.append(float(matched[0]["duration_ms"]) if matched else None)
+        return values
+
     @classmethod
     def _to_filter(cls, params: JobRunQuery) -> StoreFilter:
         store_filter: StoreFilter = {}
@@ -84,4 +237,15 @@ class JobRunRepository(ApplicationRepository[JobRun, JobRunQuery]):
             store_filter["job_name"] = params.job_name
         if params.status is not None:
             store_filter["status"] = params.status.value
+        if params.task_id is not None:
+            store_filter["task_id"] = params.task_id
+        if params.parent_job_run_id is not None:
+            store_filter["parent_job_run_id"] = params.parent_job_run_id
+        started_at_range: StoreFilter = {}
+        if params.started_after is not None:
+            started_at_range["$gte"] = params.started_after
+        if params.started_before is not None:
+            started_at_range["$lt"] = params.started_before
+        if started_at_range:
+            store_filter["started_at"] = started_at_range
         return store_filter
@@ -0,0 +1,70 @@
+from typing import Iterable, cast
+
+from celery.schedules import crontab
+from redbeat import RedBeatSchedulerEntry
+from redbeat.schedulers import RedBeatConfig, get_redis
+
+from modules.core.celery_app import app as celery_app
+
+CRON_ENTRY_SUFFIX = "_cron"
+
+
+class CronScheduleStore:
+    """The cron entries of jobs in the RedBeat schedule. Writes happen only when an entry is missing or its
+    definition changed: saving an entry puts it back to "due now", so an unconditional save on every start
+    would also fire each cron job once per start."""
+
+    @staticmethod
+    def parse(job_name: str, cron_schedule: str) -> crontab:
+        parts = cron_schedule.split()
+        if len(parts) != 5:
+            raise ValueError(
+                f"Invalid cron schedule '{cron_schedule}' for {job_name}. "
+                f"Expected format: 'minute hour day month day_of_week'"
+            )
+        minute, hour, day_of_month, month_of_year, day_of_week = parts
+        return crontab(
+            minute=minute, hour=hour, day_of_month=day_of_month, month_of_year=month_of_year, day_of_week=day_of_week
+        )
+
+    @staticmethod
+    def save_if_changed(job_name: str, task_name: str, cron_schedule: str) -> bool:
+        """Write the job's entry unless an identical one is stored. Returns whether it wrote."""
+        entry = RedBeatSchedulerEntry(
+            name=f"{task_name}{CRON_ENTRY_SUFFIX}",
+            task=task_name,
+            schedule=CronScheduleStore.parse(job_name, cron_schedule),
+            app=celery_app,
+        )
+        try:
+            stored = RedBeatSchedulerEntry.from_key(entry.key, app=celery_app)
+        except KeyError:
+            entry.save()
+            return True
+
+        if stored.task == entry.task and stored.schedule == entry.schedule and stored.enabled:
+            return False
+        # Keep the last run, so the new schedule's next run follows it instead of firing at once.
+        entry.last_run_at = stored.last_run_at
+        entry.save()
+        return True
+
+    @staticmethod
+    def remove_stale(task_prefix: str, task_names: Iterable[str]) -> list[str]:
+        """Delete the cron entries under `task_prefix` whose task is not in `task_names`, such as the
+        schedule of a job that was removed or lost its cron_schedule. Returns the deleted entry names."""
+        key_prefix = RedBeatConfig(celery_app).key_prefix
+        wanted = {f"{key_prefix}{task_name}{CRON_ENTRY_SUFFIX}" for task_name in task_names}
+        client = get_redis(celery_app)
+        removed: list[str] = []
+        for raw_key in cast(list[bytes | str], client.zrange(RedBeatConfig(celery_app).schedule_key, 0, -1)):
+            key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+            name = key.removeprefix(key_prefix)
+            if key in wanted or not name.startswith(task_prefix) or not name.endswith(CRON_ENTRY_SUFFIX):
+                continue
+            with client.pipeline() as pipeline:
+                pipeline.zrem(RedBeatConfig(celery_app).schedule_key, key)
+                pipeline.delete(key)
+                pipeline.execute()
+            removed.append(name)
+        return removed
@@ -0,0 +1,49 @@
+import threading
+import time
+
+from modules.core.common.types import CircuitState
+
+
+class CircuitBreaker:
+    """In-process breaker for one downstream host. After `failure_threshold` consecutive failures it opens
+    and rejects calls for `reset_timeout_seconds`; then it lets a single trial call through (half-open),
+    which closes it on success and reopens it on failure. `failure_threshold <= 0` never opens."""
+
+    def __init__(self, *, failure_threshold: int, reset_timeout_seconds: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.OPEN and self.retry_after_seconds() <= 0:
+                # Exactly one caller moves the breaker to half-open and makes the trial call.
+                self._state = CircuitState.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == CircuitState.HALF_OPEN or (
+                self.failure_threshold > 0 and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+
+    def retry_after_seconds(self) -> float:
+        return max(0.0, self._opened_at + self.reset_timeout_seconds - time.monotonic())
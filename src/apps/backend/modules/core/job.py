@@ -1,24 +1,67 @@
+import itertools
+import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, ClassVar, Optional
+from typing import Any, ClassVar, Iterable, Optional
 
 from celery import Task
 from celery.result import AsyncResult
-from celery.schedules import crontab
-from redbeat import RedBeatSchedulerEntry
 
+from modules.core.celery_app import CPU_QUEUE_SUFFIX
 from modules.core.celery_app import app as celery_app
-from modules.core.common.types import ActorType, AuditActor, JobArguments
+from modules.core.common.types import (
+    REDACTED,
+    ActorType,
+    AuditActor,
+    JobArguments,
+    JobBatch,
+    JobRun,
+    JobRunProgress,
+    JobRunRecording,
+    JobRunStatus,
+    JobWorkload,
+)
+from modules.core.internal.job_limits.job_limiter import JobLimiter
 from modules.core.internal.job_run.job_run_service import JobRunService
 from modules.logger.logger import Logger
 
+# Message header naming the aggregate job_run of a tracked perform_many batch. A header rather than a kwarg,
+# so perform never sees it; Celery copies headers onto retries.
+BATCH_JOB_RUN_ID_HEADER = "batch_job_run_id"
+# Message header naming the aggregate job_run of a JobWorkflow, set on every step's signature.
+WORKFLOW_JOB_RUN_ID_HEADER = "workflow_job_run_id"
+
+DEFAULT_PERFORM_MANY_CHUNK_SIZE = 1000
+
 
 class Job(ABC):
     queue: ClassVar[str] = "default"
+    # CPU-bound jobs are routed to the ".cpu" twin of `queue`, which the process-pool worker profiles consume.
+    workload: ClassVar[JobWorkload] = JobWorkload.IO
     max_retries: ClassVar[int] = 3
     retry_backoff: ClassVar[bool] = True
     retry_backoff_max: ClassVar[int] = 600
+    # Exceptions that fail the run at once instead of being retried: an error that the same call would
+    # raise again, e.g. a provider rejecting the request.
+    dont_retry_for: ClassVar[tuple[type[Exception], ...]] = ()
     cron_schedule: ClassVar[Optional[str]] = None
+    # Argument names whose values never reach the job_run record, on top of the globally sensitive names
+    # (password, token, otp, ...): e.g. a message body that carries a one-time code.
+    redacted_arguments: ClassVar[frozenset[str]] = frozenset()
+    # How the run is written to job_run. FULL costs an insert and an update (each audited) per run; a short,
+    # frequent job can drop to COMPLETION_ONLY or BUFFERED. Only FULL shows a run while it is in flight, so a
+    # job whose run takes increment_progress calls, or is watched while running, stays FULL.
+    job_run_recording: ClassVar[JobRunRecording] = JobRunRecording.FULL
+    # Most runs of this job executing at once across all workers. A run over the limit is recorded as
+    # DEFERRED and queued again after concurrency_defer_seconds.
+    max_concurrency: ClassVar[Optional[int]] = None
+    concurrency_defer_seconds: ClassVar[int] = 30
+    # Keyword argument names whose values identify a duplicate; () makes every run of the job a duplicate of
+    # the others. While one task holds the key (for dedupe_window seconds from its enqueue or start), another
+    # enqueue returns the holder's AsyncResult instead, and a run that still arrives (e.g. from the cron
+    # scheduler) is recorded as SKIPPED.
+    unique_key: ClassVar[Optional[tuple[str, ...]]] = None
+    dedupe_window: ClassVar[int] = 300
 
     @classmethod
     @abstractmethod
@@ -28,40 +71,200 @@ class Job(ABC):
 
     @classmethod
     def perform_async(cls, *args: Any, **kwargs: Any) -> AsyncResult:
-        task = cls._get_celery_task()
-        return task.apply_async(args=args, kwargs=kwargs)
+        return cls._enqueue(args, kwargs)[0]
 
     @classmethod
     def perform_at(cls, run_at: datetime, *args: Any, **kwargs: Any) -> AsyncResult:
-        task = cls._get_celery_task()
-        return task.apply_async(args=args, kwargs=kwargs, eta=run_at)
+        return cls._enqueue(args, kwargs, eta=run_at)[0]
 
     @classmethod
     def perform_in(cls, delay_seconds: int, *args: Any, **kwargs: Any) -> AsyncResult:
+        return cls._enqueue(args, kwargs, countdown=delay_seconds)[0]
+
+    @classmethod
+    def perform_many(
+        cls,
+        calls: Iterable[dict[str, Any]],
+        *,
+        chunk_size: int = DEFAULT_PERFORM_MANY_CHUNK_SIZE,
+        track_batch: bool = False,
+    ) -> JobBatch:
+        """Enqueue one run per item of `calls`, each a dict of the keyword arguments perform_async would take.
+
+        `calls` is consumed lazily, one chunk at a time, so a generator over a large backfill is never held in
+        memory. Each chunk is published through one broker producer instead of a pool checkout per message.
+        With `track_batch`, the batch gets its own job_run (`<JobName>.perform_many`) whose progress counts
+        `enqueued`, `succeeded` and `failed` runs; it is finalized when the last run finishes, as failed if
+        any run exhausted its retries."""
+        batch_job_run_id = JobRunService.start_batch(job_name=cls.__name__).id if track_batch else None
+        headers = {BATCH_JOB_RUN_ID_HEADER: batch_job_run_id} if batch_job_run_id is not None else None
+
+        enqueued = 0
+        duplicates = 0
+        for chunk in itertools.batched(calls, chunk_size):
+            chunk_enqueued = 0
+            with celery_app.producer_or_acquire() as producer:
+                for kwargs in chunk:
+                    if cls._enqueue((), kwargs, headers=headers, producer=producer)[1]:
+                        chunk_enqueued += 1
+            enqueued += chunk_enqueued
+            duplicates += len(chunk) - chunk_enqueued
+            if batch_job_run_id is not None and chunk_enqueued:
+                JobRunService.record_batch_enqueued(batch_job_run_id=batch_job_run_id, count=chunk_enqueued)
+
+        if batch_job_run_id is not None:
+            JobRunService.finish_batch_enqueue(batch_job_run_id=batch_job_run_id)
+        return JobBatch(enqueued=enqueued, duplicates=duplicates, job_run_id=batch_job_run_id)
+
+    @staticmethod
+    def increment_progress(job_run_id: str, counters: JobRunProgress, *, actor: AuditActor) -> None:
+        """Add to the named progress counters on a job_run record. A job reports on its own run with
+        `actor.actor_id`; the chunk jobs of a fan-out report on the run that enqueued them."""
+        JobRunService.increment_progress(job_run_id=job_run_id, counters=counters, actor=actor)
+
+    @staticmethod
+    def flush_buffered_job_runs() -> None:
+        """Write the job runs this process holds for BUFFERED jobs; the worker calls this on shutdown."""
+        JobRunService.flush_buffered()
+
+    @staticmethod
+    def get_job_run_for(async_result: AsyncResult, *, actor: AuditActor) -> Optional[JobRun]:
+        """The job_run record of a task enqueued with perform_async / perform_at / perform_in, read from
+        Mongo rather than the Celery result backend. None until a worker has started the task; after a
+        retry, the newest attempt."""
+        return JobRunService.get_latest_job_run_by_task_id(task_id=async_result.id, actor=actor)
+
+    @classmethod
+    def _enqueue(cls, args: tuple[Any, ...], kwargs: dict[str, Any], **options: Any) -> tuple[AsyncResult, bool]:
+        # Returns the task's result handle and whether a message was published; a duplicate of a task that
+        # holds the unique key gets that task's handle and publishes nothing.
         task = cls._get_celery_task()
-        return task.apply_async(args=args, kwargs=kwargs, countdown=delay_seconds)
+        if cls.unique_key is None:
+            return task.apply_async(args=args, kwargs=kwargs, **options), True
+
+        task_id = str(uuid.uuid4())
+        owner = JobLimiter.claim_unique(
+            JobLimiter.unique_key_for(cls.__name__, cls.unique_key, kwargs), task_id, window_seconds=cls.dedupe_window
+        )
+        if owner is not None and owner != task_id:
+            return AsyncResult(owner, app=celery_app), False
+        return task.apply_async(args=args, kwargs=kwargs, task_id=task_id, **options), True
 
     @classmethod
     def _run_with_job_run(cls, task: Task, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        headers = task.request.headers or {}
+        if cls.unique_key is not None and cls._is_duplicate_run(task, kwargs):
+            cls._record_not_run(task, args, kwargs, JobRunStatus.SKIPPED, headers)
+            return None
+
+        slot_holder = None
+        if cls.max_concurrency is not None:
+            slot_holder = f"{task.request.id}:{uuid.uuid4().hex}"
+            # A worker killed mid-run leaves its slot until the lease ends; the hard time limit bounds any run.
+            lease_seconds = int(celery_app.conf.task_time_limit or 3600) + 60
+            if not JobLimiter.acquire_slot(
+                cls.__name__, slot_holder, limit=cls.max_concurrency, lease_seconds=lease_seconds
+            ):
+                cls._record_not_run(task, args, kwargs, JobRunStatus.DEFERRED, headers)
+                cls._defer(task, args, kwargs)
+                return None
+
+        try:
+            return cls._run_recorded(task, args, kwargs, headers)
+        finally:
+            if slot_holder is not None:
+                JobLimiter.release_slot(cls.__name__, slot_holder)
+
+    @classmethod
+    def _is_duplicate_run(cls, task: Task, kwargs: dict[str, Any]) -> bool:
+        # The task that claimed the key at enqueue finds itself as the holder; one published by the cron
+        # scheduler, or after the window lapsed, claims the key here.
+        assert cls.unique_key is not None
+        task_id = task.request.id
+        owner = JobLimiter.claim_unique(
+            JobLimiter.unique_key_for(cls.__name__, cls.unique_key, kwargs), task_id, window_seconds=cls.dedupe_window
+        )
+        return owner is not None and owner != task_id
+
+    @classmethod
+    def _defer(cls, task: Task, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        if task.request.is_eager:
+            # An eager "later" would run inline, inside the run that holds the slot, and never get one.
+            return
+        # replace keeps the task id, so a unique key it holds still names it, and carries over the rest of a
+        # workflow's chain and chord instead of letting the chain continue without this step's result.
+        task.replace(
+            task.signature(
+                args,
+                kwargs,
+                countdown=cls.concurrency_defer_seconds,
+                headers=task.request.headers,
+                retries=task.request.retries or 0,
+            )
+        )
+
+    @classmethod
+    def _record_not_run(
+        cls, task: Task, args: tuple[Any, ...], kwargs: dict[str, Any], status: JobRunStatus, headers: dict[str, Any]
+    ) -> None:
+        job_run = JobRunService.record_not_run(
+            job_name=cls.__name__,
+            arguments=cls._describe_arguments(args, kwargs),
+            retry_count=task.request.retries or 0,
+            task_id=task.request.id,
+            parent_job_run_id=Job._parent_job_run_id(headers),
+            status=status,
+            recording=cls.job_run_recording,
+        )
+        Logger.info(message=f"[job.limits] {cls.__name__} task {task.request.id} {status.value}")
+        # A deferred run comes back later; a skipped one is its batch member's or workflow step's outcome.
+        if status == JobRunStatus.SKIPPED:
+            Job._record_outcome(headers, status, AuditActor(actor_type=ActorType.JOB, actor_id=job_run.id))
+
+    @classmethod
+    def _run_recorded(cls, task: Task, args: tuple[Any, ...], kwargs: dict[str, Any], headers: dict[str, Any]) -> Any:
         job_run = JobRunService.start(
             job_name=cls.__name__,
             arguments=cls._describe_arguments(args, kwargs),
             retry_count=task.request.retries or 0,
+            task_id=task.request.id,
+            parent_job_run_id=Job._parent_job_run_id(headers),
+            recording=cls.job_run_recording,
         )
         actor = AuditActor(actor_type=ActorType.JOB, actor_id=job_run.id)
         try:
             result = cls.perform(*args, actor=actor, **kwargs)
-        except Exception:
-            JobRunService.mark_failed(job_run_id=job_run.id)
+        except Exception as error:
+            JobRunService.finish(job_run=job_run, status=JobRunStatus.FAILED, recording=cls.job_run_recording)
+            # An attempt that will be retried is not the outcome; only the last one counts toward the parent.
+            if (task.request.retries or 0) >= cls.max_retries or isinstance(error, cls.dont_retry_for):
+                Job._record_outcome(headers, JobRunStatus.FAILED, actor)
             raise
-        JobRunService.mark_succeeded(job_run_id=job_run.id)
+        JobRunService.finish(job_run=job_run, status=JobRunStatus.SUCCEEDED, recording=cls.job_run_recording)
+        Job._record_outcome(headers, JobRunStatus.SUCCEEDED, actor)
         return result
 
     @staticmethod
-    def _describe_arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> JobArguments:
+    def _parent_job_run_id(headers: dict[str, Any]) -> Optional[str]:
+        parent_job_run_id: Optional[str] = headers.get(BATCH_JOB_RUN_ID_HEADER) or headers.get(
+            WORKFLOW_JOB_RUN_ID_HEADER
+        )
+        return parent_job_run_id
+
+    @staticmethod
+    def _record_outcome(headers: dict[str, Any], status: JobRunStatus, actor: AuditActor) -> None:
+        batch_job_run_id = headers.get(BATCH_JOB_RUN_ID_HEADER)
+        if batch_job_run_id:
+            JobRunService.record_batch_outcome(batch_job_run_id=batch_job_run_id, status=status, actor=actor)
+        workflow_job_run_id = headers.get(WORKFLOW_JOB_RUN_ID_HEADER)
+        if workflow_job_run_id:
+            JobRunService.record_workflow_outcome(workflow_job_run_id=workflow_job_run_id, status=status, actor=actor)
+
+    @classmethod
+    def _describe_arguments(cls, args: tuple[Any, ...], kwargs: dict[str, Any]) -> JobArguments:
         described: JobArguments = {f"arg_{index}": Job._describe_value(value) for index, value in enumerate(args)}
         for name, value in kwargs.items():
-            described[name] = Job._describe_value(value)
+            described[name] = REDACTED if name in cls.redacted_arguments else Job._describe_value(value)
         return described
 
     @staticmethod
@@ -78,9 +281,10 @@ class Job(ABC):
         @celery_app.task(
             name=task_name,
             bind=True,
-            queue=cls.queue,
+            queue=cls.routed_queue(),
             max_retries=cls.max_retries,
             autoretry_for=(Exception,),
+            dont_autoretry_for=cls.dont_retry_for,
             retry_backoff=cls.retry_backoff,
             retry_backoff_max=cls.retry_backoff_max,
             retry_jitter=True,
@@ -91,43 +295,9 @@ class Job(ABC):
         return celery_task
 
     @classmethod
-    def register(cls) -> None:
-        cls.register_task()
-        cls.register_cron()
-        if cls.cron_schedule:
-            Logger.info(message=f"Registered job {cls.__name__} with cron schedule: {cls.cron_schedule}")
-        else:
-            Logger.info(message=f"Registered job {cls.__name__}")
+    def routed_queue(cls) -> str:
+        return f"{cls.queue}{CPU_QUEUE_SUFFIX}" if cls.workload == JobWorkload.CPU else cls.queue
 
     @classmethod
     def register_task(cls) -> None:
         cls._get_celery_task()
-
-    @classmethod
-    def register_cron(cls) -> None:
-        if not cls.cron_schedule:
-            return
-
-        parts = cls.cron_schedule.split()
-        if len(parts) != 5:
-            raise ValueError(
-                f"Invalid cron schedule '{cls.cron_schedule}' for {cls.__name__}. "
-                f"Expected format: 'minute hour day month day_of_week'"
-            )
-
-        minute, hour, day_of_month, month_of_year, day_of_week = parts
-        task = cls._get_celery_task()
-
-        entry = RedBeatSchedulerEntry(
-            name=f"{cls.__module__}.{cls.__name__}_cron",
-            task=task.name,
-            schedule=crontab(
-                minute=minute,
-                hour=hour,
-                day_of_month=day_of_month,
-                month_of_year=month_of_year,
-                day_of_week=day_of_week,
-            ),
-            app=celery_app,
-        )
-        entry.save()
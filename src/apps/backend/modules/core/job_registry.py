@@ -1,9 +1,13 @@
 import importlib
+import json
 import pkgutil
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from pathlib import Path
 from types import ModuleType
-from typing import Iterator, Optional, Type
+from typing import ClassVar, Iterator, Optional, Type
 
+from modules.core.common.types import JobManifestEntry
+from modules.core.internal.job_schedule.cron_schedule_store import CronScheduleStore
 from modules.core.job import Job
 from modules.logger.logger import Logger
 
@@ -29,19 +33,75 @@ class JobsPackage:
 
 
 class JobRegistry:
+    """Registers the application's jobs from job_manifest.json, which lists every Job subclass in a
+    `modules/*/jobs/` package with its cron schedule. Reading the manifest replaces walking and importing
+    every module's jobs package at each start; a test keeps it in sync with discover().
+
+    Only processes that execute jobs call initialize(); a web process imports a job's module when it first
+    enqueues it. Cron entries are written from the manifest by sync_cron_schedules() when beat starts, and
+    only where the stored entry is missing or differs."""
+
     ROOT_PACKAGE = "modules"
+    MANIFEST_PATH: ClassVar[Path] = Path(__file__).with_name("job_manifest.json")
+
+    _initialized: ClassVar[bool] = False
 
     @classmethod
     def initialize(cls) -> None:
-        for jobs_package in cls._jobs_packages():
-            jobs_package.load_jobs()
+        if cls._initialized:
+            return
+        entries = cls.load_manifest()
+        for entry in entries:
+            importlib.import_module(entry.module)
 
         jobs = cls._loaded_jobs()
         for job in jobs:
-            job.register()
+            job.register_task()
+        cls._initialized = True
 
         Logger.info(message=f"Registered {len(jobs)} jobs")
 
+    @classmethod
+    def sync_cron_schedules(cls) -> None:
+        cron_entries = [
+            (entry, cron_schedule) for entry in cls.load_manifest() if (cron_schedule := entry.cron_schedule)
+        ]
+        saved = [
+            entry.job_name
+            for entry, cron_schedule in cron_entries
+            if CronScheduleStore.save_if_changed(entry.job_name, entry.task_name, cron_schedule)
+        ]
+        removed = CronScheduleStore.remove_stale(f"{cls.ROOT_PACKAGE}.", [entry.task_name for entry, _ in cron_entries])
+        Logger.info(
+            message=(
+                f"Synced {len(cron_entries)} cron schedules: {len(saved)} written {saved}, "
+                f"{len(removed)} removed {removed}"
+            )
+        )
+
+    @classmethod
+    def load_manifest(cls) -> list[JobManifestEntry]:
+        return [JobManifestEntry(**entry) for entry in json.loads(cls.MANIFEST_PATH.read_text())["jobs"]]
+
+    @classmethod
+    def write_manifest(cls) -> list[JobManifestEntry]:
+        entries = cls.discover()
+        manifest = {"jobs": [asdict(entry) for entry in entries]}
+        cls.MANIFEST_PATH.write_text(json.dumps(manifest, indent=2) + "\n")
+        return entries
+
+    @classmethod
+    def discover(cls) -> list[JobManifestEntry]:
+        """The manifest as it should read: every Job subclass defined in a jobs package, found by importing
+        each `modules/*/jobs/` package. Subclasses defined anywhere else, such as in tests, are left out."""
+        for jobs_package in cls._jobs_packages():
+            jobs_package.load_jobs()
+        return [
+            JobManifestEntry(job_name=job.__name__, module=job.__module__, cron_schedule=job.cron_schedule)
+            for job in sorted(cls._loaded_jobs(), key=lambda job: (job.__module__, job.__name__))
+            if job.__module__.startswith(f"{cls.ROOT_PACKAGE}.") and f".{JobsPackage.PACKAGE_NAME}." in job.__module__
+        ]
+
     @classmethod
     def _jobs_packages(cls) -> Iterator[JobsPackage]:
         root = importlib.import_module(cls.ROOT_PACKAGE)
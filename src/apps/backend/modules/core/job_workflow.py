@@ -0,0 +1,130 @@
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from celery import chain, chord, group
+from celery.canvas import Signature
+
+from modules.core.common.types import JobArguments, JobWorkflowRun
+from modules.core.internal.job_run.job_run_service import JobRunService
+from modules.core.job import WORKFLOW_JOB_RUN_ID_HEADER, Job
+
+
+@dataclass(frozen=True)
+class WorkflowStep:
+    job: type[Job]
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    # Inside a chain or as a chord callback, the step gets the previous result (a chord: the list of its
+    # group's results) as its first positional argument, ahead of `args`.
+    receives_result: bool = True
+
+    def ignoring_result(self) -> "WorkflowStep":
+        return dataclasses.replace(self, receives_result=False)
+
+
+@dataclass(frozen=True)
+class WorkflowChain:
+    nodes: tuple["WorkflowNode", ...]
+
+
+@dataclass(frozen=True)
+class WorkflowGroup:
+    nodes: tuple["WorkflowNode", ...]
+
+
+@dataclass(frozen=True)
+class WorkflowChord:
+    header: WorkflowGroup
+    callback: "WorkflowNode"
+
+
+type WorkflowNode = WorkflowStep | WorkflowChain | WorkflowGroup | WorkflowChord
+
+
+class JobWorkflow:
+    """Pipelines of jobs over Celery canvas. `chain` runs its parts one after another and hands each result
+    to the next; `group` runs its parts in parallel on whichever workers are free; `chord` runs a group and
+    then a callback with the list of its results. Parts nest:
+
+        JobWorkflow.start(
+            "account_export",
+            JobWorkflow.chain(
+                JobWorkflow.step(ExportJob, account_id=account_id),
+                JobWorkflow.chord(
+                    [JobWorkflow.step(CompressJob, part=part) for part in ("csv", "pdf")],
+                    JobWorkflow.step(EmailExportJob, account_id=account_id),
+                ),
+            ),
+        )
+
+    Every step is an ordinary run of its job, with its own job_run record, retries and redaction. start()
+    also writes one aggregate job_run, `workflow.<name>`, that each step's run names as parent_job_run_id
+    and whose progress counts the steps' outcomes: it fails with the first step that fails for good, and
+    succeeds once every step has succeeded or been skipped. Steps bypass Job.unique_key checks at enqueue;
+    a duplicate step is still skipped when it runs, and the chain goes on with None as its result."""
+
+    @staticmethod
+    def step(job: type[Job], /, *args: Any, **kwargs: Any) -> WorkflowStep:
+        return WorkflowStep(job=job, args=args, kwargs=kwargs)
+
+    @staticmethod
+    def chain(*nodes: WorkflowNode) -> WorkflowChain:
+        return WorkflowChain(nodes=nodes)
+
+    @staticmethod
+    def group(*nodes: WorkflowNode) -> WorkflowGroup:
+        return WorkflowGroup(nodes=nodes)
+
+    @staticmethod
+    def chord(header: Iterable[WorkflowNode], callback: WorkflowNode) -> WorkflowChord:
+        return WorkflowChord(header=WorkflowGroup(nodes=tuple(header)), callback=callback)
+
+    @staticmethod
+    def start(name: str, workflow: WorkflowNode) -> JobWorkflowRun:
+        steps = JobWorkflow._steps(workflow)
+        if not steps:
+            raise ValueError(f"Workflow {name!r} has no steps")
+        job_run = JobRunService.start_workflow(name=name, arguments=JobWorkflow._describe(steps), steps=len(steps))
+        result = JobWorkflow._signature(workflow, {WORKFLOW_JOB_RUN_ID_HEADER: job_run.id}).apply_async()
+        return JobWorkflowRun(job_run_id=job_run.id, result_id=result.id)
+
+    @staticmethod
+    def _signature(node: WorkflowNode, headers: dict[str, str]) -> Signature:
+        # Every step carries the header itself: the worker that continues a chain or fires a chord callback
+        # publishes the next signature with that signature's own options, not the finished task's headers.
+        match node:
+            case WorkflowStep():
+                return node.job._get_celery_task().signature(
+                    node.args, node.kwargs, headers=headers, immutable=not node.receives_result
+                )
+            case WorkflowChain():
+                return chain(*(JobWorkflow._signature(child, headers) for child in node.nodes))
+            case WorkflowGroup():
+                return group(*(JobWorkflow._signature(child, headers) for child in node.nodes))
+            case WorkflowChord():
+                return chord(
+                    [JobWorkflow._signature(child, headers) for child in node.header.nodes],
+                    JobWorkflow._signature(node.callback, headers),
+                )
+
+    @staticmethod
+    def _steps(node: WorkflowNode) -> list[WorkflowStep]:
+        match node:
+            case WorkflowStep():
+                return [node]
+            case WorkflowChain() | WorkflowGroup():
+                return [step for child in node.nodes for step in JobWorkflow._steps(child)]
+            case WorkflowChord():
+                return JobWorkflow._steps(node.header) + JobWorkflow._steps(node.callback)
+
+    @staticmethod
+    def _describe(steps: list[WorkflowStep]) -> JobArguments:
+        # Each step's arguments as its own job_run will record them, including the job's redacted_arguments,
+        # keyed by the step's position in the workflow.
+        described: JobArguments = {}
+        for index, step in enumerate(steps):
+            described[f"{index}:job"] = step.job.__name__
+            for name, value in step.job._describe_arguments(step.args, step.kwargs).items():
+                described[f"{index}:{name}"] = value
+        return described
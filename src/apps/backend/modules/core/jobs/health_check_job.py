@@ -1,10 +1,9 @@
 from typing import Any
 
-import requests
-
 from modules.config.config_service import ConfigService
 from modules.core.common.types import AuditActor
 from modules.core.job import Job
+from modules.core.outbound_http_client import OutboundHttpClient
 from modules.logger.logger import Logger
 
 
@@ -12,13 +11,17 @@ class HealthCheckJob(Job):
     queue = "default"
     max_retries = 1
     cron_schedule = "*/10 * * * *"
+    # A backed-up queue would otherwise run every missed check back to back against the same URL.
+    max_concurrency = 1
+    unique_key = ()
+    dedupe_window = 300
 
     @classmethod
     def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
         health_check_url = ConfigService[str].get_value("worker.health_check_url", default="http://localhost:8080/api/")
 
         try:
-            res = requests.get(health_check_url, timeout=3)
+            res = OutboundHttpClient.get(health_check_url, timeout=3)
 
             if res.status_code == 200:
                 Logger.info(message="Backend is healthy")
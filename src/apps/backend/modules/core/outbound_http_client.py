@@ -0,0 +1,152 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from modules.config.config_service import ConfigService
+from modules.core.common.types import OutboundHttpConfig
+from modules.core.errors import OutboundCircuitOpenError
+from modules.core.internal.outbound_http.circuit_breaker import CircuitBreaker
+
+type Timeout = float | tuple[float, float]
+
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class _HostPool:
+    session: requests.Session
+    breaker: CircuitBreaker
+
+
+@dataclass(frozen=True)
+class _OutboundHttpState:
+    # Resolved per loaded config so a config reload (tests swap the config manager) builds fresh pools.
+    config_source: object
+    config: OutboundHttpConfig
+    pools: dict[str, _HostPool] = field(default_factory=dict)
+
+
+class OutboundHttpClient:
+    """The one way the backend calls third-party HTTP APIs. Each host (scheme and authority) gets its own
+    kept-alive connection pool and circuit breaker, and every call gets connect/read timeouts and retries
+    with jittered backoff from `outbound_http` config. Nothing here logs: the Datadog log handler sends
+    through this client, and logging from inside it would feed back into the handler."""
+
+    _state: ClassVar[Optional[_OutboundHttpState]] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def request(cls, method: str, url: str, *, timeout: Optional[Timeout] = None, **kwargs: Any) -> requests.Response:
+        """
+        Send the request through the host's pool. Raises OutboundCircuitOpenError without calling the
+        host while its breaker is open. Transport errors and 5xx responses count as breaker failures
+        once retries are exhausted; any other response is returned to the caller to interpret.
+        """
+        state = cls._get_state()
+        host = cls._host_of(url)
+        pool = cls._get_pool(state, host)
+        if not pool.breaker.allow_request():
+            raise OutboundCircuitOpenError(host=host, retry_after_seconds=pool.breaker.retry_after_seconds())
+
+        resolved_timeout = (
+            timeout
+            if timeout is not None
+            else (state.config.connect_timeout_seconds, state.config.read_timeout_seconds)
+        )
+        try:
+            response = pool.session.request(method, url, timeout=resolved_timeout, **kwargs)
+        except requests.RequestException:
+            pool.breaker.record_failure()
+            raise
+
+        if response.status_code >= 500:
+            pool.breaker.record_failure()
+        else:
+            pool.breaker.record_success()
+        return response
+
+    @classmethod
+    def get(cls, url: str, **kwargs: Any) -> requests.Response:
+        return cls.request("GET", url, **kwargs)
+
+    @classmethod
+    def post(cls, url: str, **kwargs: Any) -> requests.Response:
+        return cls.request("POST", url, **kwargs)
+
+    @classmethod
+    def reset(cls) -> None:
+        # Close every pooled connection; the next call builds fresh pools and breakers.
+        with cls._lock:
+            state, cls._state = cls._state, None
+        if state is not None:
+            for pool in state.pools.values():
+                pool.session.close()
+
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        # The child must not write on connections it shares with its parent, nor close them under it: drop
+        # the inherited pools unclosed (and a lock some parent thread may have held) and build new ones.
+        cls._state = None
+        cls._lock = threading.Lock()
+
+    @classmethod
+    def _get_state(cls) -> _OutboundHttpState:
+        config_source = ConfigService.config_manager
+        state = cls._state
+        if state is None or state.config_source is not config_source:
+            with cls._lock:
+                state = cls._state
+                if state is None or state.config_source is not config_source:
+                    state = _OutboundHttpState(
+                        config_source=config_source, config=ConfigService.get_section(OutboundHttpConfig)
+                    )
+                    cls._state = state
+        return state
+
+    @classmethod
+    def _get_pool(cls, state: _OutboundHttpState, host: str) -> _HostPool:
+        pool = state.pools.get(host)
+        if pool is None:
+            with cls._lock:
+                pool = state.pools.get(host)
+                if pool is None:
+                    pool = _HostPool(
+                        session=cls._build_session(state.config),
+                        breaker=CircuitBreaker(
+                            failure_threshold=state.config.circuit_failure_threshold,
+                            reset_timeout_seconds=state.config.circuit_reset_timeout_seconds,
+                        ),
+                    )
+                    state.pools[host] = pool
+        return pool
+
+    @staticmethod
+    def _build_session(config: OutboundHttpConfig) -> requests.Session:
+        retry = Retry(
+            total=config.max_retries,
+            connect=config.max_retries,
+            # Read errors and retryable statuses are retried only for idempotent methods (urllib3's
+            # default allowed_methods), so a POST that may have reached the provider is never resent.
+            read=config.max_retries,
+            status=config.max_retries,
+            status_forcelist=RETRYABLE_STATUS_CODES,
+            backoff_factor=config.backoff_factor,
+            backoff_jitter=config.backoff_jitter,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=config.pool_maxsize, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
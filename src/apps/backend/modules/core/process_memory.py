@@ -0,0 +1,72 @@
+import gc
+import os
+from pathlib import Path
+from typing import ClassVar, Optional
+
+from modules.config.config_service import ConfigService
+from modules.core.common.types import ProcessMemoryConfig, ProcessMemoryUsage
+
+
+class ProcessMemory:
+    """Keeps the heap a forking parent builds shared with its children, and measures how much stays shared.
+
+    With preload_app, the gunicorn master imports every module, loads config and builds the app once, and
+    each worker starts out sharing those pages copy-on-write. CPython writes to an object whenever it
+    collects garbage (gc headers) or counts a reference, so each collection in a worker un-shares pages it
+    walks. The master holds off collection while it imports (hold_gc_until_fork), freezes what it built
+    (freeze_preloaded_heap) so the children's collections skip it, and each child then turns collection
+    back on with its own thresholds (tune_gc_after_fork). Celery's prefork parent freezes its heap the
+    same way after registering jobs. See docs/deployment.md."""
+
+    SMAPS_ROLLUP_PATH: ClassVar[str] = "/proc/{pid}/smaps_rollup"
+
+    @staticmethod
+    def hold_gc_until_fork() -> None:
+        # Freeing garbage while the parent imports would leave holes in its pages that the children's
+        # allocations then fill, un-sharing them; the parent allocates little after the fork anyway.
+        if ConfigService.get_section(ProcessMemoryConfig).freeze_preloaded_heap:
+            gc.disable()
+
+    @staticmethod
+    def freeze_preloaded_heap() -> None:
+        if ConfigService.get_section(ProcessMemoryConfig).freeze_preloaded_heap:
+            gc.freeze()
+
+    @staticmethod
+    def tune_gc_after_fork() -> None:
+        config = ConfigService.get_section(ProcessMemoryConfig)
+        gc.set_threshold(
+            config.gc_generation0_threshold, config.gc_generation1_threshold, config.gc_generation2_threshold
+        )
+        gc.enable()
+
+    @staticmethod
+    def usage(pid: Optional[int] = None) -> Optional[ProcessMemoryUsage]:
+        # None where /proc/<pid>/smaps_rollup is unavailable (macOS, kernels before 4.14).
+        path = Path(ProcessMemory.SMAPS_ROLLUP_PATH.format(pid=pid or os.getpid()))
+        try:
+            rollup = path.read_text()
+        except OSError:
+            return None
+
+        kib: dict[str, int] = {}
+        for line in rollup.splitlines():
+            name, separator, value = line.partition(":")
+            fields = value.split()
+            if separator and fields and fields[0].isdigit():
+                kib[name] = int(fields[0])
+        return ProcessMemoryUsage(
+            rss_kib=kib.get("Rss", 0),
+            pss_kib=kib.get("Pss", 0),
+            shared_kib=kib.get("Shared_Clean", 0) + kib.get("Shared_Dirty", 0),
+            private_kib=kib.get("Private_Clean", 0) + kib.get("Private_Dirty", 0),
+        )
+
+    @staticmethod
+    def describe(usage: Optional[ProcessMemoryUsage]) -> str:
+        if usage is None:
+            return "memory usage unavailable"
+        return (
+            f"rss={usage.rss_kib}KiB pss={usage.pss_kib}KiB "
+            f"shared={usage.shared_kib}KiB private={usage.private_kib}KiB"
+        )
@@ -0,0 +1,23 @@
+from modules.core.internal.audit.store.audit_log_repository import AuditLogRepository
+from modules.core.outbound_http_client import OutboundHttpClient
+from modules.core.repository import ApplicationRepository
+from modules.core.repository_client import ApplicationRepositoryClient
+
+
+class ProcessResources:
+    """The connection-holding state a forked child must not inherit. The gunicorn master (preload_app) and
+    a Celery prefork parent import the app, run bootstrap and log before forking, so they hold a Mongo
+    client, collections bound to it and kept-alive outbound pools. Each child calls reset_after_fork()
+    first thing (gunicorn's post_fork, Celery's worker_process_init) and re-creates them lazily on first
+    use, so no socket is shared between processes.
+
+    State that is safe to inherit stays: loaded config, registered jobs and mounted loggers. Redis clients
+    and the job-run buffer notice the new pid themselves, and the thread pools and in-process caches reset
+    through os.register_at_fork."""
+
+    @staticmethod
+    def reset_after_fork() -> None:
+        ApplicationRepositoryClient.reset_after_fork()
+        ApplicationRepository.reset_collections_after_fork()
+        AuditLogRepository.reset_after_fork()
+        OutboundHttpClient.reset_after_fork()
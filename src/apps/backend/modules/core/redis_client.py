@@ -0,0 +1,23 @@
+from typing import Optional
+
+from redis import Redis
+
+from modules.config.config_service import ConfigService
+from modules.core.common.types import RedisConfig
+
+
+class RedisClient:
+    _client: Optional[Redis] = None
+
+    @classmethod
+    def get_client(cls) -> Redis:
+        # One client per process; redis-py's pool notices a fork and reconnects in the child. The short
+        # socket timeouts matter because callers sit on the request path and fall back when Redis is slow.
+        if cls._client is None:
+            redis_config = ConfigService.get_section(RedisConfig)
+            cls._client = Redis.from_url(
+                redis_config.url,
+                socket_connect_timeout=redis_config.socket_timeout_seconds,
+                socket_timeout=redis_config.socket_timeout_seconds,
+            )
+        return cls._client
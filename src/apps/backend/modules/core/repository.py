@@ -1,7 +1,7 @@
 import dataclasses
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any, ClassVar, Mapping, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Iterator, Mapping, Optional
 
 if TYPE_CHECKING:
     from modules.core.common.types import AuditActor, FieldChanges, ResourceAction
@@ -40,6 +40,7 @@ class ApplicationRepository[EntityT, QueryT: QueryParams](ABC):
     See docs/backend-architecture.md."""
 
     _collection: ClassVar[Optional[Collection]] = None
+    _collection_initialized: ClassVar[bool] = False
 
     collection_name: ClassVar[str]
 
@@ -74,13 +75,25 @@ class ApplicationRepository[EntityT, QueryT: QueryParams](ABC):
             database = client.get_database()
             collection = database[cls.collection_name]
 
-            # init hook
-            cls.on_init_collection(collection)
+            # init hook, once per collection rather than once per process: a worker forked after the
+            # master declared the indexes only rebinds the collection to its own client.
+            if not cls._collection_initialized:
+                cls.on_init_collection(collection)
+                cls._collection_initialized = True
 
             cls._collection = collection
 
         return cls._collection
 
+    @classmethod
+    def reset_collections_after_fork(cls) -> None:
+        # Cached collections hold the parent's client; drop them so each is rebound on first use.
+        pending: list[type[ApplicationRepository[Any, Any]]] = [cls]
+        while pending:
+            repository = pending.pop()
+            repository._collection = None
+            pending.extend(repository.__subclasses__())
+
     @classmethod
     def on_init_collection(cls, collection: Collection) -> bool:
         # Override to declare indexes (and any one-time index migrations) for this collection. Runs
@@ -193,6 +206,23 @@ class ApplicationRepository[EntityT, QueryT: QueryParams](ABC):
             total_pages=total_pages,
         )
 
+    @classmethod
+    def iter_id_batches(cls, params: QueryT, *, batch_size: int) -> Iterator[list[str]]:
+        # Keyset pagination on _id: each batch is an index range scan that starts after the last id seen,
+        # so a batch deep into a large collection costs the same as the first, unlike skip. Only ids are
+        # read, so like count() nothing is read-audited; the consumer audits what it loads with find_many.
+        store_filter = cls._to_filter(params)
+        last_id: Optional[ObjectId] = None
+        while True:
+            batch_filter = store_filter if last_id is None else {"$and": [store_filter, {"_id": {"$gt": last_id}}]}
+            docs = list(cls.collection().find(batch_filter, {"_id": 1}).sort("_id", 1).limit(batch_size))
+            if not docs:
+                return
+            yield [str(doc["_id"]) for doc in docs]
+            if len(docs) < batch_size:
+                return
+            last_id = docs[-1]["_id"]
+
     @classmethod
     def count(cls, params: QueryT) -> int:
         return cls._count(cls._to_filter(params))
@@ -230,12 +260,19 @@ class ApplicationRepository[EntityT, QueryT: QueryParams](ABC):
 
     @classmethod
     def update_by_query(
-        cls, params: QueryT, fields: FieldUpdates, *, actor: "AuditActor", action: Optional["ResourceAction"] = None
+        cls,
+        params: QueryT,
+        fields: FieldUpdates,
+        *,
+        actor: "AuditActor",
+        action: Optional["ResourceAction"] = None,
+        sort: Optional[SortSpec] = None,
     ) -> Optional[EntityT]:
         # Ownership is enforced by the write filter itself (e.g. id AND account_id), so no read-then-write
         # gap and no separate ownership READ. None when nothing matched the filter. A soft delete flips a
-        # flag through this update path, so a caller passes action=DELETE to record it as a delete.
-        return cls._update_matching(cls._to_filter(params), fields, actor, action)
+        # flag through this update path, so a caller passes action=DELETE to record it as a delete. When
+        # several documents match, `sort` picks the one updated.
+        return cls._update_matching(cls._to_filter(params), fields, actor, action, sort)
 
     @classmethod
     def update_fields(cls, entity_id: str, fields: FieldUpdates, *, actor: "AuditActor") -> bool:
@@ -254,12 +291,13 @@ class ApplicationRepository[EntityT, QueryT: QueryParams](ABC):
         fields: FieldUpdates,
         actor: "AuditActor",
         action: Optional["ResourceAction"] = None,
+        sort: Optional[SortSpec] = None,
     ) -> Optional[EntityT]:
         if not fields:
-            current: Optional[StoredDocument] = cls.collection().find_one(store_filter)
+            current: Optional[StoredDocument] = cls.collection().find_one(store_filter, sort=sort)
             return cls.from_doc(current) if current is not None else None
         patch = {"updated_at": datetime.now(UTC), **fields}
-        previous = cls._apply_update(store_filter, patch, fields, actor, action)
+        previous = cls._apply_update(store_filter, patch, fields, actor, action, sort)
         if previous is None:
             return None
         return cls.from_doc({**previous, **patch})
@@ -272,11 +310,12 @@ class ApplicationRepository[EntityT, QueryT: QueryParams](ABC):
         fields: FieldUpdates,
         actor: "AuditActor",
         action: Optional["ResourceAction"] = None,
+        sort: Optional[SortSpec] = None,
     ) -> Optional[StoredDocument]:
         # BEFORE returns the document as it was immediately before the $set, so the audit diff's `old`
         # value is atomic; the audited resource_id is the matched document's own _id.
         previous: Optional[StoredDocument] = cls.collection().find_one_and_update(
-            store_filter, {"$set": patch}, return_document=ReturnDocument.BEFORE
+            store_filter, {"$set": patch}, sort=sort, return_document=ReturnDocument.BEFORE
         )
         if previous is None:
             return None
@@ -318,6 +357,38 @@ class ApplicationRepository[EntityT, QueryT: QueryParams](ABC):
             cls._emit_audit(actor, entity_id, ResourceAction.DELETE)
         return deleted
 
+    @classmethod
+    def delete_by_query(cls, params: QueryT, *, batch_size: int, max_batches: int, actor: "AuditActor") -> int:
+        """
+        Delete the documents matching params, at most batch_size per delete and max_batches deletes per call,
+        and return how many were deleted. Matches are taken in _id order by iter_id_batches; each delete
+        re-applies the filter, so a document that stopped matching since its id was read is kept. A caller
+        that hits the cap calls again to continue.
+        """
+        from modules.core.common.types import ResourceAction
+        from modules.core.internal.audit.audit_writer import AuditWriter
+
+        store_filter = cls._to_filter(params)
+        deleted = 0
+        for batch_number, entity_ids in enumerate(cls.iter_id_batches(params, batch_size=batch_size), start=1):
+            object_ids = [ObjectId(entity_id) for entity_id in entity_ids]
+            result = cls.collection().delete_many({"$and": [store_filter, {"_id": {"$in": object_ids}}]})
+            deleted_ids = entity_ids
+            if result.deleted_count < len(entity_ids):
+                kept = {str(doc["_id"]) for doc in cls.collection().find({"_id": {"$in": object_ids}}, {"_id": 1})}
+                deleted_ids = [entity_id for entity_id in entity_ids if entity_id not in kept]
+            if cls._audits():
+                AuditWriter.record_many(
+                    actor=actor,
+                    resource_type=cls._resource_type(),
+                    resource_ids=deleted_ids,
+                    action=ResourceAction.DELETE,
+                )
+            deleted += len(deleted_ids)
+            if batch_number >= max_batches:
+                break
+        return deleted
+
     @classmethod
     def _count(cls, store_filter: Optional[StoreFilter] = None) -> int:
         return int(cls.collection().count_documents(store_filter or {}))
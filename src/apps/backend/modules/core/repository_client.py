@@ -6,6 +6,7 @@ from pymongo import MongoClient
 from pymongo.server_api import ServerApi
 
 from modules.config.config_service import ConfigService
+from modules.core.common.types import MongoConfig
 from modules.logger.logger import Logger
 
 
@@ -18,9 +19,7 @@ class ApplicationRepositoryClient:
 
     @classmethod
     def get_client(cls) -> MongoClient:
-        connection_caching = ConfigService[bool].get_value(key="mongodb.connection_caching")
-
-        if connection_caching:
+        if ConfigService.get_section(MongoConfig).connection_caching:
             if cls._client is None:
                 cls._client = cls._create_client()
 
@@ -29,12 +28,20 @@ class ApplicationRepositoryClient:
         else:
             return cls._create_client()
 
+    @classmethod
+    def reset_after_fork(cls) -> None:
+        # A MongoClient is not fork-safe: its pooled sockets and monitor threads belong to the parent. The
+        # child drops the inherited client without closing it, which would end the parent's sessions, and
+        # connects afresh on first use.
+        cls._client = None
+
     @classmethod
     def _create_client(cls) -> MongoClient:
-        connection_uri = ConfigService[str].get_value(key="mongodb.uri")
+        mongo_config = ConfigService.get_section(MongoConfig)
+        connection_uri = mongo_config.uri
         cls._warn_if_uri_lacks_tls(connection_uri)
         Logger.info(message=f"connecting to database - {connection_uri}")
-        client = MongoClient(connection_uri, server_api=ServerApi("1"))
+        client = MongoClient(connection_uri, server_api=ServerApi("1"), maxPoolSize=mongo_config.max_pool_size)
         Logger.info(message=f"connected to database - {connection_uri}")
 
         return client
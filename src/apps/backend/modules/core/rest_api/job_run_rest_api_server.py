@@ -0,0 +1,13 @@
+from typing import Any, Callable
+
+from flask import Blueprint
+
+from modules.core.rest_api.job_run_router import JobRunRouter
+
+
+class JobRunRestApiServer:
+    @staticmethod
+    def create(*, auth_middleware: Callable[[Callable[..., Any]], Callable[..., Any]]) -> Blueprint:
+        # Job runs are operator-only, but core cannot depend on authentication: the app passes the check in.
+        job_run_api_blueprint = Blueprint("job_run", __name__)
+        return JobRunRouter.create_route(blueprint=job_run_api_blueprint, auth_middleware=auth_middleware)
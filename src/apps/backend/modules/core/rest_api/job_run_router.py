@@ -0,0 +1,27 @@
+from typing import Any, Callable
+
+from flask import Blueprint
+
+from modules.core.rest_api.job_run_view import JobRunSummaryView, JobRunView
+
+
+class JobRunRouter:
+    @staticmethod
+    def create_route(
+        *, blueprint: Blueprint, auth_middleware: Callable[[Callable[..., Any]], Callable[..., Any]]
+    ) -> Blueprint:
+        blueprint.add_url_rule(
+            "/job-runs", view_func=auth_middleware(JobRunView.as_view("job_run_view")), methods=["GET"]
+        )
+        blueprint.add_url_rule(
+            "/job-runs/<job_run_id>",
+            view_func=auth_middleware(JobRunView.as_view("job_run_view_by_id")),
+            methods=["GET"],
+        )
+        blueprint.add_url_rule(
+            "/job-runs/summary/<job_name>",
+            view_func=auth_middleware(JobRunSummaryView.as_view("job_run_summary_view")),
+            methods=["GET"],
+        )
+
+        return blueprint
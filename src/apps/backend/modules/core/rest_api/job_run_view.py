@@ -0,0 +1,68 @@
+from dataclasses import asdict
+from datetime import UTC, datetime
+from typing import Optional
+
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.core.common.constants import (
+    DEFAULT_JOB_RUN_PAGE_SIZE,
+    DEFAULT_JOB_RUN_SUMMARY_WINDOW,
+    MAX_JOB_RUN_PAGE_SIZE,
+)
+from modules.core.common.types import ActorType, AuditActor, JobRunQuery, JobRunStatus
+from modules.core.errors import JobRunBadRequestError
+from modules.core.internal.job_run.job_run_service import JobRunService
+
+
+class JobRunView(MethodView):
+    def get(self, job_run_id: Optional[str] = None) -> ResponseReturnValue:
+        actor = AuditActor(actor_type=ActorType.ACCOUNT, actor_id=getattr(request, "account_id"))
+        if job_run_id:
+            job_run = JobRunService.get_job_run(job_run_id=job_run_id, actor=actor)
+            return jsonify(asdict(job_run)), 200
+
+        limit = request.args.get("limit", type=int)
+        if limit is None:
+            limit = DEFAULT_JOB_RUN_PAGE_SIZE
+        if limit < 1 or limit > MAX_JOB_RUN_PAGE_SIZE:
+            raise JobRunBadRequestError(f"Limit must be between 1 and {MAX_JOB_RUN_PAGE_SIZE}")
+
+        status = request.args.get("status")
+        try:
+            job_run_status = JobRunStatus(status) if status else None
+        except ValueError:
+            raise JobRunBadRequestError(f"Unknown status: {status}")
+
+        params = JobRunQuery(
+            job_name=request.args.get("job_name") or None,
+            status=job_run_status,
+            task_id=request.args.get("task_id") or None,
+            parent_job_run_id=request.args.get("parent_job_run_id") or None,
+            started_after=_parse_datetime_arg("started_after"),
+            started_before=_parse_datetime_arg("started_before"),
+        )
+        page = JobRunService.get_job_runs(
+            params=params, limit=limit, cursor=request.args.get("cursor") or None, actor=actor
+        )
+        return jsonify(asdict(page)), 200
+
+
+class JobRunSummaryView(MethodView):
+    def get(self, job_name: str) -> ResponseReturnValue:
+        since = _parse_datetime_arg("since") or datetime.now(UTC) - DEFAULT_JOB_RUN_SUMMARY_WINDOW
+        summary = JobRunService.get_job_run_summary(job_name=job_name, since=since)
+        return jsonify(asdict(summary)), 200
+
+
+def _parse_datetime_arg(name: str) -> Optional[datetime]:
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise JobRunBadRequestError(f"{name} must be an ISO 8601 timestamp")
+    # A timestamp without an offset is read as UTC, which is how job runs are stored.
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
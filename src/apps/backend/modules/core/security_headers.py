@@ -11,19 +11,26 @@ class SecurityHeaders:
 
     @classmethod
     def init_app(cls, app: Flask) -> None:
-        behind_proxy = ConfigService[bool].get_value(key="is_server_running_behind_proxy", default=False)
-        csp_value = cls._build_csp()
+        security_headers = cls.headers()
 
         @app.after_request
         def _apply_security_headers(response: Response) -> Response:
-            response.headers["X-Content-Type-Options"] = "nosniff"
-            response.headers["Content-Security-Policy"] = csp_value
-            response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-            response.headers["Permissions-Policy"] = "geolocation=(), camera=(), microphone=()"
-            if behind_proxy:
-                response.headers["Strict-Transport-Security"] = cls._HSTS_VALUE
+            response.headers.update(security_headers)
             return response
 
+    @classmethod
+    def headers(cls) -> dict[str, str]:
+        # Also applied by the async web app, so both serving modes answer with the same headers.
+        security_headers = {
+            "X-Content-Type-Options": "nosniff",
+            "Content-Security-Policy": cls._build_csp(),
+            "Referrer-Policy": "strict-origin-when-cross-origin",
+            "Permissions-Policy": "geolocation=(), camera=(), microphone=()",
+        }
+        if ConfigService[bool].get_value(key="is_server_running_behind_proxy", default=False):
+            security_headers["Strict-Transport-Security"] = cls._HSTS_VALUE
+        return security_headers
+
     @classmethod
     def _build_csp(cls) -> str:
         script_src = cls._source_list("'self'", "web.csp_script_src_extra")
@@ -0,0 +1,50 @@
+import math
+import os
+from pathlib import Path
+from typing import ClassVar, Optional
+
+from modules.config.config_service import ConfigService
+from modules.core.common.types import WebServerConfig, WebServerSettings
+
+
+class WebServer:
+    """gunicorn's process model for the web apps, read from `web.server` by gunicorn_config.py. Workers
+    scale with the host's cores but stop at `max_workers`, because every worker is a full copy of the app
+    with its own Mongo pool; request concurrency comes from the fixed `threads` per worker instead. See the
+    sizing profile in docs/deployment.md."""
+
+    CGROUP_CPU_MAX_PATH: ClassVar[Path] = Path("/sys/fs/cgroup/cpu.max")
+
+    @staticmethod
+    def settings(cpu_count: Optional[int] = None) -> WebServerSettings:
+        config = ConfigService.get_section(WebServerConfig)
+        cpu_count = cpu_count or WebServer._available_cpus()
+        workers = config.workers or min(int(cpu_count * config.workers_per_core) + 1, config.max_workers)
+        settings = WebServerSettings(
+            workers=workers,
+            threads=config.threads,
+            max_requests=config.max_requests,
+            max_requests_jitter=config.max_requests_jitter if config.max_requests else 0,
+            timeout_seconds=config.timeout_seconds,
+            keepalive_seconds=config.keepalive_seconds,
+        )
+        if settings.workers < 1 or settings.threads < 1:
+            raise ValueError(f"web.server needs at least one worker and one thread; got {settings}")
+        return settings
+
+    @staticmethod
+    def _available_cpus() -> int:
+        # The CPUs this process may run on, which a container's cpuset limits below the host's count, and
+        # then its CPU limit: a pod limited to 500m on a 32-core node sizes for one core, not 32.
+        cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+        quota = WebServer._cgroup_cpu_quota()
+        return max(1, min(cpus, math.ceil(quota))) if quota is not None else cpus
+
+    @staticmethod
+    def _cgroup_cpu_quota() -> Optional[float]:
+        # cgroup v2 `cpu.max` reads "<quota> <period>", or "max <period>" when the CPU is not limited.
+        try:
+            quota, period = WebServer.CGROUP_CPU_MAX_PATH.read_text().split()[:2]
+            return None if quota == "max" else int(quota) / int(period)
+        except (OSError, ValueError):
+            return None
@@ -0,0 +1,73 @@
+from typing import Any
+
+from modules.config.config_service import ConfigService
+from modules.core.celery_app import ALL_QUEUES
+from modules.core.common.types import WorkerPool, WorkerProfile
+
+
+class WorkerProfiles:
+    """Named worker setups read from `worker.profiles`: which queues a worker consumes, in what order, and
+    with what pool, concurrency and prefetch. `python worker_app.py --profile <name>` starts a worker from
+    one, so deployments run one profile per process group instead of one worker for every queue."""
+
+    CONFIG_KEY = "worker.profiles"
+    DEFAULT_PROFILE_KEY = "worker.profile"
+
+    @staticmethod
+    def get(name: str) -> WorkerProfile:
+        profiles_config = ConfigService[dict[str, Any]].get_value(key=WorkerProfiles.CONFIG_KEY, default={})
+        profile_config = profiles_config.get(name)
+        if profile_config is None:
+            raise ValueError(f"Unknown worker profile {name!r}; configured profiles: {sorted(profiles_config)}")
+        return WorkerProfiles._parse(name, profile_config)
+
+    @staticmethod
+    def default_name() -> str:
+        return ConfigService.get_str(key=WorkerProfiles.DEFAULT_PROFILE_KEY, default="all")
+
+    @staticmethod
+    def names() -> list[str]:
+        return sorted(ConfigService[dict[str, Any]].get_value(key=WorkerProfiles.CONFIG_KEY, default={}))
+
+    @staticmethod
+    def celery_argv(profile: WorkerProfile) -> list[str]:
+        argv = [
+            "worker",
+            "--loglevel=info",
+            "-E",
+            f"--pool={profile.pool.value}",
+            f"--queues={','.join(profile.queues)}",
+            f"--prefetch-multiplier={profile.prefetch_multiplier}",
+        ]
+        if profile.min_concurrency is not None:
+            argv.append(f"--autoscale={profile.concurrency},{profile.min_concurrency}")
+        else:
+            argv.append(f"--concurrency={profile.concurrency}")
+        return argv
+
+    @staticmethod
+    def _parse(name: str, profile_config: dict[str, Any]) -> WorkerProfile:
+        queues = tuple(profile_config.get("queues") or ())
+        unknown_queues = sorted(set(queues) - set(ALL_QUEUES))
+        if not queues or unknown_queues:
+            raise ValueError(f"Worker profile {name!r} needs queues from {list(ALL_QUEUES)}; got {list(queues)}")
+
+        pool = WorkerPool(profile_config.get("pool", WorkerPool.PREFORK.value))
+        min_concurrency = profile_config.get("min_concurrency")
+        profile = WorkerProfile(
+            name=name,
+            queues=queues,
+            pool=pool,
+            concurrency=int(profile_config["concurrency"]),
+            prefetch_multiplier=int(profile_config.get("prefetch_multiplier", 1)),
+            min_concurrency=int(min_concurrency) if min_concurrency is not None else None,
+        )
+        if profile.concurrency < 1 or profile.prefetch_multiplier < 1:
+            raise ValueError(f"Worker profile {name!r} needs a positive concurrency and prefetch_multiplier")
+        if profile.min_concurrency is not None:
+            # Celery's autoscaler only resizes process pools.
+            if pool != WorkerPool.PREFORK or not 0 <= profile.min_concurrency <= profile.concurrency:
+                raise ValueError(
+                    f"Worker profile {name!r}: min_concurrency needs the prefork pool and at most concurrency"
+                )
+        return profile
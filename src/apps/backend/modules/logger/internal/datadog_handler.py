@@ -3,11 +3,8 @@ import os
 from logging import LogRecord, StreamHandler
 from typing import TextIO
 
-from datadog_api_client import ApiClient, Configuration
-from datadog_api_client.v2.api.logs_api import LogsApi
-from datadog_api_client.v2.models import HTTPLog, HTTPLogItem
-
 from modules.config.config_service import ConfigService
+from modules.core.outbound_http_client import OutboundHttpClient
 
 
 class DatadogHandler(StreamHandler[TextIO]):
@@ -26,32 +23,33 @@ class DatadogHandler(StreamHandler[TextIO]):
     def emit(self, record: LogRecord) -> None:
         try:
             msg = self.format(record)
-            datadog_api_key = ConfigService[str].get_value(key="datadog.api_key")
-            datadog_host = ConfigService[str].get_value(key="datadog.site_name")
-            datadog_app_name = ConfigService[str].get_value(key="datadog.app_name")
-            config = Configuration()
-            config.api_key["apiKeyAuth"] = datadog_api_key
-            config.server_variables["site"] = datadog_host
-            config.debug = False
+            datadog_api_key = ConfigService.get_str(key="datadog.api_key")
+            datadog_host = ConfigService.get_str(key="datadog.site_name")
+            datadog_app_name = ConfigService.get_str(key="datadog.app_name")
+            logs_intake_url = ConfigService.get_str(
+                key="datadog.logs_intake_url", default=f"https://http-intake.logs.{datadog_host}/api/v2/logs"
+            )
 
             env = os.environ.get("APP_ENV", "unknown")
             service_name = f"{datadog_app_name}-{env}"
 
-            with ApiClient(config) as api_client:
-                api_instance = LogsApi(api_client)
-                body = HTTPLog(
-                    [
-                        HTTPLogItem(
-                            ddsource=self.ddsource,
-                            ddtags=f"env:{env}",
-                            hostname="",
-                            message=msg,
-                            service=service_name,
-                            status=self.__get_status(record=record),
-                        )
-                    ]
-                )
-                api_instance.submit_log(body)
+            # Posted through the shared outbound client so each log line reuses a kept-alive connection
+            # instead of building a new API client and connection per record.
+            response = OutboundHttpClient.post(
+                logs_intake_url,
+                headers={"DD-API-KEY": datadog_api_key, "Content-Type": "application/json"},
+                json=[
+                    {
+                        "ddsource": self.ddsource,
+                        "ddtags": f"env:{env}",
+                        "hostname": "",
+                        "message": msg,
+                        "service": service_name,
+                        "status": self.__get_status(record=record),
+                    }
+                ],
+            )
+            response.raise_for_status()
         except Exception as e:
             print(f"Datadog logging failed: {e}")
             self.handleError(record)
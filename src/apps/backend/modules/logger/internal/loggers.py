@@ -1,7 +1,10 @@
+import logging
 from typing import Union
 
 from modules.config.config_service import ConfigService
 from modules.logger.internal.console_logger import ConsoleLogger
+from modules.logger.internal.datadog_handler import DatadogHandler
+from modules.logger.internal.datadog_handler_level import LogLevel
 from modules.logger.internal.datadog_logger import DatadogLogger
 from modules.logger.internal.types import LoggerTransports
 
@@ -21,6 +24,19 @@ class Loggers:
             if logger_transport == LoggerTransports.DATADOG:
                 Loggers._LOGGERS.append(Loggers.__get_datadog_logger())
 
+    @staticmethod
+    def attach_datadog_handler(*, logger_name: str) -> None:
+        # Ships a library's own logger (gunicorn's access log) to Datadog when that transport is configured.
+        if LoggerTransports.DATADOG not in ConfigService[list[str]].get_value(key="logger.transports"):
+            return
+        logger = logging.getLogger(logger_name)
+        if any(isinstance(handler, DatadogHandler) for handler in logger.handlers):
+            return
+        datadog_handler = DatadogHandler("flask")
+        datadog_handler.setLevel(LogLevel.get_level())
+        datadog_handler.setFormatter(logging.Formatter("[%(asctime)s] - %(name)s - %(levelname)s - %(message)s"))
+        logger.addHandler(datadog_handler)
+
     @staticmethod
     def info(*, message: str) -> None:
         [logger.info(message=message) for logger in Loggers._LOGGERS]
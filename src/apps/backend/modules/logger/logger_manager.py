@@ -5,3 +5,7 @@ class LoggerManager:
     @staticmethod
     def mount_logger() -> None:
         Loggers.initialize_loggers()
+
+    @staticmethod
+    def mount_access_logger(logger_name: str) -> None:
+        Loggers.attach_datadog_handler(logger_name=logger_name)
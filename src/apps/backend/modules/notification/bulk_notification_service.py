@@ -0,0 +1,88 @@
+from modules.config.config_service import ConfigService
+from modules.core.common.types import AuditActor
+from modules.logger.logger import Logger
+from modules.notification.email_service import EmailService
+from modules.notification.errors import ValidationError
+from modules.notification.internal.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internal.bulk_sms_sender import BulkSMSSender
+from modules.notification.internal.sendgrid_email_params import EmailParams
+from modules.notification.internal.twilio_params import SMSParams
+from modules.notification.types import (
+    BulkNotificationContent,
+    BulkNotificationRecipient,
+    BulkNotificationResult,
+    EmailRecipient,
+    SendEmailParams,
+    SendSMSParams,
+)
+
+
+class BulkNotificationService:
+    @staticmethod
+    def send(
+        *,
+        recipients: list[BulkNotificationRecipient],
+        content: BulkNotificationContent,
+        idempotency_key: str,
+        actor: AuditActor,
+    ) -> BulkNotificationResult:
+        """
+        Deliver the content to a batch of recipients on every channel it has a message for. Preferences
+        for the whole batch are loaded with one query, emails go out as batched SendGrid personalizations
+        and SMS through a concurrency-limited sender. A recipient without preferences, or who has turned
+        the channel off, is skipped, as is an address that would fail validation.
+
+        Deliveries are keyed by idempotency_key, so calling this again with the same key and recipients
+        (a retried job) does not send anything twice.
+        """
+        preferences = AccountNotificationPreferenceReader.get_account_notification_preferences_for_accounts(
+            [recipient.account_id for recipient in recipients], actor=actor
+        )
+        sms_enabled = content.sms_message_body is not None and ConfigService.get_bool(key="sms.enabled", default=False)
+        if content.sms_message_body is not None and not sms_enabled:
+            Logger.warn(message=f"SMS is disabled. Bulk notification {idempotency_key} sends email only")
+
+        emails: list[SendEmailParams] = []
+        sms_messages: dict[str, SendSMSParams] = {}
+        skipped_by_preferences = 0
+        skipped_invalid_address = 0
+        for recipient in recipients:
+            account_preferences = preferences.get(recipient.account_id)
+
+            if content.email is not None and recipient.email is not None:
+                if account_preferences is None or not account_preferences.email_enabled:
+                    skipped_by_preferences += 1
+                elif not EmailParams.is_email_valid(recipient.email):
+                    skipped_invalid_address += 1
+                else:
+                    emails.append(
+                        SendEmailParams(
+                            recipient=EmailRecipient(email=recipient.email),
+                            sender=content.email.sender,
+                            template_id=content.email.template_id,
+                            template_data={**(content.email.template_data or {}), **(recipient.template_data or {})},
+                        )
+                    )
+
+            if sms_enabled and content.sms_message_body is not None and recipient.phone_number is not None:
+                if account_preferences is None or not account_preferences.sms_enabled:
+                    skipped_by_preferences += 1
+                    continue
+                params = SendSMSParams(message_body=content.sms_message_body, recipient_phone=recipient.phone_number)
+                try:
+                    SMSParams.validate(params)
+                except ValidationError:
+                    skipped_invalid_address += 1
+                    continue
+                sms_messages[f"{idempotency_key}:sms:{recipient.account_id}"] = params
+
+        if emails:
+            EmailService.send_emails(emails, idempotency_key=f"{idempotency_key}:email")
+        sms_sent = BulkSMSSender.send(sms_messages)
+
+        return BulkNotificationResult(
+            emails_queued=len(emails),
+            sms_sent=sms_sent,
+            skipped_by_preferences=skipped_by_preferences,
+            skipped_invalid_address=skipped_invalid_address,
+        )
@@ -1,8 +1,14 @@
+import uuid
+from collections import defaultdict
+from typing import Optional
+
 from modules.core.common.types import AuditActor
 from modules.logger.logger import Logger
 from modules.notification.internal.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internal.sendgrid_email_params import EmailParams
 from modules.notification.internal.sendgrid_service import SendGridService
-from modules.notification.types import SendEmailParams
+from modules.notification.jobs.send_email_job import SendEmailJob
+from modules.notification.types import EmailSender, SendEmailParams
 
 
 class EmailService:
@@ -11,7 +17,7 @@ class EmailService:
         *, account_id: str, bypass_preferences: bool = False, params: SendEmailParams, actor: AuditActor
     ) -> None:
         if not bypass_preferences:
-            preferences = AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(
+            preferences = AccountNotificationPreferenceReader.get_cached_account_notification_preferences_by_account_id(
                 account_id, actor=actor
             )
             if not preferences.email_enabled:
@@ -22,4 +28,35 @@ class EmailService:
                 )
                 return
 
-        return SendGridService.send_email(params)
+        EmailService.send_emails([params])
+
+    @staticmethod
+    def send_emails(params_list: list[SendEmailParams], *, idempotency_key: Optional[str] = None) -> None:
+        """
+        Queue the emails for delivery. Emails sharing a template and sender are grouped into one job per
+        SendGrid request, so a fan-out costs one provider call per batch rather than per recipient.
+
+        A caller that may run again for the same emails (a retried job) passes its own idempotency_key;
+        each batch's key is derived from it, so a batch that already went out is not sent twice.
+        """
+        batches: defaultdict[tuple[str, EmailSender], list[SendEmailParams]] = defaultdict(list)
+        for params in params_list:
+            EmailParams.validate(params)
+            batches[(params.template_id, params.sender)].append(params)
+
+        batch_size = SendGridService.MAX_PERSONALIZATIONS_PER_REQUEST
+        batch_index = 0
+        for (template_id, sender), batch in batches.items():
+            for start in range(0, len(batch), batch_size):
+                batch_key = f"{idempotency_key}:{batch_index}" if idempotency_key else uuid.uuid4().hex
+                batch_index += 1
+                SendEmailJob.perform_async(
+                    idempotency_key=batch_key,
+                    template_id=template_id,
+                    sender_email=sender.email,
+                    sender_name=sender.name,
+                    recipients=[
+                        {"email": params.recipient.email, "template_data": params.template_data}
+                        for params in batch[start : start + batch_size]
+                    ],
+                )
@@ -26,8 +26,31 @@ class AccountNotificationPreferencesNotFoundError(AppError):
 
 
 class ServiceError(AppError):
-    def __init__(self, message: str, original_error: Optional[Exception] = None) -> None:
+    def __init__(
+        self, message: str, original_error: Optional[Exception] = None, provider_status_code: Optional[int] = None
+    ) -> None:
         super().__init__(code=NotificationErrorCode.SERVICE_ERROR, http_status_code=503, message=message)
         self.original_error = original_error
+        # The provider's HTTP status when it answered; None when the call never got a response.
+        self.provider_status_code = provider_status_code
         self.original_error_message = str(original_error) if original_error else None
         self.stack = getattr(original_error, "stack", None)
+
+
+class ProviderRejectedError(ServiceError):
+    """The provider answered with a 4xx other than 429: the request itself was refused, so sending it again
+    is refused the same way."""
+
+    @staticmethod
+    def is_rejection(provider_status_code: Optional[int]) -> bool:
+        return provider_status_code is not None and 400 <= provider_status_code < 500 and provider_status_code != 429
+
+
+class ProviderUnavailableError(ServiceError):
+    def __init__(self, provider: str, retry_after_seconds: float) -> None:
+        super().__init__(
+            message=f"{provider} is unavailable at the moment. Please try again in {retry_after_seconds:.0f} seconds."
+        )
+        self.code = NotificationErrorCode.PROVIDER_UNAVAILABLE
+        self.provider = provider
+        self.retry_after_seconds = retry_after_seconds
@@ -0,0 +1,64 @@
+import os
+from dataclasses import dataclass
+from typing import ClassVar, Optional
+
+from modules.config.config_service import ConfigService
+from modules.core.common.types import CacheStats
+from modules.core.ttl_cache import TTLCache
+from modules.notification.types import AccountNotificationPreferences
+
+
+@dataclass(frozen=True)
+class _PreferencesCacheState:
+    # Resolved per loaded config so a config reload (tests swap the config manager) starts an empty cache.
+    config_source: object
+    preferences: TTLCache[str, AccountNotificationPreferences]
+
+
+class AccountNotificationPreferencesCache:
+    """Per-process cache of active preferences by account_id for the delivery path. The repository
+    invalidates an entry on every write in this process; other processes see the change once their entry's
+    TTL runs out, so keep `ttl_seconds` short."""
+
+    CONFIG_KEY: ClassVar[str] = "notification.preferences_cache"
+
+    _state: ClassVar[Optional[_PreferencesCacheState]] = None
+
+    @staticmethod
+    def get(account_id: str) -> Optional[AccountNotificationPreferences]:
+        return AccountNotificationPreferencesCache._get_state().preferences.get(account_id)
+
+    @staticmethod
+    def set(preferences: AccountNotificationPreferences) -> None:
+        AccountNotificationPreferencesCache._get_state().preferences.set(preferences.account_id, preferences)
+
+    @staticmethod
+    def invalidate(account_id: str) -> None:
+        AccountNotificationPreferencesCache._get_state().preferences.invalidate(account_id)
+
+    @staticmethod
+    def stats() -> CacheStats:
+        return AccountNotificationPreferencesCache._get_state().preferences.stats()
+
+    @staticmethod
+    def _get_state() -> _PreferencesCacheState:
+        config_source = ConfigService.config_manager
+        state = AccountNotificationPreferencesCache._state
+        if state is None or state.config_source is not config_source:
+            config_key = AccountNotificationPreferencesCache.CONFIG_KEY
+            state = _PreferencesCacheState(
+                config_source=config_source,
+                preferences=TTLCache(
+                    max_entries=ConfigService.get_int(key=f"{config_key}.max_entries", default=0),
+                    ttl_seconds=ConfigService.get_int(key=f"{config_key}.ttl_seconds", default=0),
+                ),
+            )
+            AccountNotificationPreferencesCache._state = state
+        return state
+
+    @staticmethod
+    def _reset_after_fork() -> None:
+        AccountNotificationPreferencesCache._state = None
+
+
+os.register_at_fork(after_in_child=AccountNotificationPreferencesCache._reset_after_fork)
@@ -1,5 +1,6 @@
 from modules.core.common.types import AuditActor
 from modules.notification.errors import AccountNotificationPreferencesNotFoundError
+from modules.notification.internal.account_notification_preferences_cache import AccountNotificationPreferencesCache
 from modules.notification.internal.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
 )
@@ -19,3 +20,39 @@ class AccountNotificationPreferenceReader:
             raise AccountNotificationPreferencesNotFoundError(account_id=account_id)
 
         return preferences
+
+    @staticmethod
+    def get_cached_account_notification_preferences_by_account_id(
+        account_id: str, *, actor: AuditActor
+    ) -> AccountNotificationPreferences:
+        # Delivery path only: a cache hit is not read-audited, so API reads keep using the uncached getter.
+        preferences = AccountNotificationPreferencesCache.get(account_id)
+        if preferences is None:
+            preferences = AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(
+                account_id, actor=actor
+            )
+            AccountNotificationPreferencesCache.set(preferences)
+        return preferences
+
+    @staticmethod
+    def get_account_notification_preferences_for_accounts(
+        account_ids: list[str], *, actor: AuditActor
+    ) -> dict[str, AccountNotificationPreferences]:
+        preferences_by_account_id: dict[str, AccountNotificationPreferences] = {}
+        missing_account_ids: list[str] = []
+        for account_id in dict.fromkeys(account_ids):
+            preferences = AccountNotificationPreferencesCache.get(account_id)
+            if preferences is None:
+                missing_account_ids.append(account_id)
+            else:
+                preferences_by_account_id[account_id] = preferences
+
+        if missing_account_ids:
+            # One $in query for every cache miss instead of a round trip per recipient.
+            for preferences in AccountNotificationPreferencesRepository.query(
+                AccountNotificationPreferencesQuery(account_ids=tuple(missing_account_ids)), actor=actor
+            ):
+                AccountNotificationPreferencesCache.set(preferences)
+                preferences_by_account_id[preferences.account_id] = preferences
+
+        return preferences_by_account_id
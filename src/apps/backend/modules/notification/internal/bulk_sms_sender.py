@@ -0,0 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import ClassVar
+
+from modules.config.config_service import ConfigService
+from modules.notification.internal.delivery_idempotency import DeliveryIdempotency
+from modules.notification.internal.twilio_service import TwilioService
+from modules.notification.types import SendSMSParams
+
+
+class BulkSMSSender:
+    """Sends a batch of SMS from the calling worker with at most `max_concurrency` Twilio requests in
+    flight. Twilio has no batch endpoint, so this bounds the request rate one worker process adds; each
+    message is claimed under its own idempotency key, so a retried batch skips what already went out."""
+
+    CONFIG_KEY: ClassVar[str] = "notification.bulk_sms"
+
+    @staticmethod
+    def send(messages: dict[str, SendSMSParams]) -> int:
+        """
+        Send each message, keyed by its idempotency key. Returns how many are delivered, counting those a
+        previous attempt delivered; if any send fails, the first error is raised after the rest finish.
+        """
+        if not messages:
+            return 0
+
+        max_concurrency = ConfigService.get_int(key=f"{BulkSMSSender.CONFIG_KEY}.max_concurrency", default=4)
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(messages)), thread_name_prefix="bulk-sms"
+        ) as executor:
+            futures = [
+                executor.submit(BulkSMSSender._send_one, idempotency_key, params)
+                for idempotency_key, params in messages.items()
+            ]
+
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                raise error
+        return len(futures)
+
+    @staticmethod
+    def _send_one(idempotency_key: str, params: SendSMSParams) -> None:
+        if not DeliveryIdempotency.claim(idempotency_key):
+            return
+        try:
+            TwilioService.send_sms(params=params)
+        except Exception:
+            DeliveryIdempotency.release(idempotency_key)
+            raise
+        DeliveryIdempotency.mark_delivered(idempotency_key)
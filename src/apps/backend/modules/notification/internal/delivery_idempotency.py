@@ -0,0 +1,52 @@
+from typing import ClassVar
+
+from modules.config.config_service import ConfigService
+from modules.core.redis_client import RedisClient
+
+
+class DeliveryIdempotency:
+    """Guards a delivery job against sending twice when its message is redelivered or retried after the
+    provider already accepted it. The key is claimed (SET NX) before the provider call, marked delivered
+    after it, and released if the call fails so the retry can claim it again. A request the provider rejects
+    outright is marked failed instead, so a redelivered message does not send it again. A claim left behind
+    by a worker that died mid-send expires after `claim_ttl_seconds`."""
+
+    KEY_PREFIX: ClassVar[str] = "notification:delivery"
+    CONFIG_KEY: ClassVar[str] = "notification.delivery_idempotency"
+
+    _CLAIMED: ClassVar[str] = "claimed"
+    _DELIVERED: ClassVar[str] = "delivered"
+    _FAILED: ClassVar[str] = "failed"
+
+    @staticmethod
+    def claim(idempotency_key: str) -> bool:
+        claim_ttl_seconds = ConfigService.get_int(
+            key=f"{DeliveryIdempotency.CONFIG_KEY}.claim_ttl_seconds", default=300
+        )
+        claimed = RedisClient.get_client().set(
+            DeliveryIdempotency._key(idempotency_key), DeliveryIdempotency._CLAIMED, nx=True, ex=claim_ttl_seconds
+        )
+        return bool(claimed)
+
+    @staticmethod
+    def mark_delivered(idempotency_key: str) -> None:
+        DeliveryIdempotency._settle(idempotency_key, DeliveryIdempotency._DELIVERED)
+
+    @staticmethod
+    def mark_failed(idempotency_key: str) -> None:
+        DeliveryIdempotency._settle(idempotency_key, DeliveryIdempotency._FAILED)
+
+    @staticmethod
+    def release(idempotency_key: str) -> None:
+        RedisClient.get_client().delete(DeliveryIdempotency._key(idempotency_key))
+
+    @staticmethod
+    def _settle(idempotency_key: str, outcome: str) -> None:
+        delivered_ttl_seconds = ConfigService.get_int(
+            key=f"{DeliveryIdempotency.CONFIG_KEY}.delivered_ttl_seconds", default=86400
+        )
+        RedisClient.get_client().set(DeliveryIdempotency._key(idempotency_key), outcome, ex=delivered_ttl_seconds)
+
+    @staticmethod
+    def _key(idempotency_key: str) -> str:
+        return f"{DeliveryIdempotency.KEY_PREFIX}:{idempotency_key}"
@@ -0,0 +1,268 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable, ClassVar, Optional, cast
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from modules.config.config_service import ConfigService
+from modules.core.common.types import CircuitState
+from modules.core.errors import OutboundCircuitOpenError
+from modules.core.redis_client import RedisClient
+from modules.logger.logger import Logger
+from modules.notification.errors import ProviderUnavailableError, ServiceError
+from modules.notification.types import NotificationProvider, ProviderCircuitBreakerConfig, ProviderCircuitStats
+
+
+@dataclass(frozen=True)
+class _CircuitKeys:
+    open: str
+    half_open: str
+    probe: str
+    calls: str
+
+
+@dataclass
+class _BreakerState:
+    # Resolved per loaded config so a config reload (tests swap the config manager) picks up new settings.
+    config_source: object
+    config: ProviderCircuitBreakerConfig
+    redis_unavailable_until: float = field(default=0.0)
+
+
+class ProviderCircuitBreaker:
+    """Circuit breaker around SendGrid and Twilio calls, shared by every web and worker process through
+    Redis so one provider outage is detected once rather than per process.
+
+    Call outcomes are counted in time buckets. When the failure rate over the window crosses the threshold
+    the circuit opens and calls fail at once with ProviderUnavailableError for `open_seconds`. After that
+    it is half-open: one caller at a time is let through as a probe, whose success closes the circuit and
+    whose failure opens it again. A 4xx answer means the request was wrong, not that the provider is down,
+    so it does not count as a failure. If Redis is unreachable the breaker lets every call through, and
+    the outbound HTTP client's per-process breaker is what remains."""
+
+    KEY_PREFIX: ClassVar[str] = "notification:circuit"
+
+    _state: ClassVar[Optional[_BreakerState]] = None
+
+    @staticmethod
+    def call[ResultT](provider: NotificationProvider, operation: Callable[[], ResultT]) -> ResultT:
+        is_probe = ProviderCircuitBreaker.before_call(provider)
+        try:
+            result = operation()
+        except Exception as error:
+            if ProviderCircuitBreaker._is_provider_failure(error):
+                ProviderCircuitBreaker._record(provider, succeeded=False, is_probe=is_probe)
+            elif is_probe:
+                ProviderCircuitBreaker._release_probe(provider)
+            raise
+        ProviderCircuitBreaker._record(provider, succeeded=True, is_probe=is_probe)
+        return result
+
+    @staticmethod
+    def before_call(provider: NotificationProvider) -> bool:
+        """
+        Raise ProviderUnavailableError if the circuit is open, or half-open with a probe already in flight.
+        Returns True when this call is the half-open probe.
+        """
+        state = ProviderCircuitBreaker._get_state()
+        client = ProviderCircuitBreaker._redis(state)
+        if client is None:
+            return False
+
+        keys = ProviderCircuitBreaker._keys(provider)
+        try:
+            pipeline = client.pipeline(transaction=False)
+            pipeline.ttl(keys.open)
+            pipeline.exists(keys.half_open)
+            open_ttl, half_open = pipeline.execute()
+            if open_ttl > 0:
+                raise ProviderUnavailableError(provider=provider.value, retry_after_seconds=open_ttl)
+            if not half_open:
+                return False
+            if client.set(keys.probe, "1", nx=True, ex=state.config.probe_timeout_seconds):
+                ProviderCircuitBreaker._log_transition(provider, CircuitState.HALF_OPEN, "probe let through")
+                return True
+        except RedisError as error:
+            ProviderCircuitBreaker._mark_redis_unavailable(state, error)
+            return False
+        raise ProviderUnavailableError(provider=provider.value, retry_after_seconds=state.config.probe_timeout_seconds)
+
+    @staticmethod
+    def raise_if_open(provider: NotificationProvider) -> None:
+        # For callers that only queue work for the provider: while the circuit is open, queued work would
+        # fail anyway, so the caller answers now instead of later. Half-open lets the work through to probe.
+        state = ProviderCircuitBreaker._get_state()
+        client = ProviderCircuitBreaker._redis(state)
+        if client is None:
+            return
+        try:
+            open_ttl = cast(int, client.ttl(ProviderCircuitBreaker._keys(provider).open))
+        except RedisError as error:
+            ProviderCircuitBreaker._mark_redis_unavailable(state, error)
+            return
+        if open_ttl > 0:
+            raise ProviderUnavailableError(provider=provider.value, retry_after_seconds=open_ttl)
+
+    @staticmethod
+    def stats(provider: NotificationProvider) -> ProviderCircuitStats:
+        state = ProviderCircuitBreaker._get_state()
+        client = ProviderCircuitBreaker._redis(state)
+        circuit_state = CircuitState.CLOSED
+        calls = failures = 0
+        if client is not None:
+            keys = ProviderCircuitBreaker._keys(provider)
+            try:
+                pipeline = client.pipeline(transaction=False)
+                pipeline.exists(keys.open)
+                pipeline.exists(keys.half_open)
+                is_open, half_open = pipeline.execute()
+                calls, failures = ProviderCircuitBreaker._window_totals(client, state.config, provider)
+            except RedisError as error:
+                ProviderCircuitBreaker._mark_redis_unavailable(state, error)
+            else:
+                if is_open:
+                    circuit_state = CircuitState.OPEN
+                elif half_open:
+                    circuit_state = CircuitState.HALF_OPEN
+        return ProviderCircuitStats(
+            provider=provider,
+            state=circuit_state,
+            calls=calls,
+            failures=failures,
+            failure_rate=failures / calls if calls else 0.0,
+        )
+
+    @staticmethod
+    def _record(provider: NotificationProvider, *, succeeded: bool, is_probe: bool) -> None:
+        state = ProviderCircuitBreaker._get_state()
+        client = ProviderCircuitBreaker._redis(state)
+        if client is None:
+            return
+
+        config = state.config
+        keys = ProviderCircuitBreaker._keys(provider)
+        bucket_key = f"{keys.calls}:{int(time.time()) // config.bucket_seconds}"
+        try:
+            pipeline = client.pipeline(transaction=False)
+            pipeline.hincrby(bucket_key, "calls", 1)
+            if not succeeded:
+                pipeline.hincrby(bucket_key, "failures", 1)
+            pipeline.expire(bucket_key, config.window_seconds + config.bucket_seconds)
+            pipeline.execute()
+
+            if is_probe and succeeded:
+                client.delete(keys.half_open, keys.probe)
+                ProviderCircuitBreaker._log_transition(provider, CircuitState.CLOSED, "probe succeeded")
+            elif is_probe:
+                ProviderCircuitBreaker._open(client, config, provider, "probe failed")
+            elif not succeeded:
+                calls, failures = ProviderCircuitBreaker._window_totals(client, config, provider)
+                if calls >= config.minimum_calls and failures / calls >= config.failure_rate_threshold:
+                    ProviderCircuitBreaker._open(
+                        client, config, provider, f"{failures} of {calls} calls failed in {config.window_seconds}s"
+                    )
+        except RedisError as error:
+            ProviderCircuitBreaker._mark_redis_unavailable(state, error)
+
+    @staticmethod
+    def _open(client: Redis, config: ProviderCircuitBreakerConfig, provider: NotificationProvider, reason: str) -> None:
+        keys = ProviderCircuitBreaker._keys(provider)
+        pipeline = client.pipeline(transaction=True)
+        pipeline.set(keys.open, "1", ex=config.open_seconds)
+        # Half-open outlives open; it is cleared by a successful probe, and expires only as a backstop.
+        pipeline.set(keys.half_open, "1", ex=config.open_seconds + 86400)
+        pipeline.delete(keys.probe)
+        # The next decision is made on calls made after the circuit reopens, not on the outage behind it.
+        pipeline.delete(*ProviderCircuitBreaker._bucket_keys(config, provider))
+        pipeline.execute()
+        ProviderCircuitBreaker._log_transition(provider, CircuitState.OPEN, reason)
+
+    @staticmethod
+    def _release_probe(provider: NotificationProvider) -> None:
+        state = ProviderCircuitBreaker._get_state()
+        client = ProviderCircuitBreaker._redis(state)
+        if client is None:
+            return
+        try:
+            client.delete(ProviderCircuitBreaker._keys(provider).probe)
+        except RedisError as error:
+            ProviderCircuitBreaker._mark_redis_unavailable(state, error)
+
+    @staticmethod
+    def _window_totals(
+        client: Redis, config: ProviderCircuitBreakerConfig, provider: NotificationProvider
+    ) -> tuple[int, int]:
+        pipeline = client.pipeline(transaction=False)
+        for bucket_key in ProviderCircuitBreaker._bucket_keys(config, provider):
+            pipeline.hmget(bucket_key, ["calls", "failures"])
+        calls = failures = 0
+        for bucket_calls, bucket_failures in pipeline.execute():
+            calls += int(bucket_calls or 0)
+            failures += int(bucket_failures or 0)
+        return calls, failures
+
+    @staticmethod
+    def _bucket_keys(config: ProviderCircuitBreakerConfig, provider: NotificationProvider) -> list[str]:
+        current_bucket = int(time.time()) // config.bucket_seconds
+        bucket_count = max(1, config.window_seconds // config.bucket_seconds)
+        calls_key = ProviderCircuitBreaker._keys(provider).calls
+        return [f"{calls_key}:{current_bucket - offset}" for offset in range(bucket_count)]
+
+    @staticmethod
+    def _is_provider_failure(error: Exception) -> bool:
+        if isinstance(error, ProviderUnavailableError):
+            return False
+        # This process's own per-host breaker turned the call away before it reached the provider; counting it
+        # would let one process's local state open the circuit for every process.
+        if isinstance(error, OutboundCircuitOpenError) or (
+            isinstance(error, ServiceError) and isinstance(error.original_error, OutboundCircuitOpenError)
+        ):
+            return False
+        if isinstance(error, ServiceError) and error.provider_status_code is not None:
+            return error.provider_status_code >= 500 or error.provider_status_code == 429
+        # No response at all: a timeout or a refused connection.
+        return True
+
+    @staticmethod
+    def _log_transition(provider: NotificationProvider, circuit_state: CircuitState, reason: str) -> None:
+        Logger.warn(
+            message=(
+                f"[notification.circuit_breaker] provider={provider.value} state={circuit_state.value} "
+                f"reason={reason!r}"
+            )
+        )
+
+    @staticmethod
+    def _redis(state: _BreakerState) -> Optional[Redis]:
+        if not state.config.enabled or time.time() < state.redis_unavailable_until:
+            return None
+        return RedisClient.get_client()
+
+    @staticmethod
+    def _mark_redis_unavailable(state: _BreakerState, error: RedisError) -> None:
+        state.redis_unavailable_until = time.time() + state.config.redis_retry_interval_seconds
+        Logger.warn(
+            message=(
+                f"[notification.circuit_breaker.redis_unavailable] passing provider calls through for "
+                f"{state.config.redis_retry_interval_seconds}s | error={error!r}"
+            )
+        )
+
+    @staticmethod
+    def _keys(provider: NotificationProvider) -> _CircuitKeys:
+        prefix = f"{ProviderCircuitBreaker.KEY_PREFIX}:{provider.value}"
+        return _CircuitKeys(
+            open=f"{prefix}:open", half_open=f"{prefix}:half_open", probe=f"{prefix}:probe", calls=f"{prefix}:calls"
+        )
+
+    @staticmethod
+    def _get_state() -> _BreakerState:
+        config_source = ConfigService.config_manager
+        state = ProviderCircuitBreaker._state
+        if state is None or state.config_source is not config_source:
+            state = _BreakerState(
+                config_source=config_source, config=ConfigService.get_section(ProviderCircuitBreakerConfig)
+            )
+            ProviderCircuitBreaker._state = state
+        return state
@@ -0,0 +1,34 @@
+import requests
+from sendgrid.helpers.mail import Mail
+
+from modules.config.config_service import ConfigService
+from modules.core.errors import OutboundCircuitOpenError
+from modules.core.outbound_http_client import OutboundHttpClient
+from modules.notification.errors import ProviderRejectedError, ServiceError
+
+
+class SendGridClient:
+    """Posts mail/send requests through the shared outbound HTTP client, so SendGrid calls reuse kept-alive
+    connections and share its timeouts, retries and breaker. The sendgrid package still builds the
+    request body; its own urllib transport opens a new connection per call and has no timeout."""
+
+    def __init__(self, api_key: str) -> None:
+        self.api_host = ConfigService.get_str(key="sendgrid.api_host", default="https://api.sendgrid.com")
+        self.headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+
+    def send(self, message: Mail) -> None:
+        try:
+            response = OutboundHttpClient.post(
+                f"{self.api_host}/v3/mail/send", json=message.get(), headers=self.headers
+            )
+        except (OutboundCircuitOpenError, requests.RequestException) as err:
+            raise ServiceError(message=f"SendGrid request failed: {err}", original_error=err) from err
+
+        if response.status_code >= 400:
+            error_type = (
+                ProviderRejectedError if ProviderRejectedError.is_rejection(response.status_code) else ServiceError
+            )
+            raise error_type(
+                message=f"SendGrid rejected the request: status {response.status_code} {response.text}",
+                provider_status_code=response.status_code,
+            )
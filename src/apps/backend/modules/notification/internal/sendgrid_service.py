@@ -1,35 +1,56 @@
-from typing import Optional
+from typing import ClassVar, Optional
 
-import sendgrid
-from sendgrid.helpers.mail import From, Mail, TemplateId, To
+from sendgrid.helpers.mail import From, Mail, Personalization, TemplateId, To
 
 from modules.config.config_service import ConfigService
-from modules.notification.errors import ServiceError
+from modules.notification.internal.provider_circuit_breaker import ProviderCircuitBreaker
+from modules.notification.internal.sendgrid_client import SendGridClient
 from modules.notification.internal.sendgrid_email_params import EmailParams
-from modules.notification.types import SendEmailParams
+from modules.notification.types import NotificationProvider, SendEmailParams
 
 
 class SendGridService:
-    __client: Optional[sendgrid.SendGridAPIClient] = None
+    # SendGrid accepts at most 1000 personalizations in one mail/send request.
+    MAX_PERSONALIZATIONS_PER_REQUEST: ClassVar[int] = 1000
+
+    __client: Optional[SendGridClient] = None
 
     @staticmethod
     def send_email(params: SendEmailParams) -> None:
-        EmailParams.validate(params)
-
-        message = Mail(from_email=From(params.sender.email, params.sender.name), to_emails=To(params.recipient.email))
-        message.template_id = TemplateId(params.template_id)
-        message.dynamic_template_data = params.template_data
+        SendGridService.send_emails([params])
 
-        try:
-            client = SendGridService.get_client()
-            client.send(message)
-
-        except sendgrid.SendGridException as err:
-            raise ServiceError(err)
+    @staticmethod
+    def send_emails(params_list: list[SendEmailParams]) -> None:
+        """
+        Send emails that share a sender and template, one personalization per recipient, in as few
+        mail/send requests as the per-request personalization limit allows.
+        """
+        if not params_list:
+            return
+
+        first = params_list[0]
+        for params in params_list:
+            EmailParams.validate(params)
+            if params.template_id != first.template_id or params.sender != first.sender:
+                raise ValueError("A batched send requires every email to share its sender and template")
+
+        client = SendGridService.get_client()
+        batch_size = SendGridService.MAX_PERSONALIZATIONS_PER_REQUEST
+        for start in range(0, len(params_list), batch_size):
+            message = Mail(from_email=From(first.sender.email, first.sender.name))
+            message.template_id = TemplateId(first.template_id)
+            for params in params_list[start : start + batch_size]:
+                personalization = Personalization()
+                personalization.add_to(To(params.recipient.email))
+                if params.template_data:
+                    personalization.dynamic_template_data = params.template_data
+                # Mail.add_personalization inserts at the front by default; append to keep the caller's order.
+                message.add_personalization(personalization, index=len(message.personalizations))
+            ProviderCircuitBreaker.call(NotificationProvider.SENDGRID, lambda: client.send(message))
 
     @staticmethod
-    def get_client() -> sendgrid.SendGridAPIClient:
+    def get_client() -> SendGridClient:
         if not SendGridService.__client:
             api_key = ConfigService[str].get_value(key="sendgrid.api_key")
-            SendGridService.__client = sendgrid.SendGridAPIClient(api_key=api_key)
+            SendGridService.__client = SendGridClient(api_key=api_key)
         return SendGridService.__client
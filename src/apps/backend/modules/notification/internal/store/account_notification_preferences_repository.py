@@ -7,6 +7,7 @@ from pymongo.errors import OperationFailure
 from modules.core.common.types import AuditActor
 from modules.core.repository import ApplicationRepository, FieldUpdates, StoredDocument, StoreFilter
 from modules.logger.logger import Logger
+from modules.notification.internal.account_notification_preferences_cache import AccountNotificationPreferencesCache
 from modules.notification.internal.store.account_notification_preferences_model import (
     AccountNotificationPreferencesDocument,
     AccountNotificationPreferencesModel,
@@ -102,10 +103,18 @@ class AccountNotificationPreferencesRepository(
         store_filter: StoreFilter = {}
         if params.account_id is not None:
             store_filter["account_id"] = params.account_id
+        if params.account_ids is not None:
+            store_filter["account_id"] = {"$in": list(params.account_ids)}
         if params.active is not None:
             store_filter["active"] = params.active
         return store_filter
 
+    @classmethod
+    def create(cls, entity: AccountNotificationPreferences, *, actor: AuditActor) -> AccountNotificationPreferences:
+        created = super().create(entity, actor=actor)
+        AccountNotificationPreferencesCache.invalidate(created.account_id)
+        return created
+
     @classmethod
     def update_by_account_id(
         cls, account_id: str, fields: FieldUpdates, *, actor: AuditActor
@@ -118,5 +127,6 @@ class AccountNotificationPreferencesRepository(
         previous = cls.collection().find_one_and_update(
             {"account_id": account_id, "active": True}, {"$set": patch}, return_document=ReturnDocument.BEFORE
         )
+        AccountNotificationPreferencesCache.invalidate(account_id)
         cls._emit_field_update_audit(actor, str(previous["_id"]), fields, previous)
         return cls.from_doc({**previous, **patch})
@@ -0,0 +1,44 @@
+from typing import Any, Dict, Optional, Tuple
+
+from twilio.http.http_client import TwilioHttpClient
+from twilio.http.response import Response
+
+from modules.core.outbound_http_client import OutboundHttpClient
+
+
+class TwilioOutboundHttpClient(TwilioHttpClient):
+    """Twilio transport that sends through the shared outbound HTTP client instead of a session of its
+    own, so Twilio calls get the same pooling, timeouts, retries and breaker as other providers."""
+
+    def __init__(self) -> None:
+        super().__init__(pool_connections=False)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, object]] = None,
+        data: Optional[Dict[str, object]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+        allow_redirects: bool = False,
+    ) -> Response:
+        kwargs: dict[str, Any] = {
+            "params": params,
+            "headers": headers,
+            "auth": auth,
+            "allow_redirects": allow_redirects,
+            "hooks": self.request_hooks,
+        }
+        if headers and headers.get("Content-Type") == "application/json":
+            kwargs["json"] = data
+        else:
+            kwargs["data"] = data
+
+        self.log_request({"method": method.upper(), "url": url, **kwargs})
+        response = OutboundHttpClient.request(method.upper(), url, timeout=timeout, **kwargs)
+        self.log_response(response.status_code, response)
+
+        self._test_only_last_response = Response(int(response.status_code), response.text, response.headers)
+        return self._test_only_last_response
@@ -1,13 +1,17 @@
 from typing import Optional
 
+import requests
 from twilio.base.exceptions import TwilioException, TwilioRestException
 from twilio.rest import Client
 
 from modules.config.config_service import ConfigService
+from modules.core.errors import OutboundCircuitOpenError
 from modules.logger.logger import Logger
-from modules.notification.errors import ServiceError
+from modules.notification.errors import ProviderRejectedError, ServiceError
+from modules.notification.internal.provider_circuit_breaker import ProviderCircuitBreaker
+from modules.notification.internal.twilio_http_client import TwilioOutboundHttpClient
 from modules.notification.internal.twilio_params import SMSParams
-from modules.notification.types import NotificationErrorCode, SendSMSParams
+from modules.notification.types import NotificationErrorCode, NotificationProvider, SendSMSParams
 
 
 class TwilioService:
@@ -17,17 +21,21 @@ class TwilioService:
     def send_sms(params: SendSMSParams) -> None:
         SMSParams.validate(params)
 
+        ProviderCircuitBreaker.call(NotificationProvider.TWILIO, lambda: TwilioService._create_message(params))
+
+    @staticmethod
+    def _create_message(params: SendSMSParams) -> None:
         try:
             client = TwilioService.get_client()
 
             # Send SMS
             client.messages.create(
                 to=params.recipient_phone,
-                messaging_service_sid=ConfigService[str].get_value(key="twilio.messaging_service_sid"),
+                messaging_service_sid=ConfigService.get_str(key="twilio.messaging_service_sid"),
                 body=params.message_body,
             )
 
-        except TwilioException as err:
+        except (TwilioException, OutboundCircuitOpenError, requests.RequestException) as err:
             recipient_phone_number = params.recipient_phone.phone_number
             recipient_country_code = params.recipient_phone.country_code
             twilio_error_code = err.code if isinstance(err, TwilioRestException) else None
@@ -43,9 +51,11 @@ class TwilioService:
                     f"twilio_status={twilio_status}"
                 )
             )
-            raise ServiceError(
+            error_type = ProviderRejectedError if ProviderRejectedError.is_rejection(twilio_status) else ServiceError
+            raise error_type(
                 message="Our system is facing challenge to deliver OTP to you at the moment, and the team has been notified. We recommend you to come back and try again later",
                 original_error=err,
+                provider_status_code=twilio_status,
             ) from err
 
     @staticmethod
@@ -54,7 +64,6 @@ class TwilioService:
             account_sid = ConfigService[str].get_value(key="twilio.account_sid")
             auth_token = ConfigService[str].get_value(key="twilio.auth_token")
 
-            # Initialize the Twilio client
-            TwilioService.__client = Client(account_sid, auth_token)
+            TwilioService.__client = Client(account_sid, auth_token, http_client=TwilioOutboundHttpClient())
 
         return TwilioService.__client
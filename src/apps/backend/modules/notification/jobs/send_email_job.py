@@ -0,0 +1,50 @@
+from typing import Any
+
+from modules.core.common.types import AuditActor, JobRunRecording
+from modules.core.job import Job
+from modules.logger.logger import Logger
+from modules.notification.errors import ProviderRejectedError
+from modules.notification.internal.delivery_idempotency import DeliveryIdempotency
+from modules.notification.internal.sendgrid_service import SendGridService
+from modules.notification.types import EmailRecipient, EmailSender, SendEmailParams
+
+
+class SendEmailJob(Job):
+    """Sends one template to a batch of recipients, each with its own template data, in a single SendGrid
+    request: EmailService caps a batch at the per-request personalization limit, so the batch's one
+    idempotency key covers exactly one provider call."""
+
+    queue = "critical"
+    max_retries = 5
+    retry_backoff_max = 60
+    dont_retry_for = (ProviderRejectedError,)
+    # Template data carries links with password reset tokens and the like.
+    redacted_arguments = frozenset({"recipients"})
+    job_run_recording = JobRunRecording.COMPLETION_ONLY
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        idempotency_key: str = kwargs["idempotency_key"]
+        if not DeliveryIdempotency.claim(idempotency_key):
+            Logger.info(message=f"Email batch {idempotency_key} already sent, rejected or in flight, skipping")
+            return
+
+        sender = EmailSender(email=kwargs["sender_email"], name=kwargs["sender_name"])
+        params_list = [
+            SendEmailParams(
+                recipient=EmailRecipient(email=recipient["email"]),
+                sender=sender,
+                template_id=kwargs["template_id"],
+                template_data=recipient.get("template_data"),
+            )
+            for recipient in kwargs["recipients"]
+        ]
+        try:
+            SendGridService.send_emails(params_list)
+        except ProviderRejectedError:
+            DeliveryIdempotency.mark_failed(idempotency_key)
+            raise
+        except Exception:
+            DeliveryIdempotency.release(idempotency_key)
+            raise
+        DeliveryIdempotency.mark_delivered(idempotency_key)
@@ -0,0 +1,44 @@
+from typing import Any
+
+from modules.account.types import PhoneNumber
+from modules.core.common.types import AuditActor, JobRunRecording
+from modules.core.job import Job
+from modules.logger.logger import Logger
+from modules.notification.errors import ProviderRejectedError
+from modules.notification.internal.delivery_idempotency import DeliveryIdempotency
+from modules.notification.internal.twilio_service import TwilioService
+from modules.notification.types import SendSMSParams
+
+
+class SendSMSJob(Job):
+    queue = "critical"
+    max_retries = 5
+    retry_backoff_max = 60
+    dont_retry_for = (ProviderRejectedError,)
+    # The body is usually a one-time code.
+    redacted_arguments = frozenset({"message_body"})
+    # One job per message: recording only the outcome halves the Mongo writes of the busiest queue.
+    job_run_recording = JobRunRecording.COMPLETION_ONLY
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        idempotency_key: str = kwargs["idempotency_key"]
+        if not DeliveryIdempotency.claim(idempotency_key):
+            Logger.info(message=f"SMS {idempotency_key} already sent, rejected or in flight, skipping")
+            return
+
+        params = SendSMSParams(
+            message_body=kwargs["message_body"],
+            recipient_phone=PhoneNumber(
+                country_code=kwargs["recipient_country_code"], phone_number=kwargs["recipient_phone_number"]
+            ),
+        )
+        try:
+            TwilioService.send_sms(params=params)
+        except ProviderRejectedError:
+            DeliveryIdempotency.mark_failed(idempotency_key)
+            raise
+        except Exception:
+            DeliveryIdempotency.release(idempotency_key)
+            raise
+        DeliveryIdempotency.mark_delivered(idempotency_key)
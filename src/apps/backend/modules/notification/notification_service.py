@@ -1,11 +1,18 @@
 from modules.core.common.types import AuditActor
+from modules.notification.bulk_notification_service import BulkNotificationService
 from modules.notification.email_service import EmailService
 from modules.notification.internal.account_notification_preferences_reader import AccountNotificationPreferenceReader
 from modules.notification.internal.account_notification_preferences_writer import AccountNotificationPreferenceWriter
+from modules.notification.internal.provider_circuit_breaker import ProviderCircuitBreaker
 from modules.notification.sms_service import SMSService
 from modules.notification.types import (
     AccountNotificationPreferences,
+    BulkNotificationContent,
+    BulkNotificationRecipient,
+    BulkNotificationResult,
     CreateOrUpdateAccountNotificationPreferencesParams,
+    NotificationProvider,
+    ProviderCircuitStats,
     SendEmailParams,
     SendSMSParams,
 )
@@ -29,6 +36,18 @@ class NotificationService:
             account_id=account_id, bypass_preferences=bypass_preferences, params=params, actor=actor
         )
 
+    @staticmethod
+    def send_bulk_notification(
+        *,
+        recipients: list[BulkNotificationRecipient],
+        content: BulkNotificationContent,
+        idempotency_key: str,
+        actor: AuditActor,
+    ) -> BulkNotificationResult:
+        return BulkNotificationService.send(
+            recipients=recipients, content=content, idempotency_key=idempotency_key, actor=actor
+        )
+
     @staticmethod
     def create_or_update_account_notification_preferences(
         *, account_id: str, actor: AuditActor, preferences: CreateOrUpdateAccountNotificationPreferencesParams
@@ -44,3 +63,19 @@ class NotificationService:
         return AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(
             account_id, actor=actor
         )
+
+    @staticmethod
+    def get_account_notification_preferences_for_accounts(
+        *, account_ids: list[str], actor: AuditActor
+    ) -> dict[str, AccountNotificationPreferences]:
+        """
+        Preferences for many accounts keyed by account_id, served from the delivery cache with one query
+        for the misses. Accounts without preferences are absent from the result.
+        """
+        return AccountNotificationPreferenceReader.get_account_notification_preferences_for_accounts(
+            account_ids, actor=actor
+        )
+
+    @staticmethod
+    def get_provider_circuit_stats() -> list[ProviderCircuitStats]:
+        return [ProviderCircuitBreaker.stats(provider) for provider in NotificationProvider]
@@ -0,0 +1,13 @@
+from typing import Any, Callable
+
+from flask import Blueprint
+
+from modules.notification.rest_api.notification_router import NotificationRouter
+
+
+class NotificationRestApiServer:
+    @staticmethod
+    def create(*, auth_middleware: Callable[[Callable[..., Any]], Callable[..., Any]]) -> Blueprint:
+        # Operator-only, like the job-run API; authentication depends on notification, so the app passes the check in.
+        notification_api_blueprint = Blueprint("notification", __name__)
+        return NotificationRouter.create_route(blueprint=notification_api_blueprint, auth_middleware=auth_middleware)
@@ -0,0 +1,19 @@
+from typing import Any, Callable
+
+from flask import Blueprint
+
+from modules.notification.rest_api.provider_circuit_view import ProviderCircuitView
+
+
+class NotificationRouter:
+    @staticmethod
+    def create_route(
+        *, blueprint: Blueprint, auth_middleware: Callable[[Callable[..., Any]], Callable[..., Any]]
+    ) -> Blueprint:
+        blueprint.add_url_rule(
+            "/notification/provider-circuits",
+            view_func=auth_middleware(ProviderCircuitView.as_view("provider_circuit_view")),
+            methods=["GET"],
+        )
+
+        return blueprint
@@ -0,0 +1,13 @@
+from dataclasses import asdict
+
+from flask import jsonify
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.notification.notification_service import NotificationService
+
+
+class ProviderCircuitView(MethodView):
+    def get(self) -> ResponseReturnValue:
+        circuit_stats = NotificationService.get_provider_circuit_stats()
+        return jsonify([asdict(stats) for stats in circuit_stats]), 200
@@ -1,9 +1,13 @@
+import uuid
+
 from modules.config.config_service import ConfigService
 from modules.core.common.types import AuditActor
 from modules.logger.logger import Logger
 from modules.notification.internal.account_notification_preferences_reader import AccountNotificationPreferenceReader
-from modules.notification.internal.twilio_service import TwilioService
-from modules.notification.types import SendSMSParams
+from modules.notification.internal.provider_circuit_breaker import ProviderCircuitBreaker
+from modules.notification.internal.twilio_params import SMSParams
+from modules.notification.jobs.send_sms_job import SendSMSJob
+from modules.notification.types import NotificationProvider, SendSMSParams
 
 
 class SMSService:
@@ -17,7 +21,7 @@ class SMSService:
             return
 
         if not bypass_preferences:
-            preferences = AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(
+            preferences = AccountNotificationPreferenceReader.get_cached_account_notification_preferences_by_account_id(
                 account_id, actor=actor
             )
             if not preferences.sms_enabled:
@@ -27,4 +31,14 @@ class SMSService:
                 )
                 return
 
-        TwilioService.send_sms(params=params)
+        # Invalid params are reported to the caller now; Twilio itself is called from the job, off the
+        # request path, and retried there with backoff.
+        SMSParams.validate(params)
+        # While Twilio is known to be down, an OTP queued now would arrive after it expired.
+        ProviderCircuitBreaker.raise_if_open(NotificationProvider.TWILIO)
+        SendSMSJob.perform_async(
+            idempotency_key=uuid.uuid4().hex,
+            message_body=params.message_body,
+            recipient_country_code=params.recipient_phone.country_code,
+            recipient_phone_number=params.recipient_phone.phone_number,
+        )
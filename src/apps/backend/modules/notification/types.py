@@ -1,9 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from enum import StrEnum
+from typing import Any, ClassVar, Dict, Optional
 
 from modules.account.types import PhoneNumber
-from modules.core.common.types import QueryParams
+from modules.config.types import ConfigSection
+from modules.core.common.types import CircuitState, QueryParams
 
 
 @dataclass(frozen=True)
@@ -37,6 +39,7 @@ class AccountNotificationPreferences:
 @dataclass(frozen=True)
 class AccountNotificationPreferencesQuery(QueryParams):
     account_id: Optional[str] = None
+    account_ids: Optional[tuple[str, ...]] = None
     # Preferences are soft-deleted via `active`; reads default to active records only.
     active: Optional[bool] = True
 
@@ -55,14 +58,76 @@ class SendSMSParams:
     recipient_phone: PhoneNumber
 
 
+@dataclass(frozen=True)
+class BulkEmailContent:
+    sender: EmailSender
+    template_id: str
+    # Shared by every recipient; a recipient's own template_data overrides keys it also sets.
+    template_data: Dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class BulkNotificationContent:
+    email: Optional[BulkEmailContent] = None
+    sms_message_body: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BulkNotificationRecipient:
+    account_id: str
+    email: Optional[str] = None
+    phone_number: Optional[PhoneNumber] = None
+    template_data: Dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class BulkNotificationResult:
+    emails_queued: int = 0
+    sms_sent: int = 0
+    skipped_by_preferences: int = 0
+    skipped_invalid_address: int = 0
+
+
 @dataclass(frozen=True)
 class NotificationErrorCode:
     PREFERENCES_NOT_FOUND = "NOTIFICATION_ERR_01"
     VALIDATION_ERROR = "NOTIFICATION_ERR_02"
     SERVICE_ERROR = "NOTIFICATION_ERR_03"
+    PROVIDER_UNAVAILABLE = "NOTIFICATION_ERR_04"
 
 
 @dataclass(frozen=True)
 class ValidationFailure:
     field: str
     message: str
+
+
+class NotificationProvider(StrEnum):
+    SENDGRID = "sendgrid"
+    TWILIO = "twilio"
+
+
+@dataclass(frozen=True)
+class ProviderCircuitStats:
+    provider: NotificationProvider
+    state: CircuitState
+    calls: int
+    failures: int
+    failure_rate: float
+
+
+@dataclass(frozen=True)
+class ProviderCircuitBreakerConfig(ConfigSection):
+    config_prefix: ClassVar[str] = "notification.circuit_breaker"
+
+    enabled: bool = True
+    # Outcomes are counted in bucket_seconds buckets; the failure rate covers the last window_seconds.
+    window_seconds: int = 60
+    bucket_seconds: int = 10
+    # The circuit opens once the window holds at least minimum_calls calls and this share of them failed.
+    minimum_calls: int = 10
+    failure_rate_threshold: float = 0.5
+    open_seconds: int = 30
+    # A half-open probe that has not reported back within this long lets another worker probe.
+    probe_timeout_seconds: int = 15
+    redis_retry_interval_seconds: int = 30
@@ -0,0 +1,12 @@
+from modules.core.errors import AppError
+from modules.rate_limit.types import RateLimitErrorCode
+
+
+class RateLimitExceededError(AppError):
+    def __init__(self, retry_after_seconds: int) -> None:
+        super().__init__(
+            code=RateLimitErrorCode.LIMIT_EXCEEDED,
+            http_status_code=429,
+            message=f"Too many requests. Please wait {retry_after_seconds} seconds and try again.",
+        )
+        self.retry_after_seconds = retry_after_seconds
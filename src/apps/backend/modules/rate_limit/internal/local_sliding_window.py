@@ -0,0 +1,50 @@
+import math
+import threading
+from collections import OrderedDict, deque
+
+from modules.rate_limit.types import RateLimitCheck, RateLimitDecision
+
+
+class LocalSlidingWindow:
+    """In-process counterpart of RedisSlidingWindow, used while Redis is unreachable. Limits then apply
+    per gunicorn worker rather than across the fleet, which is looser but keeps the endpoints guarded.
+    At most `max_keys` windows are tracked; the least recently used one is dropped beyond that."""
+
+    def __init__(self, *, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._windows: OrderedDict[str, deque[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, checks: list[RateLimitCheck], now: float) -> RateLimitDecision:
+        with self._lock:
+            decision = RateLimitDecision(allowed=True)
+            windows: list[deque[float]] = []
+            for check in checks:
+                window = self._window(check.key)
+                while window and window[0] <= now - check.rate_limit.window_seconds:
+                    window.popleft()
+                windows.append(window)
+
+                if len(window) < check.rate_limit.limit:
+                    continue
+                retry_after_seconds = max(1, math.ceil(window[0] + check.rate_limit.window_seconds - now))
+                if decision.allowed or retry_after_seconds > decision.retry_after_seconds:
+                    decision = RateLimitDecision(
+                        allowed=False, exceeded_scope=check.scope, retry_after_seconds=retry_after_seconds
+                    )
+
+            if decision.allowed:
+                for window in windows:
+                    window.append(now)
+            return decision
+
+    def _window(self, key: str) -> deque[float]:
+        window = self._windows.get(key)
+        if window is None:
+            window = deque()
+            self._windows[key] = window
+            while len(self._windows) > self.max_keys:
+                self._windows.popitem(last=False)
+        else:
+            self._windows.move_to_end(key)
+        return window
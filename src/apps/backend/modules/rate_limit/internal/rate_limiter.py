@@ -0,0 +1,109 @@
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Optional
+
+from redis.exceptions import RedisError
+
+from modules.config.config_service import ConfigService
+from modules.core.redis_client import RedisClient
+from modules.logger.logger import Logger
+from modules.rate_limit.internal.local_sliding_window import LocalSlidingWindow
+from modules.rate_limit.internal.redis_sliding_window import RedisSlidingWindow
+from modules.rate_limit.types import RateLimit, RateLimitCheck, RateLimitDecision, RateLimitScope
+
+
+@dataclass
+class _RateLimiterState:
+    # Parsed once per loaded config; a config reload (tests swap the config manager) rebuilds the rules.
+    config_source: object
+    enabled: bool
+    routes: dict[str, dict[RateLimitScope, RateLimit]]
+    redis_retry_interval_seconds: float
+    local_windows: LocalSlidingWindow
+    redis_unavailable_until: float = field(default=0.0)
+
+
+class RateLimiter:
+    CONFIG_KEY: ClassVar[str] = "rate_limit"
+    KEY_PREFIX: ClassVar[str] = "rate_limit"
+
+    _state: ClassVar[Optional[_RateLimiterState]] = None
+
+    @staticmethod
+    def check(*, route: str, identifiers: dict[RateLimitScope, Optional[str]]) -> RateLimitDecision:
+        state = RateLimiter._get_state()
+        if not state.enabled:
+            return RateLimitDecision(allowed=True)
+
+        checks = RateLimiter._build_checks(route, state.routes.get(route, {}), identifiers)
+        if not checks:
+            return RateLimitDecision(allowed=True)
+
+        now = time.time()
+        if now >= state.redis_unavailable_until:
+            try:
+                return RedisSlidingWindow.check(RedisClient.get_client(), checks, now)
+            except RedisError as error:
+                # Back off from Redis for a while so every request does not pay a connect timeout; the
+                # in-process windows keep the endpoints limited, per worker, in the meantime.
+                state.redis_unavailable_until = now + state.redis_retry_interval_seconds
+                Logger.warn(
+                    message=(
+                        f"[rate_limit.redis_unavailable] falling back to in-process limits for "
+                        f"{state.redis_retry_interval_seconds:g}s | error={error!r}"
+                    )
+                )
+
+        return state.local_windows.check(checks, now)
+
+    @staticmethod
+    def _build_checks(
+        route: str, limits: dict[RateLimitScope, RateLimit], identifiers: dict[RateLimitScope, Optional[str]]
+    ) -> list[RateLimitCheck]:
+        checks = []
+        for scope, rate_limit in limits.items():
+            identifier = identifiers.get(scope)
+            if not identifier:
+                continue
+            # Identifiers are hashed so phone numbers and usernames are not stored in Redis in the clear.
+            digest = hashlib.sha256(identifier.strip().lower().encode("utf-8")).hexdigest()[:32]
+            key = f"{RateLimiter.KEY_PREFIX}:{route}:{scope}:{digest}"
+            checks.append(RateLimitCheck(scope=scope, key=key, rate_limit=rate_limit))
+        return checks
+
+    @staticmethod
+    def _get_state() -> _RateLimiterState:
+        config_source = ConfigService.config_manager
+        state = RateLimiter._state
+        if state is None or state.config_source is not config_source:
+            config_key = RateLimiter.CONFIG_KEY
+            state = _RateLimiterState(
+                config_source=config_source,
+                enabled=ConfigService.get_bool(key=f"{config_key}.enabled", default=False),
+                routes=RateLimiter._parse_routes(
+                    ConfigService[dict[str, Any]].get_value(key=f"{config_key}.routes", default={})
+                ),
+                redis_retry_interval_seconds=ConfigService.get_float(
+                    key=f"{config_key}.redis_retry_interval_seconds", default=30
+                ),
+                local_windows=LocalSlidingWindow(
+                    max_keys=ConfigService.get_int(key=f"{config_key}.local_max_keys", default=10000)
+                ),
+            )
+            RateLimiter._state = state
+        return state
+
+    @staticmethod
+    def _parse_routes(routes_config: dict[str, Any]) -> dict[str, dict[RateLimitScope, RateLimit]]:
+        routes: dict[str, dict[RateLimitScope, RateLimit]] = {}
+        for route, scopes_config in routes_config.items():
+            routes[route] = {}
+            for scope_name, limit_config in (scopes_config or {}).items():
+                rate_limit = RateLimit(
+                    limit=int(limit_config["limit"]), window_seconds=int(limit_config["window_seconds"])
+                )
+                if rate_limit.limit < 1 or rate_limit.window_seconds < 1:
+                    raise ValueError(f"Rate limit {route}.{scope_name} needs a positive limit and window_seconds")
+                routes[route][RateLimitScope(scope_name)] = rate_limit
+        return routes
@@ -0,0 +1,53 @@
+import math
+import secrets
+
+from redis import Redis
+
+from modules.rate_limit.types import RateLimitCheck, RateLimitDecision
+
+# Replies per check in the pipeline below: ZREMRANGEBYSCORE, ZADD, ZCARD, ZRANGE, PEXPIRE.
+_REPLIES_PER_CHECK = 5
+
+
+class RedisSlidingWindow:
+    """Sliding-window log in a Redis sorted set per key: one member per request, scored by its timestamp.
+    All checks of a request are evaluated in a single MULTI pipeline, so enforcing any number of limits
+    costs one round trip. A rejected request takes its members back out (a second round trip, paid only
+    when rejecting), so retries while blocked do not extend the block."""
+
+    @staticmethod
+    def check(client: Redis, checks: list[RateLimitCheck], now: float) -> RateLimitDecision:
+        member = f"{now:.6f}:{secrets.token_hex(4)}"
+
+        pipeline = client.pipeline(transaction=True)
+        for check in checks:
+            window_seconds = check.rate_limit.window_seconds
+            pipeline.zremrangebyscore(check.key, "-inf", now - window_seconds)
+            pipeline.zadd(check.key, {member: now})
+            pipeline.zcard(check.key)
+            pipeline.zrange(check.key, 0, 0, withscores=True)
+            pipeline.pexpire(check.key, window_seconds * 1000)
+        replies = pipeline.execute()
+
+        decision = RateLimitDecision(allowed=True)
+        for index, check in enumerate(checks):
+            offset = index * _REPLIES_PER_CHECK
+            count = int(replies[offset + 2])
+            if count <= check.rate_limit.limit:
+                continue
+
+            oldest = replies[offset + 3]
+            oldest_score = float(oldest[0][1]) if oldest else now
+            retry_after_seconds = max(1, math.ceil(oldest_score + check.rate_limit.window_seconds - now))
+            if decision.allowed or retry_after_seconds > decision.retry_after_seconds:
+                decision = RateLimitDecision(
+                    allowed=False, exceeded_scope=check.scope, retry_after_seconds=retry_after_seconds
+                )
+
+        if not decision.allowed:
+            rollback = client.pipeline(transaction=False)
+            for check in checks:
+                rollback.zrem(check.key, member)
+            rollback.execute()
+
+        return decision
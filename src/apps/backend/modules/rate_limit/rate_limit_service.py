@@ -0,0 +1,17 @@
+from typing import Optional
+
+from modules.rate_limit.errors import RateLimitExceededError
+from modules.rate_limit.internal.rate_limiter import RateLimiter
+from modules.rate_limit.types import RateLimitDecision, RateLimitScope
+
+
+class RateLimitService:
+    @staticmethod
+    def check(*, route: str, identifiers: dict[RateLimitScope, Optional[str]]) -> RateLimitDecision:
+        return RateLimiter.check(route=route, identifiers=identifiers)
+
+    @staticmethod
+    def enforce(*, route: str, identifiers: dict[RateLimitScope, Optional[str]]) -> None:
+        decision = RateLimiter.check(route=route, identifiers=identifiers)
+        if not decision.allowed:
+            raise RateLimitExceededError(retry_after_seconds=decision.retry_after_seconds)
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Optional
+
+
+class RateLimitScope(StrEnum):
+    IP = "ip"
+    PHONE_NUMBER = "phone_number"
+    USERNAME = "username"
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    limit: int
+    window_seconds: int
+
+
+@dataclass(frozen=True)
+class RateLimitCheck:
+    scope: RateLimitScope
+    key: str
+    rate_limit: RateLimit
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    exceeded_scope: Optional[RateLimitScope] = None
+    retry_after_seconds: int = 0
+
+
+@dataclass(frozen=True)
+class RateLimitErrorCode:
+    LIMIT_EXCEEDED: str = "RATE_LIMIT_ERR_01"
@@ -0,0 +1,15 @@
+from aiohttp import web
+
+from modules.task.rest_api.task_async_view import TaskAsyncView
+
+
+class TaskAsyncRouter:
+    @staticmethod
+    def create_routes() -> list[web.RouteDef]:
+        return [
+            *(web.route(method, "/accounts/{account_id}/tasks", TaskAsyncView) for method in ("POST", "GET")),
+            *(
+                web.route(method, "/accounts/{account_id}/tasks/{task_id}", TaskAsyncView)
+                for method in ("GET", "PATCH", "DELETE")
+            ),
+        ]
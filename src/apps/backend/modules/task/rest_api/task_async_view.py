@@ -0,0 +1,91 @@
+from dataclasses import asdict
+
+from aiohttp import web
+
+from modules.authentication.rest_api.async_access_auth_middleware import async_access_auth_middleware
+from modules.core.async_web_app import AsyncWebApp
+from modules.core.blocking_call_executor import BlockingCallExecutor
+from modules.core.common.types import ActorType, AuditActor
+from modules.task.rest_api.task_view import TaskView
+from modules.task.task_service import TaskService
+from modules.task.types import (
+    CreateTaskParams,
+    DeleteTaskParams,
+    GetPaginatedTasksParams,
+    GetTaskParams,
+    UpdateTaskParams,
+)
+
+
+class TaskAsyncView(web.View):
+    """The task API for the async serving mode: same routes, validation and responses as TaskView, with
+    each service call awaited on the BlockingCallExecutor."""
+
+    @property
+    def _account_id(self) -> str:
+        return self.request.match_info["account_id"]
+
+    @property
+    def _actor(self) -> AuditActor:
+        return AuditActor(actor_type=ActorType.ACCOUNT, actor_id=self._account_id)
+
+    @async_access_auth_middleware
+    async def post(self) -> web.StreamResponse:
+        title, description = TaskView.task_fields_from(await AsyncWebApp.read_json(self.request))
+
+        created_task = await BlockingCallExecutor.run(
+            TaskService.create_task,
+            params=CreateTaskParams(account_id=self._account_id, title=title, description=description),
+            actor=self._actor,
+        )
+
+        return AsyncWebApp.json_response(asdict(created_task), status=201)
+
+    @async_access_auth_middleware
+    async def get(self) -> web.StreamResponse:
+        task_id = self.request.match_info.get("task_id")
+        if task_id:
+            task = await BlockingCallExecutor.run(
+                TaskService.get_task,
+                params=GetTaskParams(account_id=self._account_id, task_id=task_id),
+                actor=self._actor,
+            )
+            return AsyncWebApp.json_response(asdict(task))
+
+        pagination_params = TaskView.pagination_params_from(
+            AsyncWebApp.query_int(self.request, "page"), AsyncWebApp.query_int(self.request, "size")
+        )
+        pagination_result = await BlockingCallExecutor.run(
+            TaskService.get_paginated_tasks,
+            params=GetPaginatedTasksParams(account_id=self._account_id, pagination_params=pagination_params),
+            actor=self._actor,
+        )
+
+        return AsyncWebApp.json_response(asdict(pagination_result))
+
+    @async_access_auth_middleware
+    async def patch(self) -> web.StreamResponse:
+        title, description = TaskView.task_fields_from(await AsyncWebApp.read_json(self.request))
+
+        updated_task = await BlockingCallExecutor.run(
+            TaskService.update_task,
+            params=UpdateTaskParams(
+                account_id=self._account_id,
+                task_id=self.request.match_info["task_id"],
+                title=title,
+                description=description,
+            ),
+            actor=self._actor,
+        )
+
+        return AsyncWebApp.json_response(asdict(updated_task))
+
+    @async_access_auth_middleware
+    async def delete(self) -> web.StreamResponse:
+        await BlockingCallExecutor.run(
+            TaskService.delete_task,
+            params=DeleteTaskParams(account_id=self._account_id, task_id=self.request.match_info["task_id"]),
+            actor=self._actor,
+        )
+
+        return web.Response(status=204)
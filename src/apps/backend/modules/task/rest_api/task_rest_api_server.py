@@ -1,5 +1,7 @@
+from aiohttp import web
 from flask import Blueprint
 
+from modules.task.rest_api.task_async_router import TaskAsyncRouter
 from modules.task.rest_api.task_router import TaskRouter
 
 
@@ -8,3 +10,7 @@ class TaskRestApiServer:
     def create() -> Blueprint:
         task_api_blueprint = Blueprint("task", __name__)
         return TaskRouter.create_route(blueprint=task_api_blueprint)
+
+    @staticmethod
+    def create_async() -> list[web.RouteDef]:
+        return TaskAsyncRouter.create_routes()
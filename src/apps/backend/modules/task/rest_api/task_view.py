@@ -1,5 +1,5 @@
 from dataclasses import asdict
-from typing import Optional
+from typing import Any, Optional
 
 from flask import jsonify, request
 from flask.typing import ResponseReturnValue
@@ -20,10 +20,9 @@ from modules.task.types import (
 
 
 class TaskView(MethodView):
-    @access_auth_middleware
-    def post(self, account_id: str) -> ResponseReturnValue:
-        request_data = request.get_json()
-
+    @staticmethod
+    def task_fields_from(request_data: Any) -> tuple[str, str]:
+        # The title and description a create or update needs; shared with TaskAsyncView.
         if request_data is None:
             raise TaskBadRequestError("Request body is required")
 
@@ -33,9 +32,28 @@ class TaskView(MethodView):
         if not request_data.get("description"):
             raise TaskBadRequestError("Description is required")
 
-        create_task_params = CreateTaskParams(
-            account_id=account_id, title=request_data["title"], description=request_data["description"]
-        )
+        return request_data["title"], request_data["description"]
+
+    @staticmethod
+    def pagination_params_from(page: Optional[int], size: Optional[int]) -> PaginationParams:
+        if page is not None and page < 1:
+            raise TaskBadRequestError("Page must be greater than 0")
+
+        if size is not None and size < 1:
+            raise TaskBadRequestError("Size must be greater than 0")
+
+        if page is None:
+            page = DEFAULT_PAGINATION_PARAMS.page
+        if size is None:
+            size = DEFAULT_PAGINATION_PARAMS.size
+
+        return PaginationParams(page=page, size=size, offset=0)
+
+    @access_auth_middleware
+    def post(self, account_id: str) -> ResponseReturnValue:
+        title, description = self.task_fields_from(request.get_json())
+
+        create_task_params = CreateTaskParams(account_id=account_id, title=title, description=description)
 
         created_task = TaskService.create_task(
             params=create_task_params, actor=AuditActor(actor_type=ActorType.ACCOUNT, actor_id=account_id)
@@ -54,21 +72,9 @@ class TaskView(MethodView):
             task_dict = asdict(task)
             return jsonify(task_dict), 200
         else:
-            page = request.args.get("page", type=int)
-            size = request.args.get("size", type=int)
-
-            if page is not None and page < 1:
-                raise TaskBadRequestError("Page must be greater than 0")
-
-            if size is not None and size < 1:
-                raise TaskBadRequestError("Size must be greater than 0")
-
-            if page is None:
-                page = DEFAULT_PAGINATION_PARAMS.page
-            if size is None:
-                size = DEFAULT_PAGINATION_PARAMS.size
-
-            pagination_params = PaginationParams(page=page, size=size, offset=0)
+            pagination_params = self.pagination_params_from(
+                request.args.get("page", type=int), request.args.get("size", type=int)
+            )
             tasks_params = GetPaginatedTasksParams(account_id=account_id, pagination_params=pagination_params)
 
             pagination_result = TaskService.get_paginated_tasks(
@@ -81,19 +87,10 @@ class TaskView(MethodView):
 
     @access_auth_middleware
     def patch(self, account_id: str, task_id: str) -> ResponseReturnValue:
-        request_data = request.get_json()
-
-        if request_data is None:
-            raise TaskBadRequestError("Request body is required")
-
-        if not request_data.get("title"):
-            raise TaskBadRequestError("Title is required")
-
-        if not request_data.get("description"):
-            raise TaskBadRequestError("Description is required")
+        title, description = self.task_fields_from(request.get_json())
 
         update_task_params = UpdateTaskParams(
-            account_id=account_id, task_id=task_id, title=request_data["title"], description=request_data["description"]
+            account_id=account_id, task_id=task_id, title=title, description=description
         )
 
         updated_task = TaskService.update_task(
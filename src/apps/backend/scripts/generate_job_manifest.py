@@ -0,0 +1,10 @@
+from modules.core.job_registry import JobRegistry
+
+
+def run() -> None:
+    entries = JobRegistry.write_manifest()
+    print(f"Wrote {len(entries)} jobs to {JobRegistry.MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    run()
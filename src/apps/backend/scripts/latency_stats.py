@@ -0,0 +1,4 @@
+def nearest_rank_percentile(sorted_samples: list[float], percentile: int) -> float:
+    # Nearest-rank on an already sorted list; good enough for tail latency and free of interpolation noise.
+    rank = max(1, -(-percentile * len(sorted_samples) // 100))
+    return sorted_samples[rank - 1]
@@ -0,0 +1,340 @@
+"""Load-generation harness for the web app.
+
+Drives a running server (or one it spawns under the real `gunicorn_config.py`) over HTTP with a pool of
+virtual users, each replaying a weighted mix of login, task listing, task writes and OTP sign-in, and
+reports p50/p95/p99 latency and throughput per endpoint. Run it from `src/apps/backend`:
+
+    PYTHONPATH=./ pipenv run python scripts/load_test.py --spawn-server --concurrency 32 --duration 60
+    PYTHONPATH=./ pipenv run python scripts/load_test.py --base-url http://localhost:8080 \\
+        --mix login=1,list_tasks=6,create_task=2,update_task=2,delete_task=1,otp_login=1
+
+Twilio and SendGrid are never called: the OTP scenario relies on the default OTP (a spawned server gets
+`DEFAULT_OTP_ENABLED=true`; start an external server the same way), which skips the SMS send, and no
+scenario sends email. A spawned server also gets `RATE_LIMIT_ENABLED=false`, since every virtual user
+shares one client IP; do the same for an external server. Point it at a disposable database; it creates
+accounts and tasks as it goes.
+"""
+
+import argparse
+import json
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import requests
+
+from scripts.latency_stats import nearest_rank_percentile
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+SCENARIOS = ("login", "list_tasks", "create_task", "update_task", "delete_task", "otp_login")
+DEFAULT_MIX = "login=1,list_tasks=6,create_task=2,update_task=2,delete_task=1,otp_login=1"
+PASSWORD = "load-test-password"
+REQUEST_TIMEOUT_SECONDS = 30
+SERVER_READY_TIMEOUT_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class EndpointReport:
+    endpoint: str
+    requests: int
+    errors: int
+    throughput_per_second: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+@dataclass
+class LoadStats:
+    # Shared by every virtual user; the lock guards plain list appends, so it is never the bottleneck.
+    latencies_ms: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def record(self, endpoint: str, latency_ms: float, ok: bool) -> None:
+        with self.lock:
+            self.latencies_ms[endpoint].append(latency_ms)
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def report(self, elapsed_seconds: float) -> list[EndpointReport]:
+        reports = []
+        for endpoint, samples in sorted(self.latencies_ms.items()):
+            ordered = sorted(samples)
+            reports.append(
+                EndpointReport(
+                    endpoint=endpoint,
+                    requests=len(ordered),
+                    errors=self.errors.get(endpoint, 0),
+                    throughput_per_second=len(ordered) / elapsed_seconds,
+                    mean_ms=statistics.fmean(ordered),
+                    p50_ms=nearest_rank_percentile(ordered, 50),
+                    p95_ms=nearest_rank_percentile(ordered, 95),
+                    p99_ms=nearest_rank_percentile(ordered, 99),
+                    max_ms=ordered[-1],
+                )
+            )
+        return reports
+
+
+class VirtualUser:
+    """One simulated client: its own account, keep-alive session and tasks, so scenarios never contend on
+    shared data and the server sees one connection per user as it would from real browsers."""
+
+    def __init__(self, index: int, base_url: str, stats: LoadStats, otp_code: str, seed: int) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.stats = stats
+        self.otp_code = otp_code
+        self.random = random.Random(seed + index)
+        self.session = requests.Session()
+        self.username = f"load-test-{seed}-{index}@example.com"
+        self.phone_number = {"country_code": "+91", "phone_number": f"7{seed % 1000:03d}{index:06d}"}
+        self.account_id = ""
+        self.token = ""
+        self.task_ids: list[str] = []
+
+    def setup(self) -> None:
+        response = self.session.post(
+            f"{self.base_url}/api/accounts",
+            json={"first_name": "Load", "last_name": "Test", "username": self.username, "password": PASSWORD},
+            timeout=REQUEST_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        self.account_id = response.json()["id"]
+        self.login()
+
+    def _call(self, endpoint: str, method: str, path: str, **kwargs: Any) -> Optional[requests.Response]:
+        if self.token:
+            kwargs.setdefault("headers", {"Authorization": f"Bearer {self.token}"})
+        started_at = time.perf_counter()
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", timeout=REQUEST_TIMEOUT_SECONDS, **kwargs)
+        except requests.RequestException:
+            self.stats.record(endpoint, (time.perf_counter() - started_at) * 1000, ok=False)
+            return None
+        self.stats.record(endpoint, (time.perf_counter() - started_at) * 1000, ok=response.status_code < 400)
+        return response if response.status_code < 400 else None
+
+    def login(self) -> None:
+        response = self._call(
+            "POST /api/access-tokens (password)",
+            "POST",
+            "/api/access-tokens",
+            json={"username": self.username, "password": PASSWORD},
+        )
+        if response is not None:
+            self.token = response.json()["token"]
+
+    def list_tasks(self) -> None:
+        page = self.random.randint(1, 3)
+        self._call("GET /api/accounts/:id/tasks", "GET", f"/api/accounts/{self.account_id}/tasks?page={page}&size=10")
+
+    def create_task(self) -> None:
+        response = self._call(
+            "POST /api/accounts/:id/tasks",
+            "POST",
+            f"/api/accounts/{self.account_id}/tasks",
+            json={"title": "Load test task", "description": "Created by the load-test harness"},
+        )
+        if response is not None:
+            self.task_ids.append(response.json()["id"])
+
+    def update_task(self) -> None:
+        if not self.task_ids:
+            self.create_task()
+            return
+        task_id = self.random.choice(self.task_ids)
+        self._call(
+            "PATCH /api/accounts/:id/tasks/:task_id",
+            "PATCH",
+            f"/api/accounts/{self.account_id}/tasks/{task_id}",
+            json={"title": "Updated load test task", "description": "Updated by the load-test harness"},
+        )
+
+    def delete_task(self) -> None:
+        if not self.task_ids:
+            self.create_task()
+            return
+        task_id = self.task_ids.pop(self.random.randrange(len(self.task_ids)))
+        self._call(
+            "DELETE /api/accounts/:id/tasks/:task_id", "DELETE", f"/api/accounts/{self.account_id}/tasks/{task_id}"
+        )
+
+    def otp_login(self) -> None:
+        # Requesting an OTP and exchanging it are separate endpoints with very different costs, so each
+        # is reported on its own line.
+        requested = self._call(
+            "POST /api/accounts (phone number)", "POST", "/api/accounts", json={"phone_number": self.phone_number}
+        )
+        if requested is None:
+            return
+        self._call(
+            "POST /api/access-tokens (otp)",
+            "POST",
+            "/api/access-tokens",
+            json={"phone_number": self.phone_number, "otp_code": self.otp_code},
+            headers={},
+        )
+
+    def scenarios(self) -> dict[str, Callable[[], None]]:
+        return {
+            "login": self.login,
+            "list_tasks": self.list_tasks,
+            "create_task": self.create_task,
+            "update_task": self.update_task,
+            "delete_task": self.delete_task,
+            "otp_login": self.otp_login,
+        }
+
+    def run(self, mix: dict[str, int], deadline: float) -> None:
+        scenarios = self.scenarios()
+        names = list(mix)
+        weights = [mix[name] for name in names]
+        while time.monotonic() < deadline:
+            scenarios[self.random.choices(names, weights)[0]]()
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix: dict[str, int] = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise ValueError(f"Unknown scenario {name.strip()!r} in --mix; expected one of {', '.join(SCENARIOS)}")
+        mix[name.strip()] = int(weight or 1)
+    return mix
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate load against the web app and report latency per endpoint.")
+    parser.add_argument("--base-url", default=os.environ.get("LOAD_TEST_BASE_URL", "http://localhost:8080"))
+    parser.add_argument("--concurrency", type=int, default=int(os.environ.get("LOAD_TEST_CONCURRENCY", "16")))
+    parser.add_argument("--duration", type=float, default=float(os.environ.get("LOAD_TEST_DURATION", "30")))
+    parser.add_argument("--mix", default=os.environ.get("LOAD_TEST_MIX", DEFAULT_MIX))
+    parser.add_argument("--otp-code", default=os.environ.get("DEFAULT_OTP_CODE", "1234"))
+    parser.add_argument("--seed", type=int, default=int(time.time()))
+    parser.add_argument("--json", type=Path, help="Also write the report as JSON to this path.")
+    parser.add_argument(
+        "--spawn-server",
+        action="store_true",
+        help="Start gunicorn with gunicorn_config.py for the duration of the run.",
+    )
+    parser.add_argument("--server-workers", type=int, help="Override gunicorn workers for the spawned server.")
+    parser.add_argument("--server-threads", type=int, help="Override gunicorn threads for the spawned server.")
+    parser.add_argument("--server-port", type=int, default=8090)
+    return parser.parse_args(argv)
+
+
+def spawn_server(args: argparse.Namespace) -> subprocess.Popen[bytes]:
+    command = ["gunicorn", "-c", "gunicorn_config.py", "--bind", f"127.0.0.1:{args.server_port}"]
+    if args.server_workers:
+        command += ["--workers", str(args.server_workers)]
+    if args.server_threads:
+        command += ["--threads", str(args.server_threads)]
+    command.append("web_app:app")
+
+    # Every virtual user signs in from 127.0.0.1, so the per-IP login limits would turn the run into 429s.
+    env = {
+        **os.environ,
+        "DEFAULT_OTP_ENABLED": "true",
+        "DEFAULT_OTP_CODE": args.otp_code,
+        "RATE_LIMIT_ENABLED": "false",
+    }
+    server = subprocess.Popen(command, cwd=BACKEND_DIR, env=env)
+    args.base_url = f"http://127.0.0.1:{args.server_port}"
+
+    deadline = time.monotonic() + SERVER_READY_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with status {server.returncode} before becoming ready")
+        try:
+            if requests.get(f"{args.base_url}/api/", timeout=1).ok:
+                return server
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    stop_server(server)
+    raise RuntimeError(f"gunicorn did not answer on {args.base_url} within {SERVER_READY_TIMEOUT_SECONDS}s")
+
+
+def stop_server(server: subprocess.Popen[bytes]) -> None:
+    server.send_signal(signal.SIGTERM)
+    try:
+        server.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+
+def format_report(reports: list[EndpointReport], elapsed_seconds: float) -> str:
+    header = (
+        f"{'endpoint':<42} {'requests':>9} {'errors':>7} {'req/s':>8} "
+        f"{'mean':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for report in reports:
+        lines.append(
+            f"{report.endpoint:<42} {report.requests:>9} {report.errors:>7} {report.throughput_per_second:>8.1f} "
+            f"{report.mean_ms:>7.1f}ms {report.p50_ms:>7.1f}ms {report.p95_ms:>7.1f}ms "
+            f"{report.p99_ms:>7.1f}ms {report.max_ms:>7.1f}ms"
+        )
+    total = sum(report.requests for report in reports)
+    lines.append(f"\n{total} requests in {elapsed_seconds:.1f}s ({total / elapsed_seconds:.1f} req/s overall)")
+    return "\n".join(lines)
+
+
+def run(argv: list[str]) -> int:
+    args = _parse_args(argv)
+    mix = parse_mix(args.mix)
+    server = spawn_server(args) if args.spawn_server else None
+    try:
+        stats = LoadStats()
+        users = [
+            VirtualUser(index, args.base_url, stats, args.otp_code, args.seed) for index in range(args.concurrency)
+        ]
+        for user in users:
+            user.setup()
+        # Account creation and the first login are setup, not load; only the timed window is reported.
+        stats = LoadStats()
+        for user in users:
+            user.stats = stats
+
+        started_at = time.monotonic()
+        deadline = started_at + args.duration
+        threads = [threading.Thread(target=user.run, args=(mix, deadline), daemon=True) for user in users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed_seconds = time.monotonic() - started_at
+    finally:
+        if server is not None:
+            stop_server(server)
+
+    reports = stats.report(elapsed_seconds)
+    print(format_report(reports, elapsed_seconds))
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        summary = {
+            "base_url": args.base_url,
+            "concurrency": args.concurrency,
+            "duration_seconds": elapsed_seconds,
+            "mix": mix,
+            "endpoints": [asdict(report) for report in reports],
+        }
+        args.json.write_text(json.dumps(summary, indent=2) + "\n")
+    return 1 if any(report.errors for report in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run(sys.argv[1:]))
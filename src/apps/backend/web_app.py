@@ -7,14 +7,21 @@ from werkzeug.middleware.proxy_fix import ProxyFix
 load_dotenv()
 
 from bin.blueprints import api_blueprint, img_assets_blueprint, react_blueprint
+from modules.account.account_service import AccountService
 from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
 from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.rest_api.access_auth_middleware import operator_auth_middleware
 from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
+from modules.authentication.types import MailerConfig, TokenConfig
 from modules.config.config_service import ConfigService
+from modules.core.common.types import MongoConfig, OutboundHttpConfig, RedisConfig
 from modules.core.errors import AppError
-from modules.core.job_registry import JobRegistry
+from modules.core.process_memory import ProcessMemory
+from modules.core.rest_api.job_run_rest_api_server import JobRunRestApiServer
 from modules.core.security_headers import SecurityHeaders
 from modules.logger.logger_manager import LoggerManager
+from modules.notification.rest_api.notification_rest_api_server import NotificationRestApiServer
+from modules.rate_limit.errors import RateLimitExceededError
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
 from scripts.bootstrap_app import BootstrapApp
 
@@ -27,10 +34,13 @@ SecurityHeaders.init_app(app)
 LoggerManager.mount_logger()
 
 AuthenticationService.validate_access_token_signing_key()
+AccountService.prepare_password_verification()
 
-BootstrapApp().run()
+# Build the typed config sections now so a missing or mistyped key stops the boot instead of failing the
+# first request that needs it.
+ConfigService.load_sections(MongoConfig, OutboundHttpConfig, RedisConfig, TokenConfig, MailerConfig)
 
-JobRegistry.initialize()
+BootstrapApp().run()
 
 
 if ConfigService.has_value("is_server_running_behind_proxy") and ConfigService[bool].get_value(
@@ -47,6 +57,12 @@ api_blueprint.register_blueprint(account_blueprint)
 task_blueprint = TaskRestApiServer.create()
 api_blueprint.register_blueprint(task_blueprint)
 
+job_run_blueprint = JobRunRestApiServer.create(auth_middleware=operator_auth_middleware)
+api_blueprint.register_blueprint(job_run_blueprint)
+
+notification_blueprint = NotificationRestApiServer.create(auth_middleware=operator_auth_middleware)
+api_blueprint.register_blueprint(notification_blueprint)
+
 app.register_blueprint(api_blueprint)
 
 app.register_blueprint(img_assets_blueprint)
@@ -55,4 +71,12 @@ app.register_blueprint(react_blueprint)
 
 @app.errorhandler(AppError)
 def handle_error(exc: AppError) -> ResponseReturnValue:
-    return jsonify({"message": exc.message, "code": exc.code}), exc.http_code or 500
+    response = jsonify({"message": exc.message, "code": exc.code})
+    if isinstance(exc, RateLimitExceededError):
+        response.headers["Retry-After"] = str(exc.retry_after_seconds)
+    return response, exc.http_code or 500
+
+
+# Last, once the app and everything it imports are built: under gunicorn's preload this is the heap every
+# worker inherits, and freezing it keeps the workers' garbage collections off those shared pages.
+ProcessMemory.freeze_preloaded_heap()
@@ -0,0 +1,107 @@
+from typing import Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from aiohttp import web
+from aiohttp.typedefs import Handler
+
+from modules.account.account_service import AccountService
+from modules.account.rest_api.account_rest_api_server import AccountRestApiServer
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.types import MailerConfig, TokenConfig
+from modules.config.config_service import ConfigService
+from modules.core.async_web_app import AsyncWebApp
+from modules.core.common.types import AsyncWebConfig, MongoConfig, OutboundHttpConfig, RedisConfig
+from modules.core.errors import AppError
+from modules.core.process_memory import ProcessMemory
+from modules.core.security_headers import SecurityHeaders
+from modules.logger.logger_manager import LoggerManager
+from modules.rate_limit.errors import RateLimitExceededError
+from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
+
+# The async serving mode: the account and task APIs on aiohttp, served next to web_app.py rather than
+# instead of it. Run with `gunicorn -c gunicorn_config.py --worker-class aiohttp.GunicornWebWorker
+# web_async_app:app` (make run-async-engine) and route those API paths here. The Flask app still serves
+# every other route and runs the bootstrap step.
+
+LoggerManager.mount_logger()
+
+AuthenticationService.validate_access_token_signing_key()
+AccountService.prepare_password_verification()
+
+ConfigService.load_sections(MongoConfig, OutboundHttpConfig, RedisConfig, TokenConfig, MailerConfig, AsyncWebConfig)
+
+cors_allowed_origin = ConfigService[str].get_value(key="web.cors_allowed_origin", default="http://localhost:3000")
+security_headers = SecurityHeaders.headers()
+
+
+def _allowed_origin(request: web.Request) -> Optional[str]:
+    origin = request.headers.get("Origin")
+    return origin if origin is not None and cors_allowed_origin in ("*", origin) else None
+
+
+def _preflight_response(request: web.Request) -> web.Response:
+    response = web.Response()
+    response.headers["Access-Control-Allow-Methods"] = "DELETE, GET, PATCH, POST"
+    if "Access-Control-Request-Headers" in request.headers:
+        response.headers["Access-Control-Allow-Headers"] = request.headers["Access-Control-Request-Headers"]
+    return response
+
+
+def _add_response_headers(request: web.Request, response: web.StreamResponse) -> None:
+    response.headers.update(security_headers)
+    origin = _allowed_origin(request)
+    if origin is not None:
+        response.headers["Access-Control-Allow-Origin"] = origin
+        response.headers["Vary"] = "Origin"
+
+
+@web.middleware
+async def apply_response_headers(request: web.Request, handler: Handler) -> web.StreamResponse:
+    # The security headers and CORS answers the Flask app gets from SecurityHeaders and flask-cors.
+    try:
+        if (
+            request.method == "OPTIONS"
+            and "Access-Control-Request-Method" in request.headers
+            and _allowed_origin(request)
+        ):
+            response: web.StreamResponse = _preflight_response(request)
+        else:
+            response = await handler(request)
+    except web.HTTPException as exc:
+        _add_response_headers(request, exc)
+        raise
+    _add_response_headers(request, response)
+    return response
+
+
+@web.middleware
+async def handle_error(request: web.Request, handler: Handler) -> web.StreamResponse:
+    try:
+        response = await handler(request)
+    except AppError as exc:
+        response = AsyncWebApp.json_response({"message": exc.message, "code": exc.code}, status=exc.http_code or 500)
+        if isinstance(exc, RateLimitExceededError):
+            response.headers["Retry-After"] = str(exc.retry_after_seconds)
+    return response
+
+
+def create_app() -> web.Application:
+    # An Application binds to the first event loop that serves it, so tests build one per client.
+    api_app = web.Application()
+    api_app.add_routes(AccountRestApiServer.create_async())
+    api_app.add_routes(TaskRestApiServer.create_async())
+
+    root_app = web.Application(middlewares=[apply_response_headers, handle_error])
+    root_app.add_subapp(AsyncWebApp.API_PREFIX, api_app)
+    return root_app
+
+
+app = create_app()
+
+
+# Last, once the app and everything it imports are built: under gunicorn's preload this is the heap every
+# worker inherits, and freezing it keeps the workers' garbage collections off those shared pages.
+ProcessMemory.freeze_preloaded_heap()
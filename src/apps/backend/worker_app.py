@@ -1,25 +1,68 @@
+import argparse
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from celery.signals import beat_init, worker_ready
+from celery.signals import beat_init, worker_process_init, worker_process_shutdown, worker_shutdown
 
+from modules.authentication.types import MailerConfig, TokenConfig
+from modules.config.config_service import ConfigService
 from modules.core.celery_app import app
+from modules.core.common.types import JobRunBufferConfig, MongoConfig, OutboundHttpConfig, RedisConfig
+from modules.core.job import Job
 from modules.core.job_registry import JobRegistry
+from modules.core.process_memory import ProcessMemory
+from modules.core.process_resources import ProcessResources
+from modules.core.worker_profiles import WorkerProfiles
+
+# Jobs run the same services as the web app, so the worker refuses to start on the same config errors.
+ConfigService.load_sections(JobRunBufferConfig, MongoConfig, OutboundHttpConfig, RedisConfig, TokenConfig, MailerConfig)
 
 # Register at import, before the worker snapshots app.tasks into its consumption strategies; a task
 # registered only after that snapshot is rejected as unregistered even while present in app.tasks.
 JobRegistry.initialize()
 
-
-@worker_ready.connect
-def reregister_jobs_on_worker_ready(sender: object = None, **kwargs: object) -> None:
-    JobRegistry.initialize()
+# Prefork children share the parent's imported modules, config and job registry; freezing them keeps the
+# children's garbage collections from un-sharing those pages.
+ProcessMemory.freeze_preloaded_heap()
 
 
+# Beat is the one process that reads the schedule, so it alone writes the cron entries, and only those that
+# are missing or changed.
 @beat_init.connect
-def reregister_jobs_on_beat_init(sender: object = None, **kwargs: object) -> None:
+def sync_cron_schedules_on_beat_init(sender: object = None, **kwargs: object) -> None:
     JobRegistry.initialize()
+    JobRegistry.sync_cron_schedules()
+
+
+# A prefork child is forked from a parent that has already connected to Mongo and Datadog; like a gunicorn
+# worker, it re-creates those connections rather than share the parent's sockets.
+@worker_process_init.connect
+def reset_process_resources_on_process_init(sender: object = None, **kwargs: object) -> None:
+    ProcessResources.reset_after_fork()
+    ProcessMemory.tune_gc_after_fork()
+
+
+# A prefork child runs BUFFERED jobs and holds their finished runs; worker_shutdown covers the solo and
+# threads pools, where jobs run in the main process.
+@worker_process_shutdown.connect
+def flush_job_runs_on_process_shutdown(sender: object = None, **kwargs: object) -> None:
+    Job.flush_buffered_job_runs()
+
+
+@worker_shutdown.connect
+def flush_job_runs_on_worker_shutdown(sender: object = None, **kwargs: object) -> None:
+    Job.flush_buffered_job_runs()
 
 
 __all__ = ["app"]
+
+
+if __name__ == "__main__":
+    # `python worker_app.py --profile io` starts a worker with the queues, pool, concurrency and prefetch of
+    # the named profile in worker.profiles; without --profile, worker.profile (WORKER_PROFILE) picks it.
+    parser = argparse.ArgumentParser(description="Start a Celery worker from a configured worker profile.")
+    parser.add_argument("--profile", default=WorkerProfiles.default_name(), choices=WorkerProfiles.names())
+    profile = WorkerProfiles.get(parser.parse_args().profile)
+    app.worker_main(WorkerProfiles.celery_argv(profile))
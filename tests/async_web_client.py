@@ -0,0 +1,22 @@
+import asyncio
+from typing import Any, Mapping, Optional
+
+from aiohttp.test_utils import TestClient, TestServer
+from web_async_app import create_app
+
+
+def request_async_app(
+    method: str, path: str, token: Optional[str] = None, data: Optional[Mapping[str, Any]] = None
+) -> tuple[int, Any]:
+    """Send one request to web_async_app and return its status and JSON body (None when not JSON). Each call
+    runs on a new event loop, so it serves a freshly built application: an aiohttp Application binds to the
+    first loop that serves it."""
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    async def send() -> tuple[int, Any]:
+        async with TestClient(TestServer(create_app())) as client:
+            response = await client.request(method, path, headers=headers, json=data)
+            body = await response.json() if response.content_type == "application/json" else None
+            return response.status, body
+
+    return asyncio.run(send())
@@ -0,0 +1,102 @@
+import argparse
+import importlib
+import pkgutil
+import sys
+from dataclasses import asdict
+from fnmatch import fnmatch
+from pathlib import Path
+
+from tests import benchmarks
+from tests.benchmarks.benchmark import registered_benchmarks, run_benchmark
+from tests.benchmarks.memory import MEMORY_PROFILE_NAME, ForkMemoryResult, format_memory_results, measure_preload_fork
+from tests.benchmarks.report import (
+    ComparisonStatus,
+    build_report,
+    compare_to_baseline,
+    format_results,
+    load_baseline,
+    write_report,
+)
+
+DEFAULT_OUTPUT = Path("output/benchmarks.json")
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks", description="Run the backend benchmark suite against Mongo and Redis."
+    )
+    parser.add_argument(
+        "patterns", nargs="*", help="Glob patterns selecting benchmarks by name, e.g. 'repository.*'. Default: all."
+    )
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Where to write the JSON results.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Stored baseline to compare with.")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run's results as the new baseline.")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed relative slowdown of the median (0.25 = 25%%)."
+    )
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=0.2, help="Ignore median changes smaller than this many milliseconds."
+    )
+    parser.add_argument("--list", action="store_true", help="List the selected benchmarks and exit.")
+    return parser.parse_args(argv)
+
+
+def _load_benchmark_modules() -> None:
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if module_info.name.startswith("bench_"):
+            importlib.import_module(f"{benchmarks.__name__}.{module_info.name}")
+
+
+def main(argv: list[str]) -> int:
+    args = _parse_args(argv)
+    _load_benchmark_modules()
+    selected = registered_benchmarks(args.patterns)
+    # The fork memory profile is selected by name like a benchmark, but runs in its own processes.
+    memory_selected = not args.patterns or any(fnmatch(MEMORY_PROFILE_NAME, pattern) for pattern in args.patterns)
+
+    if args.list:
+        print("\n".join([bench.name for bench in selected] + ([MEMORY_PROFILE_NAME] if memory_selected else [])))
+        return 0
+    if not selected and not memory_selected:
+        print("No benchmark matches the given patterns.", file=sys.stderr)
+        return 2
+
+    results = []
+    for bench in selected:
+        print(f"running {bench.name} ...", file=sys.stderr, flush=True)
+        results.append(run_benchmark(bench))
+
+    memory_results: list[ForkMemoryResult] = []
+    if memory_selected:
+        print(f"running {MEMORY_PROFILE_NAME} ...", file=sys.stderr, flush=True)
+        memory_results = measure_preload_fork()
+
+    report = build_report(results, memory_results)
+    comparisons = []
+    if args.baseline.exists() and not args.update_baseline:
+        comparisons = compare_to_baseline(
+            results, load_baseline(args.baseline), tolerance=args.tolerance, min_delta_ms=args.min_delta_ms
+        )
+        report["baseline"] = str(args.baseline)
+        report["comparisons"] = [asdict(comparison) for comparison in comparisons]
+
+    write_report(args.output, report)
+    if args.update_baseline:
+        write_report(args.baseline, report)
+
+    print(format_results(results, comparisons))
+    if memory_results:
+        print(f"\n{format_memory_results(memory_results)}")
+    print(f"\nResults written to {args.output}")
+
+    regressions = [comparison for comparison in comparisons if comparison.status == ComparisonStatus.REGRESSED]
+    if regressions:
+        names = ", ".join(comparison.name for comparison in regressions)
+        print(f"Performance regression against {args.baseline}: {names}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,65 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from modules.account.account_service import AccountService
+from modules.account.types import CreateAccountByPhoneNumberParams, PhoneNumber
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.types import CreateOTPParams
+from tests.benchmarks.benchmark import Operation, benchmark
+from tests.benchmarks.support import (
+    API_URL,
+    BENCHMARK_ACTOR,
+    BENCHMARK_PASSWORD,
+    create_account_with_token,
+    expect_status,
+    post_json,
+    reset_collections,
+)
+
+ACCESS_TOKENS_URL = f"{API_URL}/access-tokens"
+
+OTP_LOGIN_ITERATIONS = 100
+OTP_LOGIN_WARMUP = 5
+
+
+@benchmark("access_token_api.create_by_username_and_password", iterations=50)
+@contextmanager
+def create_access_token_by_username_and_password() -> Iterator[Operation]:
+    reset_collections()
+    create_account_with_token("bench-login@example.com")
+    body = {"username": "bench-login@example.com", "password": BENCHMARK_PASSWORD}
+
+    def operation() -> None:
+        expect_status(post_json(ACCESS_TOKENS_URL, body), 201)
+
+    yield operation
+    reset_collections()
+
+
+@benchmark("access_token_api.create_by_phone_number_and_otp", iterations=OTP_LOGIN_ITERATIONS, warmup=OTP_LOGIN_WARMUP)
+@contextmanager
+def create_access_token_by_phone_number_and_otp() -> Iterator[Operation]:
+    # An OTP is single use, so each iteration consumes its own pre-issued code for its own phone number.
+    reset_collections()
+    bodies = []
+    for index in range(OTP_LOGIN_ITERATIONS + OTP_LOGIN_WARMUP):
+        phone_number = PhoneNumber(country_code="+91", phone_number=f"8{index:09d}")
+        account = AccountService.get_or_create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=phone_number), actor=BENCHMARK_ACTOR
+        )
+        otp = AuthenticationService.create_otp(
+            params=CreateOTPParams(phone_number=phone_number), account_id=account.id, actor=BENCHMARK_ACTOR
+        )
+        bodies.append(
+            {
+                "phone_number": {"country_code": phone_number.country_code, "phone_number": phone_number.phone_number},
+                "otp_code": otp.otp_code,
+            }
+        )
+    pending = iter(bodies)
+
+    def operation() -> None:
+        expect_status(post_json(ACCESS_TOKENS_URL, next(pending)), 201)
+
+    yield operation
+    reset_collections()
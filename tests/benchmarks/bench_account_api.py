@@ -0,0 +1,67 @@
+import itertools
+from contextlib import contextmanager
+from typing import Iterator
+
+from web_app import app
+
+from tests.benchmarks.benchmark import Operation, benchmark
+from tests.benchmarks.support import (
+    API_URL,
+    BENCHMARK_PASSWORD,
+    create_account_with_token,
+    expect_status,
+    post_json,
+    reset_collections,
+)
+
+ACCOUNTS_URL = f"{API_URL}/accounts"
+
+
+@benchmark("account_api.create_by_username_and_password", iterations=50)
+@contextmanager
+def create_account_by_username_and_password() -> Iterator[Operation]:
+    reset_collections()
+    counter = itertools.count()
+
+    def operation() -> None:
+        body = {
+            "first_name": "Bench",
+            "last_name": "Mark",
+            "password": BENCHMARK_PASSWORD,
+            "username": f"bench-{next(counter)}@example.com",
+        }
+        expect_status(post_json(ACCOUNTS_URL, body), 201)
+
+    yield operation
+    reset_collections()
+
+
+@benchmark("account_api.create_by_phone_number", iterations=100)
+@contextmanager
+def create_account_by_phone_number() -> Iterator[Operation]:
+    # Covers the signup-or-login path: account lookup, account + preferences creation and OTP issue.
+    reset_collections()
+    counter = itertools.count()
+
+    def operation() -> None:
+        body = {"phone_number": {"country_code": "+91", "phone_number": f"9{next(counter):09d}"}}
+        expect_status(post_json(ACCOUNTS_URL, body), 201)
+
+    yield operation
+    reset_collections()
+
+
+@benchmark("account_api.get_authenticated", iterations=200)
+@contextmanager
+def get_account_authenticated() -> Iterator[Operation]:
+    # Every authenticated endpoint pays the bearer token verification this request measures.
+    reset_collections()
+    account, token = create_account_with_token("bench-reader@example.com")
+    url = f"{ACCOUNTS_URL}/{account.id}"
+
+    def operation() -> None:
+        with app.test_client() as client:
+            expect_status(client.get(url, headers={"Authorization": f"Bearer {token}"}), 200)
+
+    yield operation
+    reset_collections()
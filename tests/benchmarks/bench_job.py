@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from modules.core.celery_app import app as celery_app
+from modules.core.common.types import AuditActor
+from modules.core.job import Job
+from tests.benchmarks.benchmark import Operation, benchmark
+from tests.benchmarks.support import reset_collections
+
+
+class BenchmarkNoopJob(Job):
+    # An empty body, so what is measured is the Job machinery itself: publishing to the broker for
+    # enqueue, and the JobRun bookkeeping around perform() for execute.
+    queue = "low"
+    max_retries = 0
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        return None
+
+
+def _purge_queue(name: str) -> None:
+    with celery_app.connection_for_write() as connection:
+        connection.default_channel.queue_purge(name)
+
+
+@benchmark("job.enqueue", iterations=500, warmup=20)
+@contextmanager
+def enqueue() -> Iterator[Operation]:
+    _purge_queue(BenchmarkNoopJob.queue)
+
+    def operation() -> None:
+        BenchmarkNoopJob.perform_async("benchmark", attempt=1)
+
+    yield operation
+    _purge_queue(BenchmarkNoopJob.queue)
+
+
+@benchmark("job.execute", iterations=200, warmup=10)
+@contextmanager
+def execute() -> Iterator[Operation]:
+    # Runs the registered Celery task in-process, which is what a worker does once it has the message.
+    reset_collections()
+    task = BenchmarkNoopJob._get_celery_task()
+
+    def operation() -> None:
+        task.apply(args=("benchmark",), kwargs={"attempt": 1}, throw=True)
+
+    yield operation
+    reset_collections()
@@ -0,0 +1,169 @@
+import itertools
+from contextlib import AbstractContextManager, contextmanager
+from functools import partial
+from typing import Callable, ClassVar, Iterator, Optional
+
+from pymongo.collection import Collection
+
+from modules.core.common.types import PaginationParams
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.types import Task, TaskQuery
+from tests.benchmarks.benchmark import Benchmark, Operation, register
+from tests.benchmarks.support import BENCHMARK_ACTOR, reset_collections
+
+BENCHMARK_ACCOUNT_ID = "benchmark-account"
+
+SEEDED_TASKS = 1_000
+PAGE_SIZE = 20
+ITERATIONS = 200
+WARMUP = 10
+
+
+class AuditedBenchmarkTaskRepository(TaskRepository):
+    # A private collection keeps the repository benchmarks off the task API's data; `_collection` is
+    # re-declared so the cached handle is not inherited from TaskRepository.
+    _collection: ClassVar[Optional[Collection]] = None
+    collection_name = "benchmark_tasks"
+    audit_resource_type = "tasks"
+
+
+class UnauditedBenchmarkTaskRepository(AuditedBenchmarkTaskRepository):
+    # Same collection and verbs with the audit trail switched off, so each pair of results isolates what
+    # auditing costs that verb.
+    _collection: ClassVar[Optional[Collection]] = None
+
+    @classmethod
+    def _audits(cls) -> bool:
+        return False
+
+
+type BenchmarkRepository = type[AuditedBenchmarkTaskRepository]
+type RepositoryBenchmark = Callable[[BenchmarkRepository], AbstractContextManager[Operation]]
+
+
+def _new_task(index: int) -> Task:
+    return Task(account_id=BENCHMARK_ACCOUNT_ID, description="Benchmark task", id="", title=f"Task {index}")
+
+
+@contextmanager
+def _seeded(repository: BenchmarkRepository, count: int = SEEDED_TASKS) -> Iterator[list[str]]:
+    reset_collections()
+    repository.collection().delete_many({})
+    task_ids = [repository.create(_new_task(index), actor=BENCHMARK_ACTOR).id for index in range(count)]
+    yield task_ids
+    repository.collection().delete_many({})
+    reset_collections()
+
+
+@contextmanager
+def create(repository: BenchmarkRepository) -> Iterator[Operation]:
+    with _seeded(repository):
+        counter = itertools.count()
+
+        def operation() -> None:
+            repository.create(_new_task(next(counter)), actor=BENCHMARK_ACTOR)
+
+        yield operation
+
+
+@contextmanager
+def find(repository: BenchmarkRepository) -> Iterator[Operation]:
+    with _seeded(repository) as task_ids:
+        ids = itertools.cycle(task_ids)
+
+        def operation() -> None:
+            repository.find(next(ids), actor=BENCHMARK_ACTOR)
+
+        yield operation
+
+
+@contextmanager
+def find_many(repository: BenchmarkRepository) -> Iterator[Operation]:
+    with _seeded(repository) as task_ids:
+        page_ids = task_ids[:PAGE_SIZE]
+
+        def operation() -> None:
+            repository.find_many(page_ids, actor=BENCHMARK_ACTOR)
+
+        yield operation
+
+
+@contextmanager
+def query_paginated(repository: BenchmarkRepository) -> Iterator[Operation]:
+    with _seeded(repository):
+        params = TaskQuery(account_id=BENCHMARK_ACCOUNT_ID, active=True)
+        pagination = PaginationParams(page=1, size=PAGE_SIZE, offset=0)
+
+        def operation() -> None:
+            repository.query_paginated(params, pagination, actor=BENCHMARK_ACTOR)
+
+        yield operation
+
+
+@contextmanager
+def count(repository: BenchmarkRepository) -> Iterator[Operation]:
+    with _seeded(repository):
+        params = TaskQuery(account_id=BENCHMARK_ACCOUNT_ID, active=True)
+
+        def operation() -> None:
+            repository.count(params)
+
+        yield operation
+
+
+@contextmanager
+def update(repository: BenchmarkRepository) -> Iterator[Operation]:
+    with _seeded(repository) as task_ids:
+        ids = itertools.cycle(task_ids)
+        counter = itertools.count()
+
+        def operation() -> None:
+            repository.update(next(ids), {"title": f"Updated {next(counter)}"}, actor=BENCHMARK_ACTOR)
+
+        yield operation
+
+
+@contextmanager
+def update_fields(repository: BenchmarkRepository) -> Iterator[Operation]:
+    with _seeded(repository) as task_ids:
+        ids = itertools.cycle(task_ids)
+        counter = itertools.count()
+
+        def operation() -> None:
+            repository.update_fields(next(ids), {"title": f"Updated {next(counter)}"}, actor=BENCHMARK_ACTOR)
+
+        yield operation
+
+
+@contextmanager
+def delete(repository: BenchmarkRepository) -> Iterator[Operation]:
+    with _seeded(repository, count=ITERATIONS + WARMUP) as task_ids:
+        ids = iter(task_ids)
+
+        def operation() -> None:
+            repository.delete(next(ids), actor=BENCHMARK_ACTOR)
+
+        yield operation
+
+
+_VERBS: dict[str, RepositoryBenchmark] = {
+    "create": create,
+    "find": find,
+    "find_many": find_many,
+    "query_paginated": query_paginated,
+    "count": count,
+    "update": update,
+    "update_fields": update_fields,
+    "delete": delete,
+}
+
+for _audit, _repository in (("on", AuditedBenchmarkTaskRepository), ("off", UnauditedBenchmarkTaskRepository)):
+    for _verb, _setup in _VERBS.items():
+        register(
+            Benchmark(
+                name=f"repository.{_verb}[audit={_audit}]",
+                setup=partial(_setup, _repository),
+                iterations=ITERATIONS,
+                warmup=WARMUP,
+            )
+        )
@@ -0,0 +1,132 @@
+import itertools
+from contextlib import contextmanager
+from functools import partial
+from typing import Iterator
+
+from web_app import app
+
+from modules.task.task_service import TaskService
+from modules.task.types import CreateTaskParams
+from tests.benchmarks.benchmark import Benchmark, Operation, register
+from tests.benchmarks.support import (
+    API_URL,
+    BENCHMARK_ACTOR,
+    create_account_with_token,
+    expect_status,
+    post_json,
+    reset_collections,
+    seed_tasks,
+)
+
+# Tasks seeded for the benchmark account before each case: a typical account, and one large enough that
+# an unindexed filter or a skip-heavy page shows up as a cliff rather than noise.
+TASK_COUNTS = (1_000, 100_000)
+
+PAGE_SIZE = 20
+ITERATIONS = 100
+WARMUP = 5
+
+
+def _tasks_url(account_id: str) -> str:
+    return f"{API_URL}/accounts/{account_id}/tasks"
+
+
+def _auth_headers(token: str) -> dict[str, str]:
+    return {"Content-Type": "application/json", "Authorization": f"Bearer {token}"}
+
+
+@contextmanager
+def _seeded_account(task_count: int) -> Iterator[tuple[str, str]]:
+    reset_collections()
+    account, token = create_account_with_token("bench-tasks@example.com")
+    seed_tasks(account.id, task_count)
+    yield account.id, token
+    reset_collections()
+
+
+def _create_owned_task_ids(account_id: str, count: int) -> list[str]:
+    return [
+        TaskService.create_task(
+            params=CreateTaskParams(account_id=account_id, description="Benchmark task", title=f"Benchmark {index}"),
+            actor=BENCHMARK_ACTOR,
+        ).id
+        for index in range(count)
+    ]
+
+
+@contextmanager
+def create_task(task_count: int) -> Iterator[Operation]:
+    with _seeded_account(task_count) as (account_id, token):
+        counter = itertools.count()
+
+        def operation() -> None:
+            body = {"title": f"Task {next(counter)}", "description": "Created by the benchmark"}
+            expect_status(post_json(_tasks_url(account_id), body, token=token), 201)
+
+        yield operation
+
+
+@contextmanager
+def get_task(task_count: int) -> Iterator[Operation]:
+    with _seeded_account(task_count) as (account_id, token):
+        url = f"{_tasks_url(account_id)}/{_create_owned_task_ids(account_id, 1)[0]}"
+
+        def operation() -> None:
+            with app.test_client() as client:
+                expect_status(client.get(url, headers=_auth_headers(token)), 200)
+
+        yield operation
+
+
+@contextmanager
+def update_task(task_count: int) -> Iterator[Operation]:
+    with _seeded_account(task_count) as (account_id, token):
+        url = f"{_tasks_url(account_id)}/{_create_owned_task_ids(account_id, 1)[0]}"
+        counter = itertools.count()
+
+        def operation() -> None:
+            body = f'{{"title": "Updated {next(counter)}", "description": "Updated by the benchmark"}}'
+            with app.test_client() as client:
+                expect_status(client.patch(url, headers=_auth_headers(token), data=body), 200)
+
+        yield operation
+
+
+@contextmanager
+def delete_task(task_count: int) -> Iterator[Operation]:
+    with _seeded_account(task_count) as (account_id, token):
+        pending = iter(_create_owned_task_ids(account_id, ITERATIONS + WARMUP))
+
+        def operation() -> None:
+            with app.test_client() as client:
+                response = client.delete(f"{_tasks_url(account_id)}/{next(pending)}", headers=_auth_headers(token))
+                expect_status(response, 204)
+
+        yield operation
+
+
+@contextmanager
+def list_tasks(task_count: int, *, last_page: bool) -> Iterator[Operation]:
+    with _seeded_account(task_count) as (account_id, token):
+        page = -(-task_count // PAGE_SIZE) if last_page else 1
+        url = f"{_tasks_url(account_id)}?page={page}&size={PAGE_SIZE}"
+
+        def operation() -> None:
+            with app.test_client() as client:
+                expect_status(client.get(url, headers=_auth_headers(token)), 200)
+
+        yield operation
+
+
+for _task_count in TASK_COUNTS:
+    for _name, _setup in (
+        ("create", partial(create_task, _task_count)),
+        ("get", partial(get_task, _task_count)),
+        ("update", partial(update_task, _task_count)),
+        ("delete", partial(delete_task, _task_count)),
+        ("list_first_page", partial(list_tasks, _task_count, last_page=False)),
+        ("list_last_page", partial(list_tasks, _task_count, last_page=True)),
+    ):
+        register(
+            Benchmark(name=f"task_api.{_name}[tasks={_task_count}]", setup=_setup, iterations=ITERATIONS, warmup=WARMUP)
+        )
@@ -0,0 +1,93 @@
+import statistics
+import time
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Callable, Iterable
+
+from scripts.latency_stats import nearest_rank_percentile
+
+# A benchmark's setup is a context manager yielding the operation to time. Everything before the yield
+# (seeding, logging in) and after it (cleanup) stays outside the measurement, exactly like a pytest
+# yield fixture.
+type Operation = Callable[[], None]
+type BenchmarkSetup = Callable[[], AbstractContextManager[Operation]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: BenchmarkSetup
+    iterations: int = 100
+    warmup: int = 5
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    iterations: int
+    total_seconds: float
+    ops_per_second: float
+    mean_ms: float
+    median_ms: float
+    p95_ms: float
+    p99_ms: float
+    min_ms: float
+    max_ms: float
+    stdev_ms: float
+
+
+_registered_benchmarks: list[Benchmark] = []
+
+
+def register(benchmark: Benchmark) -> None:
+    if any(existing.name == benchmark.name for existing in _registered_benchmarks):
+        raise ValueError(f"Benchmark {benchmark.name!r} is registered more than once")
+    _registered_benchmarks.append(benchmark)
+
+
+def benchmark(name: str, *, iterations: int = 100, warmup: int = 5) -> Callable[[BenchmarkSetup], BenchmarkSetup]:
+    def decorator(setup: BenchmarkSetup) -> BenchmarkSetup:
+        register(Benchmark(name=name, setup=setup, iterations=iterations, warmup=warmup))
+        return setup
+
+    return decorator
+
+
+def registered_benchmarks(patterns: Iterable[str] = ()) -> list[Benchmark]:
+    selected = list(patterns)
+    if not selected:
+        return list(_registered_benchmarks)
+    return [bench for bench in _registered_benchmarks if any(fnmatch(bench.name, pattern) for pattern in selected)]
+
+
+def run_benchmark(bench: Benchmark) -> BenchmarkResult:
+    with bench.setup() as operation:
+        for _ in range(bench.warmup):
+            operation()
+
+        samples_ns: list[int] = []
+        for _ in range(bench.iterations):
+            started_at = time.perf_counter_ns()
+            operation()
+            samples_ns.append(time.perf_counter_ns() - started_at)
+
+    return summarize(bench.name, samples_ns)
+
+
+def summarize(name: str, samples_ns: list[int]) -> BenchmarkResult:
+    samples_ms = sorted(sample / 1_000_000 for sample in samples_ns)
+    total_seconds = sum(samples_ns) / 1_000_000_000
+    return BenchmarkResult(
+        name=name,
+        iterations=len(samples_ms),
+        total_seconds=total_seconds,
+        ops_per_second=len(samples_ms) / total_seconds if total_seconds > 0 else 0.0,
+        mean_ms=statistics.fmean(samples_ms),
+        median_ms=statistics.median(samples_ms),
+        p95_ms=nearest_rank_percentile(samples_ms, 95),
+        p99_ms=nearest_rank_percentile(samples_ms, 99),
+        min_ms=samples_ms[0],
+        max_ms=samples_ms[-1],
+        stdev_ms=statistics.stdev(samples_ms) if len(samples_ms) > 1 else 0.0,
+    )
@@ -0,0 +1,145 @@
+import argparse
+import gc
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+# Measures what preload_app is for: how much of the master's memory gunicorn workers keep sharing once they
+# have served requests and collected garbage, with and without ProcessMemory's heap freeze. Each variant
+# runs in a fresh interpreter that imports web_app as the master does and forks `workers` children; every
+# child serves a short request mix, runs a full collection, and reports its own smaps_rollup.
+
+MEMORY_PROFILE_NAME = "memory.preload_fork"
+
+FORK_WORKERS = 4
+REQUESTS_PER_WORKER = 200
+
+
+@dataclass(frozen=True)
+class ForkMemoryResult:
+    name: str
+    frozen: bool
+    workers: int
+    rss_kib: float
+    pss_kib: float
+    shared_kib: float
+    private_kib: float
+
+
+def measure_preload_fork(*, workers: int = FORK_WORKERS, requests: int = REQUESTS_PER_WORKER) -> list[ForkMemoryResult]:
+    return [_measure_variant(frozen=frozen, workers=workers, requests=requests) for frozen in (False, True)]
+
+
+def shared_memory_gain(results: list[ForkMemoryResult]) -> Optional[float]:
+    # KiB per worker that stay shared with the master because the preloaded heap was frozen.
+    by_frozen = {result.frozen: result for result in results}
+    if True not in by_frozen or False not in by_frozen:
+        return None
+    return by_frozen[True].shared_kib - by_frozen[False].shared_kib
+
+
+def format_memory_results(results: list[ForkMemoryResult]) -> str:
+    header = f"{'memory':<58} {'workers':>8} {'rss':>11} {'pss':>11} {'shared':>11} {'private':>11}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        label = f"{result.name} ({'frozen' if result.frozen else 'unfrozen'})"
+        lines.append(
+            f"{label:<58} {result.workers:>8} {result.rss_kib:>8.0f}KiB {result.pss_kib:>8.0f}KiB "
+            f"{result.shared_kib:>8.0f}KiB {result.private_kib:>8.0f}KiB"
+        )
+    gain_kib = shared_memory_gain(results)
+    if gain_kib is not None:
+        lines.append(f"gc.freeze() keeps {gain_kib:.0f}KiB more per worker shared with the master")
+    return "\n".join(lines)
+
+
+def _measure_variant(*, frozen: bool, workers: int, requests: int) -> ForkMemoryResult:
+    env = {**os.environ, "PROCESS_MEMORY_FREEZE_PRELOADED_HEAP": "true" if frozen else "false"}
+    completed = subprocess.run(
+        [sys.executable, "-m", __name__, "--workers", str(workers), "--requests", str(requests)],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    usages: list[dict[str, int]] = json.loads(completed.stdout.strip().splitlines()[-1])
+    if not usages:
+        raise RuntimeError("/proc/<pid>/smaps_rollup is unavailable; the memory profile needs Linux")
+
+    def mean(field: str) -> float:
+        return statistics.fmean(usage[field] for usage in usages)
+
+    return ForkMemoryResult(
+        name=MEMORY_PROFILE_NAME,
+        frozen=frozen,
+        workers=workers,
+        rss_kib=mean("rss_kib"),
+        pss_kib=mean("pss_kib"),
+        shared_kib=mean("shared_kib"),
+        private_kib=mean("private_kib"),
+    )
+
+
+def _run_master(workers: int, requests: int) -> list[dict[str, Any]]:
+    # The gunicorn master's preload, in order: config and the gc hold (gunicorn_config.py), then the app,
+    # which freezes its heap last when freezing is on.
+    from modules.core.process_memory import ProcessMemory
+
+    ProcessMemory.hold_gc_until_fork()
+    from web_app import app  # noqa: F401
+
+    readers = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        if os.fork() == 0:
+            os.close(read_fd)
+            _run_worker(write_fd, requests)
+        os.close(write_fd)
+        readers.append(read_fd)
+
+    usages = []
+    for read_fd in readers:
+        with os.fdopen(read_fd) as reader:
+            payload = reader.read()
+        if payload:
+            usages.append(json.loads(payload))
+    for _ in readers:
+        os.wait()
+    return usages
+
+
+def _run_worker(write_fd: int, requests: int) -> None:
+    # What gunicorn's post_fork and a short worker lifetime do: reset, serve, collect, then report.
+    exit_code = 1
+    try:
+        from web_app import app
+
+        from modules.core.process_memory import ProcessMemory
+        from modules.core.process_resources import ProcessResources
+
+        ProcessResources.reset_after_fork()
+        ProcessMemory.tune_gc_after_fork()
+        with app.test_client() as client:
+            for _ in range(requests):
+                client.get("/config.js")
+                client.get("/api/accounts/benchmark/tasks")
+        gc.collect()
+
+        usage = ProcessMemory.usage()
+        with os.fdopen(write_fd, "w") as writer:
+            writer.write(json.dumps(asdict(usage)) if usage is not None else "")
+        exit_code = 0
+    finally:
+        os._exit(exit_code)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fork preloaded web_app workers and print their memory usage.")
+    parser.add_argument("--workers", type=int, default=FORK_WORKERS)
+    parser.add_argument("--requests", type=int, default=REQUESTS_PER_WORKER)
+    arguments = parser.parse_args()
+    print(json.dumps(_run_master(arguments.workers, arguments.requests)))
@@ -0,0 +1,131 @@
+import json
+import os
+import platform
+import subprocess
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Optional
+
+from tests.benchmarks.benchmark import BenchmarkResult
+from tests.benchmarks.memory import ForkMemoryResult, shared_memory_gain
+
+REPORT_SCHEMA_VERSION = 1
+
+
+class ComparisonStatus(StrEnum):
+    IMPROVED = "improved"
+    NEW = "new"
+    REGRESSED = "regressed"
+    UNCHANGED = "unchanged"
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    name: str
+    status: ComparisonStatus
+    median_ms: float
+    baseline_median_ms: Optional[float] = None
+    ratio: Optional[float] = None
+
+
+def build_report(
+    results: list[BenchmarkResult], memory_results: Optional[list[ForkMemoryResult]] = None
+) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "environment": _describe_environment(),
+        "results": [asdict(result) for result in results],
+    }
+    # Reported, not compared: shared and private KiB depend on the kernel and allocator as much as the code.
+    if memory_results:
+        report["memory"] = {
+            "results": [asdict(result) for result in memory_results],
+            "shared_memory_gain_kib": shared_memory_gain(memory_results),
+        }
+    return report
+
+
+def write_report(path: Path, report: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    report = json.loads(path.read_text())
+    if report.get("schema_version") != REPORT_SCHEMA_VERSION:
+        raise ValueError(f"Baseline {path} has schema_version {report.get('schema_version')!r}")
+    return {result["name"]: float(result["median_ms"]) for result in report["results"]}
+
+
+def compare_to_baseline(
+    results: list[BenchmarkResult], baseline: dict[str, float], *, tolerance: float, min_delta_ms: float
+) -> list[BenchmarkComparison]:
+    # The median is compared rather than the mean so one slow GC pause or fsync does not fail the run, and
+    # a change must clear both the relative tolerance and an absolute floor: sub-millisecond operations
+    # jitter by more than 25% on a shared runner without anything having regressed.
+    comparisons: list[BenchmarkComparison] = []
+    for result in results:
+        baseline_median_ms = baseline.get(result.name)
+        if baseline_median_ms is None or baseline_median_ms <= 0:
+            comparisons.append(
+                BenchmarkComparison(name=result.name, status=ComparisonStatus.NEW, median_ms=result.median_ms)
+            )
+            continue
+
+        delta_ms = result.median_ms - baseline_median_ms
+        ratio = result.median_ms / baseline_median_ms
+        status = ComparisonStatus.UNCHANGED
+        if abs(delta_ms) >= min_delta_ms:
+            if ratio > 1 + tolerance:
+                status = ComparisonStatus.REGRESSED
+            elif ratio < 1 - tolerance:
+                status = ComparisonStatus.IMPROVED
+
+        comparisons.append(
+            BenchmarkComparison(
+                name=result.name,
+                status=status,
+                median_ms=result.median_ms,
+                baseline_median_ms=baseline_median_ms,
+                ratio=ratio,
+            )
+        )
+    return comparisons
+
+
+def format_results(results: list[BenchmarkResult], comparisons: list[BenchmarkComparison]) -> str:
+    by_name = {comparison.name: comparison for comparison in comparisons}
+    header = f"{'benchmark':<58} {'ops/s':>10} {'median':>10} {'p95':>10} {'p99':>10}  baseline"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        comparison = by_name.get(result.name)
+        verdict = ""
+        if comparison is not None:
+            verdict = comparison.status.value
+            if comparison.ratio is not None:
+                verdict = f"{verdict} ({comparison.ratio:.2f}x)"
+        lines.append(
+            f"{result.name:<58} {result.ops_per_second:>10.1f} {result.median_ms:>8.3f}ms "
+            f"{result.p95_ms:>8.3f}ms {result.p99_ms:>8.3f}ms  {verdict}"
+        )
+    return "\n".join(lines)
+
+
+def _describe_environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": _git_commit(),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip() or None
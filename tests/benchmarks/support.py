@@ -0,0 +1,86 @@
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any, Optional
+
+from web_app import app
+from werkzeug.test import TestResponse
+
+from modules.account.account_service import AccountService
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import Account, CreateAccountByUsernameAndPasswordParams
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.internal.otp.store.otp_repository import OTPRepository
+from modules.core.common.types import ActorType, AuditActor
+from modules.core.internal.audit.store.audit_log_repository import AuditLogRepository
+from modules.core.internal.job_run.store.job_run_repository import JobRunRepository
+from modules.notification.internal.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.task.internal.store.task_model import TaskModel
+from modules.task.internal.store.task_repository import TaskRepository
+
+BENCHMARK_ACTOR = AuditActor(actor_type=ActorType.WORKER, actor_id="benchmark")
+
+API_URL = "http://127.0.0.1:8080/api"
+HEADERS = {"Content-Type": "application/json"}
+BENCHMARK_PASSWORD = "benchmark-password"
+
+SEED_BATCH_SIZE = 10_000
+
+_TOUCHED_REPOSITORIES = (
+    AccountRepository,
+    AccountNotificationPreferencesRepository,
+    AuditLogRepository,
+    JobRunRepository,
+    OTPRepository,
+    TaskRepository,
+)
+
+
+def reset_collections() -> None:
+    # Every benchmark starts from, and leaves behind, empty collections so one case's data (or its audit
+    # rows) never skews the next case's index sizes.
+    for repository in _TOUCHED_REPOSITORIES:
+        repository.collection().delete_many({})
+
+
+def post_json(url: str, body: dict[str, Any], token: Optional[str] = None) -> TestResponse:
+    headers = {**HEADERS, "Authorization": f"Bearer {token}"} if token else HEADERS
+    with app.test_client() as client:
+        return client.post(url, headers=headers, data=json.dumps(body))
+
+
+def expect_status(response: TestResponse, status_code: int) -> None:
+    # A benchmark that silently measures an error path is worse than no benchmark at all.
+    if response.status_code != status_code:
+        raise AssertionError(f"Expected HTTP {status_code}, got {response.status_code}: {response.get_data(True)}")
+
+
+def create_account_with_token(username: str) -> tuple[Account, str]:
+    account = AccountService.create_account_by_username_and_password(
+        params=CreateAccountByUsernameAndPasswordParams(
+            first_name="Bench", last_name="Mark", password=BENCHMARK_PASSWORD, username=username
+        ),
+        actor=BENCHMARK_ACTOR,
+    )
+    access_token = AuthenticationService.create_access_token_by_username_and_password(account=account)
+    return account, access_token.token
+
+
+def seed_tasks(account_id: str, count: int) -> None:
+    # Seeding goes straight to the collection in large batches: it is fixture setup, not the thing being
+    # measured, and 100k audited creates would take longer than the whole suite.
+    created_at = datetime.now(UTC) - timedelta(seconds=count)
+    for batch_start in range(0, count, SEED_BATCH_SIZE):
+        docs = []
+        for index in range(batch_start, min(batch_start + SEED_BATCH_SIZE, count)):
+            timestamp = created_at + timedelta(seconds=index)
+            model = TaskModel(
+                account_id=account_id,
+                description=f"Seeded task {index}",
+                title=f"Task {index}",
+                created_at=timestamp,
+                updated_at=timestamp,
+            )
+            docs.append(model.to_bson())
+        TaskRepository.collection().insert_many(docs, ordered=False)
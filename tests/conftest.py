@@ -46,3 +46,23 @@ def purge_broker_queues() -> Iterator[None]:
     _purge_broker_queues()
     yield
     _purge_broker_queues()
+
+
+@pytest.fixture
+def eager_celery_propagates() -> bool:
+    # Override in a module to return False where tests assert on how a failed task was recorded.
+    return True
+
+
+@pytest.fixture
+def eager_celery(eager_celery_propagates: bool) -> Iterator[None]:
+    # Runs tasks in-process for the test; use with pytest.mark.usefixtures("eager_celery").
+    previous_eager = celery_app.conf.task_always_eager
+    previous_propagate = celery_app.conf.task_eager_propagates
+    celery_app.conf.task_always_eager = True
+    celery_app.conf.task_eager_propagates = eager_celery_propagates
+    try:
+        yield
+    finally:
+        celery_app.conf.task_always_eager = previous_eager
+        celery_app.conf.task_eager_propagates = previous_propagate
@@ -0,0 +1,112 @@
+from modules.account.account_service import AccountService
+from modules.account.types import AccountErrorCode, AccountSearchByIdParams, CreateAccountByUsernameAndPasswordParams
+from modules.authentication.types import AccessTokenErrorCode
+from tests.async_web_client import request_async_app
+from tests.conftest import TEST_ACTOR
+from tests.modules.account.base_test_account import BaseTestAccount
+
+ACCOUNTS_PATH = "/api/accounts"
+
+
+class TestAccountAsyncApi(BaseTestAccount):
+    """The account API served by web_async_app answers as the Flask one does."""
+
+    def test_given_valid_username_and_password_when_creating_account_then_returns_created_account(self) -> None:
+        status, account = request_async_app(
+            "POST",
+            ACCOUNTS_PATH,
+            data={"first_name": "first_name", "last_name": "last_name", "password": "password", "username": "username"},
+        )
+
+        assert status == 201
+        assert account["username"] == "username"
+        assert "password" not in account
+        assert AccountService.get_account_by_username(username="username", actor=TEST_ACTOR).id == account["id"]
+
+    def test_given_existing_username_when_creating_account_then_returns_conflict(self) -> None:
+        status, error = request_async_app(
+            "POST",
+            ACCOUNTS_PATH,
+            data={
+                "first_name": "first_name",
+                "last_name": "last_name",
+                "password": "password",
+                "username": self.account.username,
+            },
+        )
+
+        assert status == 409
+        assert error["code"] == AccountErrorCode.USERNAME_ALREADY_EXISTS
+
+    def test_given_authenticated_account_when_getting_it_then_returns_account(self) -> None:
+        status, account = request_async_app("GET", f"{ACCOUNTS_PATH}/{self.account.id}", self.access_token.token)
+
+        assert status == 200
+        assert account["id"] == self.account.id
+
+    def test_given_account_when_updating_own_profile_then_returns_updated_account(self) -> None:
+        status, account = request_async_app(
+            "PATCH",
+            f"{ACCOUNTS_PATH}/{self.account.id}",
+            self.access_token.token,
+            data={"first_name": "new_first_name"},
+        )
+
+        assert status == 200
+        assert account["first_name"] == "new_first_name"
+        assert account["last_name"] == self.account.last_name
+
+    def test_given_no_authorization_header_when_updating_profile_then_returns_unauthorized(self) -> None:
+        status, error = request_async_app(
+            "PATCH", f"{ACCOUNTS_PATH}/{self.account.id}", data={"first_name": "new_first_name"}
+        )
+
+        assert status == 401
+        assert error["code"] == AccessTokenErrorCode.AUTHORIZATION_HEADER_NOT_FOUND
+
+    def test_given_authenticated_account_when_updating_another_users_profile_then_returns_unauthorized(self) -> None:
+        other_account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="other_first_name", last_name="other_last_name", password="password", username="other_user"
+            ),
+            actor=TEST_ACTOR,
+        )
+
+        status, error = request_async_app(
+            "PATCH",
+            f"{ACCOUNTS_PATH}/{other_account.id}",
+            self.access_token.token,
+            data={"first_name": "new_first_name"},
+        )
+
+        assert status == 401
+        assert error["code"] == AccessTokenErrorCode.UNAUTHORIZED_ACCESS
+        unchanged_account = AccountService.get_account_by_id(
+            params=AccountSearchByIdParams(id=other_account.id), actor=TEST_ACTOR
+        )
+        assert unchanged_account.first_name == "other_first_name"
+
+    def test_given_unrecognized_request_body_when_updating_profile_then_returns_bad_request(self) -> None:
+        status, error = request_async_app(
+            "PATCH", f"{ACCOUNTS_PATH}/{self.account.id}", self.access_token.token, data={"unknown": "field"}
+        )
+
+        assert status == 400
+        assert error["code"] == AccountErrorCode.BAD_REQUEST
+
+    def test_given_authenticated_account_when_deleting_own_account_then_returns_no_content(self) -> None:
+        status, body = request_async_app("DELETE", f"{ACCOUNTS_PATH}/{self.account.id}", self.access_token.token)
+
+        assert status == 204
+        assert body is None
+
+        status, error = request_async_app("DELETE", f"{ACCOUNTS_PATH}/{self.account.id}", self.access_token.token)
+
+        assert status == 404
+        assert error["code"] == AccountErrorCode.NOT_FOUND
+
+    def test_given_no_authorization_header_when_deleting_account_then_returns_unauthorized(self) -> None:
+        status, error = request_async_app("DELETE", f"{ACCOUNTS_PATH}/{self.account.id}")
+
+        assert status == 401
+        assert error["code"] == AccessTokenErrorCode.AUTHORIZATION_HEADER_NOT_FOUND
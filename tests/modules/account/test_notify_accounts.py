@@ -0,0 +1,134 @@
+from typing import Iterator
+from unittest import mock
+
+import pytest
+
+from modules.account.account_service import AccountService
+from modules.account.internal.account_notification_fan_out import AccountNotificationFanOut
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import AccountQuery, CreateAccountByUsernameAndPasswordParams, PhoneNumber
+from modules.core.common.types import JobRunQuery
+from modules.core.internal.job_run.store.job_run_repository import JobRunRepository
+from modules.core.redis_client import RedisClient
+from modules.notification.internal.account_notification_preferences_cache import AccountNotificationPreferencesCache
+from modules.notification.internal.bulk_sms_sender import BulkSMSSender
+from modules.notification.internal.delivery_idempotency import DeliveryIdempotency
+from modules.notification.internal.sendgrid_service import SendGridService
+from modules.notification.internal.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.notification.internal.twilio_service import TwilioService
+from modules.notification.types import (
+    BulkEmailContent,
+    BulkNotificationContent,
+    CreateOrUpdateAccountNotificationPreferencesParams,
+    EmailSender,
+    SendSMSParams,
+)
+from tests.conftest import TEST_ACTOR
+
+CONTENT = BulkNotificationContent(
+    email=BulkEmailContent(
+        sender=EmailSender(email="team@example.com", name="Team"),
+        template_id="announcement",
+        template_data={"headline": "News"},
+    )
+)
+
+
+pytestmark = pytest.mark.usefixtures("eager_celery")
+
+
+@pytest.fixture(autouse=True)
+def clean_state() -> Iterator[None]:
+    AccountNotificationPreferencesCache._state = None
+    yield
+    AccountRepository.collection().delete_many({})
+    AccountNotificationPreferencesRepository.collection().delete_many({})
+    JobRunRepository.collection().delete_many({})
+    AccountNotificationPreferencesCache._state = None
+    client = RedisClient.get_client()
+    keys = list(client.scan_iter(match=f"{DeliveryIdempotency.KEY_PREFIX}:*"))
+    if keys:
+        client.delete(*keys)
+
+
+def _create_account(username: str, *, email_enabled: bool = True) -> str:
+    account = AccountService.create_account_by_username_and_password(
+        params=CreateAccountByUsernameAndPasswordParams(
+            first_name=username.split("@")[0], last_name="last_name", password="password", username=username
+        ),
+        actor=TEST_ACTOR,
+    )
+    if not email_enabled:
+        AccountService.create_or_update_account_notification_preferences(
+            account_id=account.id,
+            actor=TEST_ACTOR,
+            preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=False),
+        )
+    return account.id
+
+
+class TestGivenAccountsToNotify:
+    class TestWhenTheFanOutRuns:
+        def test_then_opted_in_accounts_get_one_batched_email_per_chunk(self) -> None:
+            for index in range(5):
+                _create_account(f"user{index}@example.com")
+            _create_account("muted@example.com", email_enabled=False)
+
+            with (
+                mock.patch.object(AccountNotificationFanOut, "accounts_per_chunk", return_value=4),
+                mock.patch.object(SendGridService, "send_emails") as send_emails,
+            ):
+                AccountService.send_notification_to_accounts(query=AccountQuery(), content=CONTENT)
+
+            sent = [params for call in send_emails.call_args_list for params in call.args[0]]
+            assert len(send_emails.call_args_list) == 2
+            assert sorted(params.recipient.email for params in sent) == [f"user{i}@example.com" for i in range(5)]
+            assert all(params.template_data["headline"] == "News" for params in sent)
+            assert {params.template_data["first_name"] for params in sent} == {f"user{i}" for i in range(5)}
+
+        def test_then_progress_is_tracked_on_the_fan_out_run(self) -> None:
+            for index in range(3):
+                _create_account(f"user{index}@example.com")
+            _create_account("muted@example.com", email_enabled=False)
+
+            with (
+                mock.patch.object(AccountNotificationFanOut, "accounts_per_chunk", return_value=2),
+                mock.patch.object(SendGridService, "send_emails"),
+            ):
+                AccountService.send_notification_to_accounts(query=AccountQuery(), content=CONTENT)
+
+            job_run = JobRunRepository.query_one(JobRunQuery(job_name="NotifyAccountsJob"), actor=TEST_ACTOR)
+            assert job_run is not None
+            assert job_run.progress["accounts"] == 4
+            assert job_run.progress["chunks_enqueued"] == 2
+            assert job_run.progress["chunks_completed"] == 2
+            assert job_run.progress["emails_queued"] == 3
+            assert job_run.progress["skipped_by_preferences"] == 1
+
+
+class TestGivenAccountIdsToStream:
+    def test_then_batches_cover_every_match_once_in_id_order(self) -> None:
+        account_ids = [_create_account(f"user{index}@example.com") for index in range(5)]
+
+        batches = list(AccountRepository.iter_id_batches(AccountQuery(), batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [account_id for batch in batches for account_id in batch] == sorted(account_ids)
+
+
+class TestGivenBulkSMS:
+    def test_then_a_resent_batch_skips_delivered_messages(self) -> None:
+        messages = {
+            f"bulk-sms:{number}": SendSMSParams(
+                message_body="Hello", recipient_phone=PhoneNumber(country_code="+1", phone_number=number)
+            )
+            for number in ("2124567890", "2124567891")
+        }
+
+        with mock.patch.object(TwilioService, "send_sms") as send_sms:
+            assert BulkSMSSender.send(messages) == 2
+            assert BulkSMSSender.send(messages) == 2
+
+        assert send_sms.call_count == 2
@@ -0,0 +1,74 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+import pytest
+
+from modules.account.errors import AccountPasswordHashingUnavailableError
+from modules.account.internal.password_hashing_executor import PasswordHashingExecutor, _ExecutorState
+
+
+def _install_pool(*, max_workers: int, max_queue_size: int, max_queue_wait_seconds: float) -> None:
+    PasswordHashingExecutor._state = _ExecutorState(
+        executor=ThreadPoolExecutor(max_workers=max_workers),
+        slots=threading.BoundedSemaphore(max_workers + max_queue_size),
+        max_queue_wait_seconds=max_queue_wait_seconds,
+    )
+
+
+@pytest.fixture(autouse=True)
+def restore_pool() -> Iterator[None]:
+    previous_state = PasswordHashingExecutor._state
+    yield
+    PasswordHashingExecutor._state = previous_state
+
+
+def _occupy_pool(release: threading.Event) -> threading.Thread:
+    started = threading.Event()
+
+    def slow_hash() -> bool:
+        started.set()
+        return release.wait(timeout=5)
+
+    thread = threading.Thread(target=PasswordHashingExecutor.run, args=(slow_hash,))
+    thread.start()
+    started.wait(timeout=5)
+    return thread
+
+
+class TestGivenThePasswordHashingPool:
+    class TestWhenItHasCapacity:
+        def test_then_the_operation_result_is_returned(self) -> None:
+            _install_pool(max_workers=1, max_queue_size=0, max_queue_wait_seconds=1)
+
+            assert PasswordHashingExecutor.run(lambda: "hashed") == "hashed"
+
+    class TestWhenEverySlotIsTaken:
+        def test_then_the_request_is_rejected_immediately(self) -> None:
+            _install_pool(max_workers=1, max_queue_size=0, max_queue_wait_seconds=1)
+            release = threading.Event()
+            holder = _occupy_pool(release)
+
+            started_at = time.monotonic()
+            with pytest.raises(AccountPasswordHashingUnavailableError) as error:
+                PasswordHashingExecutor.run(lambda: "hashed")
+
+            assert time.monotonic() - started_at < 0.5
+            assert error.value.http_code == 503
+            release.set()
+            holder.join()
+
+    class TestWhenAQueuedHashWaitsTooLong:
+        def test_then_it_is_rejected_without_running(self) -> None:
+            _install_pool(max_workers=1, max_queue_size=1, max_queue_wait_seconds=0.05)
+            release = threading.Event()
+            holder = _occupy_pool(release)
+            ran = threading.Event()
+
+            threading.Timer(0.2, release.set).start()
+            with pytest.raises(AccountPasswordHashingUnavailableError):
+                PasswordHashingExecutor.run(ran.set)
+
+            assert not ran.is_set()
+            holder.join()
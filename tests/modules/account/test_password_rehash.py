@@ -0,0 +1,87 @@
+from typing import Iterator
+from unittest import mock
+
+import bcrypt
+import pytest
+
+from modules.account.account_service import AccountService
+from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.password_hash import PasswordHash
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import Account, AccountSearchParams
+from modules.core.internal.audit.store.audit_log_repository import AuditLogRepository
+from tests.conftest import TEST_ACTOR
+
+USERNAME = "rehash@example.com"
+PASSWORD = "rehash-password"
+
+
+@pytest.fixture(autouse=True)
+def clean_collections() -> Iterator[None]:
+    yield
+    AccountRepository.collection().delete_many({})
+    AuditLogRepository.collection().delete_many({})
+
+
+def _create_account_hashed_at(rounds: int) -> Account:
+    hashed_password = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds=rounds)).decode()
+    account = Account(
+        id="", first_name="re", last_name="hash", hashed_password=hashed_password, phone_number=None, username=USERNAME
+    )
+    return AccountRepository.create(account, actor=TEST_ACTOR)
+
+
+def _stored_rounds(account_id: str) -> int | None:
+    stored = AccountRepository.find(account_id, actor=TEST_ACTOR)
+    assert stored is not None
+    return PasswordHash.of(stored.hashed_password).rounds()
+
+
+class TestGivenAStoredHashAtADifferentCost:
+    class TestWhenTheAccountLogsIn:
+        def test_then_the_password_is_rehashed_at_the_configured_cost(self) -> None:
+            configured_rounds = AccountUtil.password_hash_rounds()
+            account = _create_account_hashed_at(configured_rounds + 1)
+
+            AccountService.get_account_by_username_and_password(
+                params=AccountSearchParams(username=USERNAME, password=PASSWORD), actor=TEST_ACTOR
+            )
+
+            assert _stored_rounds(account.id) == configured_rounds
+            relogin = AccountService.get_account_by_username_and_password(
+                params=AccountSearchParams(username=USERNAME, password=PASSWORD), actor=TEST_ACTOR
+            )
+            assert relogin.id == account.id
+
+
+class TestGivenAStoredHashAtTheConfiguredCost:
+    class TestWhenTheAccountLogsIn:
+        def test_then_the_stored_hash_is_left_alone(self) -> None:
+            account = _create_account_hashed_at(AccountUtil.password_hash_rounds())
+            stored_before = AccountRepository.find(account.id, actor=TEST_ACTOR)
+
+            AccountService.get_account_by_username_and_password(
+                params=AccountSearchParams(username=USERNAME, password=PASSWORD), actor=TEST_ACTOR
+            )
+
+            stored_after = AccountRepository.find(account.id, actor=TEST_ACTOR)
+            assert stored_before is not None and stored_after is not None
+            assert stored_after.hashed_password == stored_before.hashed_password
+
+
+class TestGivenAnUnknownUsername:
+    class TestWhenTheEqualizingDigestIsUsed:
+        def test_then_it_is_hashed_at_the_configured_cost(self) -> None:
+            digest = PasswordHash.for_absent_account_with_equalized_timing()
+
+            assert digest.rounds() == AccountUtil.password_hash_rounds()
+            assert not digest.matches(PASSWORD)
+
+        def test_then_it_is_hashed_at_boot_rather_than_on_the_first_login(self) -> None:
+            AccountService.prepare_password_verification()
+
+            with mock.patch.object(bcrypt, "hashpw") as hashpw:
+                digest = PasswordHash.for_absent_account_with_equalized_timing()
+
+            hashpw.assert_not_called()
+            assert digest.rounds() == AccountUtil.password_hash_rounds()
@@ -1,5 +1,6 @@
 import json
 
+import pytest
 from web_app import app
 
 from modules.account.account_service import AccountService
@@ -10,7 +11,8 @@ from modules.account.types import (
     PhoneNumber,
 )
 from modules.authentication.authentication_service import AuthenticationService
-from modules.authentication.types import CreateOTPParams
+from modules.authentication.errors import OTPExpiredError, OTPIncorrectError
+from modules.authentication.types import CreateOTPParams, VerifyOTPParams
 from tests.conftest import TEST_ACTOR
 from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
 
@@ -113,3 +115,37 @@ class TestAuthenticationService(BaseTestAccessToken):
         assert authenticated_response.status_code == 200
         assert authenticated_response.json is not None
         assert authenticated_response.json.get("id") == account.id
+
+    def test_verify_otp_consumes_the_code_once(self) -> None:
+        phone_number = PhoneNumber(country_code="+91", phone_number="9999999999")
+        account = AccountWriter.create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=phone_number), actor=TEST_ACTOR
+        )
+        otp = AuthenticationService.create_otp(
+            params=CreateOTPParams(phone_number=phone_number), account_id=account.id, actor=TEST_ACTOR
+        )
+        params = VerifyOTPParams(phone_number=phone_number, otp_code=otp.otp_code)
+
+        verified_otp = AuthenticationService.verify_otp(params=params, account_id=account.id, actor=TEST_ACTOR)
+
+        assert verified_otp.id == otp.id
+        assert not verified_otp.active
+        with pytest.raises(OTPExpiredError):
+            AuthenticationService.verify_otp(params=params, account_id=account.id, actor=TEST_ACTOR)
+
+    def test_verify_otp_with_a_code_never_issued_is_incorrect(self) -> None:
+        phone_number = PhoneNumber(country_code="+91", phone_number="9999999999")
+        account = AccountWriter.create_account_by_phone_number(
+            params=CreateAccountByPhoneNumberParams(phone_number=phone_number), actor=TEST_ACTOR
+        )
+        otp = AuthenticationService.create_otp(
+            params=CreateOTPParams(phone_number=phone_number), account_id=account.id, actor=TEST_ACTOR
+        )
+        wrong_code = "0000" if otp.otp_code != "0000" else "1111"
+
+        with pytest.raises(OTPIncorrectError):
+            AuthenticationService.verify_otp(
+                params=VerifyOTPParams(phone_number=phone_number, otp_code=wrong_code),
+                account_id=account.id,
+                actor=TEST_ACTOR,
+            )
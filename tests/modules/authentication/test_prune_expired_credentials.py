@@ -0,0 +1,68 @@
+from datetime import UTC, datetime, timedelta
+from typing import Callable
+
+from bson import ObjectId
+
+from modules.account.types import PhoneNumber
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.internal.otp.store.otp_repository import OTPRepository
+from modules.authentication.internal.password_reset_token.store.password_reset_token_repository import (
+    PasswordResetTokenRepository,
+)
+from modules.authentication.types import OTP, OTPQuery, OTPStatus, PasswordResetTokenQuery
+from tests.conftest import TEST_ACTOR
+from tests.modules.authentication.base_test_access_token import BaseTestAccessToken
+
+PHONE_NUMBER = PhoneNumber(country_code="+91", phone_number="9999999999")
+
+
+class TestPruneExpiredCredentials(BaseTestAccessToken):
+    def teardown_method(self, method: Callable[..., object]) -> None:
+        super().teardown_method(method)
+        PasswordResetTokenRepository.collection().delete_many({})
+
+    @staticmethod
+    def _create_otp(*, issued_hours_ago: int, active: bool) -> OTP:
+        status = OTPStatus.PENDING if active else OTPStatus.SUCCESS
+        otp = OTPRepository.create(
+            OTP(id="", otp_code="1234", phone_number=PHONE_NUMBER, status=str(status), active=active), actor=TEST_ACTOR
+        )
+        OTPRepository.collection().update_one(
+            {"_id": ObjectId(otp.id)}, {"$set": {"created_at": datetime.now(UTC) - timedelta(hours=issued_hours_ago)}}
+        )
+        return otp
+
+    @staticmethod
+    def _create_password_reset_token(*, expired_hours_ago: int) -> None:
+        PasswordResetTokenRepository.create_for_account(
+            str(ObjectId()), "token-hash", datetime.now() - timedelta(hours=expired_hours_ago), actor=TEST_ACTOR
+        )
+
+    def test_then_credentials_past_retention_are_deleted_and_recent_ones_kept(self) -> None:
+        self._create_otp(issued_hours_ago=48, active=False)
+        self._create_otp(issued_hours_ago=30, active=True)
+        recent_otp = self._create_otp(issued_hours_ago=1, active=True)
+        self._create_password_reset_token(expired_hours_ago=48)
+        self._create_password_reset_token(expired_hours_ago=1)
+
+        pruned = AuthenticationService.prune_expired_credentials(actor=TEST_ACTOR)
+
+        assert pruned.otps == 2
+        assert pruned.password_reset_tokens == 1
+        assert [otp.id for otp in OTPRepository.query(OTPQuery(), actor=TEST_ACTOR)] == [recent_otp.id]
+        assert PasswordResetTokenRepository.count(PasswordResetTokenQuery()) == 1
+
+    def test_then_delete_by_query_stops_after_max_batches(self) -> None:
+        for _ in range(5):
+            self._create_otp(issued_hours_ago=48, active=False)
+        cutoff = datetime.now(UTC) - timedelta(hours=24)
+
+        first_run = OTPRepository.delete_by_query(
+            OTPQuery(created_before=cutoff), batch_size=2, max_batches=2, actor=TEST_ACTOR
+        )
+        second_run = OTPRepository.delete_by_query(
+            OTPQuery(created_before=cutoff), batch_size=2, max_batches=2, actor=TEST_ACTOR
+        )
+
+        assert (first_run, second_run) == (4, 1)
+        assert OTPRepository.count(OTPQuery()) == 0
@@ -0,0 +1,119 @@
+import time
+from typing import Any, Iterator, Optional
+from unittest import mock
+
+import jwt
+import pytest
+from web_app import app
+
+from modules.account.types import Account
+from modules.authentication.authentication_service import AuthenticationService
+from modules.authentication.errors import AccessTokenExpiredError, AccessTokenInvalidError
+from modules.authentication.internal.access_token.access_token_util import AccessTokenUtil
+from modules.authentication.types import TokenConfig
+from modules.config.config_service import ConfigService
+from modules.config.internal.config_manager import ConfigManager
+
+ACCOUNT = Account(
+    id="64b7f0c2a1b2c3d4e5f60718",
+    first_name="first_name",
+    last_name="last_name",
+    hashed_password="hashed",
+    phone_number=None,
+    username="cache@example.com",
+)
+VERIFICATION_CACHE_URL = "http://127.0.0.1:8080/api/access-tokens/verification-cache"
+
+
+@pytest.fixture(autouse=True)
+def fresh_verification_state() -> Iterator[None]:
+    AccessTokenUtil._verification_state = None
+    yield
+    AccessTokenUtil._verification_state = None
+
+
+def _signed_token(expires_in_seconds: float) -> str:
+    signing_key = ConfigService.get_section(TokenConfig).token_signing_key
+    payload = {"account_id": ACCOUNT.id, "exp": time.time() + expires_in_seconds}
+    return jwt.encode(payload, signing_key, algorithm="HS256")
+
+
+class TestGivenAValidAccessToken:
+    class TestWhenItIsVerifiedRepeatedly:
+        def test_then_only_the_first_verification_decodes_it(self) -> None:
+            token = AuthenticationService.create_access_token_by_username_and_password(account=ACCOUNT).token
+
+            first = AuthenticationService.verify_access_token(token=token)
+            second = AuthenticationService.verify_access_token(token=token)
+
+            assert first == second
+            assert first.account_id == ACCOUNT.id
+            stats = AuthenticationService.get_verified_token_cache_stats()
+            assert stats.misses == 1
+            assert stats.hits == 1
+            assert stats.size == 1
+
+    class TestWhenItExpiresWhileCached:
+        def test_then_the_cached_payload_is_not_served_past_exp(self) -> None:
+            token = _signed_token(expires_in_seconds=1)
+            AuthenticationService.verify_access_token(token=token)
+
+            time.sleep(1.2)
+
+            with pytest.raises(AccessTokenExpiredError):
+                AuthenticationService.verify_access_token(token=token)
+
+    class TestWhenTheConfigIsReloaded:
+        def test_then_the_cache_starts_empty(self) -> None:
+            token = AuthenticationService.create_access_token_by_username_and_password(account=ACCOUNT).token
+            AuthenticationService.verify_access_token(token=token)
+
+            previous_manager = ConfigService.config_manager
+            ConfigService.config_manager = ConfigManager()
+            try:
+                stats = AuthenticationService.get_verified_token_cache_stats()
+                assert stats.size == 0
+                assert stats.hits == 0
+            finally:
+                ConfigService.config_manager = previous_manager
+
+
+class TestGivenAnInvalidAccessToken:
+    class TestWhenItIsVerifiedRepeatedly:
+        def test_then_every_attempt_is_rejected_and_nothing_is_cached(self) -> None:
+            token = _signed_token(expires_in_seconds=60) + "tampered"
+
+            for _ in range(2):
+                with pytest.raises(AccessTokenInvalidError):
+                    AuthenticationService.verify_access_token(token=token)
+
+            stats = AuthenticationService.get_verified_token_cache_stats()
+            assert stats.hits == 0
+            assert stats.misses == 2
+            assert stats.size == 0
+
+
+class TestGivenAnOperator:
+    class TestWhenTheVerificationCacheStatsAreRequested:
+        def test_then_the_serving_process_counters_are_returned(self) -> None:
+            token = AuthenticationService.create_access_token_by_username_and_password(account=ACCOUNT).token
+            original_get_list = ConfigService.get_list
+
+            def get_list(key: str, default: Optional[list[Any]] = None) -> list[Any]:
+                return (
+                    [ACCOUNT.id] if key == "web.operator_account_ids" else original_get_list(key=key, default=default)
+                )
+
+            with mock.patch.object(ConfigService, "get_list", side_effect=get_list), app.test_client() as client:
+                client.get(VERIFICATION_CACHE_URL, headers={"Authorization": f"Bearer {token}"})
+                response = client.get(VERIFICATION_CACHE_URL, headers={"Authorization": f"Bearer {token}"})
+
+            assert response.status_code == 200
+            assert response.json is not None
+            assert (response.json["misses"], response.json["hits"], response.json["size"]) == (1, 1, 1)
+
+        def test_then_a_missing_token_is_rejected(self) -> None:
+            with app.test_client() as client:
+                response = client.get(VERIFICATION_CACHE_URL)
+
+            assert response.status_code == 401
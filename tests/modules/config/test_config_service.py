@@ -0,0 +1,163 @@
+import os
+from dataclasses import dataclass, field
+from typing import Callable, ClassVar
+
+import pytest
+
+from modules.authentication.types import MailerConfig, TokenConfig
+from modules.config.config_service import ConfigService
+from modules.config.errors import MissingKeyError, ValueTypeMismatchError
+from modules.config.internal.config_manager import ConfigManager
+from modules.config.internal.config_utils import ConfigUtil
+from modules.config.types import CONFIG_KEY_METADATA, ConfigSection, ErrorCode
+from modules.core.common.types import MongoConfig
+from tests.modules.config.base_test_config import BaseTestConfig
+
+
+@dataclass(frozen=True)
+class _SampleSection(ConfigSection):
+    config_prefix: ClassVar[str] = "mongodb"
+
+    uri: str
+    transports: list[str] = field(metadata={CONFIG_KEY_METADATA: "logger.transports"})
+    pool_size: int = 5
+
+
+@dataclass(frozen=True)
+class _MissingKeySection(ConfigSection):
+    config_prefix: ClassVar[str] = "mongodb"
+
+    replica_set: str
+
+
+@dataclass(frozen=True)
+class _MistypedSection(ConfigSection):
+    config_prefix: ClassVar[str] = "mongodb"
+
+    uri: int
+
+
+class TestConfigFlattening(BaseTestConfig):
+    def test_flatten_indexes_leaves_and_subtrees(self) -> None:
+        flattened = ConfigUtil.flatten({"a": {"b": {"c": 1}, "d": [1, 2]}, "e": "x"}, separator=".")
+
+        assert flattened == {"a": {"b": {"c": 1}, "d": [1, 2]}, "a.b": {"c": 1}, "a.b.c": 1, "a.d": [1, 2], "e": "x"}
+
+    def test_flattened_store_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            ConfigService.config_manager.flattened_store["mongodb.uri"] = "mongodb://elsewhere"  # type: ignore[index]
+
+    def test_changing_a_returned_subtree_or_list_leaves_config_unchanged(self) -> None:
+        mongodb = ConfigService[dict[str, object]].get_value(key="mongodb")
+        mongodb["uri"] = "mongodb://elsewhere"
+        transports = ConfigService.get_list(key="logger.transports")
+        transports.append("elsewhere")
+
+        assert ConfigService.get_str(key="mongodb.uri") != "mongodb://elsewhere"
+        assert ConfigService[dict[str, object]].get_value(key="mongodb")["uri"] != "mongodb://elsewhere"
+        assert "elsewhere" not in ConfigService.get_list(key="logger.transports")
+
+    def test_lookup_does_not_descend_past_a_leaf(self) -> None:
+        assert not ConfigService.has_value("mongodb.uri.scheme")
+
+    def test_subtree_lookup_returns_nested_values(self) -> None:
+        mongodb = ConfigService[dict[str, object]].get_value(key="mongodb")
+
+        assert mongodb["uri"] == ConfigService.get_str(key="mongodb.uri")
+
+
+class TestTypedAccessors(BaseTestConfig):
+    def test_typed_accessors_return_configured_values(self) -> None:
+        assert ConfigService.get_str(key="mongodb.uri").startswith("mongodb")
+        assert ConfigService.get_int(key="accounts.token_expiry_days") > 0
+        assert isinstance(ConfigService.get_bool(key="mongodb.connection_caching"), bool)
+        assert "console" in ConfigService.get_list(key="logger.transports")
+
+    def test_float_accessor_accepts_integers(self) -> None:
+        assert ConfigService.get_float(key="accounts.token_expiry_days") == float(
+            ConfigService.get_int(key="accounts.token_expiry_days")
+        )
+
+    def test_default_is_used_for_missing_key(self) -> None:
+        assert ConfigService.get_int(key="does.not.exist", default=7) == 7
+
+    def test_missing_key_without_default_raises(self) -> None:
+        with pytest.raises(MissingKeyError) as exc_info:
+            ConfigService.get_str(key="does.not.exist")
+
+        assert exc_info.value.code == ErrorCode.MISSING_KEY
+
+    def test_wrong_type_raises(self) -> None:
+        with pytest.raises(ValueTypeMismatchError) as exc_info:
+            ConfigService.get_int(key="mongodb.uri")
+
+        assert exc_info.value.code == ErrorCode.VALUE_TYPE_MISMATCH
+
+    def test_bool_is_not_accepted_as_int(self) -> None:
+        with pytest.raises(ValueTypeMismatchError):
+            ConfigService.get_int(key="mongodb.connection_caching")
+
+
+class TestConfigReload(BaseTestConfig):
+    ENV_VAR = "DEFAULT_OTP_CODE"
+
+    def setup_method(self, method: Callable[..., object]) -> None:
+        super().setup_method(method)
+        self.original_config_manager = ConfigService.config_manager
+        self.original_env_value = os.environ.get(self.ENV_VAR)
+
+    def teardown_method(self, method: Callable[..., object]) -> None:
+        if self.original_env_value is None:
+            os.environ.pop(self.ENV_VAR, None)
+        else:
+            os.environ[self.ENV_VAR] = self.original_env_value
+        ConfigService.config_manager = self.original_config_manager
+        super().teardown_method(method)
+
+    def test_environment_changes_apply_only_after_reload(self) -> None:
+        os.environ[self.ENV_VAR] = "9876"
+        assert ConfigService.get_str(key="public.default_otp.code", default="") != "9876"
+
+        ConfigService.reload()
+
+        assert isinstance(ConfigService.config_manager, ConfigManager)
+        assert ConfigService.config_manager is not self.original_config_manager
+        assert ConfigService.get_str(key="public.default_otp.code") == "9876"
+
+
+class TestConfigSections(BaseTestConfig):
+    def setup_method(self, method: Callable[..., object]) -> None:
+        super().setup_method(method)
+        self.original_config_manager = ConfigService.config_manager
+
+    def teardown_method(self, method: Callable[..., object]) -> None:
+        ConfigService.config_manager = self.original_config_manager
+        super().teardown_method(method)
+
+    def test_section_reads_prefixed_absolute_and_default_values(self) -> None:
+        section = ConfigService.get_section(_SampleSection)
+
+        assert section.uri == ConfigService.get_str(key="mongodb.uri")
+        assert section.transports == ConfigService.get_list(key="logger.transports")
+        assert section.pool_size == 5
+
+    def test_section_is_built_once_per_loaded_config(self) -> None:
+        section = ConfigService.get_section(_SampleSection)
+        assert ConfigService.get_section(_SampleSection) is section
+
+        ConfigService.reload()
+
+        assert ConfigService.get_section(_SampleSection) is not section
+
+    def test_missing_key_fails_when_the_section_loads(self) -> None:
+        with pytest.raises(MissingKeyError):
+            ConfigService.load_sections(_MissingKeySection)
+
+    def test_mistyped_value_fails_when_the_section_loads(self) -> None:
+        with pytest.raises(ValueTypeMismatchError):
+            ConfigService.load_sections(_MistypedSection)
+
+    def test_application_sections_load(self) -> None:
+        ConfigService.load_sections(MongoConfig, TokenConfig, MailerConfig)
+
+        assert ConfigService.get_section(TokenConfig).token_expiry_days > 0
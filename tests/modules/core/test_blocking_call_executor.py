@@ -0,0 +1,61 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+import pytest
+
+from modules.core.blocking_call_executor import BlockingCallExecutor, _ExecutorState
+from modules.core.errors import BlockingCallExecutorSaturatedError
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+def _install_pool(*, max_workers: int, max_queue_size: int) -> None:
+    BlockingCallExecutor._state = _ExecutorState(
+        executor=ThreadPoolExecutor(max_workers=max_workers),
+        slots=threading.BoundedSemaphore(max_workers + max_queue_size),
+    )
+
+
+@pytest.fixture(autouse=True)
+def restore_pool() -> Iterator[None]:
+    previous_state = BlockingCallExecutor._state
+    yield
+    BlockingCallExecutor._state = previous_state
+
+
+class TestGivenTheBlockingCallPool:
+    class TestWhenItHasCapacity:
+        def test_then_the_call_runs_off_the_event_loop_with_the_callers_context(self) -> None:
+            _install_pool(max_workers=1, max_queue_size=0)
+
+            async def call() -> tuple[str, str]:
+                request_id.set("request-1")
+                return await BlockingCallExecutor.run(
+                    lambda suffix: (threading.current_thread().name, request_id.get() + suffix), "-seen"
+                )
+
+            thread_name, seen_request_id = asyncio.run(call())
+
+            assert thread_name != threading.main_thread().name
+            assert seen_request_id == "request-1-seen"
+
+    class TestWhenEverySlotIsTaken:
+        def test_then_the_call_is_rejected_until_a_running_call_finishes(self) -> None:
+            _install_pool(max_workers=1, max_queue_size=0)
+            release = threading.Event()
+
+            async def calls() -> str:
+                holder = asyncio.ensure_future(BlockingCallExecutor.run(release.wait, 5))
+                await asyncio.sleep(0.05)
+                with pytest.raises(BlockingCallExecutorSaturatedError) as error:
+                    await BlockingCallExecutor.run(lambda: "rejected")
+                assert error.value.http_code == 503
+
+                release.set()
+                await holder
+                return await BlockingCallExecutor.run(lambda: "admitted")
+
+            assert asyncio.run(calls()) == "admitted"
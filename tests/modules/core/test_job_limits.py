@@ -0,0 +1,147 @@
+from typing import Any, Iterator
+from unittest import mock
+
+import pytest
+from celery.canvas import Signature
+from celery.exceptions import Ignore
+
+from modules.core.common.types import AuditActor, JobRunQuery, JobRunStatus
+from modules.core.internal.audit.store.audit_log_repository import AuditLogRepository
+from modules.core.internal.job_limits.job_limiter import JobLimiter
+from modules.core.internal.job_run.store.job_run_repository import JobRunRepository
+from modules.core.job import BATCH_JOB_RUN_ID_HEADER, Job
+from modules.core.redis_client import RedisClient
+from tests.conftest import TEST_ACTOR
+
+
+class UniqueJob(Job):
+    max_retries = 0
+    unique_key = ("account_id",)
+    performed: list[str] = []
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        cls.performed.append(kwargs["account_id"])
+
+
+class SingleSlotJob(Job):
+    max_retries = 0
+    max_concurrency = 1
+    performed: int = 0
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        cls.performed += 1
+
+
+pytestmark = pytest.mark.usefixtures("eager_celery")
+
+
+@pytest.fixture
+def eager_celery_propagates() -> bool:
+    # Failed tasks are recorded in job_run instead of raised into the test.
+    return False
+
+
+def _delete_limit_keys() -> None:
+    client = RedisClient.get_client()
+    for prefix in (JobLimiter.UNIQUE_KEY_PREFIX, JobLimiter.CONCURRENCY_KEY_PREFIX):
+        keys = list(client.scan_iter(match=f"{prefix}:*"))
+        if keys:
+            client.delete(*keys)
+
+
+@pytest.fixture(autouse=True)
+def clean_state() -> Iterator[None]:
+    UniqueJob.performed = []
+    SingleSlotJob.performed = 0
+    _delete_limit_keys()
+    JobRunRepository.collection().delete_many({})
+    AuditLogRepository.collection().delete_many({})
+    yield
+    _delete_limit_keys()
+    JobRunRepository.collection().delete_many({})
+    AuditLogRepository.collection().delete_many({})
+
+
+def _statuses(job_name: str) -> list[JobRunStatus]:
+    return sorted(run.status for run in JobRunRepository.query(JobRunQuery(job_name=job_name), actor=TEST_ACTOR))
+
+
+class TestGivenAJobWithAUniqueKey:
+    class TestWhenTheSameArgumentsAreEnqueuedTwice:
+        def test_then_the_duplicate_returns_the_first_task(self) -> None:
+            first = UniqueJob.perform_async(account_id="a1")
+            second = UniqueJob.perform_async(account_id="a1")
+
+            assert second.id == first.id
+            assert UniqueJob.performed == ["a1"]
+
+        def test_then_other_arguments_are_not_duplicates(self) -> None:
+            UniqueJob.perform_async(account_id="a1")
+            UniqueJob.perform_async(account_id="a2")
+
+            assert UniqueJob.performed == ["a1", "a2"]
+
+    class TestWhenABatchRepeatsArguments:
+        def test_then_duplicates_are_counted_and_not_published(self) -> None:
+            batch = UniqueJob.perform_many([{"account_id": "a1"}, {"account_id": "a1"}, {"account_id": "a2"}])
+
+            assert batch.enqueued == 2
+            assert batch.duplicates == 1
+            assert UniqueJob.performed == ["a1", "a2"]
+
+    class TestWhenAnotherTaskHoldsTheKeyAtExecution:
+        def test_then_the_run_is_skipped(self) -> None:
+            key = JobLimiter.unique_key_for("UniqueJob", UniqueJob.unique_key or (), {"account_id": "a1"})
+            RedisClient.get_client().set(key, "scheduled-task-id")
+
+            # A message published without claiming the key, as the cron scheduler does.
+            UniqueJob._get_celery_task().apply_async(kwargs={"account_id": "a1"})
+
+            assert UniqueJob.performed == []
+            assert _statuses("UniqueJob") == [JobRunStatus.SKIPPED]
+
+
+class TestGivenAJobWithAConcurrencyLimit:
+    class TestWhenASlotIsFree:
+        def test_then_the_run_executes_and_frees_its_slot(self) -> None:
+            SingleSlotJob.perform_async()
+            SingleSlotJob.perform_async()
+
+            assert SingleSlotJob.performed == 2
+            assert RedisClient.get_client().zcard(f"{JobLimiter.CONCURRENCY_KEY_PREFIX}:SingleSlotJob") == 0
+
+    class TestWhenEverySlotIsTaken:
+        def test_then_the_run_is_deferred(self) -> None:
+            assert JobLimiter.acquire_slot("SingleSlotJob", "running-elsewhere", limit=1, lease_seconds=60)
+
+            SingleSlotJob.perform_async()
+
+            assert SingleSlotJob.performed == 0
+            assert _statuses("SingleSlotJob") == [JobRunStatus.DEFERRED]
+
+        def test_then_a_worker_republishes_the_task_under_the_same_id(self) -> None:
+            task = SingleSlotJob._get_celery_task()
+            headers = {BATCH_JOB_RUN_ID_HEADER: "batch-run-id"}
+            task.push_request(id="deferred-task-id", retries=2, headers=headers, is_eager=False)
+            try:
+                with mock.patch.object(Signature, "apply_async", autospec=True) as apply_async:
+                    with pytest.raises(Ignore):
+                        SingleSlotJob._defer(task, (), {"account_id": "a1"})
+            finally:
+                task.pop_request()
+
+            republished = apply_async.call_args.args[0]
+            assert republished.id == "deferred-task-id"
+            assert republished.kwargs == {"account_id": "a1"}
+            assert republished.options["retries"] == 2
+            assert republished.options["headers"] == headers
+            assert republished.options["countdown"] == SingleSlotJob.concurrency_defer_seconds
+
+    class TestWhenALeaseHasExpired:
+        def test_then_its_slot_is_reclaimed(self) -> None:
+            assert JobLimiter.acquire_slot("SingleSlotJob", "crashed-worker", limit=1, lease_seconds=60)
+
+            with mock.patch("modules.core.internal.job_limits.job_limiter.time.time", return_value=10**10):
+                assert JobLimiter.acquire_slot("SingleSlotJob", "next-run", limit=1, lease_seconds=60)
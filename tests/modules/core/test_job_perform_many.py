@@ -0,0 +1,82 @@
+from typing import Any, Iterator
+
+import pytest
+
+from modules.core.common.types import AuditActor, JobRunQuery, JobRunStatus
+from modules.core.internal.audit.store.audit_log_repository import AuditLogRepository
+from modules.core.internal.job_run.store.job_run_repository import JobRunRepository
+from modules.core.job import Job
+from tests.conftest import TEST_ACTOR
+
+
+class RecordingJob(Job):
+    max_retries = 0
+    performed: list[int] = []
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        if kwargs.get("fail"):
+            raise RuntimeError("job body failed")
+        cls.performed.append(kwargs["number"])
+
+
+pytestmark = pytest.mark.usefixtures("eager_celery")
+
+
+@pytest.fixture
+def eager_celery_propagates() -> bool:
+    # Failed tasks are recorded in job_run instead of raised into the test.
+    return False
+
+
+@pytest.fixture(autouse=True)
+def clean_collections() -> Iterator[None]:
+    RecordingJob.performed = []
+    JobRunRepository.collection().delete_many({})
+    AuditLogRepository.collection().delete_many({})
+    yield
+    JobRunRepository.collection().delete_many({})
+    AuditLogRepository.collection().delete_many({})
+
+
+def _batch_run(job_run_id: str) -> Any:
+    return JobRunRepository.find(job_run_id, actor=TEST_ACTOR)
+
+
+class TestGivenManyCalls:
+    class TestWhenTheyAreEnqueuedInChunks:
+        def test_then_every_call_runs_once(self) -> None:
+            batch = RecordingJob.perform_many(({"number": number} for number in range(7)), chunk_size=3)
+
+            assert batch.enqueued == 7
+            assert batch.job_run_id is None
+            assert RecordingJob.performed == list(range(7))
+            assert JobRunRepository.count(JobRunQuery(job_name="RecordingJob")) == 7
+
+    class TestWhenTheBatchIsTracked:
+        def test_then_the_batch_run_counts_outcomes_and_succeeds(self) -> None:
+            batch = RecordingJob.perform_many(
+                ({"number": number} for number in range(5)), chunk_size=2, track_batch=True
+            )
+
+            assert batch.job_run_id is not None
+            batch_run = _batch_run(batch.job_run_id)
+            assert batch_run.job_name == "RecordingJob.perform_many"
+            assert batch_run.status == JobRunStatus.SUCCEEDED
+            assert batch_run.progress == {"enqueued": 5, "enqueue_finished": 1, "succeeded": 5}
+
+        def test_then_a_run_that_fails_for_good_fails_the_batch(self) -> None:
+            batch = RecordingJob.perform_many([{"number": 1}, {"number": 2, "fail": True}], track_batch=True)
+
+            assert batch.job_run_id is not None
+            batch_run = _batch_run(batch.job_run_id)
+            assert batch_run.status == JobRunStatus.FAILED
+            assert batch_run.progress["succeeded"] == 1
+            assert batch_run.progress["failed"] == 1
+
+        def test_then_an_empty_batch_succeeds_at_once(self) -> None:
+            batch = RecordingJob.perform_many([], track_batch=True)
+
+            assert batch.enqueued == 0
+            assert batch.job_run_id is not None
+            assert _batch_run(batch.job_run_id).status == JobRunStatus.SUCCEEDED
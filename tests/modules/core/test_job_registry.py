@@ -1,7 +1,10 @@
+import pytest
 from redbeat import RedBeatSchedulerEntry
 from redbeat.schedulers import RedBeatConfig
 
 from modules.core.celery_app import app as celery_app
+from modules.core.internal.job_schedule.cron_schedule_store import CronScheduleStore
+from modules.core.job_registry import JobRegistry
 from modules.core.jobs.health_check_job import HealthCheckJob
 
 HEALTH_CHECK_TASK_NAME = "modules.core.jobs.health_check_job.HealthCheckJob"
@@ -16,9 +19,9 @@ class TestGivenTheWorkerEntrypointIsImported:
 
 
 class TestGivenAJobHasACronSchedule:
-    class TestWhenTheJobRegistersItsCron:
+    class TestWhenBeatSyncsTheCronSchedules:
         def test_then_the_entry_persists_to_the_redbeat_redis_schedule(self) -> None:
-            HealthCheckJob.register_cron()
+            JobRegistry.sync_cron_schedules()
 
             schedule_name = f"{HealthCheckJob.__module__}.{HealthCheckJob.__name__}_cron"
             entry = RedBeatSchedulerEntry.from_key(
@@ -26,3 +29,33 @@ class TestGivenAJobHasACronSchedule:
             )
 
             assert entry.task == HEALTH_CHECK_TASK_NAME
+
+        def test_then_saving_an_unchanged_entry_again_does_not_write(self) -> None:
+            assert HealthCheckJob.cron_schedule is not None
+            JobRegistry.sync_cron_schedules()
+
+            assert (
+                CronScheduleStore.save_if_changed(
+                    HealthCheckJob.__name__, HEALTH_CHECK_TASK_NAME, HealthCheckJob.cron_schedule
+                )
+                is False
+            )
+
+
+class TestGivenTheJobManifest:
+    class TestWhenComparedWithTheJobsPackages:
+        def test_then_it_lists_every_job_and_cron_schedule(self) -> None:
+            # On failure, regenerate it: make run-script file=generate_job_manifest
+            assert JobRegistry.load_manifest() == JobRegistry.discover()
+
+    class TestWhenCronSchedulesAreSynced:
+        def test_then_an_entry_for_a_job_no_longer_listed_is_removed(self) -> None:
+            stale_name = "modules.removed.jobs.removed_job.RemovedJob_cron"
+            RedBeatSchedulerEntry(
+                name=stale_name, task="modules.removed.jobs.removed_job.RemovedJob", schedule=60, app=celery_app
+            ).save()
+
+            JobRegistry.sync_cron_schedules()
+
+            with pytest.raises(KeyError):
+                RedBeatSchedulerEntry.from_key(f"{RedBeatConfig(celery_app).key_prefix}{stale_name}", app=celery_app)
@@ -0,0 +1,187 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any, Iterator, Optional
+from unittest import mock
+
+import pytest
+from web_app import app
+from werkzeug.test import TestResponse
+
+from modules.account.account_service import AccountService
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import CreateAccountByUsernameAndPasswordParams
+from modules.authentication.authentication_service import AuthenticationService
+from modules.config.config_service import ConfigService
+from modules.core.common.types import JobRun, JobRunStatus
+from modules.core.internal.audit.store.audit_log_repository import AuditLogRepository
+from modules.core.internal.job_run.store.job_run_repository import JobRunRepository
+from modules.core.job import Job
+from tests.conftest import TEST_ACTOR
+
+JOB_RUNS_URL = "http://127.0.0.1:8080/api/job-runs"
+PASSWORD = "testpassword"
+
+
+class EchoJob(Job):
+    max_retries = 0
+
+    @classmethod
+    def perform(cls, *args: Any, actor: Any, **kwargs: Any) -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def clean_collections() -> Iterator[None]:
+    for repository in (JobRunRepository, AuditLogRepository, AccountRepository):
+        repository.collection().delete_many({})
+    yield
+    for repository in (JobRunRepository, AuditLogRepository, AccountRepository):
+        repository.collection().delete_many({})
+
+
+@pytest.fixture
+def operator_token() -> Iterator[str]:
+    account_id, token = _create_account_and_token("operator@example.com")
+    original_get_list = ConfigService.get_list
+
+    def get_list(key: str, default: Optional[list[Any]] = None) -> list[Any]:
+        return [account_id] if key == "web.operator_account_ids" else original_get_list(key=key, default=default)
+
+    with mock.patch.object(ConfigService, "get_list", side_effect=get_list):
+        yield token
+
+
+def _create_account_and_token(username: str) -> tuple[str, str]:
+    account = AccountService.create_account_by_username_and_password(
+        params=CreateAccountByUsernameAndPasswordParams(
+            username=username, password=PASSWORD, first_name="Op", last_name="Erator"
+        ),
+        actor=TEST_ACTOR,
+    )
+    return account.id, AuthenticationService.create_access_token_by_username_and_password(account=account).token
+
+
+def _create_run(
+    *, job_name: str = "EchoJob", status: JobRunStatus, started_at: datetime, duration: Optional[timedelta] = None
+) -> JobRun:
+    return JobRunRepository.create(
+        JobRun(
+            id="",
+            job_name=job_name,
+            status=status,
+            started_at=started_at,
+            ended_at=started_at + duration if duration is not None else None,
+        ),
+        actor=TEST_ACTOR,
+    )
+
+
+def _get(url: str, token: str) -> TestResponse:
+    with app.test_client() as client:
+        return client.get(url, headers={"Authorization": f"Bearer {token}"})
+
+
+class TestGivenJobRunsThatStartedAtTheSameTime:
+    class TestWhenTheyArePagedThrough:
+        def test_then_every_run_appears_once_newest_first(self, operator_token: str) -> None:
+            started_at = datetime(2026, 1, 1, tzinfo=UTC)
+            created = [_create_run(status=JobRunStatus.SUCCEEDED, started_at=started_at) for _ in range(3)]
+            created += [_create_run(status=JobRunStatus.SUCCEEDED, started_at=started_at - timedelta(minutes=1))]
+            _create_run(job_name="OtherJob", status=JobRunStatus.SUCCEEDED, started_at=started_at)
+
+            seen: list[str] = []
+            url = f"{JOB_RUNS_URL}?job_name=EchoJob&limit=2"
+            while True:
+                response = _get(url, operator_token)
+                assert response.status_code == 200
+                assert response.json is not None
+                seen += [item["id"] for item in response.json["items"]]
+                if response.json["next_cursor"] is None:
+                    break
+                url = f"{JOB_RUNS_URL}?job_name=EchoJob&limit=2&cursor={response.json['next_cursor']}"
+
+            assert seen == [run.id for run in sorted(created[:3], key=lambda run: run.id, reverse=True)] + [
+                created[3].id
+            ]
+
+    class TestWhenFilteredByStatus:
+        def test_then_only_matching_runs_are_listed(self, operator_token: str) -> None:
+            started_at = datetime(2026, 1, 1, tzinfo=UTC)
+            _create_run(status=JobRunStatus.SUCCEEDED, started_at=started_at)
+            failed = _create_run(status=JobRunStatus.FAILED, started_at=started_at)
+
+            response = _get(f"{JOB_RUNS_URL}?status=failed", operator_token)
+
+            assert response.json is not None
+            assert [item["id"] for item in response.json["items"]] == [failed.id]
+
+
+class TestGivenAJobRun:
+    class TestWhenFetchedById:
+        def test_then_the_run_is_returned(self, operator_token: str) -> None:
+            job_run = _create_run(status=JobRunStatus.RUNNING, started_at=datetime.now(UTC))
+
+            response = _get(f"{JOB_RUNS_URL}/{job_run.id}", operator_token)
+
+            assert response.status_code == 200
+            assert response.json is not None
+            assert response.json["status"] == "running"
+
+        def test_then_an_unknown_id_is_not_found(self, operator_token: str) -> None:
+            response = _get(f"{JOB_RUNS_URL}/64b7f0c2a1b2c3d4e5f60718", operator_token)
+
+            assert response.status_code == 404
+
+    class TestWhenTheCallerIsNotAnOperator:
+        def test_then_access_is_denied(self) -> None:
+            _, token = _create_account_and_token("someone@example.com")
+
+            response = _get(JOB_RUNS_URL, token)
+
+            assert response.status_code == 401
+
+    class TestWhenItWasEnqueuedWithPerformAsync:
+        @pytest.mark.usefixtures("eager_celery")
+        def test_then_it_is_found_from_the_async_result(self) -> None:
+            async_result = EchoJob.perform_async()
+
+            job_run = Job.get_job_run_for(async_result, actor=TEST_ACTOR)
+
+            assert job_run is not None
+            assert job_run.job_name == "EchoJob"
+            assert job_run.task_id == async_result.id
+
+
+class TestGivenFinishedAndRunningJobRuns:
+    class TestWhenTheSummaryIsRequested:
+        def test_then_counts_percentiles_and_failure_rate_are_reported(self, operator_token: str) -> None:
+            started_at = datetime.now(UTC) - timedelta(hours=1)
+            for seconds in range(1, 11):
+                _create_run(status=JobRunStatus.SUCCEEDED, started_at=started_at, duration=timedelta(seconds=seconds))
+            for _ in range(2):
+                _create_run(status=JobRunStatus.FAILED, started_at=started_at, duration=timedelta(seconds=20))
+            _create_run(status=JobRunStatus.RUNNING, started_at=started_at)
+            _create_run(status=JobRunStatus.FAILED, started_at=started_at - timedelta(days=2), duration=timedelta(1))
+
+            response = _get(f"{JOB_RUNS_URL}/summary/EchoJob", operator_token)
+
+            assert response.status_code == 200
+            summary = response.json
+            assert summary is not None
+            assert (summary["total"], summary["running"], summary["succeeded"], summary["failed"]) == (13, 1, 10, 2)
+            assert summary["failure_rate"] == pytest.approx(2 / 12)
+            assert summary["p50_duration_ms"] == 6000
+            assert summary["p95_duration_ms"] == 20000
+
+        def test_then_runs_that_did_not_finish_are_left_out_of_the_percentiles(self, operator_token: str) -> None:
+            started_at = datetime.now(UTC) - timedelta(hours=1)
+            for seconds in (1, 2):
+                _create_run(status=JobRunStatus.SUCCEEDED, started_at=started_at, duration=timedelta(seconds=seconds))
+            for status in (JobRunStatus.SKIPPED, JobRunStatus.DEFERRED, JobRunStatus.SKIPPED):
+                _create_run(status=status, started_at=started_at, duration=timedelta(0))
+
+            response = _get(f"{JOB_RUNS_URL}/summary/EchoJob", operator_token)
+
+            assert response.status_code == 200
+            summary = response.json
+            assert summary is not None
+            assert (summary["p50_duration_ms"], summary["p95_duration_ms"]) == (1000, 2000)
@@ -0,0 +1,121 @@
+from typing import Any, Iterator
+from unittest import mock
+
+import pytest
+
+from modules.config.config_service import ConfigService
+from modules.core.common.types import (
+    AuditActor,
+    JobRunBufferConfig,
+    JobRunQuery,
+    JobRunRecording,
+    JobRunStatus,
+    ResourceAction,
+)
+from modules.core.internal.audit.store.audit_log_repository import AuditLogRepository
+from modules.core.internal.job_run.store.job_run_repository import JobRunRepository
+from modules.core.job import Job
+from tests.conftest import TEST_ACTOR
+
+
+class CompletionOnlyJob(Job):
+    max_retries = 0
+    job_run_recording = JobRunRecording.COMPLETION_ONLY
+    rows_seen_while_running: list[int] = []
+    actors: list[AuditActor] = []
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        cls.rows_seen_while_running.append(JobRunRepository.count(JobRunQuery(job_name=cls.__name__)))
+        cls.actors.append(actor)
+        if kwargs.get("fail"):
+            raise RuntimeError("job body failed")
+
+
+class BufferedJob(Job):
+    max_retries = 0
+    job_run_recording = JobRunRecording.BUFFERED
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        return None
+
+
+pytestmark = pytest.mark.usefixtures("eager_celery")
+
+
+@pytest.fixture
+def eager_celery_propagates() -> bool:
+    # Failed tasks are recorded in job_run instead of raised into the test.
+    return False
+
+
+@pytest.fixture(autouse=True)
+def clean_collections() -> Iterator[None]:
+    CompletionOnlyJob.rows_seen_while_running = []
+    CompletionOnlyJob.actors = []
+    Job.flush_buffered_job_runs()
+    JobRunRepository.collection().delete_many({})
+    AuditLogRepository.collection().delete_many({})
+    yield
+    Job.flush_buffered_job_runs()
+    JobRunRepository.collection().delete_many({})
+    AuditLogRepository.collection().delete_many({})
+
+
+@pytest.fixture
+def small_buffer() -> Iterator[None]:
+    original_get_section = ConfigService.get_section
+
+    def get_section(section_type: Any) -> Any:
+        if section_type is JobRunBufferConfig:
+            return JobRunBufferConfig(max_records=2, flush_interval_seconds=60)
+        return original_get_section(section_type)
+
+    with mock.patch.object(ConfigService, "get_section", side_effect=get_section):
+        yield
+
+
+def _runs(job_name: str) -> list[Any]:
+    return JobRunRepository.query(JobRunQuery(job_name=job_name), actor=TEST_ACTOR)
+
+
+class TestGivenACompletionOnlyJob:
+    class TestWhenItSucceeds:
+        def test_then_one_row_is_written_when_it_ends_under_the_id_it_ran_as(self) -> None:
+            CompletionOnlyJob.perform_async()
+
+            assert CompletionOnlyJob.rows_seen_while_running == [0]
+            runs = _runs("CompletionOnlyJob")
+            assert len(runs) == 1
+            assert runs[0].status == JobRunStatus.SUCCEEDED
+            assert runs[0].started_at is not None and runs[0].ended_at is not None
+            assert runs[0].started_at <= runs[0].ended_at
+            assert runs[0].id == CompletionOnlyJob.actors[0].actor_id
+            create_audit = {"resource_id": runs[0].id, "action": ResourceAction.CREATE.value}
+            assert AuditLogRepository.collection().count_documents(create_audit) == 1
+
+    class TestWhenItFails:
+        def test_then_the_row_records_the_failure(self) -> None:
+            CompletionOnlyJob.perform_async(fail=True)
+
+            runs = _runs("CompletionOnlyJob")
+            assert [run.status for run in runs] == [JobRunStatus.FAILED]
+
+
+class TestGivenABufferedJob:
+    class TestWhenFewerRunsThanTheBatchSizeFinish:
+        def test_then_they_are_written_on_flush(self, small_buffer: None) -> None:
+            BufferedJob.perform_async()
+            assert _runs("BufferedJob") == []
+
+            Job.flush_buffered_job_runs()
+
+            assert [run.status for run in _runs("BufferedJob")] == [JobRunStatus.SUCCEEDED]
+
+    class TestWhenABatchFills:
+        def test_then_it_is_written_in_one_insert(self, small_buffer: None) -> None:
+            BufferedJob.perform_async()
+            BufferedJob.perform_async()
+
+            assert len(_runs("BufferedJob")) == 2
@@ -0,0 +1,147 @@
+from typing import Any, Iterator
+
+import pytest
+
+from modules.core.common.types import AuditActor, JobRun, JobRunQuery, JobRunStatus
+from modules.core.internal.audit.store.audit_log_repository import AuditLogRepository
+from modules.core.internal.job_run.store.job_run_repository import JobRunRepository
+from modules.core.job import Job
+from modules.core.job_workflow import JobWorkflow
+from tests.conftest import TEST_ACTOR
+
+
+class ExportJob(Job):
+    max_retries = 0
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> int:
+        return int(kwargs["rows"])
+
+
+class DoubleJob(Job):
+    max_retries = 0
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> int:
+        if kwargs.get("fail"):
+            raise RuntimeError("step failed")
+        return int(args[0]) * 2 if args else 0
+
+
+class CollectJob(Job):
+    max_retries = 0
+    redacted_arguments = frozenset({"recipient"})
+    received: list[Any] = []
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        cls.received.append(args[0] if args else None)
+
+
+pytestmark = pytest.mark.usefixtures("eager_celery")
+
+
+@pytest.fixture
+def eager_celery_propagates() -> bool:
+    # Failed tasks are recorded in job_run instead of raised into the test.
+    return False
+
+
+@pytest.fixture(autouse=True)
+def clean_collections() -> Iterator[None]:
+    CollectJob.received = []
+    JobRunRepository.collection().delete_many({})
+    AuditLogRepository.collection().delete_many({})
+    yield
+    JobRunRepository.collection().delete_many({})
+    AuditLogRepository.collection().delete_many({})
+
+
+def _workflow_run(job_run_id: str) -> JobRun:
+    job_run = JobRunRepository.find(job_run_id, actor=TEST_ACTOR)
+    assert job_run is not None
+    return job_run
+
+
+def _step_runs(job_run_id: str) -> list[JobRun]:
+    return JobRunRepository.query(JobRunQuery(parent_job_run_id=job_run_id), actor=TEST_ACTOR)
+
+
+class TestGivenAChainOfSteps:
+    class TestWhenItRuns:
+        def test_then_each_step_gets_the_previous_result(self) -> None:
+            JobWorkflow.start(
+                "export",
+                JobWorkflow.chain(
+                    JobWorkflow.step(ExportJob, rows=3), JobWorkflow.step(DoubleJob), JobWorkflow.step(CollectJob)
+                ),
+            )
+
+            assert CollectJob.received == [6]
+
+        def test_then_the_workflow_run_links_and_counts_its_steps(self) -> None:
+            run = JobWorkflow.start(
+                "export", JobWorkflow.chain(JobWorkflow.step(ExportJob, rows=3), JobWorkflow.step(DoubleJob))
+            )
+
+            workflow_run = _workflow_run(run.job_run_id)
+            assert workflow_run.job_name == "workflow.export"
+            assert workflow_run.status == JobRunStatus.SUCCEEDED
+            assert workflow_run.progress == {"steps": 2, "succeeded": 2}
+            assert sorted(step_run.job_name for step_run in _step_runs(run.job_run_id)) == ["DoubleJob", "ExportJob"]
+
+    class TestWhenAStepIgnoresTheResult:
+        def test_then_it_gets_only_its_own_arguments(self) -> None:
+            JobWorkflow.start(
+                "export",
+                JobWorkflow.chain(JobWorkflow.step(ExportJob, rows=3), JobWorkflow.step(CollectJob).ignoring_result()),
+            )
+
+            assert CollectJob.received == [None]
+
+
+class TestGivenAChord:
+    class TestWhenTheGroupFinishes:
+        def test_then_the_callback_gets_every_result(self) -> None:
+            run = JobWorkflow.start(
+                "fan_in",
+                JobWorkflow.chord(
+                    [JobWorkflow.step(DoubleJob, 1), JobWorkflow.step(DoubleJob, 2)], JobWorkflow.step(CollectJob)
+                ),
+            )
+
+            assert CollectJob.received == [[2, 4]]
+            assert _workflow_run(run.job_run_id).status == JobRunStatus.SUCCEEDED
+            assert len(_step_runs(run.job_run_id)) == 3
+
+
+class TestGivenAGroupWithAFailingStep:
+    class TestWhenItRuns:
+        def test_then_the_workflow_fails_and_counts_both_outcomes(self) -> None:
+            run = JobWorkflow.start(
+                "parallel", JobWorkflow.group(JobWorkflow.step(DoubleJob, 1), JobWorkflow.step(DoubleJob, fail=True))
+            )
+
+            workflow_run = _workflow_run(run.job_run_id)
+            assert workflow_run.status == JobRunStatus.FAILED
+            assert workflow_run.progress["succeeded"] == 1
+            assert workflow_run.progress["failed"] == 1
+
+
+class TestGivenStepArguments:
+    class TestWhenTheWorkflowStarts:
+        def test_then_the_workflow_run_records_them_redacted(self) -> None:
+            run = JobWorkflow.start(
+                "notify", JobWorkflow.step(CollectJob, "ready", recipient="someone@example.com", attempt=1)
+            )
+
+            arguments = _workflow_run(run.job_run_id).arguments
+            assert arguments["0:job"] == "CollectJob"
+            assert arguments["0:arg_0"] == "ready"
+            assert arguments["0:recipient"] == "[redacted]"
+            assert arguments["0:attempt"] == 1
+
+    class TestWhenTheWorkflowIsEmpty:
+        def test_then_it_is_rejected(self) -> None:
+            with pytest.raises(ValueError):
+                JobWorkflow.start("empty", JobWorkflow.group())
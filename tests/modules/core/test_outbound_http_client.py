@@ -0,0 +1,146 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, ClassVar, Iterator
+
+import pytest
+import requests
+
+from modules.config.config_service import ConfigService
+from modules.config.internal.config_manager import ConfigManager
+from modules.core.common.types import CircuitState
+from modules.core.errors import OutboundCircuitOpenError
+from modules.core.internal.outbound_http.circuit_breaker import CircuitBreaker
+from modules.core.outbound_http_client import OutboundHttpClient
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    statuses: ClassVar[list[int]] = []
+    requests_seen: ClassVar[list[tuple[str, int]]] = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._respond()
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._respond()
+
+    def _respond(self) -> None:
+        # Record the client port so a test can tell whether the connection was reused.
+        _StubHandler.requests_seen.append((self.command, self.client_address[1]))
+        status = _StubHandler.statuses.pop(0) if _StubHandler.statuses else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *_args: object) -> None:
+        return
+
+
+@pytest.fixture
+def stub_server() -> Iterator[str]:
+    _StubHandler.statuses = []
+    _StubHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+@pytest.fixture(autouse=True)
+def outbound_config(monkeypatch: pytest.MonkeyPatch) -> Iterator[Callable[[dict[str, str]], None]]:
+    def configure(env: dict[str, str]) -> None:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setattr(ConfigService, "config_manager", ConfigManager())
+
+    yield configure
+    OutboundHttpClient.reset()
+
+
+def _fast_config(**overrides: str) -> dict[str, str]:
+    return {"OUTBOUND_HTTP_BACKOFF_FACTOR": "0", "OUTBOUND_HTTP_BACKOFF_JITTER": "0", **overrides}
+
+
+class TestGivenAStubProvider:
+    class TestWhenCallingItRepeatedly:
+        def test_then_the_connection_is_kept_alive(
+            self, stub_server: str, outbound_config: Callable[[dict[str, str]], None]
+        ) -> None:
+            outbound_config(_fast_config())
+
+            for _ in range(3):
+                assert OutboundHttpClient.get(f"{stub_server}/ping").status_code == 200
+
+            assert len({port for _, port in _StubHandler.requests_seen}) == 1
+
+    class TestWhenItAnswers503:
+        def test_then_a_get_is_retried(
+            self, stub_server: str, outbound_config: Callable[[dict[str, str]], None]
+        ) -> None:
+            outbound_config(_fast_config())
+            _StubHandler.statuses = [503, 200]
+
+            assert OutboundHttpClient.get(f"{stub_server}/ping").status_code == 200
+            assert len(_StubHandler.requests_seen) == 2
+
+        def test_then_a_post_is_not_resent(
+            self, stub_server: str, outbound_config: Callable[[dict[str, str]], None]
+        ) -> None:
+            outbound_config(_fast_config())
+            _StubHandler.statuses = [503, 200]
+
+            assert OutboundHttpClient.post(f"{stub_server}/send", json={}).status_code == 503
+            assert len(_StubHandler.requests_seen) == 1
+
+    class TestWhenItKeepsFailing:
+        def test_then_the_breaker_opens_and_calls_fail_fast(
+            self, stub_server: str, outbound_config: Callable[[dict[str, str]], None]
+        ) -> None:
+            outbound_config(_fast_config(OUTBOUND_HTTP_MAX_RETRIES="0", OUTBOUND_HTTP_CIRCUIT_FAILURE_THRESHOLD="2"))
+            _StubHandler.statuses = [500, 500]
+
+            OutboundHttpClient.post(f"{stub_server}/send")
+            OutboundHttpClient.post(f"{stub_server}/send")
+            with pytest.raises(OutboundCircuitOpenError):
+                OutboundHttpClient.post(f"{stub_server}/send")
+
+            assert len(_StubHandler.requests_seen) == 2
+
+
+class TestGivenAnUnreachableHost:
+    def test_then_the_transport_error_reaches_the_caller(
+        self, outbound_config: Callable[[dict[str, str]], None]
+    ) -> None:
+        outbound_config(_fast_config(OUTBOUND_HTTP_MAX_RETRIES="0"))
+
+        with pytest.raises(requests.ConnectionError):
+            OutboundHttpClient.get("http://127.0.0.1:1/")
+
+
+class TestGivenACircuitBreaker:
+    def test_then_a_half_open_trial_closes_it_on_success(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=0)
+        breaker.record_failure()
+
+        # The reset timeout has passed, so one trial call is let through and the next is held back.
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_then_a_failed_trial_reopens_it(self) -> None:
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout_seconds=0)
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
@@ -0,0 +1,110 @@
+import gc
+import os
+from pathlib import Path
+from typing import Callable, Iterator
+
+import pytest
+
+from modules.config.config_service import ConfigService
+from modules.config.internal.config_manager import ConfigManager
+from modules.core.process_memory import ProcessMemory
+
+SMAPS_ROLLUP = """55903f694000-7ffc363a8000 ---p 00000000 00:00 0                          [rollup]
+Rss:                1304 kB
+Pss:                 486 kB
+Shared_Clean:       1120 kB
+Shared_Dirty:          8 kB
+Private_Clean:        80 kB
+Private_Dirty:       104 kB
+"""
+
+
+@pytest.fixture(autouse=True)
+def restore_gc() -> Iterator[None]:
+    # gc cannot refreeze a subset of objects, so nothing here unfreezes: tests that freeze do it in a child
+    # process and the rest assert on the change in the freeze count.
+    was_enabled = gc.isenabled()
+    thresholds = gc.get_threshold()
+    yield
+    gc.set_threshold(*thresholds)
+    if was_enabled:
+        gc.enable()
+    else:
+        gc.disable()
+
+
+@pytest.fixture
+def memory_config(monkeypatch: pytest.MonkeyPatch) -> Callable[[dict[str, str]], None]:
+    def configure(env: dict[str, str]) -> None:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setattr(ConfigService, "config_manager", ConfigManager())
+
+    return configure
+
+
+class TestGivenAForkingParent:
+    class TestWhenFreezingIsOn:
+        def test_then_the_preloaded_heap_is_frozen_and_collection_held(
+            self, memory_config: Callable[[dict[str, str]], None]
+        ) -> None:
+            memory_config({"PROCESS_MEMORY_FREEZE_PRELOADED_HEAP": "true"})
+
+            pid = os.fork()
+            if pid == 0:
+                freeze_count = gc.get_freeze_count()
+                ProcessMemory.hold_gc_until_fork()
+                ProcessMemory.freeze_preloaded_heap()
+                os._exit(0 if not gc.isenabled() and gc.get_freeze_count() > freeze_count else 1)
+
+            _, status = os.waitpid(pid, 0)
+
+            assert os.waitstatus_to_exitcode(status) == 0
+
+    class TestWhenFreezingIsOff:
+        def test_then_the_heap_is_left_alone(self, memory_config: Callable[[dict[str, str]], None]) -> None:
+            memory_config({"PROCESS_MEMORY_FREEZE_PRELOADED_HEAP": "false"})
+            gc.enable()
+            freeze_count = gc.get_freeze_count()
+
+            ProcessMemory.hold_gc_until_fork()
+            ProcessMemory.freeze_preloaded_heap()
+
+            assert gc.isenabled()
+            assert gc.get_freeze_count() == freeze_count
+
+
+class TestGivenAForkedChild:
+    class TestWhenItTunesCollection:
+        def test_then_collection_resumes_with_the_configured_thresholds(
+            self, memory_config: Callable[[dict[str, str]], None]
+        ) -> None:
+            memory_config({})
+            gc.disable()
+
+            ProcessMemory.tune_gc_after_fork()
+
+            assert gc.isenabled()
+            assert gc.get_threshold() == (10_000, 10, 10)
+
+
+class TestGivenTheProcessMemoryRollup:
+    class TestWhenItIsRead:
+        def test_then_shared_and_private_memory_are_summed(
+            self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        ) -> None:
+            (tmp_path / "smaps_rollup").write_text(SMAPS_ROLLUP)
+            monkeypatch.setattr(ProcessMemory, "SMAPS_ROLLUP_PATH", str(tmp_path / "smaps_rollup"))
+
+            usage = ProcessMemory.usage()
+
+            assert usage is not None
+            assert (usage.rss_kib, usage.pss_kib, usage.shared_kib, usage.private_kib) == (1304, 486, 1128, 184)
+
+        def test_then_a_missing_rollup_reads_as_unavailable(
+            self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        ) -> None:
+            monkeypatch.setattr(ProcessMemory, "SMAPS_ROLLUP_PATH", str(tmp_path / "missing"))
+
+            assert ProcessMemory.usage() is None
+            assert ProcessMemory.describe(None) == "memory usage unavailable"
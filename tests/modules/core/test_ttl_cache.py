@@ -0,0 +1,46 @@
+import time
+
+from modules.core.ttl_cache import TTLCache
+
+
+class TestGivenATTLCache:
+    class TestWhenItIsFull:
+        def test_then_the_least_recently_used_entry_is_evicted(self) -> None:
+            cache: TTLCache[str, int] = TTLCache(max_entries=2, ttl_seconds=60)
+            cache.set("a", 1)
+            cache.set("b", 2)
+            cache.get("a")
+
+            cache.set("c", 3)
+
+            assert cache.get("a") == 1
+            assert cache.get("b") is None
+            assert cache.get("c") == 3
+            assert cache.stats().evictions == 1
+
+    class TestWhenAnEntryOutlivesItsTTL:
+        def test_then_it_is_a_miss(self) -> None:
+            cache: TTLCache[str, int] = TTLCache(max_entries=10, ttl_seconds=60)
+            cache.set("short", 1, ttl_seconds=0.05)
+
+            time.sleep(0.1)
+
+            assert cache.get("short") is None
+            assert cache.stats().size == 0
+
+    class TestWhenAnEntryAsksForALongerTTLThanTheCache:
+        def test_then_the_cache_ttl_wins(self) -> None:
+            cache: TTLCache[str, int] = TTLCache(max_entries=10, ttl_seconds=0.05)
+            cache.set("key", 1, ttl_seconds=60)
+
+            time.sleep(0.1)
+
+            assert cache.get("key") is None
+
+    class TestWhenItIsDisabled:
+        def test_then_nothing_is_stored(self) -> None:
+            cache: TTLCache[str, int] = TTLCache(max_entries=0, ttl_seconds=60)
+            cache.set("key", 1)
+
+            assert cache.get("key") is None
+            assert cache.stats().size == 0
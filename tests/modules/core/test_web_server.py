@@ -0,0 +1,151 @@
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+from unittest import mock
+
+import pytest
+from pymongo.collection import Collection
+
+from modules.config.config_service import ConfigService
+from modules.config.internal.config_manager import ConfigManager
+from modules.core.base_model import StoredDocument
+from modules.core.common.types import QueryParams
+from modules.core.outbound_http_client import OutboundHttpClient
+from modules.core.process_resources import ProcessResources
+from modules.core.repository import ApplicationRepository, ApplicationRepositoryClient, StoreFilter
+from modules.core.web_server import WebServer
+
+
+class _ForkTestRepository(ApplicationRepository[StoredDocument, QueryParams]):
+    collection_name = "fork_test"
+    init_calls = 0
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        cls.init_calls += 1
+        return True
+
+    @classmethod
+    def from_doc(cls, doc: StoredDocument) -> StoredDocument:
+        return doc
+
+    @classmethod
+    def _to_filter(cls, params: QueryParams) -> StoreFilter:
+        return {}
+
+
+@pytest.fixture
+def server_config(monkeypatch: pytest.MonkeyPatch) -> Callable[[dict[str, str]], None]:
+    def configure(env: dict[str, str]) -> None:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setattr(ConfigService, "config_manager", ConfigManager())
+
+    return configure
+
+
+@pytest.fixture
+def parent_process_resources() -> Iterator[Any]:
+    previous_client = ApplicationRepositoryClient._client
+    previous_state = OutboundHttpClient._state
+    client = mock.MagicMock()
+    ApplicationRepositoryClient._client = client
+    OutboundHttpClient._state = mock.MagicMock()
+    try:
+        yield client
+    finally:
+        ApplicationRepositoryClient._client = previous_client
+        OutboundHttpClient._state = previous_state
+        _ForkTestRepository._collection = None
+
+
+class TestGivenTheWebServerConfig:
+    class TestWhenWorkersAreSizedFromTheHost:
+        def test_then_workers_follow_the_cores_up_to_the_cap(
+            self, server_config: Callable[[dict[str, str]], None]
+        ) -> None:
+            server_config({"WEB_WORKERS": "0", "WEB_MAX_WORKERS": "8"})
+
+            assert WebServer.settings(cpu_count=2).workers == 3
+            assert WebServer.settings(cpu_count=16).workers == 8
+
+        def test_then_threads_do_not_grow_with_the_cores(self, server_config: Callable[[dict[str, str]], None]) -> None:
+            server_config({"WEB_WORKERS": "0", "WEB_THREADS": "8"})
+
+            assert WebServer.settings(cpu_count=2).threads == WebServer.settings(cpu_count=64).threads == 8
+
+    class TestWhenCountsAreConfigured:
+        def test_then_they_override_the_sizing(self, server_config: Callable[[dict[str, str]], None]) -> None:
+            server_config({"WEB_WORKERS": "5", "WEB_THREADS": "12", "WEB_MAX_REQUESTS": "500"})
+
+            settings = WebServer.settings(cpu_count=64)
+
+            assert (settings.workers, settings.threads, settings.max_requests) == (5, 12, 500)
+
+        def test_then_turning_recycling_off_drops_the_jitter(
+            self, server_config: Callable[[dict[str, str]], None]
+        ) -> None:
+            server_config({"WEB_MAX_REQUESTS": "0", "WEB_MAX_REQUESTS_JITTER": "100"})
+
+            settings = WebServer.settings(cpu_count=4)
+
+            assert (settings.max_requests, settings.max_requests_jitter) == (0, 0)
+
+        def test_then_zero_threads_is_rejected(self, server_config: Callable[[dict[str, str]], None]) -> None:
+            server_config({"WEB_THREADS": "0"})
+
+            with pytest.raises(ValueError):
+                WebServer.settings(cpu_count=4)
+
+
+class TestGivenResourcesCreatedBeforeTheFork:
+    class TestWhenTheWorkerResetsThem:
+        def test_then_connection_holders_are_dropped_without_closing_them(self, parent_process_resources: Any) -> None:
+            _ForkTestRepository.collection()
+
+            ProcessResources.reset_after_fork()
+
+            assert ApplicationRepositoryClient._client is None
+            assert _ForkTestRepository._collection is None
+            assert OutboundHttpClient._state is None
+            parent_process_resources.close.assert_not_called()
+
+        def test_then_collections_rebind_without_redeclaring_indexes(self, parent_process_resources: Any) -> None:
+            _ForkTestRepository.collection()
+            init_calls = _ForkTestRepository.init_calls
+
+            ProcessResources.reset_after_fork()
+            with mock.patch.object(ApplicationRepositoryClient, "get_client", return_value=mock.MagicMock()) as get:
+                _ForkTestRepository.collection()
+
+            get.assert_called_once()
+            assert _ForkTestRepository.init_calls == init_calls
+
+    class TestWhenTheProcessForks:
+        def test_then_the_child_starts_without_the_parents_client(self, parent_process_resources: Any) -> None:
+            # The hook gunicorn runs in post_fork, exercised in a real child process.
+            pid = os.fork()
+            if pid == 0:
+                ProcessResources.reset_after_fork()
+                os._exit(0 if ApplicationRepositoryClient._client is None else 1)
+
+            _, status = os.waitpid(pid, 0)
+
+            assert os.waitstatus_to_exitcode(status) == 0
+            assert ApplicationRepositoryClient._client is parent_process_resources
+
+
+class TestGivenAContainerCpuLimit:
+    class TestWhenTheHostCpusAreCounted:
+        @pytest.mark.parametrize(
+            ("cpu_max", "expected_cpus"), [("50000 100000", 1), ("250000 100000", 3), ("max 100000", None)]
+        )
+        def test_then_the_limit_caps_them(
+            self, cpu_max: str, expected_cpus: Optional[int], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        ) -> None:
+            cpu_max_path = tmp_path / "cpu.max"
+            cpu_max_path.write_text(f"{cpu_max}\n")
+            monkeypatch.setattr(WebServer, "CGROUP_CPU_MAX_PATH", cpu_max_path)
+            monkeypatch.setattr(os, "sched_getaffinity", lambda _: set(range(32)))
+
+            assert WebServer._available_cpus() == (expected_cpus or 32)
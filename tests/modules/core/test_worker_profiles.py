@@ -0,0 +1,88 @@
+from typing import Any
+
+import pytest
+
+from modules.core.celery_app import ALL_QUEUES
+from modules.core.common.types import AuditActor, JobWorkload, WorkerPool, WorkerProfile
+from modules.core.job import Job
+from modules.core.worker_profiles import WorkerProfiles
+from tests.modules.config.base_test_config import BaseTestConfig
+
+
+class CpuBoundJob(Job):
+    queue = "low"
+    workload = JobWorkload.CPU
+
+    @classmethod
+    def perform(cls, *args: Any, actor: AuditActor, **kwargs: Any) -> None:
+        return None
+
+
+class TestGivenTheConfiguredProfiles(BaseTestConfig):
+    def test_then_every_profile_parses(self) -> None:
+        for name in WorkerProfiles.names():
+            assert WorkerProfiles.get(name).name == name
+
+    def test_then_the_split_profiles_cover_every_queue(self) -> None:
+        consumed = {queue for name in ("critical", "io", "cpu") for queue in WorkerProfiles.get(name).queues}
+
+        assert consumed == set(ALL_QUEUES)
+        assert set(WorkerProfiles.get("all").queues) == set(ALL_QUEUES)
+
+    def test_then_the_all_profile_lists_critical_first(self) -> None:
+        assert WorkerProfiles.get("all").queues[0] == "critical"
+
+    def test_then_an_unknown_profile_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            WorkerProfiles.get("does-not-exist")
+
+
+class TestGivenAProfile:
+    class TestWhenItIsTurnedIntoWorkerArguments:
+        def test_then_the_queues_pool_and_prefetch_are_passed(self) -> None:
+            profile = WorkerProfile(
+                name="io", queues=("default", "low"), pool=WorkerPool.THREADS, concurrency=16, prefetch_multiplier=2
+            )
+
+            argv = WorkerProfiles.celery_argv(profile)
+
+            assert argv[0] == "worker"
+            assert "--pool=threads" in argv
+            assert "--queues=default,low" in argv
+            assert "--prefetch-multiplier=2" in argv
+            assert "--concurrency=16" in argv
+
+        def test_then_a_minimum_concurrency_autoscales(self) -> None:
+            profile = WorkerProfile(
+                name="cpu",
+                queues=("default.cpu",),
+                pool=WorkerPool.PREFORK,
+                concurrency=4,
+                prefetch_multiplier=1,
+                min_concurrency=1,
+            )
+
+            argv = WorkerProfiles.celery_argv(profile)
+
+            assert "--autoscale=4,1" in argv
+            assert not any(argument.startswith("--concurrency") for argument in argv)
+
+
+class TestGivenAMisconfiguredProfile:
+    class TestWhenItIsParsed:
+        def test_then_an_unknown_queue_is_rejected(self) -> None:
+            with pytest.raises(ValueError):
+                WorkerProfiles._parse("broken", {"queues": ["urgent"], "pool": "threads", "concurrency": 4})
+
+        def test_then_autoscaling_a_thread_pool_is_rejected(self) -> None:
+            with pytest.raises(ValueError):
+                WorkerProfiles._parse(
+                    "broken", {"queues": ["default"], "pool": "threads", "concurrency": 4, "min_concurrency": 1}
+                )
+
+
+class TestGivenAJobWithACpuWorkload:
+    class TestWhenItsTaskIsRegistered:
+        def test_then_it_is_routed_to_the_cpu_queue(self) -> None:
+            assert CpuBoundJob.routed_queue() == "low.cpu"
+            assert CpuBoundJob._get_celery_task().queue == "low.cpu"
@@ -0,0 +1,105 @@
+from typing import Iterator
+from unittest import mock
+
+import pytest
+from bson import ObjectId
+
+from modules.notification.internal.account_notification_preferences_cache import AccountNotificationPreferencesCache
+from modules.notification.internal.account_notification_preferences_reader import AccountNotificationPreferenceReader
+from modules.notification.internal.store.account_notification_preferences_repository import (
+    AccountNotificationPreferencesRepository,
+)
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
+from tests.conftest import TEST_ACTOR
+
+
+@pytest.fixture(autouse=True)
+def clean_preferences() -> Iterator[None]:
+    AccountNotificationPreferencesRepository.collection().delete_many({})
+    AccountNotificationPreferencesCache._state = None
+    yield
+    AccountNotificationPreferencesRepository.collection().delete_many({})
+    AccountNotificationPreferencesCache._state = None
+
+
+def _save_preferences(account_id: str, *, email_enabled: bool) -> None:
+    NotificationService.create_or_update_account_notification_preferences(
+        account_id=account_id,
+        actor=TEST_ACTOR,
+        preferences=CreateOrUpdateAccountNotificationPreferencesParams(email_enabled=email_enabled),
+    )
+
+
+def _cached_read(account_id: str) -> bool:
+    return AccountNotificationPreferenceReader.get_cached_account_notification_preferences_by_account_id(
+        account_id, actor=TEST_ACTOR
+    ).email_enabled
+
+
+class TestAccountNotificationPreferencesCache:
+    def test_cached_read_is_served_without_a_query(self) -> None:
+        account_id = str(ObjectId())
+        _save_preferences(account_id, email_enabled=True)
+        assert _cached_read(account_id) is True
+
+        with mock.patch.object(AccountNotificationPreferencesRepository, "query_one") as query_one:
+            assert _cached_read(account_id) is True
+
+        query_one.assert_not_called()
+
+    def test_update_invalidates_the_cached_entry(self) -> None:
+        account_id = str(ObjectId())
+        _save_preferences(account_id, email_enabled=True)
+        assert _cached_read(account_id) is True
+
+        _save_preferences(account_id, email_enabled=False)
+
+        assert _cached_read(account_id) is False
+
+    def test_create_invalidates_the_cached_entry(self) -> None:
+        account_id = str(ObjectId())
+        _save_preferences(account_id, email_enabled=True)
+        assert _cached_read(account_id) is True
+        AccountNotificationPreferencesRepository.collection().delete_many({})
+
+        _save_preferences(account_id, email_enabled=False)
+
+        assert _cached_read(account_id) is False
+
+
+class TestPreferencesForAccounts:
+    def test_misses_are_loaded_with_one_query(self) -> None:
+        cached_account_id, first_account_id, second_account_id = (str(ObjectId()) for _ in range(3))
+        for account_id in (cached_account_id, first_account_id, second_account_id):
+            _save_preferences(account_id, email_enabled=account_id != second_account_id)
+        _cached_read(cached_account_id)
+        unknown_account_id = str(ObjectId())
+
+        with mock.patch.object(
+            AccountNotificationPreferencesRepository, "query", wraps=AccountNotificationPreferencesRepository.query
+        ) as query:
+            preferences = NotificationService.get_account_notification_preferences_for_accounts(
+                account_ids=[cached_account_id, first_account_id, second_account_id, unknown_account_id],
+                actor=TEST_ACTOR,
+            )
+
+        assert query.call_count == 1
+        assert query.call_args.args[0].account_ids == (first_account_id, second_account_id, unknown_account_id)
+        assert set(preferences) == {cached_account_id, first_account_id, second_account_id}
+        assert preferences[second_account_id].email_enabled is False
+
+    def test_loaded_preferences_fill_the_cache(self) -> None:
+        account_id = str(ObjectId())
+        _save_preferences(account_id, email_enabled=True)
+        NotificationService.get_account_notification_preferences_for_accounts(
+            account_ids=[account_id], actor=TEST_ACTOR
+        )
+
+        with mock.patch.object(AccountNotificationPreferencesRepository, "query") as query:
+            preferences = NotificationService.get_account_notification_preferences_for_accounts(
+                account_ids=[account_id], actor=TEST_ACTOR
+            )
+
+        query.assert_not_called()
+        assert preferences[account_id].email_enabled is True
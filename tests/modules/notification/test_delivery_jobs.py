@@ -0,0 +1,119 @@
+from typing import Any, Iterator
+from unittest import mock
+
+import pytest
+
+from modules.account.types import PhoneNumber
+from modules.core.common.types import REDACTED, JobRunQuery
+from modules.core.internal.job_run.store.job_run_repository import JobRunRepository
+from modules.core.redis_client import RedisClient
+from modules.notification.email_service import EmailService
+from modules.notification.errors import ProviderRejectedError
+from modules.notification.internal.delivery_idempotency import DeliveryIdempotency
+from modules.notification.internal.sendgrid_service import SendGridService
+from modules.notification.internal.twilio_service import TwilioService
+from modules.notification.jobs.send_email_job import SendEmailJob
+from modules.notification.jobs.send_sms_job import SendSMSJob
+from modules.notification.types import EmailRecipient, EmailSender, SendEmailParams
+from tests.conftest import TEST_ACTOR
+
+SENDER = EmailSender(email="sender@example.com", name="Sender")
+
+
+pytestmark = pytest.mark.usefixtures("eager_celery")
+
+
+@pytest.fixture(autouse=True)
+def clean_state() -> Iterator[None]:
+    JobRunRepository.collection().delete_many({})
+    yield
+    JobRunRepository.collection().delete_many({})
+    client = RedisClient.get_client()
+    keys = list(client.scan_iter(match=f"{DeliveryIdempotency.KEY_PREFIX}:*"))
+    if keys:
+        client.delete(*keys)
+
+
+def _sms_kwargs(idempotency_key: str) -> dict[str, Any]:
+    return {
+        "idempotency_key": idempotency_key,
+        "message_body": "1234 is your One Time Password (OTP) for verification.",
+        "recipient_country_code": "+1",
+        "recipient_phone_number": "2124567890",
+    }
+
+
+def _email(address: str, template_id: str = "template-a") -> SendEmailParams:
+    return SendEmailParams(
+        recipient=EmailRecipient(email=address),
+        sender=SENDER,
+        template_id=template_id,
+        template_data={"first_name": address.split("@")[0]},
+    )
+
+
+class TestGivenAnSMSJob:
+    class TestWhenTheSameMessageIsDeliveredTwice:
+        @mock.patch.object(TwilioService, "send_sms")
+        def test_then_twilio_is_called_once(self, send_sms: mock.MagicMock) -> None:
+            SendSMSJob.perform(actor=TEST_ACTOR, **_sms_kwargs("sms-once"))
+            SendSMSJob.perform(actor=TEST_ACTOR, **_sms_kwargs("sms-once"))
+
+            send_sms.assert_called_once()
+            params = send_sms.call_args.kwargs["params"]
+            assert params.recipient_phone == PhoneNumber(country_code="+1", phone_number="2124567890")
+
+    class TestWhenTwilioFails:
+        @mock.patch.object(TwilioService, "send_sms", side_effect=RuntimeError("twilio down"))
+        def test_then_the_key_is_released_for_the_retry(self, send_sms: mock.MagicMock) -> None:
+            with pytest.raises(RuntimeError):
+                SendSMSJob.perform(actor=TEST_ACTOR, **_sms_kwargs("sms-retry"))
+
+            assert DeliveryIdempotency.claim("sms-retry")
+
+    class TestWhenTwilioRejectsTheRequest:
+        @mock.patch.object(
+            TwilioService,
+            "send_sms",
+            side_effect=ProviderRejectedError(message="invalid number", provider_status_code=400),
+        )
+        def test_then_it_is_not_retried_and_the_key_is_marked_failed(self, send_sms: mock.MagicMock) -> None:
+            with pytest.raises(ProviderRejectedError):
+                SendSMSJob.perform_async(**_sms_kwargs("sms-rejected"))
+
+            send_sms.assert_called_once()
+            assert not DeliveryIdempotency.claim("sms-rejected")
+
+    class TestWhenTheJobRuns:
+        @mock.patch.object(TwilioService, "send_sms")
+        def test_then_the_message_body_is_not_recorded_on_the_job_run(self, send_sms: mock.MagicMock) -> None:
+            SendSMSJob.perform_async(**_sms_kwargs("sms-redacted"))
+
+            job_run = JobRunRepository.query_one(JobRunQuery(job_name="SendSMSJob"), actor=TEST_ACTOR)
+            assert job_run is not None
+            assert job_run.arguments["message_body"] == REDACTED
+            assert job_run.arguments["recipient_phone_number"] == "2124567890"
+
+
+class TestGivenEmailsToSend:
+    class TestWhenTheyShareATemplateAndSender:
+        def test_then_they_go_out_in_one_sendgrid_request(self) -> None:
+            client = mock.MagicMock()
+            with mock.patch.object(SendGridService, "get_client", return_value=client):
+                EmailService.send_emails(
+                    [_email("a@example.com"), _email("b@example.com"), _email("c@example.com", "template-b")]
+                )
+
+            sent = [call.args[0].get() for call in client.send.call_args_list]
+            assert sorted(len(body["personalizations"]) for body in sent) == [1, 2]
+            batched = next(body for body in sent if len(body["personalizations"]) == 2)
+            assert batched["template_id"] == "template-a"
+            assert [p["dynamic_template_data"]["first_name"] for p in batched["personalizations"]] == ["a", "b"]
+
+    class TestWhenABatchExceedsTheRequestLimit:
+        def test_then_it_is_split_into_one_job_per_request(self) -> None:
+            batch_size = SendGridService.MAX_PERSONALIZATIONS_PER_REQUEST
+            with mock.patch.object(SendEmailJob, "perform_async") as perform_async:
+                EmailService.send_emails([_email(f"user{index}@example.com") for index in range(batch_size + 1)])
+
+            assert [len(call.kwargs["recipients"]) for call in perform_async.call_args_list] == [batch_size, 1]
@@ -0,0 +1,185 @@
+from typing import Any, Iterator, Optional
+from unittest import mock
+
+import pytest
+from web_app import app
+
+from modules.account.account_service import AccountService
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import CreateAccountByUsernameAndPasswordParams, PhoneNumber
+from modules.authentication.authentication_service import AuthenticationService
+from modules.config.config_service import ConfigService
+from modules.core.common.types import CircuitState
+from modules.core.errors import OutboundCircuitOpenError
+from modules.core.redis_client import RedisClient
+from modules.notification.errors import ProviderUnavailableError, ServiceError
+from modules.notification.internal.provider_circuit_breaker import ProviderCircuitBreaker
+from modules.notification.internal.twilio_service import TwilioService
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import NotificationProvider, ProviderCircuitBreakerConfig, SendSMSParams
+from tests.conftest import TEST_ACTOR
+
+PROVIDER = NotificationProvider.TWILIO
+PROVIDER_CIRCUITS_URL = "http://127.0.0.1:8080/api/notification/provider-circuits"
+CONFIG = ProviderCircuitBreakerConfig(minimum_calls=4, failure_rate_threshold=0.5, open_seconds=30)
+
+
+@pytest.fixture(autouse=True)
+def breaker_config() -> Iterator[None]:
+    original_get_section = ConfigService.get_section
+
+    def get_section(section_type: Any) -> Any:
+        return CONFIG if section_type is ProviderCircuitBreakerConfig else original_get_section(section_type)
+
+    with mock.patch.object(ConfigService, "get_section", side_effect=get_section):
+        ProviderCircuitBreaker._state = None
+        _clear_circuit_keys()
+        yield
+        _clear_circuit_keys()
+        ProviderCircuitBreaker._state = None
+
+
+@pytest.fixture
+def operator_token() -> Iterator[str]:
+    account = AccountService.create_account_by_username_and_password(
+        params=CreateAccountByUsernameAndPasswordParams(
+            username="operator@example.com", password="testpassword", first_name="Op", last_name="Erator"
+        ),
+        actor=TEST_ACTOR,
+    )
+    original_get_list = ConfigService.get_list
+
+    def get_list(key: str, default: Optional[list[Any]] = None) -> list[Any]:
+        return [account.id] if key == "web.operator_account_ids" else original_get_list(key=key, default=default)
+
+    with mock.patch.object(ConfigService, "get_list", side_effect=get_list):
+        yield AuthenticationService.create_access_token_by_username_and_password(account=account).token
+    AccountRepository.collection().delete_many({})
+
+
+def _clear_circuit_keys() -> None:
+    client = RedisClient.get_client()
+    keys = list(client.scan_iter(match=f"{ProviderCircuitBreaker.KEY_PREFIX}:*"))
+    if keys:
+        client.delete(*keys)
+
+
+def _fail(status_code: int | None = 503) -> None:
+    raise ServiceError(message="provider failed", provider_status_code=status_code)
+
+
+def _record_failures(count: int, status_code: int | None = 503) -> None:
+    for _ in range(count):
+        with pytest.raises(ServiceError):
+            ProviderCircuitBreaker.call(PROVIDER, lambda: _fail(status_code))
+
+
+def _succeed() -> str:
+    return "sent"
+
+
+class TestGivenAProviderThatKeepsFailing:
+    class TestWhenTheFailureRateCrossesTheThreshold:
+        def test_then_the_circuit_opens_and_calls_fail_fast(self) -> None:
+            ProviderCircuitBreaker.call(PROVIDER, _succeed)
+            _record_failures(3)
+
+            operation = mock.Mock()
+            with pytest.raises(ProviderUnavailableError):
+                ProviderCircuitBreaker.call(PROVIDER, operation)
+
+            operation.assert_not_called()
+            assert NotificationService.get_provider_circuit_stats()[1].state == CircuitState.OPEN
+
+    class TestWhenTooFewCallsWereMade:
+        def test_then_the_circuit_stays_closed(self) -> None:
+            _record_failures(3)
+
+            assert ProviderCircuitBreaker.call(PROVIDER, _succeed) == "sent"
+
+    class TestWhenThisProcesssOwnHttpBreakerIsOpen:
+        def test_then_the_calls_it_turns_away_do_not_count(self) -> None:
+            def turned_away() -> None:
+                error = OutboundCircuitOpenError(host="api.twilio.com", retry_after_seconds=30)
+                raise ServiceError(message="request failed", original_error=error) from error
+
+            for _ in range(CONFIG.minimum_calls + 1):
+                with pytest.raises(ServiceError):
+                    ProviderCircuitBreaker.call(PROVIDER, turned_away)
+
+            stats = ProviderCircuitBreaker.stats(PROVIDER)
+            assert stats.state == CircuitState.CLOSED
+            assert (stats.calls, stats.failures) == (0, 0)
+
+    class TestWhenTheProviderRejectsTheRequests:
+        def test_then_client_errors_do_not_count(self) -> None:
+            _record_failures(5, status_code=400)
+
+            stats = ProviderCircuitBreaker.stats(PROVIDER)
+            assert stats.state == CircuitState.CLOSED
+            assert stats.failures == 0
+
+
+class TestGivenAnOpenCircuit:
+    class TestWhenTheOpenPeriodHasPassed:
+        def test_then_one_probe_closes_it_on_success(self) -> None:
+            _record_failures(4)
+            RedisClient.get_client().delete(f"{ProviderCircuitBreaker.KEY_PREFIX}:{PROVIDER.value}:open")
+
+            assert ProviderCircuitBreaker.before_call(PROVIDER) is True
+            with pytest.raises(ProviderUnavailableError):
+                ProviderCircuitBreaker.before_call(PROVIDER)
+            ProviderCircuitBreaker._record(PROVIDER, succeeded=True, is_probe=True)
+
+            assert ProviderCircuitBreaker.stats(PROVIDER).state == CircuitState.CLOSED
+
+        def test_then_a_failed_probe_reopens_it(self) -> None:
+            _record_failures(4)
+            RedisClient.get_client().delete(f"{ProviderCircuitBreaker.KEY_PREFIX}:{PROVIDER.value}:open")
+
+            _record_failures(1)
+
+            assert ProviderCircuitBreaker.stats(PROVIDER).state == CircuitState.OPEN
+
+    class TestWhenAnSMSIsSent:
+        def test_then_twilio_is_not_called(self) -> None:
+            _record_failures(4)
+
+            with mock.patch.object(TwilioService, "get_client") as get_client:
+                with pytest.raises(ProviderUnavailableError):
+                    TwilioService.send_sms(
+                        SendSMSParams(
+                            message_body="1234",
+                            recipient_phone=PhoneNumber(country_code="+1", phone_number="2124567890"),
+                        )
+                    )
+
+            get_client.assert_not_called()
+
+
+class TestGivenAnOperator:
+    class TestWhenTheProviderCircuitsAreRequested:
+        def test_then_each_providers_state_and_failure_rate_are_reported(self, operator_token: str) -> None:
+            _record_failures(4)
+            ProviderCircuitBreaker.call(NotificationProvider.SENDGRID, _succeed)
+            with pytest.raises(ServiceError):
+                ProviderCircuitBreaker.call(NotificationProvider.SENDGRID, _fail)
+
+            with app.test_client() as client:
+                response = client.get(PROVIDER_CIRCUITS_URL, headers={"Authorization": f"Bearer {operator_token}"})
+
+            assert response.status_code == 200
+            circuits = {circuit["provider"]: circuit for circuit in response.json or []}
+            sendgrid = circuits[NotificationProvider.SENDGRID.value]
+            assert (sendgrid["state"], sendgrid["calls"], sendgrid["failure_rate"]) == (
+                CircuitState.CLOSED.value,
+                2,
+                0.5,
+            )
+            assert circuits[PROVIDER.value]["state"] == CircuitState.OPEN.value
+
+        def test_then_a_missing_token_is_rejected(self) -> None:
+            with app.test_client() as client:
+                response = client.get(PROVIDER_CIRCUITS_URL)
+
+            assert response.status_code == 401
@@ -0,0 +1,134 @@
+import json
+import uuid
+from typing import Iterator
+
+import pytest
+from redis import Redis
+from web_app import app
+
+from modules.config.config_service import ConfigService
+from modules.config.internal.config_manager import ConfigManager
+from modules.core.redis_client import RedisClient
+from modules.rate_limit.errors import RateLimitExceededError
+from modules.rate_limit.internal.local_sliding_window import LocalSlidingWindow
+from modules.rate_limit.internal.rate_limiter import RateLimiter
+from modules.rate_limit.rate_limit_service import RateLimitService
+from modules.rate_limit.types import RateLimit, RateLimitCheck, RateLimitScope
+
+ACCESS_TOKEN_URL = "http://127.0.0.1:8080/api/access-tokens"
+
+# An address nothing listens on, so the Redis client fails fast with a connection error.
+UNREACHABLE_REDIS_URL = "redis://127.0.0.1:1/0"
+
+
+@pytest.fixture
+def rate_limits_enabled(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+    monkeypatch.setattr(ConfigService, "config_manager", ConfigManager())
+    RateLimiter._state = None
+    yield
+    RateLimiter._state = None
+    RedisClient._client = None
+    client = RedisClient.get_client()
+    keys = list(client.scan_iter(match=f"{RateLimiter.KEY_PREFIX}:*"))
+    if keys:
+        client.delete(*keys)
+
+
+def _check(key: str, limit: int, window_seconds: int = 60) -> RateLimitCheck:
+    return RateLimitCheck(
+        scope=RateLimitScope.IP, key=key, rate_limit=RateLimit(limit=limit, window_seconds=window_seconds)
+    )
+
+
+class TestGivenALocalSlidingWindow:
+    class TestWhenRequestsExceedTheLimit:
+        def test_then_the_request_over_the_limit_is_rejected_until_the_window_slides(self) -> None:
+            windows = LocalSlidingWindow(max_keys=10)
+            checks = [_check("ip:1", limit=2, window_seconds=60)]
+
+            assert windows.check(checks, now=1000.0).allowed
+            assert windows.check(checks, now=1010.0).allowed
+
+            rejected = windows.check(checks, now=1020.0)
+            assert not rejected.allowed
+            assert rejected.exceeded_scope == RateLimitScope.IP
+            assert rejected.retry_after_seconds == 40
+
+            assert windows.check(checks, now=1061.0).allowed
+
+    class TestWhenOneOfSeveralLimitsRejects:
+        def test_then_the_other_limits_are_not_charged(self) -> None:
+            windows = LocalSlidingWindow(max_keys=10)
+            tight = _check("ip:tight", limit=1)
+            loose = _check("ip:loose", limit=2)
+
+            assert windows.check([tight, loose], now=1000.0).allowed
+            assert not windows.check([tight, loose], now=1001.0).allowed
+            assert not windows.check([tight, loose], now=1002.0).allowed
+
+            assert windows.check([loose], now=1003.0).allowed
+
+
+@pytest.mark.usefixtures("rate_limits_enabled")
+class TestGivenRateLimitsBackedByRedis:
+    class TestWhenARouteLimitIsExceeded:
+        def test_then_enforce_raises_with_a_retry_after(self) -> None:
+            client_ip = uuid.uuid4().hex
+            signup_limit = ConfigService.get_int(key="rate_limit.routes.signup.ip.limit")
+
+            for _ in range(signup_limit):
+                RateLimitService.enforce(route="signup", identifiers={RateLimitScope.IP: client_ip})
+
+            with pytest.raises(RateLimitExceededError) as exc_info:
+                RateLimitService.enforce(route="signup", identifiers={RateLimitScope.IP: client_ip})
+
+            assert exc_info.value.http_code == 429
+            assert exc_info.value.retry_after_seconds > 0
+
+        def test_then_rejected_attempts_do_not_extend_the_window(self) -> None:
+            client_ip = uuid.uuid4().hex
+            signup_limit = ConfigService.get_int(key="rate_limit.routes.signup.ip.limit")
+            for _ in range(signup_limit + 3):
+                RateLimitService.check(route="signup", identifiers={RateLimitScope.IP: client_ip})
+
+            keys = list(RedisClient.get_client().scan_iter(match=f"{RateLimiter.KEY_PREFIX}:signup:ip:*"))
+            assert [RedisClient.get_client().zcard(key) for key in keys] == [signup_limit]
+
+    class TestWhenAnIdentifierIsMissing:
+        def test_then_only_the_identified_scopes_are_limited(self) -> None:
+            username = f"{uuid.uuid4().hex}@example.com"
+            for _ in range(ConfigService.get_int(key="rate_limit.routes.login.username.limit")):
+                RateLimitService.enforce(route="login", identifiers={RateLimitScope.USERNAME: username})
+
+            assert not RateLimitService.check(route="login", identifiers={RateLimitScope.USERNAME: username}).allowed
+            assert RateLimitService.check(route="login", identifiers={RateLimitScope.IP: None}).allowed
+
+    class TestWhenRedisIsUnavailable:
+        def test_then_limits_fall_back_to_the_process(self, monkeypatch: pytest.MonkeyPatch) -> None:
+            monkeypatch.setattr(RedisClient, "_client", Redis.from_url(UNREACHABLE_REDIS_URL))
+            client_ip = uuid.uuid4().hex
+            signup_limit = ConfigService.get_int(key="rate_limit.routes.signup.ip.limit")
+
+            for _ in range(signup_limit):
+                assert RateLimitService.check(route="signup", identifiers={RateLimitScope.IP: client_ip}).allowed
+
+            assert not RateLimitService.check(route="signup", identifiers={RateLimitScope.IP: client_ip}).allowed
+
+    class TestWhenTheLoginLimitIsExceededOverHttp:
+        def test_then_the_api_answers_429_with_retry_after(self) -> None:
+            username = f"{uuid.uuid4().hex}@example.com"
+            body = json.dumps({"username": username, "password": "wrong-password"})
+            headers = {"Content-Type": "application/json"}
+            login_limit = ConfigService.get_int(key="rate_limit.routes.login.username.limit")
+
+            with app.test_client() as client:
+                for _ in range(login_limit):
+                    response = client.post(ACCESS_TOKEN_URL, headers=headers, data=body)
+                    assert response.status_code != 429
+                response = client.post(ACCESS_TOKEN_URL, headers=headers, data=body)
+
+            assert response.status_code == 429
+            assert response.json is not None
+            assert response.json["code"] == "RATE_LIMIT_ERR_01"
+            assert int(response.headers["Retry-After"]) > 0
@@ -0,0 +1,64 @@
+from modules.authentication.types import AccessTokenErrorCode
+from modules.task.types import TaskErrorCode
+from tests.async_web_client import request_async_app
+from tests.modules.task.base_test_task import BaseTestTask, TaskRequestBody
+
+
+class TestTaskAsyncApi(BaseTestTask):
+    """The task API served by web_async_app answers as the Flask one does."""
+
+    def test_create_and_get_task(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task_data: TaskRequestBody = {"title": self.DEFAULT_TASK_TITLE, "description": self.DEFAULT_TASK_DESCRIPTION}
+
+        status, created_task = request_async_app("POST", f"/api/accounts/{account.id}/tasks", token, data=task_data)
+        assert status == 201
+        self.assert_task_response(
+            created_task,
+            title=self.DEFAULT_TASK_TITLE,
+            description=self.DEFAULT_TASK_DESCRIPTION,
+            account_id=account.id,
+        )
+
+        status, fetched_task = request_async_app("GET", f"/api/accounts/{account.id}/tasks/{created_task['id']}", token)
+        assert status == 200
+        assert fetched_task == created_task
+
+    def test_get_paginated_tasks(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        status, page = request_async_app("GET", f"/api/accounts/{account.id}/tasks?page=1&size=2", token)
+
+        assert status == 200
+        self.assert_pagination_response(page, expected_items_count=2, expected_total_count=3, expected_size=2)
+
+    def test_create_task_missing_title(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        status, error = request_async_app(
+            "POST", f"/api/accounts/{account.id}/tasks", token, data={"description": self.DEFAULT_TASK_DESCRIPTION}
+        )
+
+        assert status == 400
+        assert error["code"] == TaskErrorCode.BAD_REQUEST
+
+    def test_get_all_tasks_no_auth(self) -> None:
+        account, _ = self.create_account_and_get_token()
+
+        status, error = request_async_app("GET", f"/api/accounts/{account.id}/tasks")
+
+        assert status == 401
+        assert error["code"] == AccessTokenErrorCode.AUTHORIZATION_HEADER_NOT_FOUND
+
+    def test_cross_account_access_is_denied(self) -> None:
+        account1, token1 = self.create_account_and_get_token(username="async_owner@example.com")
+        _, token2 = self.create_account_and_get_token(username="async_other@example.com")
+        task = self.create_test_task(account_id=account1.id)
+
+        status, error = request_async_app("DELETE", f"/api/accounts/{account1.id}/tasks/{task.id}", token2)
+
+        assert status == 401
+        assert error["code"] == AccessTokenErrorCode.UNAUTHORIZED_ACCESS
+        status, _ = request_async_app("GET", f"/api/accounts/{account1.id}/tasks/{task.id}", token1)
+        assert status == 200